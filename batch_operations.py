@@ -24,7 +24,6 @@ Migration from JSON-RPC Batching:
 import asyncio
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 
 from fastmcp.dependencies import Progress
@@ -55,7 +54,7 @@ async def clear_context_batch_tool(
     This operation runs asynchronously with progress tracking.
 
     Performance Notes:
-    - Uses parallel processing with ThreadPoolExecutor for efficiency
+    - Uses concurrent asyncio requests for efficiency
     - Individual requests maintain protocol compliance
     - Client-side request coordination replaces JSON-RPC batching
 
@@ -117,7 +116,7 @@ async def _execute_clear_context_batch(
     """Execute the actual context cleanup logic using individual requests.
 
     Performance Implementation:
-    - Uses ThreadPoolExecutor for parallel individual requests
+    - Uses concurrent asyncio individual requests (non-blocking)
     - Replaces previous JSON-RPC batching with application-level coordination
     - Maintains efficiency while ensuring MCP 2025-06-18 compliance
     """
@@ -145,8 +144,8 @@ async def _execute_clear_context_batch(
             if message:
                 logger.info(f"Clear Context Progress: {message}")
 
-        # Get registry client (registry is already resolved, never None here)
-        registry_client = registry_manager.get_registry(registry)
+        # Get async registry client (registry is already resolved, never None here)
+        registry_client = registry_manager.get_async_registry(registry)
 
         await update_progress(
             f"Starting cleanup of context '{context}' in registry '{registry}' (individual requests)",
@@ -169,7 +168,7 @@ async def _execute_clear_context_batch(
 
         # Get all subjects in the context FIRST to determine total progress steps
         # This ensures set_total() is called before any increment() calls
-        subjects = registry_client.get_subjects(context)
+        subjects = await registry_client.get_subjects(context)
         if isinstance(subjects, dict) and "error" in subjects:
             subjects = []
         subjects_found = len(subjects)
@@ -242,25 +241,18 @@ async def _execute_clear_context_batch(
             f"Starting deletion of {subjects_found} subjects using parallel individual requests",
         )
 
-        # Delete subjects in parallel using individual requests (replaces JSON-RPC batching)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for subject in subjects:
-                future = executor.submit(_delete_subject_from_context, registry_client, subject, context)
-                futures.append(future)
-
-            total_futures = len(futures)
-            for i, future in enumerate(as_completed(futures)):
-                try:
-                    if future.result():
-                        subjects_deleted += 1
-                except Exception as e:
-                    errors.append(str(e))
-
-                # Increment progress after each deletion completes
-                await increment_progress(
-                    f"Deleted {subjects_deleted} of {subjects_found} subjects (individual requests)",
-                )
+        # Delete subjects concurrently using individual requests (replaces JSON-RPC batching)
+        for deletion in asyncio.as_completed(_delete_subjects_from_context(registry_client, subjects, context)):
+            try:
+                if await deletion:
+                    subjects_deleted += 1
+            except Exception as e:
+                errors.append(str(e))
+
+            # Increment progress after each deletion completes
+            await increment_progress(
+                f"Deleted {subjects_deleted} of {subjects_found} subjects (individual requests)",
+            )
 
         await update_progress("Computing cleanup results")
 
@@ -309,7 +301,7 @@ async def _execute_clear_context_batch(
         }
 
 
-def _delete_subject_from_context(registry_client, subject: str, context: Optional[str] = None) -> bool:
+async def _delete_subject_from_context(registry_client, subject: str, context: Optional[str] = None) -> bool:
     """Helper function to delete a subject from a context using individual request.
 
     Note: This makes a single HTTP request per subject, replacing previous
@@ -317,12 +309,21 @@ def _delete_subject_from_context(registry_client, subject: str, context: Optiona
     """
     try:
         url = registry_client.build_context_url(f"/subjects/{subject}", context)
-        response = registry_client.session.delete(url, auth=registry_client.auth, headers=registry_client.headers)
-        return response.status_code in [200, 404]  # 404 is OK, subject already deleted
+        status, _ = await registry_client.request("DELETE", url)
+        return status in [200, 404]  # 404 is OK, subject already deleted
     except Exception:
         return False
 
 
+def _delete_subjects_from_context(registry_client, subjects: List[str], context: Optional[str] = None) -> List:
+    """Build one deletion coroutine per subject.
+
+    How many run against the registry at once is decided by the registry's adaptive
+    concurrency limiter, which backs off when the registry reports overload.
+    """
+    return [_delete_subject_from_context(registry_client, subject, context) for subject in subjects]
+
+
 @structured_output("clear_multiple_contexts_batch", fallback_on_error=True)
 async def clear_multiple_contexts_batch_tool(
     contexts: List[str],
@@ -343,7 +344,7 @@ async def clear_multiple_contexts_batch_tool(
     This operation runs asynchronously with progress tracking.
 
     Performance Notes:
-    - Uses parallel processing with ThreadPoolExecutor for efficiency
+    - Uses concurrent asyncio requests for efficiency
     - Individual requests maintain protocol compliance
     - Client-side request coordination replaces JSON-RPC batching
 
@@ -405,7 +406,7 @@ async def _execute_clear_multiple_contexts_batch(
     """Execute the actual multiple contexts cleanup logic using individual requests.
 
     Performance Implementation:
-    - Uses ThreadPoolExecutor for parallel individual requests across contexts
+    - Uses concurrent asyncio individual requests across contexts
     - Replaces previous JSON-RPC batching with application-level coordination
     - Maintains efficiency while ensuring MCP 2025-06-18 compliance
     """
@@ -432,8 +433,8 @@ async def _execute_clear_multiple_contexts_batch(
             if message:
                 logger.info(f"Multi-Context Clear Progress: {message}")
 
-        # Get registry client (registry is already resolved, never None here)
-        registry_client = registry_manager.get_registry(registry)
+        # Get async registry client (registry is already resolved, never None here)
+        registry_client = registry_manager.get_async_registry(registry)
 
         await update_progress(
             f"Starting cleanup of {len(contexts)} contexts in registry '{registry}' (individual requests)",
@@ -479,7 +480,7 @@ async def _execute_clear_multiple_contexts_batch(
         for i, context in enumerate(contexts, 1):
             try:
                 # Get subjects in context
-                subjects = registry_client.get_subjects(context)
+                subjects = await registry_client.get_subjects(context)
                 if isinstance(subjects, dict) and "error" in subjects:
                     subjects = []
                 total_subjects_found += len(subjects)
@@ -495,27 +496,15 @@ async def _execute_clear_multiple_contexts_batch(
                     )
                     continue
 
-                # Delete subjects in parallel using individual requests
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = []
-                    for subject in subjects:
-                        future = executor.submit(
-                            _delete_subject_from_context,
-                            registry_client,
-                            subject,
-                            context,
-                        )
-                        futures.append(future)
-
-                    # Wait for all deletions to complete
-                    context_deleted_count = 0
-                    for future in as_completed(futures):
-                        try:
-                            if future.result():
-                                total_subjects_deleted += 1
-                                context_deleted_count += 1
-                        except Exception as e:
-                            errors.append(str(e))
+                # Delete subjects concurrently using individual requests
+                context_deleted_count = 0
+                for deletion in asyncio.as_completed(_delete_subjects_from_context(registry_client, subjects, context)):
+                    try:
+                        if await deletion:
+                            total_subjects_deleted += 1
+                            context_deleted_count += 1
+                    except Exception as e:
+                        errors.append(str(e))
 
                 # Context deletion not supported by Schema Registry API
                 if delete_contexts_after:
@@ -9,10 +9,12 @@ Provides registry comparison, context comparison, and missing schema detection
 with JSON Schema validation, type-safe responses, and HATEOAS navigation links.
 """
 
+import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from resource_linking import add_links_to_response
+from schema_registry_common import load_context_schemas_async
 from schema_validation import (
     create_error_response,
     structured_output,
@@ -60,8 +62,8 @@ async def compare_registries_tool(
             await context.info(f"Starting registry comparison: {source_registry} vs {target_registry}")
             await context.report_progress(0.0, 100.0, "Initializing registry comparison")
 
-        source_client = registry_manager.get_registry(source_registry)
-        target_client = registry_manager.get_registry(target_registry)
+        source_client = registry_manager.get_async_registry(source_registry)
+        target_client = registry_manager.get_async_registry(target_registry)
 
         if not source_client:
             return create_error_response(
@@ -88,24 +90,37 @@ async def compare_registries_tool(
             "mcp_protocol_version": "2025-11-25",
         }
 
-        # Compare subjects (10-30%)
-        if context:
-            await context.info(f"Fetching subjects from source registry: {source_registry}")
-            await context.report_progress(15.0, 100.0, f"Fetching subjects from {source_registry}")
-
-        source_subjects = set(source_client.get_subjects() or [])
-
-        if context:
-            await context.report_progress(20.0, 100.0, f"Found {len(source_subjects)} subjects in source registry")
-
+        # Load subjects and versions of both registries with bulk listings (10-30%)
         if context:
-            await context.info(f"Fetching subjects from target registry: {target_registry}")
-            await context.report_progress(25.0, 100.0, f"Fetching subjects from {target_registry}")
+            await context.info(f"Loading subjects from registries: {source_registry}, {target_registry}")
+            await context.report_progress(15.0, 100.0, f"Loading subjects from {source_registry} and {target_registry}")
 
-        target_subjects = set(target_client.get_subjects() or [])
+        source_loaded, target_loaded = await asyncio.gather(
+            load_context_schemas_async(source_client, include_schemas=False),
+            load_context_schemas_async(target_client, include_schemas=False),
+        )
+        for registry_name, loaded in ((source_registry, source_loaded), (target_registry, target_loaded)):
+            if "error" in loaded:
+                return create_error_response(
+                    f"Failed to load subjects from registry '{registry_name}': {loaded['error']}",
+                    error_code="REGISTRY_COMPARISON_FAILED",
+                    registry_mode=registry_mode,
+                )
+        source_versions_by_subject = {
+            subject: [entry["version"] for entry in versions] for subject, versions in source_loaded["subjects"].items()
+        }
+        target_versions_by_subject = {
+            subject: [entry["version"] for entry in versions] for subject, versions in target_loaded["subjects"].items()
+        }
+        source_subjects = set(source_versions_by_subject)
+        target_subjects = set(target_versions_by_subject)
 
         if context:
-            await context.report_progress(30.0, 100.0, f"Found {len(target_subjects)} subjects in target registry")
+            await context.report_progress(
+                30.0,
+                100.0,
+                f"Found {len(source_subjects)} subjects in source and {len(target_subjects)} in target registry",
+            )
 
         # Build subject comparison (30-35%)
         if context:
@@ -138,8 +153,8 @@ async def compare_registries_tool(
                     progress = 40.0 + (i / len(common_subjects)) * 15.0  # 40% to 55%
                     await context.report_progress(progress, 100.0, f"Comparing schema versions for {subject}")
 
-                source_versions = source_client.get_schema_versions(subject) or []
-                target_versions = target_client.get_schema_versions(subject) or []
+                source_versions = source_versions_by_subject[subject]
+                target_versions = target_versions_by_subject[subject]
 
                 if source_versions != target_versions:
                     schema_differences.append(
@@ -168,12 +183,12 @@ async def compare_registries_tool(
                 await context.info("Comparing contexts between registries")
                 await context.report_progress(60.0, 100.0, "Fetching contexts from source registry")
 
-            source_contexts = set(source_client.get_contexts() or [])
+            source_contexts = set(await source_client.get_contexts() or [])
 
             if context:
                 await context.report_progress(65.0, 100.0, f"Found {len(source_contexts)} contexts in source registry")
 
-            target_contexts = set(target_client.get_contexts() or [])
+            target_contexts = set(await target_client.get_contexts() or [])
 
             if context:
                 await context.report_progress(70.0, 100.0, f"Found {len(target_contexts)} contexts in target registry")
@@ -196,8 +211,9 @@ async def compare_registries_tool(
                 await context.info("Comparing global configurations")
                 await context.report_progress(75.0, 100.0, "Fetching global configurations")
 
-            source_config = source_client.get_global_config()
-            target_config = target_client.get_global_config()
+            source_config, target_config = await asyncio.gather(
+                source_client.get_global_config(), target_client.get_global_config()
+            )
 
             # Remove registry-specific fields for comparison
             source_config_clean = {k: v for k, v in source_config.items() if k not in ["registry", "error"]}
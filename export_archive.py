@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Export Archive Module
+
+Chunked, compressed and resumable exports. An archive is a directory under
+EXPORT_DIR holding:
+
+- segment-00001.ndjson.gz, ...: the records of an NDJSON export (export_stream
+  format), split into compressed segments (gzip, or zstd with the zstd extra)
+- checkpoint.json: the export options, the completed segments with their
+  SHA-256, the completed contexts and how far the current context got
+- manifest.json and index.json: written once the export is complete
+
+Segments are cut at subject boundaries once they hold EXPORT_SEGMENT_MAX_BYTES of
+uncompressed records. Each is written under a .part name and only recorded in the
+checkpoint once complete. Running the same export into the same archive again
+resumes after the last completed segment: finished contexts are skipped, and the
+context in progress continues after the last subject it completed. Subjects added
+or removed since then do not shift what is skipped; with the bulk GET /schemas
+listing, paging starts near the recorded offset, so what was written is not
+fetched again.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from export_stream import (
+    DEFAULT_CONTEXT,
+    NDJSON_FORMAT,
+    NDJSON_FORMAT_VERSION,
+    SnapshotIndex,
+    _context_param,
+    _schema_record,
+    _write_json,
+    iter_context_versions,
+    resolve_export_path,
+)
+from schema_registry_common import RegistryClient
+
+logger = logging.getLogger(__name__)
+
+# Export Archive Configuration
+# Uncompressed bytes of records per segment; segments are cut at the next subject boundary
+EXPORT_SEGMENT_MAX_BYTES = int(os.getenv("EXPORT_SEGMENT_MAX_BYTES", str(64 * 1024 * 1024)))
+
+ARCHIVE_FORMAT = "schema-registry-export+archive"
+COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+CHECKPOINT_FILE = "checkpoint.json"
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.json"
+
+
+class ArchiveError(RuntimeError):
+    """An archive that cannot be resumed (different options, damaged segments)."""
+
+
+def resolve_compression(compression: str) -> str:
+    """Compression actually used: zstd falls back to gzip when the zstandard package is not installed."""
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression '{compression}'; use one of {', '.join(COMPRESSIONS)}")
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError as e:
+            logger.warning(f"zstd compression unavailable ({e}); writing gzip segments")
+            return "gzip"
+    return compression
+
+
+def _compressor(raw: BinaryIO, compression: str) -> BinaryIO:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+    return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0)
+
+
+def _decompressor(raw: BinaryIO, compression: str) -> BinaryIO:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(raw)
+    return gzip.GzipFile(fileobj=raw, mode="rb")
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _Segment:
+    """One compressed segment being written."""
+
+    def __init__(self, directory: str, number: int, compression: str):
+        self.name = f"segment-{number:05d}.ndjson{COMPRESSIONS[compression]}"
+        self.path = os.path.join(directory, self.name)
+        self._raw = open(f"{self.path}.part", "wb")
+        self._stream = _compressor(self._raw, compression)
+        self.bytes = 0
+        self.records = 0
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+        self._stream.write(line)
+        self.bytes += len(line)
+        self.records += 1
+
+    def close(self) -> Dict[str, Any]:
+        """Finish the segment, move it into place and return its checkpoint entry."""
+        self._stream.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        os.replace(f"{self.path}.part", self.path)
+        return {
+            "name": self.name,
+            "records": self.records,
+            "bytes": self.bytes,
+            "compressed_bytes": os.path.getsize(self.path),
+            "sha256": _file_sha256(self.path),
+        }
+
+    def abort(self):
+        try:
+            self._stream.close()
+        except Exception:
+            pass
+        self._raw.close()
+        try:
+            os.remove(f"{self.path}.part")
+        except OSError:
+            pass
+
+
+class ArchiveWriter:
+    """Writes records into segments and the checkpoint that makes them resumable."""
+
+    def __init__(self, directory: str, checkpoint: Dict[str, Any], segment_max_bytes: int):
+        self.directory = directory
+        self.checkpoint = checkpoint
+        self.segment_max_bytes = segment_max_bytes
+        self.segment: Optional[_Segment] = None
+        # Progress of the context being written, saved with each completed segment
+        self.completed_contexts: List[str] = list(checkpoint["completed_contexts"])
+        self.current: Optional[Dict[str, Any]] = checkpoint.get("current")
+
+    def write(self, record: Dict[str, Any]):
+        if self.segment is None:
+            self.segment = _Segment(
+                self.directory, len(self.checkpoint["segments"]) + 1, self.checkpoint["compression"]
+            )
+        self.segment.write(record)
+
+    def cut_if_full(self):
+        """Close the current segment once it is full; call only between subjects."""
+        if self.segment is not None and self.segment.bytes >= self.segment_max_bytes:
+            self.flush()
+
+    def flush(self):
+        """Close the current segment (if any) and save the checkpoint."""
+        if self.segment is not None:
+            self.checkpoint["segments"].append(self.segment.close())
+            self.segment = None
+        self.checkpoint["completed_contexts"] = list(self.completed_contexts)
+        self.checkpoint["current"] = dict(self.current) if self.current else None
+        save_checkpoint(self.directory, self.checkpoint)
+
+    def abort(self):
+        if self.segment is not None:
+            self.segment.abort()
+            self.segment = None
+
+
+def save_checkpoint(directory: str, checkpoint: Dict[str, Any]):
+    checkpoint["updated_at"] = datetime.now().isoformat()
+    _write_json(os.path.join(directory, CHECKPOINT_FILE), checkpoint, indent=2)
+
+
+def _open_checkpoint(directory: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Load and verify the checkpoint of an archive, or start a new one."""
+    path = os.path.join(directory, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        checkpoint = {
+            "format": ARCHIVE_FORMAT,
+            "format_version": NDJSON_FORMAT_VERSION,
+            **options,
+            "started_at": datetime.now().isoformat(),
+            "segments": [],
+            "completed_contexts": [],
+            "current": None,
+            "complete": False,
+            "resumed": 0,
+        }
+        save_checkpoint(directory, checkpoint)
+        return checkpoint
+
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    different = [key for key, value in options.items() if checkpoint.get(key) != value]
+    if different:
+        raise ArchiveError(f"Archive {directory} was started with different {', '.join(different)}")
+
+    # Completed segments must be intact; anything else is left over from the interrupted run
+    recorded = set()
+    for segment in checkpoint["segments"]:
+        segment_path = os.path.join(directory, segment["name"])
+        if not os.path.exists(segment_path) or _file_sha256(segment_path) != segment["sha256"]:
+            raise ArchiveError(f"Segment {segment['name']} of archive {directory} is missing or damaged")
+        recorded.add(segment["name"])
+    for name in os.listdir(directory):
+        if name.startswith("segment-") and name not in recorded:
+            os.remove(os.path.join(directory, name))
+    return checkpoint
+
+
+def iter_archive_records(directory: str) -> Iterator[Dict[str, Any]]:
+    """Records of a (complete or partial) archive, in export order."""
+    with open(os.path.join(directory, CHECKPOINT_FILE), encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    for segment in checkpoint["segments"]:
+        with open(os.path.join(directory, segment["name"]), "rb") as raw:
+            with io.TextIOWrapper(_decompressor(raw, checkpoint["compression"]), encoding="utf-8") as lines:
+                for line in lines:
+                    yield json.loads(line)
+
+
+def _write_context(
+    writer: ArchiveWriter,
+    client: RegistryClient,
+    context: str,
+    include_config: bool,
+    include_versions: str,
+):
+    """Write (or continue writing) one context, cutting segments between subjects."""
+    current = writer.current if writer.current and writer.current["context"] == context else None
+    if current is None:
+        record: Dict[str, Any] = {"type": "context", "context": context}
+        if include_config:
+            global_config = client.get_global_config(_context_param(context))
+            if "error" not in global_config:
+                record["global_config"] = global_config
+            global_mode = client.get_mode(_context_param(context))
+            if "error" not in global_mode:
+                record["global_mode"] = global_mode
+        writer.write(record)
+        current = {"context": context, "last_subject": None, "versions_done": 0}
+    writer.current = current
+
+    versions = iter_context_versions(
+        client,
+        context,
+        latest_only=include_versions == "latest",
+        after_subject=current["last_subject"],
+        start_hint=current["versions_done"],
+    )
+    subject = None
+    written = 0
+    for entry in versions:
+        if entry.get("subject") != subject:
+            if subject is not None:
+                current["last_subject"] = subject
+                current["versions_done"] += written
+                written = 0
+                writer.cut_if_full()
+            subject = entry.get("subject")
+            if include_config:
+                config = client.get_subject_config(subject, _context_param(context))
+                if "error" not in config:
+                    writer.write({"type": "subject_config", "context": context, "subject": subject, "config": config})
+        writer.write(_schema_record(context, entry))
+        written += 1
+
+    writer.completed_contexts.append(context)
+    writer.current = None
+
+
+def _finish(directory: str, checkpoint: Dict[str, Any], started: float) -> Dict[str, Any]:
+    """Index the completed archive, write its manifest and mark the checkpoint complete."""
+    index = SnapshotIndex(checkpoint["registry"], checkpoint["scope"], checkpoint["include_config"])
+    digest = hashlib.sha256()
+    counts: Dict[str, Dict[str, int]] = {}
+    for record in iter_archive_records(directory):
+        digest.update(json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n")
+        index.add(record)
+        if record["type"] == "context":
+            counts.setdefault(record["context"], {"subjects": 0, "versions": 0})
+        elif record["type"] == "schema":
+            counts[record["context"]]["versions"] += 1
+    for context, entry in index.contexts.items():
+        counts.setdefault(context, {"versions": 0})["subjects"] = len(entry["subjects"])
+
+    segments = checkpoint["segments"]
+    manifest = {
+        "format": ARCHIVE_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "records_format": NDJSON_FORMAT,
+        "path": directory,
+        "registry": checkpoint["registry"],
+        "scope": checkpoint["scope"],
+        "compression": checkpoint["compression"],
+        "segments": segments,
+        "segment_count": len(segments),
+        "contexts": counts,
+        "context_count": len(counts),
+        "subject_count": sum(entry["subjects"] for entry in counts.values()),
+        "version_count": sum(entry["versions"] for entry in counts.values()),
+        "bytes": sum(segment["bytes"] for segment in segments),
+        "compressed_bytes": sum(segment["compressed_bytes"] for segment in segments),
+        "sha256": digest.hexdigest(),
+        "resumed": checkpoint["resumed"],
+        "exported_at": checkpoint["started_at"],
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+    manifest["index_path"] = os.path.join(directory, INDEX_FILE)
+    _write_json(manifest["index_path"], index.to_dict(export_path=directory, export_sha256=manifest["sha256"]))
+    manifest["manifest_path"] = os.path.join(directory, MANIFEST_FILE)
+    _write_json(manifest["manifest_path"], manifest, indent=2)
+
+    checkpoint["complete"] = True
+    save_checkpoint(directory, checkpoint)
+    return manifest
+
+
+def archive_export(
+    client: RegistryClient,
+    contexts: List[str],
+    output_path: Optional[str] = None,
+    scope: str = "global",
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+    compression: str = "gzip",
+    segment_max_bytes: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Export the given contexts into a resumable archive directory and return its manifest.
+
+    Passing the output_path of an interrupted archive resumes it; a complete archive is returned as is.
+    """
+    started = time.monotonic()
+    directory = resolve_export_path(output_path, client.config.name, scope, suffix=".archive")
+    options = {
+        "registry": client.config.name,
+        "scope": scope,
+        "include_config": include_config,
+        "include_versions": include_versions,
+        "compression": resolve_compression(compression),
+    }
+    checkpoint = _open_checkpoint(directory, options)
+    if checkpoint["complete"]:
+        with open(os.path.join(directory, MANIFEST_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    if checkpoint["segments"]:
+        checkpoint["resumed"] += 1
+        logger.info(f"Resuming export archive {directory} after {len(checkpoint['segments'])} segments")
+
+    writer = ArchiveWriter(
+        directory, checkpoint, segment_max_bytes if segment_max_bytes is not None else EXPORT_SEGMENT_MAX_BYTES
+    )
+    try:
+        if not checkpoint["segments"]:
+            header: Dict[str, Any] = {
+                "type": "header",
+                "format": NDJSON_FORMAT,
+                "format_version": NDJSON_FORMAT_VERSION,
+                "registry": client.config.name,
+                "scope": scope,
+                "include_config": include_config,
+                "include_versions": include_versions,
+            }
+            if include_metadata:
+                header["registry_url"] = client.config.url
+                header["exported_at"] = checkpoint["started_at"]
+            writer.write(header)
+        for context in contexts:
+            if context not in writer.completed_contexts:
+                _write_context(writer, client, context, include_config, include_versions)
+        writer.flush()
+    except Exception as e:
+        writer.abort()
+        raise ArchiveError(f"{e} (resume with output_path={os.path.basename(directory)})") from e
+    return _finish(directory, checkpoint, started)
+
+
+def archive_export_context(
+    client: RegistryClient,
+    context: str,
+    output_path: Optional[str] = None,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+    compression: str = "gzip",
+) -> Dict[str, Any]:
+    """Export one context into a resumable archive."""
+    context = context or DEFAULT_CONTEXT
+    return archive_export(
+        client, [context], output_path, context, include_metadata, include_config, include_versions, compression
+    )
+
+
+def archive_export_global(
+    client: RegistryClient,
+    output_path: Optional[str] = None,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+    compression: str = "gzip",
+) -> Dict[str, Any]:
+    """Export every context of the registry, the default context last, into a resumable archive."""
+    contexts = client.get_contexts()
+    if isinstance(contexts, dict) and "error" in contexts:
+        return contexts
+    contexts = [context for context in contexts if context != DEFAULT_CONTEXT] + [DEFAULT_CONTEXT]
+    return archive_export(
+        client, contexts, output_path, "global", include_metadata, include_config, include_versions, compression
+    )
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Deduplicated Export Module
+
+Content-addressed export format: every distinct schema body is stored once in a
+blob table keyed by its fingerprint, and subject versions reference blobs by key.
+The same schema registered under many subjects (or copied into many contexts)
+costs one blob plus a small {"version", "id", "blob"} record per occurrence, and
+export metadata appears once instead of on every subject and version.
+
+Blob bodies are kept as the registry returns them (schema strings are not parsed
+and re-serialized), so building and serializing the export is cheaper too.
+expand_dedup_export() turns it back into the export_context / export_global shape.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from registry_resilience import get_registry_executor
+from schema_registry_common import RegistryClient, load_context_schemas
+
+DEDUP_FORMAT = "schema-registry-export+dedup"
+DEDUP_FORMAT_VERSION = 1
+DEFAULT_CONTEXT = "."
+EXPORT_VERSION = "1.7.0"
+
+
+def schema_fingerprint(schema_type: str, schema: str, references: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Blob key of a schema body: SHA-256 over its type, text and references."""
+    digest = hashlib.sha256(schema_type.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(schema.encode("utf-8"))
+    if references:
+        digest.update(b"\0")
+        digest.update(json.dumps(references, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return f"sha256:{digest.hexdigest()[:32]}"
+
+
+class BlobTable:
+    """Distinct schema bodies keyed by fingerprint, in first-seen order."""
+
+    def __init__(self):
+        self.blobs: Dict[str, Dict[str, Any]] = {}
+        self.references = 0
+
+    def add(self, entry: Dict[str, Any]) -> str:
+        """Store the entry's schema body (once) and return its blob key."""
+        schema_type = entry.get("schemaType", "AVRO")
+        schema = entry.get("schema", "")
+        if not isinstance(schema, str):
+            schema = json.dumps(schema, separators=(",", ":"))
+        references = entry.get("references") or None
+        key = schema_fingerprint(schema_type, schema, references)
+        if key not in self.blobs:
+            blob: Dict[str, Any] = {"schemaType": schema_type, "schema": schema}
+            if references:
+                blob["references"] = references
+            self.blobs[key] = blob
+        self.references += 1
+        return key
+
+
+def _context_param(context: str) -> Optional[str]:
+    return None if context in (DEFAULT_CONTEXT, "") else context
+
+
+def _dedup_context(
+    client: RegistryClient,
+    context: str,
+    blobs: BlobTable,
+    include_config: bool,
+    include_versions: str,
+) -> Dict[str, Any]:
+    """One context of a dedup export; raises when its subjects cannot be loaded."""
+    loaded = load_context_schemas(client, _context_param(context), latest_only=include_versions == "latest")
+    if "error" in loaded:
+        raise RuntimeError(f"Failed to load context '{context}': {loaded['error']}")
+
+    subjects = [
+        {
+            "subject": subject,
+            "versions": [
+                {"version": entry.get("version"), "id": entry.get("id"), "blob": blobs.add(entry)} for entry in versions
+            ],
+        }
+        for subject, versions in loaded["subjects"].items()
+    ]
+    result: Dict[str, Any] = {"context": context, "subjects": subjects}
+
+    if include_config:
+        configs = get_registry_executor().map(
+            client.config.name,
+            lambda record: client.get_subject_config(record["subject"], _context_param(context)),
+            subjects,
+        )
+        for record, config in zip(subjects, configs):
+            if "error" not in config:
+                record["config"] = config
+
+        global_config = client.get_global_config(_context_param(context))
+        if "error" not in global_config:
+            result["global_config"] = global_config
+        global_mode = client.get_mode(_context_param(context))
+        if "error" not in global_mode:
+            result["global_mode"] = global_mode
+    return result
+
+
+def build_dedup_export(
+    client: RegistryClient,
+    contexts: List[str],
+    scope: str = "global",
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Dedup export of the given contexts ("." is the default context)."""
+    try:
+        blobs = BlobTable()
+        contexts_data = [
+            _dedup_context(client, context, blobs, include_config, include_versions) for context in contexts
+        ]
+        result: Dict[str, Any] = {
+            "format": DEDUP_FORMAT,
+            "format_version": DEDUP_FORMAT_VERSION,
+            "scope": scope,
+            "registry": client.config.name,
+            "include_metadata": include_metadata,
+            "blobs": blobs.blobs,
+            "contexts": contexts_data,
+            "blob_count": len(blobs.blobs),
+            "version_count": blobs.references,
+            "subject_count": sum(len(context["subjects"]) for context in contexts_data),
+        }
+        if include_config and scope == "global":
+            global_config = client.get_global_config()
+            if "error" not in global_config:
+                result["global_config"] = global_config
+            global_mode = client.get_mode()
+            if "error" not in global_mode:
+                result["global_mode"] = global_mode
+        if include_metadata:
+            result["metadata"] = {
+                "exported_at": datetime.now().isoformat(),
+                "registry_url": client.config.url,
+                "export_version": EXPORT_VERSION,
+            }
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def export_context_dedup(
+    client: RegistryClient,
+    context: str,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Dedup export of one context."""
+    context = context or DEFAULT_CONTEXT
+    return build_dedup_export(client, [context], context, include_metadata, include_config, include_versions)
+
+
+def export_global_dedup(
+    client: RegistryClient,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Dedup export of every context of the registry, the default context last."""
+    contexts = client.get_contexts()
+    if isinstance(contexts, dict) and "error" in contexts:
+        return contexts
+    contexts = [context for context in contexts if context != DEFAULT_CONTEXT] + [DEFAULT_CONTEXT]
+    return build_dedup_export(client, contexts, "global", include_metadata, include_config, include_versions)
+
+
+def _expand_version(
+    subject: str, record: Dict[str, Any], blob: Dict[str, Any], registry: str, context: Optional[str], metadata: Dict
+) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "subject": subject,
+        "version": record["version"],
+        "id": record["id"],
+        "schemaType": blob["schemaType"],
+    }
+    try:
+        entry["schema"] = json.loads(blob["schema"])
+    except (json.JSONDecodeError, TypeError):
+        # Protobuf and other non-JSON bodies stay as text, as in export_subject
+        entry["schema"] = blob["schema"]
+    if "references" in blob:
+        entry["references"] = blob["references"]
+    entry["registry"] = registry
+    entry["metadata"] = {**metadata, "context": context}
+    return entry
+
+
+def _expand_context(export: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    name = context["context"]
+    context_param = "" if name == DEFAULT_CONTEXT else name
+    metadata = export.get("metadata", {})
+    version_metadata = {
+        "exported_at": metadata.get("exported_at"),
+        "registry_url": metadata.get("registry_url"),
+        "export_version": EXPORT_VERSION,
+    }
+    subjects = []
+    for record in context["subjects"]:
+        subject = record["subject"]
+        subject_export: Dict[str, Any] = {
+            "subject": subject,
+            "versions": [
+                _expand_version(
+                    subject,
+                    version,
+                    export["blobs"][version["blob"]],
+                    export["registry"],
+                    context_param,
+                    version_metadata,
+                )
+                for version in record["versions"]
+            ],
+        }
+        if export.get("include_metadata"):
+            subject_export["metadata"] = {**version_metadata, "context": context_param}
+        if "config" in record:
+            subject_export["config"] = record["config"]
+        subjects.append(subject_export)
+
+    result: Dict[str, Any] = {"context": context_param, "subjects": subjects}
+    for key in ("global_config", "global_mode"):
+        if key in context:
+            result[key] = context[key]
+    if metadata:
+        result["metadata"] = metadata
+    return result
+
+
+def expand_dedup_export(export: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the export_context (context scope) or export_global (global scope) shape from a dedup export."""
+    if export.get("format") != DEDUP_FORMAT:
+        raise ValueError(f"Not a {DEDUP_FORMAT} export")
+    contexts = [_expand_context(export, context) for context in export["contexts"]]
+    if export["scope"] != "global":
+        return contexts[0]
+
+    result: Dict[str, Any] = {
+        "contexts": [context for context in contexts if context["context"] != ""],
+        "default_context": next((context for context in contexts if context["context"] == ""), None),
+    }
+    for key in ("global_config", "global_mode", "metadata"):
+        if key in export:
+            result[key] = export[key]
+    return result
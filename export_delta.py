@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Differential Export Module
+
+Incremental NDJSON exports against the index of an earlier export (export_stream
+writes one next to every export). Only what changed since then is fetched and
+written:
+
+- schema: subject versions that are not in the base (same record as a full export)
+- delete: subject versions in the base that the registry no longer has
+- subject_config: subject configs that changed ("config": null when removed)
+- context: one per context, carrying global_config / global_mode only when they changed
+
+Subject versions are immutable, so new and deleted entries are found by comparing
+(subject, version) pairs and their schema IDs: a subject hard-deleted and registered
+again restarts at version 1, and its reused versions are written as a delete followed
+by a schema record. Only new versions have their schema bodies fetched (the bulk
+listing already carries them and their IDs; without it, one version per subject is
+fetched to check its ID). Each delta writes an index of the resulting registry
+state, so deltas chain: the next delta can use it as its base.
+apply_delta() merges a delta onto its base export into a new full export.
+"""
+
+import copy
+import json
+import time
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from export_stream import (
+    DEFAULT_CONTEXT,
+    NDJSON_FORMAT,
+    NDJSON_FORMAT_VERSION,
+    NdjsonExportWriter,
+    SnapshotIndex,
+    _schema_record,
+    resolve_export_path,
+    write_index,
+    write_manifest,
+)
+from registry_resilience import get_registry_executor
+from schema_registry_common import RegistryClient, load_context_schemas
+
+NDJSON_DELTA_FORMAT = "schema-registry-export+ndjson-delta"
+
+
+def _context_param(context: str) -> Optional[str]:
+    return None if context == DEFAULT_CONTEXT else context
+
+
+def _fetch_new_versions(
+    client: RegistryClient, context: str, subject: str, entries: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Schema bodies of new versions; entries from the bulk listing already have them."""
+    if all("schema" in entry for entry in entries):
+        return entries
+
+    def fetch(entry: Dict[str, Any]) -> Dict[str, Any]:
+        if "schema" in entry:
+            return entry
+        schema = client.get_schema(subject, str(entry["version"]), _context_param(context))
+        if "error" in schema:
+            raise RuntimeError(f"Failed to get {subject} version {entry['version']}: {schema['error']}")
+        return {**schema, "subject": subject}
+
+    return get_registry_executor().map(client.config.name, fetch, entries)
+
+
+def _reused_versions(
+    client: RegistryClient, context: str, subjects: Dict[str, Tuple[List[Dict[str, Any]], Dict[int, int]]]
+) -> Dict[str, Set[int]]:
+    """Versions listed under the base's numbers that now hold other schema IDs, per subject.
+
+    `subjects` maps each subject to its current entries and its base {version: schema ID}.
+    Entries without an ID (crawled listings) get the newest version both sides share fetched;
+    if its ID changed the subject was registered again and every shared version is reused.
+    """
+    reused: Dict[str, Set[int]] = {}
+    to_check: List[Tuple[str, int]] = []
+    for subject, (entries, base_ids) in subjects.items():
+        shared = [entry for entry in entries if entry.get("version") in base_ids]
+        if all("id" in entry for entry in shared):
+            changed = {entry["version"] for entry in shared if entry["id"] != base_ids[entry["version"]]}
+            if changed:
+                reused[subject] = changed
+        elif shared:
+            to_check.append((subject, max(entry["version"] for entry in shared)))
+
+    def check(item: Tuple[str, int]) -> Dict[str, Any]:
+        subject, version = item
+        schema = client.get_schema(subject, str(version), _context_param(context))
+        if "error" in schema:
+            raise RuntimeError(f"Failed to get {subject} version {version}: {schema['error']}")
+        return schema
+
+    for (subject, version), schema in zip(to_check, get_registry_executor().map(client.config.name, check, to_check)):
+        entries, base_ids = subjects[subject]
+        if schema["id"] != base_ids[version]:
+            reused[subject] = {entry["version"] for entry in entries if entry.get("version") in base_ids}
+            # Keep the fetched body so it is not requested again
+            entries[:] = [
+                {**schema, "subject": subject} if entry.get("version") == version else entry for entry in entries
+            ]
+    return reused
+
+
+def _write_context_delta(
+    writer: NdjsonExportWriter,
+    client: RegistryClient,
+    context: str,
+    base: Dict[str, Any],
+    include_config: bool,
+) -> Dict[str, int]:
+    """Compare one context with its base entry and write the differences."""
+    loaded = load_context_schemas(client, _context_param(context), include_schemas=False)
+    if "error" in loaded:
+        raise RuntimeError(f"Failed to load context '{context}': {loaded['error']}")
+    current: Dict[str, List[Dict[str, Any]]] = loaded["subjects"]
+    base_subjects: Dict[str, Any] = base.get("subjects", {})
+
+    record: Dict[str, Any] = {"type": "context", "context": context}
+    configs: List[Dict[str, Any]] = []
+    if include_config:
+        for key, fetch in (("global_config", client.get_global_config), ("global_mode", client.get_mode)):
+            value = fetch(_context_param(context))
+            if "error" not in value and value != base.get(key):
+                record[key] = value
+        configs = get_registry_executor().map(
+            client.config.name, lambda subject: client.get_subject_config(subject, _context_param(context)), current
+        )
+    writer.write(record)
+
+    base_ids = {
+        subject: {version[0]: version[1] for version in base_subjects.get(subject, {}).get("versions", [])}
+        for subject in current
+    }
+    reused = _reused_versions(client, context, {subject: (current[subject], base_ids[subject]) for subject in current})
+
+    counts = {"added": 0, "deleted": 0, "configs_changed": 0}
+    for position, (subject, entries) in enumerate(current.items()):
+        base_subject = base_subjects.get(subject, {})
+        replaced = reused.get(subject, set())
+        known = set(base_ids[subject]) - replaced
+
+        # A reused version's old entry goes first so the index drops it before the new one is added
+        for version in sorted(replaced):
+            writer.write({"type": "delete", "context": context, "subject": subject, "version": version})
+            counts["deleted"] += 1
+
+        if include_config:
+            config = configs[position] if "error" not in configs[position] else None
+            # Deleting every version dropped the subject and its config from the index
+            base_config = base_subject.get("config") if known or not replaced else None
+            if config != base_config:
+                writer.write({"type": "subject_config", "context": context, "subject": subject, "config": config})
+                counts["configs_changed"] += 1
+
+        new_entries = [entry for entry in entries if entry.get("version") not in known]
+        for entry in _fetch_new_versions(client, context, subject, new_entries):
+            writer.write(_schema_record(context, {**entry, "subject": subject}))
+            counts["added"] += 1
+
+        versions = {entry.get("version") for entry in entries}
+        for version in sorted(known - versions):
+            writer.write({"type": "delete", "context": context, "subject": subject, "version": version})
+            counts["deleted"] += 1
+
+    for subject, base_subject in base_subjects.items():
+        if subject not in current:
+            for version in base_subject.get("versions", []):
+                writer.write({"type": "delete", "context": context, "subject": subject, "version": version[0]})
+                counts["deleted"] += 1
+    return counts
+
+
+def stream_export_delta(
+    client: RegistryClient,
+    base_index: str,
+    output_path: Optional[str] = None,
+    include_metadata: bool = True,
+) -> Dict[str, Any]:
+    """Write the changes since the export indexed by `base_index` (a path inside EXPORT_DIR) and return the
+    delta's manifest. Covers the same scope (one context or the whole registry) and options as the base."""
+    started = time.monotonic()
+    base = SnapshotIndex.load(resolve_export_path(base_index, client.config.name, "base"))
+    if base.registry != client.config.name:
+        return {"error": f"Base export is of registry '{base.registry}', not '{client.config.name}'"}
+    # The writer updates `base` as delta records go out; compare against the state before the delta
+    base_contexts = copy.deepcopy(base.contexts)
+
+    if base.scope == "global":
+        contexts = client.get_contexts()
+        if isinstance(contexts, dict) and "error" in contexts:
+            return contexts
+        contexts = [context for context in contexts if context != DEFAULT_CONTEXT]
+        contexts += [context for context in base_contexts if context not in contexts and context != DEFAULT_CONTEXT]
+        contexts.append(DEFAULT_CONTEXT)
+    else:
+        contexts = [base.scope]
+
+    path = resolve_export_path(output_path, client.config.name, f"{base.scope}-delta")
+    header: Dict[str, Any] = {
+        "type": "header",
+        "format": NDJSON_DELTA_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "registry": client.config.name,
+        "scope": base.scope,
+        "include_config": base.include_config,
+        "base_index": base_index,
+    }
+    if include_metadata:
+        header["registry_url"] = client.config.url
+        header["exported_at"] = datetime.now().isoformat()
+
+    context_counts: Dict[str, Dict[str, int]] = {}
+    with NdjsonExportWriter(path, base) as writer:
+        writer.write(header)
+        for context in contexts:
+            context_counts[context] = _write_context_delta(
+                writer, client, context, base_contexts.get(context, {}), base.include_config
+            )
+
+    manifest = {
+        "format": NDJSON_DELTA_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "path": path,
+        "registry": client.config.name,
+        "scope": base.scope,
+        "base_index": base_index,
+        "contexts": context_counts,
+        "added_count": sum(counts["added"] for counts in context_counts.values()),
+        "deleted_count": sum(counts["deleted"] for counts in context_counts.values()),
+        "configs_changed_count": sum(counts["configs_changed"] for counts in context_counts.values()),
+        "records": writer.records,
+        "bytes": writer.bytes,
+        "sha256": writer.sha256,
+        "exported_at": header.get("exported_at", datetime.now().isoformat()),
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+    manifest["index_path"] = write_index(path, writer)
+    manifest["manifest_path"] = write_manifest(path, manifest)
+    return manifest
+
+
+class _DeltaApplier:
+    """Merges delta records into a base export read record by record."""
+
+    def __init__(self, writer: NdjsonExportWriter, delta: Iterator[Dict[str, Any]]):
+        self.writer = writer
+        self.delta_header: Dict[str, Any] = {}
+        self.context_changes: Dict[str, Dict[str, Any]] = {}
+        self.configs: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self.added: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.deleted: Set[Tuple[str, str, Any]] = set()
+        # Subjects of each context, in delta order, so new subjects can follow the base ones
+        self.delta_subjects: Dict[str, List[str]] = {}
+        for record in delta:
+            kind, context = record["type"], record.get("context")
+            if kind == "header":
+                self.delta_header = record
+            elif kind == "context":
+                self.context_changes[context] = record
+            else:
+                key = (context, record["subject"])
+                subjects = self.delta_subjects.setdefault(context, [])
+                if record["subject"] not in subjects:
+                    subjects.append(record["subject"])
+                if kind == "subject_config":
+                    self.configs[key] = record["config"]
+                elif kind == "schema":
+                    self.added.setdefault(key, []).append(record)
+                elif kind == "delete":
+                    self.deleted.add((context, record["subject"], record["version"]))
+
+        self.context: Optional[str] = None
+        self.subject: Optional[Tuple[str, str]] = None
+        self.pending_config: Optional[Dict[str, Any]] = None
+        self.seen_contexts: Set[str] = set()
+        self.seen_subjects: Set[Tuple[str, str]] = set()
+
+    def _write_schema(self, record: Dict[str, Any]):
+        # A subject's config is only written once one of its versions survives
+        if self.pending_config is not None:
+            self.writer.write(self.pending_config)
+            self.pending_config = None
+        self.writer.write(record)
+
+    def _start_subject(self, context: str, subject: str, config_record: Optional[Dict[str, Any]] = None):
+        key = (context, subject)
+        if self.subject == key:
+            return
+        self._finish_subject()
+        self.subject = key
+        self.seen_subjects.add(key)
+        if key in self.configs:
+            config = self.configs[key]
+            config_record = (
+                {"type": "subject_config", "context": context, "subject": subject, "config": config}
+                if config is not None
+                else None
+            )
+        self.pending_config = config_record
+
+    def _finish_subject(self):
+        if self.subject is not None:
+            for record in self.added.get(self.subject, []):
+                self._write_schema(record)
+        self.subject = None
+        self.pending_config = None
+
+    def _start_context(self, record: Dict[str, Any]):
+        self._finish_context()
+        self.context = record["context"]
+        self.seen_contexts.add(self.context)
+        changes = self.context_changes.get(self.context, {})
+        self.writer.write({**record, **changes})
+
+    def _finish_context(self):
+        self._finish_subject()
+        if self.context is not None:
+            for subject in self.delta_subjects.get(self.context, []):
+                if (self.context, subject) not in self.seen_subjects:
+                    self._start_subject(self.context, subject)
+                    self._finish_subject()
+        self.context = None
+
+    def apply(self, base: Iterator[Dict[str, Any]]):
+        for record in base:
+            kind = record["type"]
+            if kind == "header":
+                header = dict(record)
+                if "exported_at" in self.delta_header:
+                    header["exported_at"] = self.delta_header["exported_at"]
+                self.writer.write(header)
+            elif kind == "context":
+                self._start_context(record)
+            elif kind == "subject_config":
+                self._start_subject(record["context"], record["subject"], record)
+            elif kind == "schema":
+                self._start_subject(record["context"], record["subject"])
+                if (record["context"], record["subject"], record["version"]) not in self.deleted:
+                    self._write_schema(record)
+        self._finish_context()
+
+        # Contexts created since the base export
+        for context, record in self.context_changes.items():
+            if context not in self.seen_contexts:
+                self._start_context(record)
+        self._finish_context()
+
+
+def _read_records(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def apply_delta(base_path: str, delta_path: str, output_path: str) -> Dict[str, Any]:
+    """Merge a delta onto its base NDJSON export into a new full export (paths inside EXPORT_DIR).
+
+    Only the delta is held in memory; the base is streamed. Returns the new export's manifest.
+    """
+    base_path = resolve_export_path(base_path, "", "base")
+    delta_path = resolve_export_path(delta_path, "", "delta")
+    path = resolve_export_path(output_path, "", "applied")
+
+    base_records = _read_records(base_path)
+    header = next(base_records)
+    if header.get("format") != NDJSON_FORMAT:
+        raise ValueError(f"Not a {NDJSON_FORMAT} export: {base_path}")
+    delta_records = _read_records(delta_path)
+    delta_header = next(delta_records)
+    if delta_header.get("format") != NDJSON_DELTA_FORMAT:
+        raise ValueError(f"Not a {NDJSON_DELTA_FORMAT} file: {delta_path}")
+
+    index = SnapshotIndex(header["registry"], header["scope"], header["include_config"])
+    with NdjsonExportWriter(path, index) as writer:
+        applier = _DeltaApplier(writer, chain([delta_header], delta_records))
+        applier.apply(chain([header], base_records))
+
+    manifest = {
+        "format": NDJSON_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "path": path,
+        "registry": header["registry"],
+        "scope": header["scope"],
+        "base_path": base_path,
+        "delta_path": delta_path,
+        "records": writer.records,
+        "version_count": writer.records.get("schema", 0),
+        "bytes": writer.bytes,
+        "sha256": writer.sha256,
+    }
+    manifest["index_path"] = write_index(path, writer)
+    manifest["manifest_path"] = write_manifest(path, manifest)
+    return manifest
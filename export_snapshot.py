@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Snapshot Export Module
+
+Builds the offline snapshot (registry_snapshot.py) a registry serves reads from
+when REGISTRY_SNAPSHOT_PATH (or SCHEMA_REGISTRY_SNAPSHOT_X) is set:
+
+- from an export: an NDJSON file or an export archive directory under EXPORT_DIR
+  (deltas must be merged with apply_delta() first)
+- from a live sync: every context's versions are read from the registry, from
+  the bulk GET /schemas listing a page at a time or subject by subject, through
+  a separate client so the snapshot being replaced is not read back
+
+The new file replaces the old one and the registry client switches to it. After
+a live sync, subjects written through the server before the sync started are
+served from the snapshot again; an export may predate those writes, so after
+building from one they keep going to the registry.
+"""
+
+import json
+import os
+import time
+from dataclasses import replace
+from typing import Any, Dict, Iterator, List, Optional
+
+from export_archive import iter_archive_records
+from export_stream import (
+    DEFAULT_CONTEXT,
+    NDJSON_FORMAT,
+    _schema_record,
+    iter_context_versions,
+    resolve_export_path,
+)
+from registry_snapshot import SnapshotWriter
+from schema_registry_common import RegistryClient
+
+
+def iter_export_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Records of an NDJSON export file or export archive directory; raises ValueError for anything else."""
+    if os.path.isdir(path):
+        records = iter_archive_records(path)
+    else:
+        records = _iter_ndjson(path)
+    header = next(records, None)
+    if header is None or header.get("type") != "header" or header.get("format") != NDJSON_FORMAT:
+        found = header.get("format") if isinstance(header, dict) else None
+        hint = " (merge deltas with apply_delta() first)" if found and found != NDJSON_FORMAT else ""
+        raise ValueError(f"Not a {NDJSON_FORMAT} export: {path}{hint}")
+    yield header
+    yield from records
+
+
+def _iter_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _iter_live_records(client: RegistryClient, contexts: List[str]) -> Iterator[Dict[str, Any]]:
+    for context in contexts:
+        yield {"type": "context", "context": context}
+        for entry in iter_context_versions(client, context):
+            yield _schema_record(context, entry)
+
+
+def build_registry_snapshot(client: RegistryClient, source: Optional[str] = None) -> Dict[str, Any]:
+    """Rebuild the registry's offline snapshot from an export under EXPORT_DIR, or from the registry itself.
+
+    Returns the snapshot's metadata (path, counts, bytes, source).
+    """
+    snapshot = client.snapshot
+    if snapshot is None:
+        return {
+            "error": f"No snapshot configured for registry '{client.config.name}' "
+            "(set REGISTRY_SNAPSHOT_PATH or SCHEMA_REGISTRY_SNAPSHOT_X)"
+        }
+
+    started = time.monotonic()
+    synced_through = None
+    live_client = None
+    if source:
+        path = resolve_export_path(source, client.config.name, "snapshot")
+        if not os.path.exists(path):
+            return {"error": f"Export not found: {source}"}
+        records = iter_export_records(path)
+        label = f"export:{os.path.basename(path)}"
+    else:
+        synced_through = snapshot.write_sequence
+        live_client = RegistryClient(replace(client.config, snapshot_path=""))
+        contexts = live_client.get_contexts()
+        if isinstance(contexts, dict) and "error" in contexts:
+            live_client.close()
+            return contexts
+        contexts = [context for context in contexts if context != DEFAULT_CONTEXT] + [DEFAULT_CONTEXT]
+        records = _iter_live_records(live_client, contexts)
+        label = f"registry:{client.config.url}"
+
+    try:
+        with SnapshotWriter(snapshot.path, client.config.name, label) as writer:
+            for record in records:
+                writer.write(record)
+            result = writer.close()
+    except (OSError, ValueError) as e:
+        return {"error": str(e)}
+    finally:
+        if live_client is not None:
+            live_client.close()
+
+    if not snapshot.reload(synced_through):
+        return {"error": f"Snapshot {snapshot.path} was written but could not be opened"}
+    result["registry"] = client.config.name
+    result["duration_seconds"] = round(time.monotonic() - started, 3)
+    return result
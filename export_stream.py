@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Module
+
+Writes context and global exports to NDJSON files instead of building them in
+memory. Each line is one JSON record:
+
+- header: export format, registry and export options (always the first line)
+- context: start of a context, with its global config and mode when requested
+- subject_config: a subject's compatibility config, before its first version
+- schema: one subject version (subject, version, id, schemaType, schema, references)
+
+Versions are read from the paged bulk GET /schemas listing one page at a time
+(or subject by subject on registries without it) and written as they arrive,
+so memory stays constant however large the registry is. The file is written
+under a temporary name with a running SHA-256 and moved into place when
+complete; the caller only gets a small manifest (path, counts, checksum), which
+is also written next to the export together with an index of every subject
+version (schema ID and fingerprint) and config, the base for differential exports.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from export_dedup import schema_fingerprint
+from schema_registry_common import RegistryClient, iter_schemas_bulk
+
+# Streaming Export Configuration
+# Directory NDJSON exports are written to; output paths given to the tools must stay inside it
+EXPORT_DIR = os.getenv("EXPORT_DIR", os.path.join(tempfile.gettempdir(), "schema-registry-exports"))
+
+NDJSON_FORMAT = "schema-registry-export+ndjson"
+NDJSON_FORMAT_VERSION = 1
+INDEX_FORMAT = "schema-registry-export+index"
+DEFAULT_CONTEXT = "."
+MANIFEST_SUFFIX = ".manifest.json"
+INDEX_SUFFIX = ".index.json"
+
+
+class ExportPathError(ValueError):
+    """An export output path that is not a file inside EXPORT_DIR."""
+
+
+def resolve_export_path(output_path: Optional[str], registry: str, scope: str, suffix: str = ".ndjson") -> str:
+    """Absolute path of an export file inside EXPORT_DIR; a timestamped name is chosen when none is given."""
+    export_dir = os.path.realpath(EXPORT_DIR)
+    if not output_path:
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        safe_scope = "".join(c if c.isalnum() or c in "-_" else "_" for c in scope) or "default"
+        output_path = f"{registry}-{safe_scope}-{stamp}{suffix}"
+    path = os.path.realpath(os.path.join(export_dir, output_path))
+    if os.path.commonpath([export_dir, path]) != export_dir or path == export_dir:
+        raise ExportPathError(f"Export path must be a file inside {export_dir}: {output_path}")
+    return path
+
+
+def record_fingerprint(record: Dict[str, Any]) -> str:
+    """Blob fingerprint of a schema record, as used by the dedup format."""
+    schema = record.get("schema") or ""
+    if not isinstance(schema, str):
+        schema = json.dumps(schema, separators=(",", ":"))
+    return schema_fingerprint(record.get("schemaType", "AVRO"), schema, record.get("references"))
+
+
+class SnapshotIndex:
+    """Registry state recorded by an export: per context its config and mode, and per subject its
+    config and [version, schema ID, fingerprint] list. Applying delta records updates it in place."""
+
+    def __init__(self, registry: str, scope: str, include_config: bool, contexts: Optional[Dict[str, Any]] = None):
+        self.registry = registry
+        self.scope = scope
+        self.include_config = include_config
+        self.contexts: Dict[str, Dict[str, Any]] = contexts if contexts is not None else {}
+
+    def context(self, context: str) -> Dict[str, Any]:
+        return self.contexts.setdefault(context, {"subjects": {}})
+
+    def subject(self, context: str, subject: str) -> Dict[str, Any]:
+        return self.context(context)["subjects"].setdefault(subject, {"versions": []})
+
+    def add(self, record: Dict[str, Any]):
+        """Apply one export or delta record."""
+        kind = record["type"]
+        if kind == "context":
+            entry = self.context(record["context"])
+            for key in ("global_config", "global_mode"):
+                if key in record:
+                    entry[key] = record[key]
+        elif kind == "subject_config":
+            if record["config"] is not None:
+                self.subject(record["context"], record["subject"])["config"] = record["config"]
+            else:
+                self.context(record["context"])["subjects"].get(record["subject"], {}).pop("config", None)
+        elif kind == "schema":
+            self.subject(record["context"], record["subject"])["versions"].append(
+                [record["version"], record["id"], record_fingerprint(record)]
+            )
+        elif kind == "delete":
+            subjects = self.context(record["context"])["subjects"]
+            subject = subjects.get(record["subject"])
+            if subject is not None:
+                subject["versions"] = [v for v in subject["versions"] if v[0] != record["version"]]
+                if not subject["versions"]:
+                    del subjects[record["subject"]]
+
+    def to_dict(self, **extra) -> Dict[str, Any]:
+        return {
+            "format": INDEX_FORMAT,
+            "format_version": NDJSON_FORMAT_VERSION,
+            "registry": self.registry,
+            "scope": self.scope,
+            "include_config": self.include_config,
+            **extra,
+            "contexts": self.contexts,
+        }
+
+    @classmethod
+    def load(cls, path: str) -> "SnapshotIndex":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Not an export index: {path}")
+        return cls(data["registry"], data["scope"], data["include_config"], data["contexts"])
+
+
+class NdjsonExportWriter:
+    """Append-only NDJSON file with running record counts and SHA-256, published atomically on close.
+
+    Every record written is also applied to `index` when one is given.
+    """
+
+    def __init__(self, path: str, index: Optional[SnapshotIndex] = None):
+        self.path = path
+        self.index = index
+        self.partial_path = f"{path}.part"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(self.partial_path, "wb")
+        self._sha256 = hashlib.sha256()
+        self.bytes = 0
+        self.records: Dict[str, int] = {}
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+        self._file.write(line)
+        self._sha256.update(line)
+        self.bytes += len(line)
+        self.records[record["type"]] = self.records.get(record["type"], 0) + 1
+        if self.index is not None:
+            self.index.add(record)
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def close(self):
+        """Flush the file to disk and move it to its final path."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+
+    def abort(self):
+        """Drop the partial file."""
+        self._file.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "NdjsonExportWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _context_param(context: str) -> Optional[str]:
+    return None if context == DEFAULT_CONTEXT else context
+
+
+def iter_context_versions(
+    client: RegistryClient,
+    context: str,
+    latest_only: bool = False,
+    after_subject: Optional[str] = None,
+    start_hint: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Every subject version of a context, in subject order, without holding more than one page or subject.
+
+    A resumed export skips the subjects it already has: every subject up to and including `after_subject`.
+    With the bulk listing, paging starts at the last entry already written (`start_hint` entries were) when
+    that entry still belongs to a written subject, and from the start of the listing otherwise.
+    """
+
+    def remaining(entries: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        return (entry for entry in entries if after_subject is None or entry.get("subject") > after_subject)
+
+    start = max(start_hint - 1, 0) if after_subject is not None else 0
+    pages = iter_schemas_bulk(client, _context_param(context), latest_only=latest_only, start=start)
+    if pages is not None:
+        first = next(pages, [])
+        if start and (not first or first[0].get("subject") > after_subject):
+            # Entries ahead of the hint were removed since the last run, so it may point past unwritten ones
+            pages = iter_schemas_bulk(client, _context_param(context), latest_only=latest_only) or iter(())
+            first = []
+        yield from remaining(iter(first))
+        for page in pages:
+            yield from remaining(iter(page))
+        return
+
+    # Registries without GET /schemas: one subject at a time
+    for subject in client.get_subjects(_context_param(context)):
+        if after_subject is not None and subject <= after_subject:
+            continue
+        if latest_only:
+            versions: List[Any] = ["latest"]
+        else:
+            versions = client.get_schema_versions(subject, _context_param(context))
+            if isinstance(versions, dict):
+                continue
+        for version in versions:
+            entry = client.get_schema(subject, str(version), _context_param(context))
+            if "error" not in entry:
+                yield {**entry, "subject": subject}
+
+
+def _schema_record(context: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    record = {
+        "type": "schema",
+        "context": context,
+        "subject": entry.get("subject"),
+        "version": entry.get("version"),
+        "id": entry.get("id"),
+        "schemaType": entry.get("schemaType", "AVRO"),
+        "schema": entry.get("schema"),
+    }
+    if entry.get("references"):
+        record["references"] = entry["references"]
+    return record
+
+
+def write_context(
+    writer: NdjsonExportWriter,
+    client: RegistryClient,
+    context: str,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, int]:
+    """Write one context's records; returns its subject and version counts."""
+    record: Dict[str, Any] = {"type": "context", "context": context}
+    if include_config:
+        global_config = client.get_global_config(_context_param(context))
+        if "error" not in global_config:
+            record["global_config"] = global_config
+        global_mode = client.get_mode(_context_param(context))
+        if "error" not in global_mode:
+            record["global_mode"] = global_mode
+    writer.write(record)
+
+    subjects = versions = 0
+    last_subject = None
+    for entry in iter_context_versions(client, context, latest_only=include_versions == "latest"):
+        subject = entry.get("subject")
+        if subject != last_subject:
+            last_subject = subject
+            subjects += 1
+            if include_config:
+                config = client.get_subject_config(subject, _context_param(context))
+                if "error" not in config:
+                    writer.write({"type": "subject_config", "context": context, "subject": subject, "config": config})
+        writer.write(_schema_record(context, entry))
+        versions += 1
+    return {"subjects": subjects, "versions": versions}
+
+
+def stream_export(
+    client: RegistryClient,
+    contexts: List[str],
+    output_path: Optional[str] = None,
+    scope: str = "global",
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Stream the given contexts ("." is the default context) to an NDJSON file and return its manifest."""
+    started = time.monotonic()
+    path = resolve_export_path(output_path, client.config.name, scope)
+
+    header: Dict[str, Any] = {
+        "type": "header",
+        "format": NDJSON_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "registry": client.config.name,
+        "scope": scope,
+        "include_config": include_config,
+        "include_versions": include_versions,
+    }
+    if include_metadata:
+        header["registry_url"] = client.config.url
+        header["exported_at"] = datetime.now().isoformat()
+
+    context_counts: Dict[str, Dict[str, int]] = {}
+    index = SnapshotIndex(client.config.name, scope, include_config)
+    with NdjsonExportWriter(path, index) as writer:
+        writer.write(header)
+        for context in contexts:
+            context_counts[context] = write_context(writer, client, context, include_config, include_versions)
+
+    manifest = {
+        "format": NDJSON_FORMAT,
+        "format_version": NDJSON_FORMAT_VERSION,
+        "path": path,
+        "registry": client.config.name,
+        "scope": scope,
+        "contexts": context_counts,
+        "context_count": len(context_counts),
+        "subject_count": sum(counts["subjects"] for counts in context_counts.values()),
+        "version_count": sum(counts["versions"] for counts in context_counts.values()),
+        "records": writer.records,
+        "bytes": writer.bytes,
+        "sha256": writer.sha256,
+        "exported_at": header.get("exported_at", datetime.now().isoformat()),
+        "duration_seconds": round(time.monotonic() - started, 3),
+    }
+    manifest["index_path"] = write_index(path, writer)
+    manifest["manifest_path"] = write_manifest(path, manifest)
+    return manifest
+
+
+def _write_json(path: str, data: Dict[str, Any], indent: Optional[int] = None):
+    with open(f"{path}.part", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(f"{path}.part", path)
+
+
+def write_manifest(path: str, manifest: Dict[str, Any]) -> str:
+    """Write the manifest next to its export file and return the manifest's path."""
+    manifest_path = f"{path}{MANIFEST_SUFFIX}"
+    _write_json(manifest_path, manifest, indent=2)
+    return manifest_path
+
+
+def write_index(path: str, writer: NdjsonExportWriter) -> str:
+    """Write the writer's index next to its export file and return the index's path."""
+    index_path = f"{path}{INDEX_SUFFIX}"
+    _write_json(index_path, writer.index.to_dict(export_path=path, export_sha256=writer.sha256))
+    return index_path
+
+
+def stream_export_context(
+    client: RegistryClient,
+    context: str,
+    output_path: Optional[str] = None,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Stream one context to an NDJSON file and return its manifest."""
+    context = context or DEFAULT_CONTEXT
+    return stream_export(client, [context], output_path, context, include_metadata, include_config, include_versions)
+
+
+def stream_export_global(
+    client: RegistryClient,
+    output_path: Optional[str] = None,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Stream every context of the registry, the default context last, to an NDJSON file."""
+    contexts = client.get_contexts()
+    if isinstance(contexts, dict) and "error" in contexts:
+        return contexts
+    contexts = [context for context in contexts if context != DEFAULT_CONTEXT] + [DEFAULT_CONTEXT]
+    return stream_export(client, contexts, output_path, "global", include_metadata, include_config, include_versions)
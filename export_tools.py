@@ -9,15 +9,24 @@ Provides schema, subject, context, and global export functionality
 with JSON Schema validation, type-safe responses, and HATEOAS navigation links.
 """
 
+import asyncio
 import json
+import math
 from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
+from export_archive import archive_export_context, archive_export_global
+from export_dedup import export_context_dedup, export_global_dedup
+from export_delta import stream_export_delta
+from export_snapshot import build_registry_snapshot
+from export_stream import ExportPathError, stream_export_context, stream_export_global
+from registry_resilience import get_registry_executor
 from resource_linking import add_links_to_response
-from schema_registry_common import export_context as common_export_context
+from schema_registry_common import build_subject_export
+from schema_registry_common import export_context_async as common_export_context_async
 from schema_registry_common import export_global as common_export_global
 from schema_registry_common import export_schema as common_export_schema
 from schema_registry_common import export_subject as common_export_subject
-from schema_registry_common import get_default_client
+from schema_registry_common import gather_limited, get_default_client, load_context_schemas_async
 from schema_validation import (
     create_error_response,
     structured_output,
@@ -26,6 +35,9 @@ from schema_validation import (
 if TYPE_CHECKING:
     from fastmcp.server.context import Context
 
+# Context exports report progress about this many times, however many subjects there are
+EXPORT_PROGRESS_STEPS = 20
+
 
 def _get_registry_name_for_linking(registry_mode: str, client=None, registry: Optional[str] = None) -> str:
     """Helper function to get registry name for linking."""
@@ -39,6 +51,45 @@ def _get_registry_name_for_linking(registry_mode: str, client=None, registry: Op
         return "unknown"
 
 
+async def _export_on_executor(
+    registry_manager,
+    registry_mode: str,
+    registry: Optional[str],
+    export_fn,
+    *args,
+    mcp_context: Optional["Context"] = None,
+) -> Dict[str, Any]:
+    """Run an ndjson, archive, dedup or snapshot export function on the shared registry executor and return its result."""
+    client = (
+        get_default_client(registry_manager) if registry_mode == "single" else registry_manager.get_registry(registry)
+    )
+    if client is None:
+        return create_error_response(
+            "No registry configured or registry not found",
+            error_code="REGISTRY_NOT_CONFIGURED",
+            registry_mode=registry_mode,
+        )
+
+    if mcp_context:
+        await mcp_context.info(f"Exporting from registry: {client.config.name}")
+        await mcp_context.report_progress(5.0, 100.0, f"Running {export_fn.__name__}")
+
+    try:
+        future = get_registry_executor().submit(client.config.name, export_fn, client, *args)
+        result = await asyncio.wrap_future(future)
+    except ExportPathError as e:
+        return create_error_response(str(e), error_code="INVALID_EXPORT_PATH", registry_mode=registry_mode)
+    if "error" in result:
+        return create_error_response(result["error"], error_code="EXPORT_FAILED", registry_mode=registry_mode)
+
+    result["registry_mode"] = registry_mode
+    result["mcp_protocol_version"] = "2025-11-25"
+    if mcp_context:
+        await mcp_context.info(f"Export written to {result['path']}" if "path" in result else "Export completed")
+        await mcp_context.report_progress(100.0, 100.0, "Export completed")
+    return result
+
+
 @structured_output("export_schema", fallback_on_error=True)
 def export_schema_tool(
     subject: str,
@@ -156,24 +207,33 @@ def export_subject_tool(
             )
 
         result = common_export_subject(client, subject, context, include_metadata, include_config, include_versions)
+        return _finalize_subject_export(result, subject, registry_mode, client, registry, context)
+    except Exception as e:
+        return create_error_response(str(e), error_code="SUBJECT_EXPORT_FAILED", registry_mode=registry_mode)
 
-        # Add structured output metadata
-        result["registry_mode"] = registry_mode
-        result["mcp_protocol_version"] = "2025-11-25"
 
-        # Ensure required fields for export subject
-        if "subject" not in result:
-            result["subject"] = subject
-        if "versions" not in result:
-            result["versions"] = []
+def _finalize_subject_export(
+    result: Dict[str, Any],
+    subject: str,
+    registry_mode: str,
+    client,
+    registry: Optional[str],
+    context: Optional[str],
+) -> Dict[str, Any]:
+    """Add structured output metadata, required fields and resource links to a subject export."""
+    # Add structured output metadata
+    result["registry_mode"] = registry_mode
+    result["mcp_protocol_version"] = "2025-11-25"
 
-        # Add resource links
-        registry_name = _get_registry_name_for_linking(registry_mode, client, registry)
-        result = add_links_to_response(result, "subject", registry_name, subject=subject, context=context)
+    # Ensure required fields for export subject
+    if "subject" not in result:
+        result["subject"] = subject
+    if "versions" not in result:
+        result["versions"] = []
 
-        return result
-    except Exception as e:
-        return create_error_response(str(e), error_code="SUBJECT_EXPORT_FAILED", registry_mode=registry_mode)
+    # Add resource links
+    registry_name = _get_registry_name_for_linking(registry_mode, client, registry)
+    return add_links_to_response(result, "subject", registry_name, subject=subject, context=context)
 
 
 @structured_output("export_context", fallback_on_error=True)
@@ -186,6 +246,9 @@ async def export_context_tool(
     include_config: bool = True,
     include_versions: str = "all",
     mcp_context: Optional["Context"] = None,
+    format: str = "json",
+    output_path: Optional[str] = None,
+    compression: str = "gzip",
 ) -> Dict[str, Any]:
     """
     Export all subjects within a context.
@@ -197,11 +260,58 @@ async def export_context_tool(
         include_config: Include configuration data
         include_versions: Which versions to include (all, latest)
         mcp_context: MCP Context for progress reporting
+        format: "json" returns the export inline; "dedup" returns it inline with each distinct
+            schema body stored once in a blob table; "ndjson" streams it to a file under
+            EXPORT_DIR and returns only its manifest (path, counts, checksum); "archive" writes
+            compressed segments with a checkpoint to a directory under EXPORT_DIR
+        output_path: File name for the ndjson export (or directory for the archive), relative to
+            EXPORT_DIR; an interrupted archive resumes when exported again to the same output_path
+        compression: Archive segment compression (gzip, zstd)
 
     Returns:
         Dictionary containing context export data with structured validation and resource links
     """
     try:
+        if format == "dedup":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                export_context_dedup,
+                context,
+                include_metadata,
+                include_config,
+                include_versions,
+                mcp_context=mcp_context,
+            )
+        if format == "archive":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                archive_export_context,
+                context,
+                output_path,
+                include_metadata,
+                include_config,
+                include_versions,
+                compression,
+                mcp_context=mcp_context,
+            )
+        if format == "ndjson":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                stream_export_context,
+                context,
+                output_path,
+                include_metadata,
+                include_config,
+                include_versions,
+                mcp_context=mcp_context,
+            )
+
         # Initial setup (0-10%)
         if mcp_context:
             await mcp_context.info(f"Starting context export: {context}")
@@ -209,7 +319,7 @@ async def export_context_tool(
 
         if registry_mode == "single":
             # Single-registry mode: use common function
-            client = get_default_client(registry_manager)
+            client = registry_manager.get_async_registry()
             if client is None:
                 return create_error_response(
                     "No default registry configured",
@@ -220,7 +330,9 @@ async def export_context_tool(
             if mcp_context:
                 await mcp_context.report_progress(5.0, 100.0, "Using default registry client")
 
-            result = common_export_context(client, context, include_metadata, include_config, include_versions)
+            result = await common_export_context_async(
+                client, context, include_metadata, include_config, include_versions
+            )
             result["registry_mode"] = "single"
             result["mcp_protocol_version"] = "2025-11-25"
 
@@ -235,7 +347,7 @@ async def export_context_tool(
             return result
         else:
             # Multi-registry mode: use client approach
-            client = registry_manager.get_registry(registry)
+            client = registry_manager.get_async_registry(registry)
             if client is None:
                 return create_error_response(
                     f"Registry '{registry}' not found",
@@ -246,48 +358,53 @@ async def export_context_tool(
             if mcp_context:
                 await mcp_context.report_progress(10.0, 100.0, f"Registry client '{registry}' initialized")
 
-            # Get all subjects in context (10-25%)
+            # Load all subject versions in context with a few bulk requests (10-25%)
             if mcp_context:
-                await mcp_context.info(f"Fetching subjects from context: {context}")
-                await mcp_context.report_progress(15.0, 100.0, f"Fetching subjects from context '{context}'")
+                await mcp_context.info(f"Loading schemas from context: {context}")
+                await mcp_context.report_progress(15.0, 100.0, f"Loading schemas from context '{context}'")
 
-            subjects_list = client.get_subjects(context)
-            if isinstance(subjects_list, dict) and "error" in subjects_list:
+            loaded = await load_context_schemas_async(client, context, latest_only=include_versions == "latest")
+            if "error" in loaded:
                 return create_error_response(
-                    f"Failed to get subjects for context '{context}': {subjects_list.get('error')}",
+                    f"Failed to get subjects for context '{context}': {loaded.get('error')}",
                     error_code="CONTEXT_SUBJECTS_RETRIEVAL_FAILED",
                     registry_mode=registry_mode,
                 )
+            subjects_list = list(loaded["subjects"])
 
             if mcp_context:
                 await mcp_context.report_progress(25.0, 100.0, f"Found {len(subjects_list)} subjects in context")
 
-            # Export each subject (25-70%)
+            # Export subjects in batches, fetching their configs concurrently (25-70%)
             subjects_data = []
             if mcp_context:
                 await mcp_context.info(f"Exporting {len(subjects_list)} subjects")
                 await mcp_context.report_progress(30.0, 100.0, f"Starting export of {len(subjects_list)} subjects")
 
-            for i, subject in enumerate(subjects_list):
-                # Report progress for subject export
-                if mcp_context and len(subjects_list) > 0:
-                    progress = 30.0 + (i / len(subjects_list)) * 40.0  # 30% to 70%
-                    await mcp_context.report_progress(
-                        progress, 100.0, f"Exporting subject {i+1}/{len(subjects_list)}: {subject}"
+            window = client.limiter.window
+            batch_size = max(window, math.ceil(len(subjects_list) / EXPORT_PROGRESS_STEPS))
+            for start in range(0, len(subjects_list), batch_size):
+                batch = subjects_list[start : start + batch_size]
+                configs = (
+                    await gather_limited(lambda subject: client.get_subject_config(subject, context), batch, window)
+                    if include_config
+                    else [None] * len(batch)
+                )
+                for subject, config in zip(batch, configs):
+                    subject_export = build_subject_export(
+                        client, subject, loaded["subjects"][subject], context, include_metadata
+                    )
+                    if config is not None and "error" not in config:
+                        subject_export["config"] = config
+                    subjects_data.append(
+                        _finalize_subject_export(subject_export, subject, registry_mode, client, registry, context)
                     )
 
-                subject_export = export_subject_tool(
-                    subject,
-                    registry_manager,
-                    registry_mode,
-                    context,
-                    include_metadata,
-                    include_config,
-                    include_versions,
-                    registry,
-                )
-                if "error" not in subject_export:
-                    subjects_data.append(subject_export)
+                if mcp_context:
+                    progress = 30.0 + (len(subjects_data) / len(subjects_list)) * 40.0  # 30% to 70%
+                    await mcp_context.report_progress(
+                        progress, 100.0, f"Exported {len(subjects_data)}/{len(subjects_list)} subjects"
+                    )
 
             if mcp_context:
                 await mcp_context.report_progress(70.0, 100.0, f"Exported {len(subjects_data)} subjects successfully")
@@ -310,11 +427,11 @@ async def export_context_tool(
                 if mcp_context:
                     await mcp_context.report_progress(80.0, 100.0, "Fetching context configuration")
 
-                global_config = client.get_global_config(context)
+                global_config = await client.get_global_config(context)
                 if "error" not in global_config:
                     result["global_config"] = global_config
 
-                global_mode = client.get_mode(context)
+                global_mode = await client.get_mode(context)
                 if "error" not in global_mode:
                     result["global_mode"] = global_mode
 
@@ -366,6 +483,10 @@ async def export_global_tool(
     include_config: bool = True,
     include_versions: str = "all",
     mcp_context: Optional["Context"] = None,
+    format: str = "json",
+    output_path: Optional[str] = None,
+    base_index: Optional[str] = None,
+    compression: str = "gzip",
 ) -> Dict[str, Any]:
     """
     Export all contexts and schemas from a registry.
@@ -376,11 +497,68 @@ async def export_global_tool(
         include_config: Include configuration data
         include_versions: Which versions to include (all, latest)
         mcp_context: MCP Context for progress reporting
+        format: "json" returns the export inline; "dedup" returns it inline with each distinct
+            schema body stored once in a blob table; "ndjson" streams it to a file under
+            EXPORT_DIR and returns only its manifest (path, counts, checksum); "archive" writes
+            compressed segments with a checkpoint to a directory under EXPORT_DIR
+        output_path: File name for the ndjson export (or directory for the archive), relative to
+            EXPORT_DIR; an interrupted archive resumes when exported again to the same output_path
+        base_index: Index of an earlier ndjson export (its manifest's index_path); with format
+            "ndjson", only the changes since that export are written, as a delta file
+        compression: Archive segment compression (gzip, zstd)
 
     Returns:
         Dictionary containing global export data with structured validation and resource links
     """
     try:
+        if format == "dedup":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                export_global_dedup,
+                include_metadata,
+                include_config,
+                include_versions,
+                mcp_context=mcp_context,
+            )
+        if format == "archive":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                archive_export_global,
+                output_path,
+                include_metadata,
+                include_config,
+                include_versions,
+                compression,
+                mcp_context=mcp_context,
+            )
+        if format == "ndjson" and base_index:
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                stream_export_delta,
+                base_index,
+                output_path,
+                include_metadata,
+                mcp_context=mcp_context,
+            )
+        if format == "ndjson":
+            return await _export_on_executor(
+                registry_manager,
+                registry_mode,
+                registry,
+                stream_export_global,
+                output_path,
+                include_metadata,
+                include_config,
+                include_versions,
+                mcp_context=mcp_context,
+            )
+
         # Initial setup (0-10%)
         if mcp_context:
             await mcp_context.info(f"Starting global export from registry: {registry or 'default'}")
@@ -554,3 +732,31 @@ async def export_global_tool(
         if mcp_context:
             await mcp_context.error(f"Global export failed: {str(e)}")
         return create_error_response(str(e), error_code="GLOBAL_EXPORT_FAILED", registry_mode=registry_mode)
+
+
+@structured_output("build_registry_snapshot", fallback_on_error=True)
+async def build_registry_snapshot_tool(
+    registry_manager,
+    registry_mode: str,
+    registry: Optional[str] = None,
+    source: Optional[str] = None,
+    mcp_context: Optional["Context"] = None,
+) -> Dict[str, Any]:
+    """
+    Rebuild the offline snapshot a registry serves reads from.
+
+    Args:
+        registry: Optional registry name (ignored in single-registry mode)
+        source: ndjson export file or archive directory, relative to EXPORT_DIR; without
+            one, the snapshot is synced from the registry
+        mcp_context: MCP Context for progress reporting
+
+    Returns:
+        Snapshot metadata (path, counts, bytes, source) with structured validation
+    """
+    try:
+        return await _export_on_executor(
+            registry_manager, registry_mode, registry, build_registry_snapshot, source, mcp_context=mcp_context
+        )
+    except Exception as e:
+        return create_error_response(str(e), error_code="SNAPSHOT_BUILD_FAILED", registry_mode=registry_mode)
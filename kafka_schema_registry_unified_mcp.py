@@ -116,6 +116,7 @@ from elicitation_mcp_integration import (
     update_elicitation_implementation,
 )
 from export_tools import (
+    build_registry_snapshot_tool,
     export_context_tool,
     export_global_tool,
     export_schema_tool,
@@ -151,6 +152,7 @@ from schema_registry_common import (
     MultiRegistryManager,
 )
 from schema_registry_common import check_viewonly_mode as _check_viewonly_mode
+from schema_registry_common import read_credential
 from schema_validation import (
     create_error_response,
     create_success_response,
@@ -159,8 +161,9 @@ from schema_validation import (
 from statistics_tools import (
     count_contexts_tool,
     count_schema_versions_tool,
+    count_schemas_executor_tool,
     count_schemas_task_queue_tool,
-    count_schemas_tool,
+    get_registry_analytics_tool,
     get_registry_statistics_task_queue_tool,
 )
 from workflow_mcp_integration import (
@@ -467,43 +470,55 @@ logger.info(f"🔍 Auto-detected registry mode: {REGISTRY_MODE}")
 
 
 class SecureHeaderDict(dict):
-    """Dictionary-like class that generates fresh headers with credentials on each access."""
+    """Registry request headers with credentials from the environment, built once.
+
+    Call ``refresh()`` after rotating SCHEMA_REGISTRY_USER / SCHEMA_REGISTRY_PASSWORD
+    (or their ``*_FILE`` secret files); reads are plain dict lookups.
+    """
 
     def __init__(self, content_type: str = "application/vnd.schemaregistry.v1+json"):
         super().__init__()
         self.content_type = content_type
-        self._update_headers()
+        self.refresh()
 
-    def _update_headers(self):
-        """Update headers with fresh credentials."""
-        self.clear()
-        self["Content-Type"] = self.content_type
-        # Get credentials from environment
-        user = os.getenv("SCHEMA_REGISTRY_USER", "")
-        password = os.getenv("SCHEMA_REGISTRY_PASSWORD", "")
+    def refresh(self):
+        """Rebuild headers from the current credentials."""
+        headers = {"Content-Type": self.content_type}
+        user = read_credential("SCHEMA_REGISTRY_USER")
+        password = read_credential("SCHEMA_REGISTRY_PASSWORD")
         if user and password:
             credentials = base64.b64encode(f"{user}:{password}".encode()).decode()
-            self["Authorization"] = f"Basic {credentials}"
+            headers["Authorization"] = f"Basic {credentials}"
+        self.clear()
+        self.update(headers)
 
-    def __getitem__(self, key):
-        self._update_headers()  # Refresh on each access
-        return super().__getitem__(key)
 
-    def get(self, key, default=None):
-        self._update_headers()  # Refresh on each access
-        return super().get(key, default)
+def reload_registry_credentials() -> Dict[str, bool]:
+    """Credential rotation hook: re-read registry credentials from env vars or mounted secret files.
+
+    Runs on SIGHUP in single registry mode (multi-registry mode reloads the whole configuration
+    then) and whenever a mounted ``*_FILE`` credential secret changes. Rebuilds each client's auth
+    and headers in place, keeping its connection pool. Returns which registries' credentials changed.
+    """
+    global auth
+    changed = registry_manager.reload_credentials()
+    headers.refresh()
+    standard_headers.refresh()
+    if REGISTRY_MODE == "single":
+        default_client = registry_manager.get_registry()
+        auth = default_client.auth if default_client else None
+    return changed
 
-    def items(self):
-        self._update_headers()  # Refresh on each access
-        return super().items()
 
-    def keys(self):
-        self._update_headers()  # Refresh on each access
-        return super().keys()
+def reload_registry_configuration() -> Dict[str, Any]:
+    """Re-read the multi-registry configuration and apply the changes without a restart.
 
-    def values(self):
-        self._update_headers()  # Refresh on each access
-        return super().values()
+    Unchanged registries keep their clients and connection pools. Returns the registry
+    names per change type, or an error in single registry mode.
+    """
+    if not isinstance(registry_manager, MultiRegistryManager):
+        return {"error": "Configuration reload is only supported in multi-registry mode"}
+    return registry_manager.reload()
 
 
 if REGISTRY_MODE == "single":
@@ -525,9 +540,16 @@ if REGISTRY_MODE == "single":
         from requests.auth import HTTPBasicAuth
 
         auth = HTTPBasicAuth(SCHEMA_REGISTRY_USER, SCHEMA_REGISTRY_PASSWORD)
+
+    # Rotate credentials on SIGHUP without a restart
+    registry_manager.install_reload_signal(reload=reload_registry_credentials)
 else:
     logger.info("🌐 Initializing Multi-Registry Manager")
     registry_manager = MultiRegistryManager()
+    # Pick up registry changes on SIGHUP or when REGISTRY_CONFIG_FILE changes, without a restart
+    registry_manager.install_reload_signal()
+    if registry_manager.watch_config_file():
+        logger.info(f"👀 Watching {registry_manager.config_file} for registry configuration changes")
 
     # Multi-registry globals
     SCHEMA_REGISTRY_URL = ""
@@ -538,6 +560,10 @@ else:
     headers = SecureHeaderDict("application/vnd.schemaregistry.v1+json")
     standard_headers = SecureHeaderDict("application/json")
 
+# Rotate credentials whenever a mounted *_FILE credential secret changes
+if registry_manager.watch_credential_files(reload_registry_credentials):
+    logger.info("👀 Watching registry credential secret files for rotation")
+
 # Initialize elicitation MCP integration (only if not in SLIM_MODE)
 if not SLIM_MODE:
     try:
@@ -1660,10 +1686,18 @@ if not SLIM_MODE:
         include_metadata: bool = True,
         include_config: bool = True,
         include_versions: str = "all",
+        format: str = "json",
+        output_path: Optional[str] = None,
+        compression: str = "gzip",
         *,
         mcp_context: Context,
     ):
-        """Export all subjects within a context."""
+        """Export all subjects within a context.
+
+        format: "json" (default), "dedup" (each distinct schema body stored once), "ndjson"
+        (streamed to a file under EXPORT_DIR; returns its manifest) or "archive" (gzip/zstd
+        segments with a checkpoint; re-run with the same output_path to resume).
+        """
         return await export_context_tool(
             context,
             registry_manager,
@@ -1673,6 +1707,9 @@ if not SLIM_MODE:
             include_config,
             include_versions,
             mcp_context,
+            format,
+            output_path,
+            compression,
         )
 
     @mcp.tool()
@@ -1682,10 +1719,21 @@ if not SLIM_MODE:
         include_metadata: bool = True,
         include_config: bool = True,
         include_versions: str = "all",
+        format: str = "json",
+        output_path: Optional[str] = None,
+        base_index: Optional[str] = None,
+        compression: str = "gzip",
         *,
         mcp_context: Context,
     ):
-        """Export all contexts and schemas from a registry."""
+        """Export all contexts and schemas from a registry.
+
+        format: "json" (default), "dedup" (each distinct schema body stored once), "ndjson"
+        (streamed to a file under EXPORT_DIR; returns its manifest) or "archive" (gzip/zstd
+        segments with a checkpoint; re-run with the same output_path to resume). With
+        format="ndjson" and base_index (index_path of an earlier ndjson export), only changes
+        since then are written.
+        """
         return await export_global_tool(
             registry_manager,
             REGISTRY_MODE,
@@ -1694,6 +1742,10 @@ if not SLIM_MODE:
             include_config,
             include_versions,
             mcp_context,
+            format,
+            output_path,
+            base_index,
+            compression,
         )
 
     @mcp.tool()
@@ -1735,6 +1787,21 @@ if not SLIM_MODE:
             registry_mode=REGISTRY_MODE,
         )
 
+    @mcp.tool()
+    @require_scopes("admin")
+    async def build_registry_snapshot(
+        registry: Optional[str] = None,
+        source: Optional[str] = None,
+        *,
+        mcp_context: Context,
+    ):
+        """Rebuild the offline snapshot (REGISTRY_SNAPSHOT_PATH) a registry serves reads from.
+
+        source: ndjson export file or archive directory under EXPORT_DIR; without one the
+        snapshot is synced from the live registry.
+        """
+        return await build_registry_snapshot_tool(registry_manager, REGISTRY_MODE, registry, source, mcp_context)
+
 
 # ===== MIGRATION TOOLS (Hidden in SLIM_MODE) =====
 
@@ -2041,24 +2108,37 @@ def count_contexts(registry: Optional[str] = None):
 
 @mcp.tool(task=True)
 @require_scopes("read")
-async def count_schemas(context: Optional[str] = None, registry: Optional[str] = None, progress: Progress = Progress()):
-    """Count the number of schemas in a context or registry."""
+async def count_schemas(
+    context: Optional[str] = None,
+    registry: Optional[str] = None,
+    max_staleness: Optional[float] = None,
+    progress: Progress = Progress(),
+):
+    """Count the number of schemas in a context or registry.
+
+    Answers from the statistics snapshot when it is at most max_staleness seconds old.
+    """
     # Use background task version for better performance when counting across multiple contexts
     if not SLIM_MODE and context is None:
         # Multiple contexts - use optimized async version with background tasks
         return await count_schemas_task_queue_tool(
-            registry_manager, REGISTRY_MODE, context, registry, progress=progress
+            registry_manager, REGISTRY_MODE, context, registry, progress=progress, max_staleness=max_staleness
         )
     else:
-        # Single context or SLIM_MODE - use direct version
-        return count_schemas_tool(registry_manager, REGISTRY_MODE, context, registry)
+        # Single context or SLIM_MODE - direct version, run on the registry executor off the event loop
+        return await count_schemas_executor_tool(registry_manager, REGISTRY_MODE, context, registry, max_staleness)
 
 
 @mcp.tool()
 @require_scopes("read")
-def count_schema_versions(subject: str, context: Optional[str] = None, registry: Optional[str] = None):
-    """Count the number of versions for a specific schema."""
-    return count_schema_versions_tool(subject, registry_manager, REGISTRY_MODE, context, registry)
+def count_schema_versions(
+    subject: str, context: Optional[str] = None, registry: Optional[str] = None, max_staleness: Optional[float] = None
+):
+    """Count the number of versions for a specific schema.
+
+    Answers from the statistics snapshot when it is at most max_staleness seconds old.
+    """
+    return count_schema_versions_tool(subject, registry_manager, REGISTRY_MODE, context, registry, max_staleness)
 
 
 # Heavy statistics tool (Hidden in SLIM_MODE)
@@ -2067,12 +2147,49 @@ if not SLIM_MODE:
     @mcp.tool(task=True)
     @require_scopes("read")
     async def get_registry_statistics(
-        registry: Optional[str] = None, include_context_details: bool = True, progress: Progress = Progress()
+        registry: Optional[str] = None,
+        include_context_details: bool = True,
+        max_staleness: Optional[float] = None,
+        progress: Progress = Progress(),
     ):
-        """Get comprehensive statistics about a registry."""
+        """Get comprehensive statistics about a registry.
+
+        Served from a materialized snapshot; contexts older than max_staleness seconds are refreshed
+        incrementally first. Each context reports when it was last refreshed.
+        """
         # Always use background task version for better performance due to complexity
         return await get_registry_statistics_task_queue_tool(
-            registry_manager, REGISTRY_MODE, registry, include_context_details, progress=progress
+            registry_manager,
+            REGISTRY_MODE,
+            registry,
+            include_context_details,
+            progress=progress,
+            max_staleness=max_staleness,
+        )
+
+    @mcp.tool(task=True)
+    @require_scopes("read")
+    async def get_registry_analytics(
+        registry: Optional[str] = None,
+        context: Optional[str] = None,
+        top_n: int = 10,
+        include_context_details: bool = True,
+        progress: Progress = Progress(),
+    ):
+        """Get capacity-planning analytics for a registry or one context.
+
+        Reports distributions of versions per subject, schema sizes and field counts, a breakdown
+        by schema type (AVRO/JSON/PROTOBUF) and the top_n subjects by version count and by size,
+        for the registry and (with include_context_details) for each context.
+        """
+        return await get_registry_analytics_tool(
+            registry_manager,
+            REGISTRY_MODE,
+            registry,
+            context,
+            top_n,
+            include_context_details,
+            progress=progress,
         )
 
 
@@ -3077,13 +3194,13 @@ def registry_info_specific_resource(name: str):
 
 @mcp.resource("registry://status")
 @require_scopes("read")
-def registry_status_resource():
+async def registry_status_resource():
     """Get connection status for all registries."""
     import json
 
     try:
-        # Test all registries
-        result = test_all_registries_tool(registry_manager, REGISTRY_MODE)
+        # Test all registries (served from the shared health snapshot when fresh)
+        result = await test_all_registries_tool(registry_manager, REGISTRY_MODE)
 
         # Add resource metadata
         result["resource_info"] = {
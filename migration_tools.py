@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional
 
 from fastmcp.dependencies import Progress
 
+from registry_resilience import get_registry_executor
 from resource_linking import add_links_to_response
 from schema_validation import (
     create_error_response,
@@ -377,21 +378,22 @@ async def _execute_schema_migration_async(
 
     await _safe_progress_call(progress, "set_message", "Preparing schema migration")
 
-    # Run the synchronous migration in a thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    migration_result = await loop.run_in_executor(
-        None,
-        _execute_schema_migration,
-        subject,
-        source_client,
-        target_client,
-        source_context,
-        target_context,
-        versions,
-        migrate_all_versions,
-        preserve_ids,
-        dry_run,
-        force_without_id_preservation,
+    # Run the synchronous migration on the shared registry executor to avoid blocking
+    migration_result = await asyncio.wrap_future(
+        get_registry_executor().submit(
+            source_client.config.name,
+            _execute_schema_migration,
+            subject,
+            source_client,
+            target_client,
+            source_context,
+            target_context,
+            versions,
+            migrate_all_versions,
+            preserve_ids,
+            dry_run,
+            force_without_id_preservation,
+        )
     )
 
     # Update progress based on result
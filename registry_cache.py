@@ -0,0 +1,856 @@
+#!/usr/bin/env python3
+"""
+Registry Response Cache Module
+
+Bounded, per-registry read-through cache for Schema Registry GET responses.
+
+Entries are keyed by request URL (so they are context-aware), expire after a
+per-endpoint TTL and are evicted least-recently-used once the entry count or
+byte budget is exceeded. Writes made through the same registry client
+invalidate the entries they can affect.
+
+Schema bodies are immutable once registered, so they are additionally kept in a
+process-wide SchemaIdStore that never expires: every schema ID is fetched at
+most once per process. Bodies are also learned from numbered subject version
+reads, but which ID a version points to is not permanent (versions can be
+deleted), so those reads follow the TTL cache like any other.
+
+Reads that miss both are coalesced: concurrent identical GETs (from worker
+threads or coroutines) share one upstream request and its result.
+
+Server metadata (cluster IDs, version) almost never changes and is kept per
+registry in a ServerMetadataCache with a long TTL; stale metadata keeps being
+served while one background refresh runs.
+
+Registry statistics are materialized per registry in a StatisticsSnapshot of
+per-context, per-subject version lists. Writes mark the subjects they touch, so
+a refresh only re-queries subjects that are new or were written to.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+# Response Cache Configuration
+REGISTRY_CACHE_ENABLED = os.getenv("REGISTRY_CACHE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+REGISTRY_CACHE_MAX_ENTRIES = int(os.getenv("REGISTRY_CACHE_MAX_ENTRIES", "2000"))
+REGISTRY_CACHE_MAX_BYTES = int(os.getenv("REGISTRY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# Per-endpoint TTLs in seconds, overridable with REGISTRY_CACHE_TTL_<ENDPOINT>.
+# Listings change whenever anyone registers a schema, so they get the shortest TTL.
+DEFAULT_CACHE_TTLS = {
+    "contexts": 30.0,
+    "subjects": 5.0,
+    "versions": 5.0,
+    "schema": 30.0,
+    "config": 30.0,
+    "mode": 30.0,
+}
+REGISTRY_CACHE_TTLS = {
+    endpoint: float(os.getenv(f"REGISTRY_CACHE_TTL_{endpoint.upper()}", str(ttl)))
+    for endpoint, ttl in DEFAULT_CACHE_TTLS.items()
+}
+
+# Server metadata (/v1/metadata/id and /v1/metadata/version) TTLs in seconds
+REGISTRY_METADATA_TTL = float(os.getenv("REGISTRY_METADATA_TTL", "3600"))
+# Metadata that could not be fetched is retried sooner
+REGISTRY_METADATA_ERROR_TTL = float(os.getenv("REGISTRY_METADATA_ERROR_TTL", "30"))
+
+# Statistics Snapshot Configuration
+# Default age in seconds up to which statistics tools answer from the snapshot
+STATISTICS_MAX_STALENESS = float(os.getenv("STATISTICS_MAX_STALENESS", "30"))
+# Subjects changed by other clients are only seen when a context is fully re-read, at most this many seconds apart
+STATISTICS_FULL_REFRESH_INTERVAL = float(os.getenv("STATISTICS_FULL_REFRESH_INTERVAL", "3600"))
+
+# Schema-by-ID Store Configuration
+REGISTRY_SCHEMA_STORE_ENABLED = os.getenv("REGISTRY_SCHEMA_STORE_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+REGISTRY_SCHEMA_STORE_MAX_BYTES = int(os.getenv("REGISTRY_SCHEMA_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Directory that bodies evicted from memory are spilled to; empty disables spilling
+REGISTRY_SCHEMA_STORE_SPILL_DIR = os.getenv("REGISTRY_SCHEMA_STORE_SPILL_DIR", "")
+
+DEFAULT_CONTEXT = "."
+STORED_RESPONSE_HEADERS = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
+
+_CONTEXT_PREFIX = re.compile(r"^/contexts/([^/]+)(/.*)$")
+_CACHEABLE_PATHS = [
+    (re.compile(r"^/contexts$"), "contexts"),
+    (re.compile(r"^/subjects$"), "subjects"),
+    (re.compile(r"^/subjects/([^/]+)/versions$"), "versions"),
+    (re.compile(r"^/subjects/([^/]+)/versions/[^/]+$"), "schema"),
+    (re.compile(r"^/config(?:/([^/]+))?$"), "config"),
+    (re.compile(r"^/mode(?:/([^/]+))?$"), "mode"),
+]
+_SUBJECT_WRITE_PATH = re.compile(r"^/subjects/([^/]+)(?:/.*)?$")
+# Immutable reads served from the schema-by-ID store
+_SCHEMA_ID_PATH = re.compile(r"^/schemas/ids/(\d+)$")
+# Numbered version reads whose bodies are fed into the store
+_SCHEMA_VERSION_PATH = re.compile(r"^/subjects/([^/]+)/versions/(\d+)$")
+# Response fields that describe where a schema is registered rather than the schema itself
+_SCHEMA_LOCATION_FIELDS = ("subject", "version", "id")
+
+
+def _split_context(path: str) -> Tuple[str, str]:
+    """Strip a /contexts/{context} prefix, returning (context, remaining path)."""
+    match = _CONTEXT_PREFIX.match(path)
+    if match:
+        return unquote(match.group(1)), match.group(2)
+    return DEFAULT_CONTEXT, path
+
+
+def classify_registry_path(path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Split a registry-relative path into (context, endpoint, subject).
+
+    The endpoint is None for paths that are not cached.
+    """
+    context, path = _split_context(path)
+    for pattern, endpoint in _CACHEABLE_PATHS:
+        match = pattern.match(path)
+        if match:
+            subject = match.group(1) if match.groups() else None
+            return context, endpoint, unquote(subject) if subject else None
+    return context, None, None
+
+
+@dataclass
+class CachedResponse:
+    """Status, body and headers of a successful registry GET."""
+
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8")
+
+
+def _encode_schema_body(result: Dict[str, Any]) -> bytes:
+    """Serialize the parts of a schema response that belong to the schema itself."""
+    body = {key: value for key, value in result.items() if key not in _SCHEMA_LOCATION_FIELDS}
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+class SchemaIdStore:
+    """Process-wide, never-expiring store of schema bodies keyed by (registry, context, schema ID).
+
+    Schema IDs are scoped per context in context-aware registries, so the context is
+    part of the key. Bodies are kept in memory up to ``max_bytes``; least recently
+    used bodies beyond that are spilled to ``spill_dir`` when configured and read
+    back on demand, otherwise they are dropped and fetched again on next use.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = REGISTRY_SCHEMA_STORE_ENABLED,
+        max_bytes: int = REGISTRY_SCHEMA_STORE_MAX_BYTES,
+        spill_dir: str = REGISTRY_SCHEMA_STORE_SPILL_DIR,
+    ):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+
+        self._lock = threading.Lock()
+        self._bodies: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
+        self._bytes = 0
+        self._spilled: Set[Tuple[str, str, int]] = set()
+        self._spill_path: Optional[str] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.spills = 0
+        self.spill_reads = 0
+
+    # ----- schema bodies -----
+
+    def get_body(self, registry: str, context: str, schema_id: int) -> Optional[bytes]:
+        """Return the stored body for a schema ID, reading it back from disk if it was spilled."""
+        if not self.enabled:
+            return None
+        key = (registry, context, schema_id)
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                self.hits += 1
+                return body
+            if key not in self._spilled:
+                self.misses += 1
+                return None
+
+        body = self._read_spilled(key)
+        with self._lock:
+            if body is None:
+                self._spilled.discard(key)
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.spill_reads += 1
+        return body
+
+    def put_body(self, registry: str, context: str, schema_id: int, body: bytes):
+        """Store the body of a schema ID; bodies never change, so existing entries are kept."""
+        if not self.enabled or len(body) > self.max_bytes:
+            return
+        key = (registry, context, schema_id)
+        evicted = []
+        with self._lock:
+            if key in self._bodies:
+                return
+            self._bodies[key] = body
+            self._bytes += len(body)
+            while self._bytes > self.max_bytes:
+                old_key, old_body = self._bodies.popitem(last=False)
+                self._bytes -= len(old_body)
+                evicted.append((old_key, old_body))
+
+        for old_key, old_body in evicted:
+            self._spill(old_key, old_body)
+
+    def _spill_file(self, key: Tuple[str, str, int]) -> Optional[str]:
+        if self._spill_path is None:
+            return None
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._spill_path, f"{digest}.json")
+
+    def _spill(self, key: Tuple[str, str, int], body: bytes):
+        """Write an evicted body to the spill directory, if one is configured."""
+        if not self.spill_dir:
+            return
+        try:
+            with self._lock:
+                if self._spill_path is None:
+                    os.makedirs(self.spill_dir, exist_ok=True)
+                    # A private directory per process: IDs are only trusted for this process' lifetime
+                    self._spill_path = tempfile.mkdtemp(prefix="schema-store-", dir=self.spill_dir)
+                    atexit.register(shutil.rmtree, self._spill_path, True)
+            path = self._spill_file(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as handle:
+                handle.write(body)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        with self._lock:
+            self._spilled.add(key)
+            self.spills += 1
+
+    def _read_spilled(self, key: Tuple[str, str, int]) -> Optional[bytes]:
+        path = self._spill_file(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as handle:
+                return handle.read()
+        except OSError:
+            return None
+
+    # ----- housekeeping -----
+
+    def clear(self):
+        """Drop every stored body."""
+        with self._lock:
+            self._bodies.clear()
+            self._bytes = 0
+            self._spilled.clear()
+            spill_path, self._spill_path = self._spill_path, None
+        if spill_path:
+            shutil.rmtree(spill_path, ignore_errors=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/spill counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._bodies),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "spilled_entries": len(self._spilled),
+                "spills": self.spills,
+                "spill_reads": self.spill_reads,
+            }
+
+
+# Shared by every registry client in the process
+schema_id_store = SchemaIdStore()
+
+
+class _InFlightCall:
+    """A request being executed on behalf of every caller that asked for it meanwhile."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls from threads so they share one execution."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run `fn` unless a call for `key` is already in flight; return (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _InFlightCall()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutine calls within each event loop."""
+
+    def __init__(self):
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await `fn()` unless a call for `key` is already in flight; return (result, shared)."""
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        while key in calls:
+            future = calls[key]
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: make our own request
+                if not future.cancelled():
+                    raise
+                self.coalesced -= 1
+
+        future = calls[key] = loop.create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if calls.get(key) is future:
+                del calls[key]
+        return result, False
+
+
+@dataclass
+class _CacheEntry:
+    response: CachedResponse
+    expires_at: float
+    size: int
+    context: str
+    endpoint: str
+    subject: Optional[str]
+
+
+class RegistryResponseCache:
+    """Thread-safe TTL + LRU cache of registry GET responses for one registry."""
+
+    def __init__(
+        self,
+        base_url: str,
+        enabled: bool = REGISTRY_CACHE_ENABLED,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = REGISTRY_CACHE_MAX_ENTRIES,
+        max_bytes: int = REGISTRY_CACHE_MAX_BYTES,
+        schema_store: Optional[SchemaIdStore] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.schema_store = schema_id_store if schema_store is None else schema_store
+        self.enabled = enabled
+        self.ttls = dict(REGISTRY_CACHE_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        # Bumped on every invalidation so reads that raced a write are not stored
+        self.generation = 0
+        # Called with (context, subject or None) for every write that can change registry contents
+        self.write_listeners: List[Callable[[str, Optional[str]], None]] = []
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _relative_path(self, url: str) -> Optional[str]:
+        """Return the path below the registry base URL, or None for foreign URLs."""
+        if not url.startswith(self.base_url):
+            return None
+        return urlsplit(url[len(self.base_url) :] or "/").path or "/"
+
+    def _classify(self, url: str) -> Tuple[str, Optional[str], Optional[str]]:
+        path = self._relative_path(url)
+        if path is None:
+            return DEFAULT_CONTEXT, None, None
+        return classify_registry_path(path)
+
+    def is_cacheable(self, url: str) -> bool:
+        """Whether GET responses for this URL are cached."""
+        if not self.enabled:
+            return False
+        endpoint = self._classify(url)[1]
+        return endpoint is not None and self.ttls.get(endpoint, 0) > 0
+
+    def _immutable_path(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return (context, path) for plain reads the schema store can answer or learn from."""
+        if not self.schema_store.enabled or not url.startswith(self.base_url):
+            return None
+        parts = urlsplit(url[len(self.base_url) :] or "/")
+        if parts.query:
+            return None
+        return _split_context(parts.path or "/")
+
+    def _get_stored(self, url: str) -> Optional[CachedResponse]:
+        """Answer schema-by-ID reads from the schema store."""
+        located = self._immutable_path(url)
+        if located is None:
+            return None
+        context, path = located
+
+        match = _SCHEMA_ID_PATH.match(path)
+        if not match:
+            return None
+        body = self.schema_store.get_body(self.base_url, context, int(match.group(1)))
+        if body is None:
+            return None
+        return CachedResponse(200, body, dict(STORED_RESPONSE_HEADERS), "utf-8")
+
+    def _store_response(self, url: str, response: CachedResponse) -> bool:
+        """Record schema bodies from by-ID and numbered version reads.
+
+        True if the store answers the URL from now on; version reads are still cached with their TTL.
+        """
+        located = self._immutable_path(url)
+        if located is None:
+            return False
+        context, path = located
+
+        id_match = _SCHEMA_ID_PATH.match(path)
+        version_match = None if id_match else _SCHEMA_VERSION_PATH.match(path)
+        if not id_match and not version_match:
+            return False
+        try:
+            result = json.loads(response.content)
+        except ValueError:
+            return False
+        if not isinstance(result, dict) or "schema" not in result:
+            return False
+
+        schema_id = int(id_match.group(1)) if id_match else result.get("id")
+        if isinstance(schema_id, int):
+            self.schema_store.put_body(self.base_url, context, schema_id, _encode_schema_body(result))
+        return bool(id_match)
+
+    def _subject_version_url(self, context: str, subject: str, version: int) -> str:
+        """URL a registry client requests a numbered subject version at."""
+        prefix = f"/contexts/{quote(context, safe='')}" if context != DEFAULT_CONTEXT else ""
+        return f"{self.base_url}{prefix}/subjects/{subject}/versions/{version}"
+
+    def record_subject_version(
+        self,
+        context: str,
+        entry: Dict[str, Any],
+        generation: Optional[int] = None,
+        subject: Optional[str] = None,
+    ) -> bool:
+        """Store a subject version (subject, version, id, schema...) read by any means, e.g. a bulk listing.
+
+        The body goes to the schema store; the version read itself is cached like a fetched one, so it
+        expires with the schema TTL. `subject` is the name used in request paths when it differs from
+        the one the registry reports.
+        """
+        schema_id, version = entry.get("id"), entry.get("version")
+        if not isinstance(schema_id, int) or not isinstance(version, int) or "schema" not in entry:
+            return False
+        self.schema_store.put_body(self.base_url, context, schema_id, _encode_schema_body(entry))
+        subject = subject or entry.get("subject")
+        if subject:
+            content = json.dumps(entry).encode("utf-8")
+            response = CachedResponse(200, content, dict(STORED_RESPONSE_HEADERS), "utf-8")
+            self.put(self._subject_version_url(context, subject, version), response, generation)
+        return True
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return a stored or fresh cached response, counting a hit or miss."""
+        stored = self._get_stored(url)
+        if stored is not None:
+            return stored
+        if not self.is_cacheable(url):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(url)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry.response
+
+    def put(self, url: str, response: CachedResponse, generation: Optional[int] = None):
+        """Store a successful response unless the cache was invalidated since `generation`."""
+        if response.status_code != 200 or self._store_response(url, response):
+            return
+        if not self.is_cacheable(url):
+            return
+
+        context, endpoint, subject = self._classify(url)
+        size = len(response.content) + len(url)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if url in self._entries:
+                self._remove(url)
+            self._entries[url] = _CacheEntry(
+                response=response,
+                expires_at=time.monotonic() + self.ttls[endpoint],
+                size=size,
+                context=context,
+                endpoint=endpoint,
+                subject=subject,
+            )
+            self._bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, url: str):
+        """Drop one entry (caller must hold the lock)."""
+        entry = self._entries.pop(url)
+        self._bytes -= entry.size
+
+    def invalidate_for_write(self, method: str, url: str):
+        """Drop entries that a write request to `url` can make stale."""
+        path = self._relative_path(url)
+        if path is None:
+            return
+
+        context, path = _split_context(path)
+
+        # Compatibility checks are POSTs that do not change registry state
+        if path.startswith("/compatibility/"):
+            return
+
+        subject_match = _SUBJECT_WRITE_PATH.match(path)
+        subject = unquote(subject_match.group(1)) if subject_match else None
+        if not (path == "/config" or path.startswith(("/config/", "/mode"))):
+            for listener in self.write_listeners:
+                listener(context, subject)
+
+        if subject_match:
+
+            def affected(entry: _CacheEntry) -> bool:
+                return entry.endpoint == "contexts" or (
+                    entry.context == context and (entry.endpoint == "subjects" or entry.subject == subject)
+                )
+
+        elif path == "/config" or path.startswith("/config/"):
+
+            def affected(entry: _CacheEntry) -> bool:
+                return entry.context == context and entry.endpoint == "config"
+
+        elif path == "/mode" or path.startswith("/mode/"):
+
+            def affected(entry: _CacheEntry) -> bool:
+                return entry.context == context and entry.endpoint == "mode"
+
+        else:
+
+            def affected(entry: _CacheEntry) -> bool:
+                return True
+
+        with self._lock:
+            self.generation += 1
+            for key in [key for key, entry in self._entries.items() if affected(entry)]:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class ServerMetadataCache:
+    """Server metadata of one registry with stale-while-revalidate semantics.
+
+    A cold lookup is fetched by the caller; once the TTL has passed the cached value is
+    still returned and the caller is told to start a single background refresh.
+    """
+
+    def __init__(self, ttl: float = REGISTRY_METADATA_TTL, error_ttl: float = REGISTRY_METADATA_ERROR_TTL):
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self._entry: Optional[Tuple[float, float, Dict[str, Any]]] = None  # (fetched, expires, metadata)
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @staticmethod
+    def _has_error(metadata: Dict[str, Any]) -> bool:
+        return any(key.endswith("_error") for key in metadata)
+
+    def lookup(self) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return (copy of cached metadata or None, whether a refresh should be started)."""
+        with self._lock:
+            if self._entry is None:
+                self.misses += 1
+                return None, False
+            self.hits += 1
+            _, expires, metadata = self._entry
+            refresh = time.monotonic() > expires and not self._refreshing
+            if refresh:
+                self._refreshing = True
+                self.refreshes += 1
+            return dict(metadata), refresh
+
+    def store(self, metadata: Dict[str, Any]):
+        """Record freshly fetched metadata; a failed refresh keeps the last good value for error_ttl."""
+        with self._lock:
+            now = time.monotonic()
+            if not self._has_error(metadata):
+                self._entry = (now, now + self.ttl, dict(metadata))
+            elif self._entry is not None and not self._has_error(self._entry[2]):
+                self._entry = (self._entry[0], now + self.error_ttl, self._entry[2])
+            else:
+                self._entry = (now, now + self.error_ttl, dict(metadata))
+            self._refreshing = False
+
+    def refresh_failed(self):
+        with self._lock:
+            self._refreshing = False
+
+    def clear(self):
+        with self._lock:
+            self._entry = None
+            self._refreshing = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "age": round(time.monotonic() - self._entry[0], 3) if self._entry else None,
+            }
+
+
+@dataclass
+class ContextStatistics:
+    """Materialized version lists of one context."""
+
+    subjects: Dict[str, List[int]]
+    refreshed_at: float  # wall clock, for reporting
+    refreshed: float  # monotonic, for staleness
+    full_refreshed: float  # monotonic time of the last refresh that re-read every subject
+
+
+class StatisticsSnapshot:
+    """Per-context, per-subject version lists of one registry, refreshed incrementally.
+
+    Contexts are keyed as the registry client addresses them (None is the default
+    context). Writes through the client mark the subjects they touch; a refresh
+    re-reads only those and subjects it has not seen before, and takes every
+    subject again once full_refresh_interval has passed.
+    """
+
+    def __init__(self, full_refresh_interval: float = STATISTICS_FULL_REFRESH_INTERVAL):
+        self.full_refresh_interval = full_refresh_interval
+        self._lock = threading.Lock()
+        self._contexts: Dict[Optional[str], ContextStatistics] = {}
+        self._context_list: Optional[Tuple[List[str], float]] = None  # (contexts, monotonic refresh time)
+        # Write sequence numbers of changed subjects, and of changes to a whole context
+        self._writes = 0
+        self._changed: Dict[Optional[str], Dict[str, int]] = {}
+        self._changed_contexts: Dict[Optional[str], int] = {}
+        # Coalesces concurrent refreshes of the same contexts
+        self.flight = SingleFlight()
+        self.hits = 0
+        self.refreshes = 0
+        self.full_refreshes = 0
+
+    def record_write(self, context: str, subject: Optional[str]):
+        """Mark a subject (or, without one, the whole context) as changed. `context` is in cache form."""
+        key = None if context == DEFAULT_CONTEXT else context
+        with self._lock:
+            self._writes += 1
+            if subject is None:
+                self._changed_contexts[key] = self._writes
+            else:
+                self._changed.setdefault(key, {})[subject] = self._writes
+            # A write may create the context
+            if self._context_list is not None and context not in self._context_list[0]:
+                self._context_list = None
+
+    def get_contexts(self, max_staleness: float) -> Optional[List[str]]:
+        with self._lock:
+            if self._context_list is None or time.monotonic() - self._context_list[1] > max_staleness:
+                return None
+            return list(self._context_list[0])
+
+    def store_contexts(self, contexts: List[str]):
+        with self._lock:
+            self._context_list = (list(contexts), time.monotonic())
+
+    def get(self, context: Optional[str], max_staleness: Optional[float] = None) -> Optional[ContextStatistics]:
+        """The context's statistics; with max_staleness, only if that fresh and not written to since."""
+        with self._lock:
+            entry = self._contexts.get(context)
+            if entry is None or max_staleness is None:
+                return entry
+            if (
+                time.monotonic() - entry.refreshed > max_staleness
+                or self._changed.get(context)
+                or context in self._changed_contexts
+            ):
+                return None
+            self.hits += 1
+            return entry
+
+    def start_refresh(self, context: Optional[str]) -> Tuple[Optional[Dict[str, List[int]]], Optional[Set[str]], int]:
+        """Return (previous version lists or None for a full refresh, subjects to re-read or None for all, sequence).
+
+        Pass the sequence to store() so that only changes seen by this refresh are cleared.
+        """
+        with self._lock:
+            entry = self._contexts.get(context)
+            if entry is None or time.monotonic() - entry.full_refreshed > self.full_refresh_interval:
+                return None, None, self._writes
+            if context in self._changed_contexts:
+                return entry.subjects, None, self._writes
+            return entry.subjects, set(self._changed.get(context, ())), self._writes
+
+    def store(
+        self,
+        context: Optional[str],
+        subjects: Dict[str, List[int]],
+        started: Tuple[float, float],
+        full: bool,
+        sequence: int,
+    ):
+        """Record a refresh that started at `started` (wall clock, monotonic)."""
+        wall, monotonic = started
+        with self._lock:
+            previous = self._contexts.get(context)
+            full_refreshed = monotonic if full or previous is None else previous.full_refreshed
+            self._contexts[context] = ContextStatistics(subjects, wall, monotonic, full_refreshed)
+            self.refreshes += 1
+            self.full_refreshes += int(full)
+            if self._changed_contexts.get(context, sequence + 1) <= sequence:
+                del self._changed_contexts[context]
+            changed = self._changed.get(context)
+            if changed:
+                for subject in [subject for subject, seq in changed.items() if seq <= sequence]:
+                    del changed[subject]
+
+    def update_subject(self, context: Optional[str], subject: str, versions: List[int]):
+        """Fold a freshly read version list into an already materialized context."""
+        with self._lock:
+            entry = self._contexts.get(context)
+            # Only replace known subjects: readers may be iterating the mapping
+            if entry is not None and subject in entry.subjects and subject not in self._changed.get(context, ()):
+                entry.subjects[subject] = list(versions)
+
+    def clear(self):
+        with self._lock:
+            self._contexts.clear()
+            self._context_list = None
+            self._changed.clear()
+            self._changed_contexts.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "contexts": len(self._contexts),
+                "subjects": sum(len(entry.subjects) for entry in self._contexts.values()),
+                "hits": self.hits,
+                "refreshes": self.refreshes,
+                "full_refreshes": self.full_refreshes,
+                "oldest_age": round(max((now - e.refreshed for e in self._contexts.values()), default=0.0), 3),
+            }
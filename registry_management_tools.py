@@ -9,6 +9,7 @@ Provides registry listing, connection testing, and information retrieval
 with JSON Schema validation, type-safe responses, and HATEOAS navigation links.
 """
 
+import asyncio
 from typing import Any, Dict, Optional
 
 from resource_linking import add_links_to_response
@@ -42,8 +43,8 @@ def list_registries_tool(registry_manager, registry_mode: str) -> Dict[str, Any]
     """
     try:
         registries_list = []
-        for name in registry_manager.list_registries():
-            info = registry_manager.get_registry_info(name)
+        # Connection status and server metadata for every registry are gathered concurrently
+        for name, info in registry_manager.get_registries_info().items():
             if info:
                 # Add structured output metadata
                 info["registry_mode"] = registry_mode
@@ -152,8 +153,8 @@ def test_registry_connection_tool(
                 registry_mode=registry_mode,
             )
 
-        # Get connection test result
-        result = client.test_connection()
+        # Get connection test result from the shared health snapshot
+        result = registry_manager.get_registry_health(registry)
 
         # Add structured output metadata
         result["registry_mode"] = registry_mode
@@ -173,15 +174,15 @@ def test_registry_connection_tool(
             "name": client.config.name,
             "url": client.config.url,
             "description": client.config.description,
-            "viewonly": client.config.readonly,
+            "viewonly": client.config.viewonly,
             "has_authentication": bool(client.config.user and client.config.password),
         }
 
         # Add connection health assessment
         result["health_assessment"] = {
             "status": "healthy" if result.get("status") == "connected" else "unhealthy",
-            "can_perform_operations": result.get("status") == "connected" and not client.config.readonly,
-            "viewonly_mode": client.config.readonly,
+            "can_perform_operations": result.get("status") == "connected" and not client.config.viewonly,
+            "viewonly_mode": client.config.viewonly,
         }
 
         # Add resource links
@@ -215,7 +216,7 @@ async def test_all_registries_tool(registry_manager, registry_mode: str) -> Dict
             if default_registry:
                 client = registry_manager.get_registry(default_registry)
                 if client:
-                    result = client.test_connection()
+                    result = registry_manager.get_registry_health(default_registry)
 
                     # Add metadata to the test result
                     try:
@@ -227,8 +228,8 @@ async def test_all_registries_tool(registry_manager, registry_mode: str) -> Dict
                     # Add health assessment
                     result["health_assessment"] = {
                         "status": ("healthy" if result.get("status") == "connected" else "unhealthy"),
-                        "can_perform_operations": result.get("status") == "connected" and not client.config.readonly,
-                        "viewonly_mode": client.config.readonly,
+                        "can_perform_operations": result.get("status") == "connected" and not client.config.viewonly,
+                        "viewonly_mode": client.config.viewonly,
                     }
 
                     # Convert to enhanced response format
@@ -262,14 +263,28 @@ async def test_all_registries_tool(registry_manager, registry_mode: str) -> Dict
             result["mcp_protocol_version"] = "2025-11-25"
             result["test_timestamp"] = __import__("datetime").datetime.now().isoformat()
 
-            # Add metadata to each registry test result
+            # Add metadata to each registry test result (cached per client, fetched concurrently)
             if "registry_tests" in result:
+                pending = {
+                    name: registry_manager.get_registry(name)
+                    for name, test_result in result["registry_tests"].items()
+                    if isinstance(test_result, dict) and "error" not in test_result
+                }
+                clients = {name: client for name, client in pending.items() if client}
+                fetched = await asyncio.gather(
+                    *(client.async_client.get_server_metadata() for client in clients.values()),
+                    return_exceptions=True,
+                )
+                server_metadata = dict(zip(clients, fetched))
+
                 for registry_name, test_result in result["registry_tests"].items():
                     if isinstance(test_result, dict) and "error" not in test_result:
                         try:
-                            client = registry_manager.get_registry(registry_name)
+                            client = clients.get(registry_name)
                             if client:
-                                metadata = client.get_server_metadata()
+                                metadata = server_metadata[registry_name]
+                                if isinstance(metadata, BaseException):
+                                    raise metadata
                                 test_result["server_metadata"] = metadata
 
                                 # Add registry configuration info
@@ -277,7 +292,7 @@ async def test_all_registries_tool(registry_manager, registry_mode: str) -> Dict
                                     "name": client.config.name,
                                     "url": client.config.url,
                                     "description": client.config.description,
-                                    "viewonly": client.config.readonly,
+                                    "viewonly": client.config.viewonly,
                                     "has_authentication": bool(client.config.user and client.config.password),
                                 }
 
@@ -285,8 +300,8 @@ async def test_all_registries_tool(registry_manager, registry_mode: str) -> Dict
                                 test_result["health_assessment"] = {
                                     "status": ("healthy" if test_result.get("status") == "connected" else "unhealthy"),
                                     "can_perform_operations": test_result.get("status") == "connected"
-                                    and not client.config.readonly,
-                                    "viewonly_mode": client.config.readonly,
+                                    and not client.config.viewonly,
+                                    "viewonly_mode": client.config.viewonly,
                                 }
                         except Exception as e:
                             test_result["metadata_error"] = str(e)
@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Registry Resilience Module
+
+Per-registry protection for Schema Registry instances that are slow or overloaded.
+
+AdaptiveConcurrencyLimiter bounds how many requests are in flight against one
+registry at a time. The window follows AIMD (additive increase, multiplicative
+decrease): it grows slowly while responses come back fast and halves when the
+registry answers 429/502/503/504 or requests time out, honouring Retry-After.
+The same limiter is shared by worker threads (sync client) and coroutines
+(async client) so bulk tools run as fast as each registry safely allows.
+
+CircuitBreaker stops callers from waiting on a registry that is known to be
+down. After consecutive connection failures, timeouts or 502/503/504 responses
+the breaker opens and requests fail immediately with CircuitOpenError. A
+background probe (or, without one, a single trial request) moves it to
+half-open after the reset timeout and closes it again once the registry answers.
+
+RegistryExecutor is the one process-wide thread pool that blocking registry work
+runs on. A global cap bounds the number of threads, and each registry gets a
+bulkhead: at most a fixed number of workers, with further tasks queued per
+registry and started round-robin as workers free up, so one busy registry
+cannot take every thread. Tasks submitted from a worker that cannot start at
+once run inline on that worker instead of queueing, so nested fan-outs never
+deadlock on the pool.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import requests
+
+# Adaptive Concurrency Configuration
+REGISTRY_CONCURRENCY_ENABLED = os.getenv("REGISTRY_CONCURRENCY_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+REGISTRY_CONCURRENCY_INITIAL = int(os.getenv("REGISTRY_CONCURRENCY_INITIAL", "10"))
+REGISTRY_CONCURRENCY_MIN = int(os.getenv("REGISTRY_CONCURRENCY_MIN", "1"))
+REGISTRY_CONCURRENCY_MAX = int(os.getenv("REGISTRY_CONCURRENCY_MAX", "32"))
+# Responses slower than this (seconds) stop the window from growing
+REGISTRY_CONCURRENCY_LATENCY_TARGET = float(os.getenv("REGISTRY_CONCURRENCY_LATENCY_TARGET", "1.0"))
+# Longest Retry-After (seconds) a registry can impose on new requests
+REGISTRY_BACKOFF_MAX = float(os.getenv("REGISTRY_BACKOFF_MAX", "30"))
+
+# Circuit Breaker Configuration
+REGISTRY_BREAKER_ENABLED = os.getenv("REGISTRY_BREAKER_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+# Consecutive failures that open the breaker
+REGISTRY_BREAKER_FAILURE_THRESHOLD = int(os.getenv("REGISTRY_BREAKER_FAILURE_THRESHOLD", "5"))
+# Seconds an open breaker waits before probing the registry again
+REGISTRY_BREAKER_RESET_TIMEOUT = float(os.getenv("REGISTRY_BREAKER_RESET_TIMEOUT", "10"))
+# Timeout (seconds) of each background recovery probe
+REGISTRY_BREAKER_PROBE_TIMEOUT = float(os.getenv("REGISTRY_BREAKER_PROBE_TIMEOUT", "5"))
+
+# Shared Executor Configuration
+# Threads shared by all blocking registry work in the process
+REGISTRY_EXECUTOR_MAX_WORKERS = int(os.getenv("REGISTRY_EXECUTOR_MAX_WORKERS", "64"))
+# Workers one registry may occupy at a time; further tasks for it wait in its own queue
+REGISTRY_EXECUTOR_BULKHEAD = int(os.getenv("REGISTRY_EXECUTOR_BULKHEAD", "32"))
+
+# Statuses that mean "slow down" rather than "your request is wrong"
+OVERLOAD_STATUSES = (429, 502, 503, 504)
+# Statuses that mean the registry itself is unavailable (429 means it is alive but busy)
+BREAKER_FAILURE_STATUSES = (502, 503, 504)
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency window for one registry, usable from threads and coroutines."""
+
+    # Several requests in flight usually fail together; count them as one overload signal
+    DECREASE_COOLDOWN = 1.0
+    DECREASE_FACTOR = 0.5
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = REGISTRY_CONCURRENCY_INITIAL,
+        min_limit: int = REGISTRY_CONCURRENCY_MIN,
+        max_limit: int = REGISTRY_CONCURRENCY_MAX,
+        latency_target: float = REGISTRY_CONCURRENCY_LATENCY_TARGET,
+        enabled: bool = REGISTRY_CONCURRENCY_ENABLED,
+    ):
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.enabled = enabled
+
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.in_flight = 0
+        self.backoff_until = 0.0
+        self._last_decrease = 0.0
+
+        self.requests = 0
+        self.waits = 0
+        self.increases = 0
+        self.decreases = 0
+        self.overloads = 0
+        self.timeouts = 0
+
+    @property
+    def window(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_limit, int(self.limit))
+
+    def _try_acquire(self) -> Optional[float]:
+        """Take a slot if possible (caller holds the lock).
+
+        Returns 0 when a slot was taken, the remaining backoff in seconds while the
+        registry asked us to wait, or None when the window is full.
+        """
+        remaining = self.backoff_until - time.monotonic()
+        if remaining > 0:
+            return remaining
+        if self.in_flight < self.window:
+            self.in_flight += 1
+            self.requests += 1
+            return 0.0
+        return None
+
+    def acquire(self):
+        """Block the calling thread until a slot is free."""
+        if not self.enabled:
+            return
+        with self._cond:
+            waited = False
+            while True:
+                delay = self._try_acquire()
+                if delay == 0.0:
+                    break
+                waited = True
+                self._cond.wait(timeout=delay)
+            if waited:
+                self.waits += 1
+
+    async def acquire_async(self):
+        """Wait on the event loop (without blocking it) until a slot is free."""
+        if not self.enabled:
+            return
+        loop = asyncio.get_running_loop()
+        waited = False
+        while True:
+            with self._cond:
+                delay = self._try_acquire()
+                if delay == 0.0:
+                    if waited:
+                        self.waits += 1
+                    return
+                future = None
+                if delay is None:
+                    future = loop.create_future()
+                    self._async_waiters.append((loop, future))
+            waited = True
+            if future is None:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await future
+            finally:
+                with self._cond:
+                    if (loop, future) in self._async_waiters:
+                        self._async_waiters.remove((loop, future))
+
+    def release(
+        self,
+        latency: float,
+        status: Optional[int] = None,
+        timed_out: bool = False,
+        retry_after: Optional[str] = None,
+    ):
+        """Return a slot and adapt the window to how the request went."""
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+
+            if timed_out or status in OVERLOAD_STATUSES:
+                if timed_out:
+                    self.timeouts += 1
+                else:
+                    self.overloads += 1
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    self.backoff_until = max(self.backoff_until, now + min(delay, REGISTRY_BACKOFF_MAX))
+                if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+                    self.limit = max(float(self.min_limit), self.limit * self.DECREASE_FACTOR)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif status is not None and status < 500 and latency <= self.latency_target:
+                if self.limit < self.max_limit:
+                    # +1 per window's worth of fast responses
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                    self.increases += 1
+
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the current window and adaptation counters."""
+        with self._cond:
+            return {
+                "enabled": self.enabled,
+                "window": self.window,
+                "in_flight": self.in_flight,
+                "min_window": self.min_limit,
+                "max_window": self.max_limit,
+                "backoff_remaining": round(max(0.0, self.backoff_until - time.monotonic()), 3),
+                "requests": self.requests,
+                "waits": self.waits,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "overloads": self.overloads,
+                "timeouts": self.timeouts,
+            }
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without contacting a registry while its circuit breaker is open.
+
+    Subclasses requests' ConnectionError so existing handlers for unreachable
+    registries treat a fast failure the same way as a slow one.
+    """
+
+    def __init__(self, name: str, retry_in: float):
+        self.registry = name
+        self.retry_in = retry_in
+        super().__init__(f"Circuit breaker open for registry '{name}': registry unavailable, retry in {retry_in:.1f}s")
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one registry.
+
+    ``allow()`` is a lock-free state check while the breaker is closed, so the
+    common path costs nothing. When a ``probe`` callable is given, an open
+    breaker is tested by a daemon thread instead of by callers' requests; the
+    probe returns True once the registry answers again.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = REGISTRY_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = REGISTRY_BREAKER_RESET_TIMEOUT,
+        probe: Optional[Callable[[], bool]] = None,
+        enabled: bool = REGISTRY_BREAKER_ENABLED,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._probe_thread: Optional[threading.Thread] = None
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.consecutive_failures = 0
+        self._trial_in_flight = False
+
+        self.opens = 0
+        self.rejected = 0
+        self.probes = 0
+        self.probe_failures = 0
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent to the registry now."""
+        if not self.enabled or self.state == self.CLOSED:
+            return True
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.probe is None
+                and self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                # No background probe: let exactly one caller's request test the registry
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def check(self):
+        """Raise CircuitOpenError if the registry must not be contacted."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker next tests the registry (0 when not open)."""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def record(self, status: Optional[int] = None, failed: bool = False):
+        """Record the outcome of a request that was allowed through.
+
+        ``failed`` marks connection errors and timeouts; a ``status`` of None without
+        ``failed`` is an outcome that says nothing about registry health.
+        """
+        if not self.enabled:
+            return
+        if failed or status in BREAKER_FAILURE_STATUSES:
+            self.record_failure()
+        elif status is not None:
+            self.record_success()
+        elif self._trial_in_flight:
+            with self._lock:
+                self._trial_in_flight = False
+                if self.state == self.HALF_OPEN:
+                    self.state = self.OPEN
+
+    def record_success(self):
+        """The registry answered: reset the failure count and close the breaker."""
+        if self.state == self.CLOSED and not self.consecutive_failures:
+            return
+        with self._lock:
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit breaker for registry '{self.name}' closed: registry recovered")
+                self.state = self.CLOSED
+                self._wakeup.set()
+
+    def record_failure(self):
+        """The registry failed: open the breaker once failures reach the threshold."""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        """Open the breaker and start the recovery probe (caller holds the lock)."""
+        if self.state != self.OPEN:
+            self.opens += 1
+            logger.warning(
+                f"Circuit breaker for registry '{self.name}' opened after "
+                f"{self.consecutive_failures} consecutive failures"
+            )
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        if self.probe is not None and (self._probe_thread is None or not self._probe_thread.is_alive()):
+            self._wakeup.clear()
+            self._probe_thread = threading.Thread(
+                target=self._probe_loop, name=f"registry-breaker-{self.name}", daemon=True
+            )
+            self._probe_thread.start()
+
+    def _probe_loop(self):
+        """Probe the registry every reset timeout until it answers, then close the breaker."""
+        while True:
+            self._wakeup.wait(self.reset_timeout)
+            with self._lock:
+                if self.state != self.OPEN:
+                    return
+                self.state = self.HALF_OPEN
+                self.probes += 1
+            try:
+                healthy = bool(self.probe())
+            except Exception:
+                healthy = False
+            if healthy:
+                self.record_success()
+                return
+            with self._lock:
+                self.probe_failures += 1
+                if self.state == self.CLOSED:
+                    return
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stop(self):
+        """Reset to closed and end a running recovery probe (the registry is being removed)."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the breaker state and its counters."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "state": self.state,
+                "state_value": self.STATE_VALUES[self.state],
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_in": round(self.retry_in(), 3),
+                "opens": self.opens,
+                "rejected": self.rejected,
+                "probes": self.probes,
+                "probe_failures": self.probe_failures,
+            }
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+_Task = Tuple[Hashable, Future, Callable[..., Any], tuple, dict]
+
+
+class RegistryExecutor:
+    """Process-wide bounded thread pool for blocking registry work, with a bulkhead per registry.
+
+    Work is submitted under a bulkhead key, normally the registry name. Health checks use
+    health_lane(name) so they are never queued behind bulk work on the same registry.
+    """
+
+    def __init__(self, max_workers: int = REGISTRY_EXECUTOR_MAX_WORKERS, bulkhead: int = REGISTRY_EXECUTOR_BULKHEAD):
+        self.max_workers = max(1, max_workers)
+        self.bulkhead = max(1, min(bulkhead, self.max_workers))
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="registry-worker")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # Tasks waiting for their bulkhead or a free worker, in round-robin order of keys
+        self._queues: "OrderedDict[Hashable, Deque[_Task]]" = OrderedDict()
+        self._active: Dict[Hashable, int] = {}
+        self._peak: Dict[Hashable, int] = {}
+        self._running = 0
+        self._threads: set = set()
+
+        self.submitted = 0
+        self.completed = 0
+        self.caller_runs = 0
+        self.peak_active = 0
+
+    @staticmethod
+    def health_lane(registry: str) -> str:
+        """Bulkhead key for connection tests and metadata of a registry."""
+        return f"{registry}:health"
+
+    def submit(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Run fn(*args, **kwargs) within the bulkhead of `key` and return its Future."""
+        future: Future = Future()
+        task = (key, future, fn, args, kwargs)
+        with self._lock:
+            self.submitted += 1
+            if self._can_start(key):
+                self._start(key)
+                start = True
+            elif getattr(self._local, "worker", False):
+                # Waiting here could deadlock a worker on its own pool; do the work instead
+                self.caller_runs += 1
+                start = None
+            else:
+                self._queues.setdefault(key, deque()).append(task)
+                start = False
+
+        if start:
+            self._pool.submit(self._run, task)
+        elif start is None:
+            self._execute(future, fn, args, kwargs)
+        return future
+
+    def map(self, key: Hashable, fn: Callable[..., Any], items: Iterable[Any]) -> List[Any]:
+        """Apply fn to every item within the bulkhead of `key`; results keep the input order."""
+        futures = [self.submit(key, fn, item) for item in items]
+        return [future.result() for future in futures]
+
+    def _can_start(self, key: Hashable) -> bool:
+        return self._running < self.max_workers and self._active.get(key, 0) < self.bulkhead
+
+    def _start(self, key: Hashable):
+        """Account for a task handed to the pool (caller must hold the lock)."""
+        self._running += 1
+        self._active[key] = self._active.get(key, 0) + 1
+        self._peak[key] = max(self._peak.get(key, 0), self._active[key])
+        self.peak_active = max(self.peak_active, self._running)
+
+    def _next_queued(self) -> Optional[_Task]:
+        """Pop the next task whose bulkhead has room, rotating between keys (caller must hold the lock)."""
+        for key in list(self._queues):
+            queue = self._queues[key]
+            if self._active.get(key, 0) < self.bulkhead:
+                task = queue.popleft()
+                if queue:
+                    self._queues.move_to_end(key)
+                else:
+                    del self._queues[key]
+                return task
+        return None
+
+    @staticmethod
+    def _execute(future: Future, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _run(self, task: _Task):
+        key, future, fn, args, kwargs = task
+        self._local.worker = True
+        try:
+            self._execute(future, fn, args, kwargs)
+        finally:
+            ready = []
+            with self._lock:
+                self._threads.add(threading.get_ident())
+                self._running -= 1
+                self._active[key] -= 1
+                if not self._active[key]:
+                    del self._active[key]
+                self.completed += 1
+                while self._running < self.max_workers:
+                    queued = self._next_queued()
+                    if queued is None:
+                        break
+                    self._start(queued[0])
+                    ready.append(queued)
+            for queued in ready:
+                self._pool.submit(self._run, queued)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return worker and queue gauges, overall and per bulkhead."""
+        with self._lock:
+            keys = set(self._active) | set(self._queues)
+            return {
+                "max_workers": self.max_workers,
+                "bulkhead": self.bulkhead,
+                "threads": len(self._threads),
+                "active_workers": self._running,
+                "queue_depth": sum(len(queue) for queue in self._queues.values()),
+                "peak_active_workers": self.peak_active,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "caller_runs": self.caller_runs,
+                "bulkheads": {
+                    str(key): {
+                        "active": self._active.get(key, 0),
+                        "queued": len(self._queues.get(key, ())),
+                        "peak_active": self._peak.get(key, 0),
+                    }
+                    for key in keys
+                },
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
+
+
+_registry_executor: Optional[RegistryExecutor] = None
+_registry_executor_lock = threading.Lock()
+
+
+def get_registry_executor() -> RegistryExecutor:
+    """The process-wide executor, created on first use."""
+    global _registry_executor
+    with _registry_executor_lock:
+        if _registry_executor is None:
+            _registry_executor = RegistryExecutor()
+        return _registry_executor
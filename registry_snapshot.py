@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Registry Snapshot Module
+
+Offline, on-disk copy of a registry's subjects, versions and schemas that the
+registry client answers reads from without a round trip. A snapshot is a SQLite
+file (built from an export or a live sync, see export_snapshot.py) opened
+read-only and memory-mapped, so lookups are indexed and nothing is loaded into
+memory up front:
+
+- contexts(context)
+- versions(context, subject, version, id), also indexed by (context, id)
+- schemas(context, id, schema_type, schema, refs)
+- meta(key, value): format, registry, source and when it was built
+
+RegistrySnapshot answers GET /contexts, /subjects, /subjects/{s}/versions,
+/subjects/{s}/versions/{v} and /schemas/ids/{id}[/subjects|/versions], in the
+default context or under /contexts/{context}, with the registry's JSON and error
+bodies. Anything else (configs, modes, compatibility checks, queries) still goes
+to the registry. Writes through the client mark the subjects they touch, and
+reads of those go to the registry until the snapshot is rebuilt.
+
+Subjects, versions and schema IDs the snapshot does not have go to the registry
+too, since they may have been registered after it was built; the snapshot only
+answers them "not found" (get(url, offline=True)) once the registry cannot be
+reached.
+
+Snapshot files are never modified in place: a rebuild writes a new file and
+moves it over the old one, and reload() switches to it.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from registry_cache import STORED_RESPONSE_HEADERS, CachedResponse, _split_context
+
+logger = logging.getLogger(__name__)
+
+# Registry Snapshot Configuration
+# Bytes of the snapshot file SQLite may memory-map (0 disables memory-mapped reads)
+REGISTRY_SNAPSHOT_MMAP_BYTES = int(os.getenv("REGISTRY_SNAPSHOT_MMAP_BYTES", str(256 * 1024 * 1024)))
+
+SNAPSHOT_FORMAT = "schema-registry-snapshot+sqlite"
+SNAPSHOT_FORMAT_VERSION = 1
+
+_SCHEMA_DDL = (
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE contexts (context TEXT PRIMARY KEY)",
+    "CREATE TABLE versions (context TEXT, subject TEXT, version INTEGER, id INTEGER,"
+    " PRIMARY KEY (context, subject, version)) WITHOUT ROWID",
+    "CREATE TABLE schemas (context TEXT, id INTEGER, schema_type TEXT, schema TEXT, refs TEXT,"
+    " PRIMARY KEY (context, id)) WITHOUT ROWID",
+)
+# Built after loading, which is faster than maintaining it row by row
+_INDEX_DDL = "CREATE INDEX versions_by_id ON versions (context, id)"
+
+
+class SnapshotWriter:
+    """Builds a snapshot file from export records (context and schema records; others are ignored).
+
+    The file is written under a .part name and moved into place on close.
+    """
+
+    def __init__(self, path: str, registry: str, source: str):
+        self.path = path
+        self.partial_path = f"{path}.part"
+        self.registry = registry
+        self.source = source
+        self.contexts = 0
+        self.versions = 0
+        self._subjects = set()
+        if os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.partial_path)
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        for statement in _SCHEMA_DDL:
+            self._conn.execute(statement)
+
+    def _add_context(self, context: str):
+        if self._conn.execute("INSERT OR IGNORE INTO contexts VALUES (?)", (context,)).rowcount:
+            self.contexts += 1
+
+    def write(self, record: Dict[str, Any]):
+        kind = record.get("type")
+        if kind == "context":
+            self._add_context(record["context"])
+        elif kind == "schema":
+            context = record["context"]
+            self._add_context(context)
+            schema = record.get("schema") or ""
+            if not isinstance(schema, str):
+                schema = json.dumps(schema, separators=(",", ":"))
+            references = record.get("references")
+            self._conn.execute(
+                "INSERT OR IGNORE INTO schemas VALUES (?, ?, ?, ?, ?)",
+                (
+                    context,
+                    record["id"],
+                    record.get("schemaType", "AVRO"),
+                    schema,
+                    json.dumps(references) if references else None,
+                ),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?)",
+                (context, record["subject"], record["version"], record["id"]),
+            )
+            self._subjects.add((context, record["subject"]))
+            self.versions += 1
+
+    def close(self) -> Dict[str, Any]:
+        """Finish the file, move it to its final path and return its metadata."""
+        meta = {
+            "format": SNAPSHOT_FORMAT,
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "registry": self.registry,
+            "source": self.source,
+            "created_at": datetime.now().isoformat(),
+            "context_count": self.contexts,
+            "subject_count": len(self._subjects),
+            "version_count": self.versions,
+        }
+        self._conn.execute(_INDEX_DDL)
+        self._conn.executemany("INSERT INTO meta VALUES (?, ?)", [(k, json.dumps(v)) for k, v in meta.items()])
+        self._conn.commit()
+        self._conn.close()
+        os.replace(self.partial_path, self.path)
+        return {"path": self.path, "bytes": os.path.getsize(self.path), **meta}
+
+    def abort(self):
+        """Drop the partial file."""
+        self._conn.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+
+
+def _not_found(error_code: int, message: str) -> CachedResponse:
+    body = json.dumps({"error_code": error_code, "message": message}).encode("utf-8")
+    return CachedResponse(404, body, dict(STORED_RESPONSE_HEADERS), "utf-8")
+
+
+def _ok(result: Any) -> CachedResponse:
+    return CachedResponse(200, json.dumps(result).encode("utf-8"), dict(STORED_RESPONSE_HEADERS), "utf-8")
+
+
+def _schema_body(schema_type: str, schema: str, refs: Optional[str]) -> Dict[str, Any]:
+    """The registry's schema fields; like the registry, schemaType is left out for AVRO."""
+    body: Dict[str, Any] = {}
+    if schema_type != "AVRO":
+        body["schemaType"] = schema_type
+    if refs:
+        body["references"] = json.loads(refs)
+    body["schema"] = schema
+    return body
+
+
+class RegistrySnapshot:
+    """Read-only view of a snapshot file that answers plain registry GETs for one registry.
+
+    A missing file is not an error: reads go to the registry until one is built and reload() is called.
+    """
+
+    def __init__(self, path: str, base_url: str):
+        self.path = path
+        self.base_url = base_url.rstrip("/")
+        self.meta: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._built_at: Optional[float] = None
+        # Write sequence numbers of changed subjects, and of changes to a whole context
+        self._writes = 0
+        self._changed: Dict[Tuple[str, str], int] = {}
+        self._changed_contexts: Dict[str, int] = {}
+        self.served = 0
+        self.passed_through = 0
+        self.reload()
+
+    @property
+    def loaded(self) -> bool:
+        return self._conn is not None
+
+    @property
+    def write_sequence(self) -> int:
+        """Sequence number of the last write recorded; pass it to reload() after a rebuild that began then."""
+        with self._lock:
+            return self._writes
+
+    def reload(self, synced_through: Optional[int] = None) -> bool:
+        """(Re)open the snapshot file; returns whether one is loaded.
+
+        Writes recorded up to `synced_through` are forgotten, as the new file already contains them.
+        """
+        conn = None
+        meta: Dict[str, Any] = {}
+        if os.path.exists(self.path):
+            try:
+                conn = sqlite3.connect(
+                    f"{Path(self.path).resolve().as_uri()}?mode=ro&immutable=1", uri=True, check_same_thread=False
+                )
+                conn.execute(f"PRAGMA mmap_size = {REGISTRY_SNAPSHOT_MMAP_BYTES}")
+                meta = {key: json.loads(value) for key, value in conn.execute("SELECT key, value FROM meta")}
+                if meta.get("format") != SNAPSHOT_FORMAT:
+                    raise ValueError(f"not a {SNAPSHOT_FORMAT} file")
+            except (sqlite3.Error, ValueError) as e:
+                logger.error(f"Cannot open registry snapshot {self.path}: {e}")
+                if conn is not None:
+                    conn.close()
+                conn, meta = None, {}
+        else:
+            logger.warning(f"Registry snapshot {self.path} does not exist yet; reads go to the registry")
+
+        with self._lock:
+            old, self._conn, self.meta = self._conn, conn, meta
+            self._built_at = os.path.getmtime(self.path) if conn is not None else None
+            if synced_through is not None:
+                self._changed = {key: seq for key, seq in self._changed.items() if seq > synced_through}
+                self._changed_contexts = {
+                    key: seq for key, seq in self._changed_contexts.items() if seq > synced_through
+                }
+        if old is not None:
+            old.close()
+        if conn is not None:
+            logger.info(f"Loaded registry snapshot {self.path} ({meta.get('version_count', 0)} versions)")
+        return conn is not None
+
+    def close(self):
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def record_write(self, context: str, subject: Optional[str]):
+        """Mark a subject (or, without one, the whole context) as changed since the snapshot."""
+        with self._lock:
+            self._writes += 1
+            if subject is None:
+                self._changed_contexts[context] = self._writes
+            else:
+                self._changed[(context, subject)] = self._writes
+
+    def _is_current(self, context: Optional[str] = None, subject: Optional[str] = None) -> bool:
+        """Whether nothing the read depends on was written since the snapshot (caller holds the lock).
+
+        No context: any context-level write counts; no subject: any write to the context counts.
+        """
+        if context is None:
+            return not self._changed_contexts
+        if context in self._changed_contexts:
+            return False
+        if subject is None:
+            return not any(key[0] == context for key in self._changed)
+        return (context, subject) not in self._changed
+
+    def get(self, url: str, offline: bool = False) -> Optional[CachedResponse]:
+        """Answer a plain GET of this registry from the snapshot, or None to send it to the registry.
+
+        Reads of what the snapshot does not have are sent to the registry, unless `offline` (the
+        registry could not be reached), in which case they get the registry's not-found answer.
+        """
+        if self._conn is None or not url.startswith(self.base_url):
+            return None
+        parts = urlsplit(url[len(self.base_url) :] or "/")
+        if parts.query:
+            return None
+
+        with self._lock:
+            if self._conn is None:
+                return None
+            path = parts.path or "/"
+            if path == "/contexts":
+                response = self._contexts() if self._is_current() else None
+            else:
+                context, path = _split_context(path)
+                response = self._route(context, path.rstrip("/").split("/")[1:], offline)
+            if response is None:
+                self.passed_through += 1
+            else:
+                self.served += 1
+            return response
+
+    def _route(self, context: str, segments: List[str], offline: bool) -> Optional[CachedResponse]:
+        if segments == ["subjects"]:
+            return self._subjects(context) if self._is_current(context) else None
+        if len(segments) in (3, 4) and segments[0] == "subjects" and segments[2] == "versions":
+            subject = unquote(segments[1])
+            if not self._is_current(context, subject):
+                return None
+            if len(segments) == 3:
+                return self._versions(context, subject, offline)
+            return self._version(context, subject, segments[3], offline)
+        if len(segments) in (3, 4) and segments[:2] == ["schemas", "ids"] and segments[2].isdigit():
+            if not self._is_current(context):
+                return None
+            view = segments[3] if len(segments) == 4 else None
+            if view not in (None, "subjects", "versions"):
+                return None
+            return self._schema_by_id(context, int(segments[2]), view, offline)
+        return None
+
+    def _contexts(self) -> CachedResponse:
+        return _ok([row[0] for row in self._conn.execute("SELECT context FROM contexts ORDER BY context")])
+
+    def _subjects(self, context: str) -> CachedResponse:
+        rows = self._conn.execute(
+            "SELECT DISTINCT subject FROM versions WHERE context = ? ORDER BY subject", (context,)
+        ).fetchall()
+        return _ok([row[0] for row in rows])
+
+    def _versions(self, context: str, subject: str, offline: bool) -> Optional[CachedResponse]:
+        rows = self._conn.execute(
+            "SELECT version FROM versions WHERE context = ? AND subject = ? ORDER BY version", (context, subject)
+        ).fetchall()
+        if not rows:
+            return _not_found(40401, f"Subject '{subject}' not found.") if offline else None
+        return _ok([row[0] for row in rows])
+
+    def _version(self, context: str, subject: str, version: str, offline: bool) -> Optional[CachedResponse]:
+        query = (
+            "SELECT v.version, v.id, s.schema_type, s.schema, s.refs FROM versions v"
+            " JOIN schemas s ON s.context = v.context AND s.id = v.id WHERE v.context = ? AND v.subject = ?"
+        )
+        if version in ("latest", "-1"):
+            row = self._conn.execute(f"{query} ORDER BY v.version DESC LIMIT 1", (context, subject)).fetchone()
+        elif version.isdigit():
+            row = self._conn.execute(f"{query} AND v.version = ?", (context, subject, int(version))).fetchone()
+        else:
+            return None
+        if row is None:
+            if not offline:
+                return None
+            exists = self._conn.execute(
+                "SELECT 1 FROM versions WHERE context = ? AND subject = ? LIMIT 1", (context, subject)
+            ).fetchone()
+            if exists is None:
+                return _not_found(40401, f"Subject '{subject}' not found.")
+            return _not_found(40402, f"Version {version} not found.")
+        number, schema_id, schema_type, schema, refs = row
+        return _ok({"subject": subject, "version": number, "id": schema_id, **_schema_body(schema_type, schema, refs)})
+
+    def _schema_by_id(
+        self, context: str, schema_id: int, view: Optional[str], offline: bool
+    ) -> Optional[CachedResponse]:
+        if view is None:
+            row = self._conn.execute(
+                "SELECT schema_type, schema, refs FROM schemas WHERE context = ? AND id = ?", (context, schema_id)
+            ).fetchone()
+            if row is None:
+                return _not_found(40403, f"Schema {schema_id} not found") if offline else None
+            return _ok(_schema_body(*row))
+
+        rows = self._conn.execute(
+            "SELECT subject, version FROM versions WHERE context = ? AND id = ? ORDER BY subject, version",
+            (context, schema_id),
+        ).fetchall()
+        if not rows:
+            return _not_found(40403, f"Schema {schema_id} not found") if offline else None
+        if view == "subjects":
+            return _ok(list(dict.fromkeys(subject for subject, _ in rows)))
+        return _ok([{"subject": subject, "version": version} for subject, version in rows])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the snapshot's metadata, age and served/passed-through read counters."""
+        with self._lock:
+            return {
+                "enabled": True,
+                "path": self.path,
+                "loaded": self._conn is not None,
+                "source": self.meta.get("source"),
+                "created_at": self.meta.get("created_at"),
+                "age_seconds": round(time.time() - self._built_at, 3) if self._built_at is not None else 0,
+                "contexts": self.meta.get("context_count", 0),
+                "subjects": self.meta.get("subject_count", 0),
+                "versions": self.meta.get("version_count", 0),
+                "served": self.served,
+                "passed_through": self.passed_through,
+                "changed_subjects": len(self._changed),
+                "changed_contexts": len(self._changed_contexts),
+            }
@@ -30,6 +30,8 @@ Usage:
 
 import logging
 import os
+import random
+import threading
 import time
 from collections import defaultdict
 from datetime import datetime, timezone
@@ -46,12 +48,120 @@ from kafka_schema_registry_unified_mcp import (
     mcp,
     registry_manager,
 )
+from registry_cache import schema_id_store
+from registry_resilience import get_registry_executor
 
 # Configure logging for remote deployment
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Background registry health monitor feeding /health and /ready
+HEALTH_MONITOR_INTERVAL = float(os.getenv("HEALTH_MONITOR_INTERVAL", "15"))  # seconds between probe rounds
+HEALTH_MONITOR_JITTER = float(os.getenv("HEALTH_MONITOR_JITTER", "0.1"))  # +/- fraction of the interval
+HEALTH_MONITOR_TIMEOUT = float(os.getenv("HEALTH_MONITOR_TIMEOUT", "5"))  # per-registry probe deadline
+# A snapshot older than this means the monitor is stuck; defaults to three missed rounds
+HEALTH_MONITOR_STALE_AFTER = float(os.getenv("HEALTH_MONITOR_STALE_AFTER", str(HEALTH_MONITOR_INTERVAL * 3)))
+
+
+# Per-registry client metrics: (stats key, metric name, metric type, help text)
+REGISTRY_CONNECTION_METRICS = [
+    ("requests", "mcp_schema_registry_connection_requests_total", "counter", "Requests sent over pooled connections"),
+    ("connections_opened", "mcp_schema_registry_connections_opened_total", "counter", "New registry connections"),
+    ("connections_reused", "mcp_schema_registry_connections_reused_total", "counter", "Reused keep-alive requests"),
+    (
+        "reuse_ratio",
+        "mcp_schema_registry_connection_reuse_ratio",
+        "gauge",
+        "Fraction of requests on reused connections",
+    ),
+    (
+        "idle_evictions",
+        "mcp_schema_registry_connection_idle_evictions_total",
+        "counter",
+        "Idle connection pool evictions",
+    ),
+    (
+        "coalesced_requests",
+        "mcp_schema_registry_coalesced_requests_total",
+        "counter",
+        "Concurrent identical GETs that shared one in-flight request",
+    ),
+]
+REGISTRY_CACHE_METRICS = [
+    ("hits", "mcp_schema_registry_cache_hits_total", "counter", "Registry reads served from the response cache"),
+    ("misses", "mcp_schema_registry_cache_misses_total", "counter", "Registry reads that missed the response cache"),
+    ("evictions", "mcp_schema_registry_cache_evictions_total", "counter", "Response cache LRU evictions"),
+    ("expirations", "mcp_schema_registry_cache_expirations_total", "counter", "Response cache TTL expirations"),
+    ("invalidations", "mcp_schema_registry_cache_invalidations_total", "counter", "Entries invalidated by writes"),
+    ("entries", "mcp_schema_registry_cache_entries", "gauge", "Entries currently in the response cache"),
+    ("bytes", "mcp_schema_registry_cache_bytes", "gauge", "Bytes currently held by the response cache"),
+]
+REGISTRY_CONCURRENCY_METRICS = [
+    ("window", "mcp_schema_registry_concurrency_window", "gauge", "Current adaptive concurrency window"),
+    ("in_flight", "mcp_schema_registry_requests_in_flight", "gauge", "Registry requests currently in flight"),
+    ("waits", "mcp_schema_registry_concurrency_waits_total", "counter", "Requests that waited for a window slot"),
+    ("decreases", "mcp_schema_registry_concurrency_decreases_total", "counter", "Window shrinks on overload"),
+    ("overloads", "mcp_schema_registry_overload_responses_total", "counter", "429/502/503/504 registry responses"),
+    ("timeouts", "mcp_schema_registry_request_timeouts_total", "counter", "Registry requests that timed out"),
+]
+REGISTRY_BREAKER_METRICS = [
+    (
+        "state_value",
+        "mcp_schema_registry_circuit_state",
+        "gauge",
+        "Circuit breaker state (0=closed, 1=half-open, 2=open)",
+    ),
+    ("opens", "mcp_schema_registry_circuit_opens_total", "counter", "Times the circuit breaker opened"),
+    ("rejected", "mcp_schema_registry_circuit_rejected_total", "counter", "Requests failed fast by an open breaker"),
+    (
+        "probes",
+        "mcp_schema_registry_circuit_probes_total",
+        "counter",
+        "Recovery probes sent while the breaker was open",
+    ),
+    (
+        "consecutive_failures",
+        "mcp_schema_registry_consecutive_failures",
+        "gauge",
+        "Consecutive failed registry requests",
+    ),
+]
+REGISTRY_SNAPSHOT_METRICS = [
+    ("served", "mcp_registry_snapshot_reads_total", "counter", "Registry reads answered from the offline snapshot"),
+    (
+        "passed_through",
+        "mcp_registry_snapshot_passed_through_total",
+        "counter",
+        "Snapshot-covered reads sent to the registry because the subject was written since",
+    ),
+    ("versions", "mcp_registry_snapshot_versions", "gauge", "Schema versions in the loaded snapshot"),
+    ("age_seconds", "mcp_registry_snapshot_age_seconds", "gauge", "Age of the loaded snapshot file"),
+]
+# Process-wide schema-by-ID store metrics (shared by all registries)
+SCHEMA_STORE_METRICS = [
+    ("hits", "mcp_schema_store_hits_total", "counter", "Schema body reads served without a registry round trip"),
+    ("misses", "mcp_schema_store_misses_total", "counter", "Schema body reads that had to fetch from a registry"),
+    ("entries", "mcp_schema_store_entries", "gauge", "Schema bodies held in memory"),
+    ("bytes", "mcp_schema_store_bytes", "gauge", "Bytes of schema bodies held in memory"),
+    ("spilled_entries", "mcp_schema_store_spilled_entries", "gauge", "Schema bodies spilled to disk"),
+    ("spill_reads", "mcp_schema_store_spill_reads_total", "counter", "Schema bodies read back from disk"),
+]
+
+# Process-wide registry executor metrics (shared thread pool with per-registry bulkheads)
+REGISTRY_EXECUTOR_METRICS = [
+    ("threads", "mcp_registry_executor_threads", "gauge", "Worker threads started by the shared executor"),
+    ("active_workers", "mcp_registry_executor_active_workers", "gauge", "Workers currently running registry tasks"),
+    ("queue_depth", "mcp_registry_executor_queue_depth", "gauge", "Registry tasks waiting for a worker"),
+    ("submitted", "mcp_registry_executor_submitted_total", "counter", "Registry tasks submitted to the executor"),
+    ("caller_runs", "mcp_registry_executor_caller_runs_total", "counter", "Nested tasks run inline by a busy worker"),
+]
+REGISTRY_BULKHEAD_METRICS = [
+    ("active", "mcp_registry_bulkhead_active_workers", "gauge", "Workers running tasks for a bulkhead"),
+    ("queued", "mcp_registry_bulkhead_queue_depth", "gauge", "Tasks queued behind a full bulkhead"),
+]
+
+
 # Metrics collection
 class RemoteMCPMetrics:
     """Collect and expose metrics for remote MCP server."""
@@ -235,6 +345,58 @@ class RemoteMCPMetrics:
 
         return stats
 
+    def get_registry_client_stats(self, stats_method: str) -> dict:
+        """Collect per-registry runtime stats exposed by a RegistryClient method (no registry round trips)."""
+        stats = {}
+        try:
+            for registry_name in registry_manager.list_registries():
+                client = registry_manager.get_registry(registry_name)
+                collector = getattr(client, stats_method, None) if client else None
+                if collector is None:
+                    continue
+                try:
+                    client_stats = collector()
+                except Exception as e:
+                    logger.debug(f"Failed to collect {stats_method} for registry '{registry_name}': {e}")
+                    continue
+                if isinstance(client_stats, dict):
+                    stats[registry_name] = client_stats
+        except Exception as e:
+            logger.warning(f"Failed to collect registry client stats: {e}")
+        return stats
+
+    def get_registry_client_metrics(self, stats_method: str, metric_specs: list) -> list:
+        """Render per-registry client stats as Prometheus lines using (stat, name, type, help) specs."""
+        client_stats = self.get_registry_client_stats(stats_method)
+        lines = []
+        for stat_key, metric_name, metric_type, help_text in metric_specs:
+            lines.extend(["", f"# HELP {metric_name} {help_text}", f"# TYPE {metric_name} {metric_type}"])
+            for registry, stats in client_stats.items():
+                lines.append(f'{metric_name}{{registry="{registry}"}} {stats.get(stat_key, 0)}')
+        return lines
+
+    def get_schema_store_metrics(self) -> list:
+        """Render the process-wide schema-by-ID store stats as Prometheus lines."""
+        stats = schema_id_store.get_stats()
+        lines = []
+        for stat_key, metric_name, metric_type, help_text in SCHEMA_STORE_METRICS:
+            lines.extend(["", f"# HELP {metric_name} {help_text}", f"# TYPE {metric_name} {metric_type}"])
+            lines.append(f"{metric_name} {stats.get(stat_key, 0)}")
+        return lines
+
+    def get_registry_executor_metrics(self) -> list:
+        """Render the shared registry executor stats, with per-bulkhead gauges, as Prometheus lines."""
+        stats = get_registry_executor().get_stats()
+        lines = []
+        for stat_key, metric_name, metric_type, help_text in REGISTRY_EXECUTOR_METRICS:
+            lines.extend(["", f"# HELP {metric_name} {help_text}", f"# TYPE {metric_name} {metric_type}"])
+            lines.append(f"{metric_name} {stats.get(stat_key, 0)}")
+        for stat_key, metric_name, metric_type, help_text in REGISTRY_BULKHEAD_METRICS:
+            lines.extend(["", f"# HELP {metric_name} {help_text}", f"# TYPE {metric_name} {metric_type}"])
+            for bulkhead, bulkhead_stats in stats.get("bulkheads", {}).items():
+                lines.append(f'{metric_name}{{bulkhead="{bulkhead}"}} {bulkhead_stats.get(stat_key, 0)}')
+        return lines
+
     def get_uptime(self) -> float:
         """Get server uptime in seconds."""
         return time.time() - self.start_time
@@ -353,6 +515,17 @@ class RemoteMCPMetrics:
             ]
         )
 
+        _, snapshot_age = health_monitor.get_snapshot()
+        if snapshot_age is not None:
+            metrics.extend(
+                [
+                    "",
+                    "# HELP mcp_registry_health_snapshot_age_seconds Age of the background registry health snapshot",
+                    "# TYPE mcp_registry_health_snapshot_age_seconds gauge",
+                    f"mcp_registry_health_snapshot_age_seconds {snapshot_age:.3f}",
+                ]
+            )
+
         # Schema Registry specific metrics
         metrics.extend(
             [
@@ -485,6 +658,15 @@ class RemoteMCPMetrics:
             status_value = 1 if stats.get("status") == "healthy" else 0
             metrics.append(f'mcp_schema_registry_status{{registry="{registry}"}} {status_value}')
 
+        # Per-registry client runtime statistics (read from in-process counters)
+        metrics.extend(self.get_registry_client_metrics("get_connection_stats", REGISTRY_CONNECTION_METRICS))
+        metrics.extend(self.get_registry_client_metrics("get_cache_stats", REGISTRY_CACHE_METRICS))
+        metrics.extend(self.get_registry_client_metrics("get_concurrency_stats", REGISTRY_CONCURRENCY_METRICS))
+        metrics.extend(self.get_registry_client_metrics("get_breaker_stats", REGISTRY_BREAKER_METRICS))
+        metrics.extend(self.get_registry_client_metrics("get_snapshot_stats", REGISTRY_SNAPSHOT_METRICS))
+        metrics.extend(self.get_schema_store_metrics())
+        metrics.extend(self.get_registry_executor_metrics())
+
         metrics.extend(
             [
                 "",
@@ -526,6 +708,127 @@ def get_security_headers() -> dict:
     }
 
 
+class RegistryHealthMonitor:
+    """Probe registries on a schedule and keep the latest health snapshot in memory.
+
+    /health and /ready read the snapshot instead of testing registries inline, so probe
+    traffic is bounded by the monitor interval rather than by how often Kubernetes asks.
+    """
+
+    def __init__(
+        self,
+        manager,
+        registry_mode: str,
+        interval: float = HEALTH_MONITOR_INTERVAL,
+        jitter: float = HEALTH_MONITOR_JITTER,
+        timeout: float = HEALTH_MONITOR_TIMEOUT,
+        stale_after: float = HEALTH_MONITOR_STALE_AFTER,
+    ):
+        self.manager = manager
+        self.registry_mode = registry_mode
+        self.interval = interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.snapshot = None  # replaced atomically after each probe round
+        self.rounds = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _registry_names(self) -> list:
+        if self.registry_mode == "single":
+            default_registry = self.manager.get_default_registry()
+            return [default_registry] if default_registry else []
+        return list(self.manager.list_registries())
+
+    def probe(self) -> dict:
+        """Run one probe round and publish the resulting snapshot."""
+        start = time.monotonic()
+        registries = {}
+        healthy = True
+        try:
+            names = self._registry_names()
+            if not names:
+                healthy = False
+                registries["error"] = "No registry client available"
+            else:
+                results = self.manager.probe_registries(names, max_age=0, timeout=self.timeout)
+                for name in names:
+                    result = results.get(name) or {"status": "error", "error": "Client not available"}
+                    registries[name] = result
+                    if result.get("status") != "connected":
+                        healthy = False
+        except Exception as e:
+            healthy = False
+            registries["error"] = str(e)
+
+        snapshot = {
+            "healthy": healthy,
+            "ready": any(
+                isinstance(result, dict) and result.get("status") == "connected" for result in registries.values()
+            ),
+            "registries": registries,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "probe_duration_ms": (time.monotonic() - start) * 1000,
+            "monotonic": time.monotonic(),
+        }
+        self.snapshot = snapshot
+        self.rounds += 1
+        metrics.record_health_check()
+        return snapshot
+
+    def next_delay(self) -> float:
+        """Interval with random jitter so replicas do not probe registries in lockstep."""
+        return max(0.0, self.interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.probe()
+            except Exception as e:
+                logger.warning(f"Registry health probe failed: {e}")
+            self._stop.wait(self.next_delay())
+
+    def ensure_started(self) -> bool:
+        """Start the monitor thread unless it is already running. Returns True if it was (re)started."""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="registry-health-monitor", daemon=True)
+            self._thread.start()
+            return True
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get_snapshot(self) -> tuple:
+        """Latest snapshot and its age in seconds, or (None, None) before the first round completes."""
+        snapshot = self.snapshot
+        if snapshot is None:
+            return None, None
+        return snapshot, time.monotonic() - snapshot["monotonic"]
+
+    def describe(self, snapshot: dict, age: float) -> dict:
+        """Snapshot metadata included in /health and /ready responses."""
+        return {
+            "checked_at": snapshot["checked_at"] if snapshot else None,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "stale": age is None or age > self.stale_after,
+            "probe_duration_ms": snapshot["probe_duration_ms"] if snapshot else None,
+            "interval_seconds": self.interval,
+            "rounds": self.rounds,
+        }
+
+
+health_monitor = RegistryHealthMonitor(registry_manager, REGISTRY_MODE)
+
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
     """Health check endpoint for Kubernetes and monitoring."""
@@ -556,60 +859,27 @@ async def health_check(request):
             },
         }
 
-        # Test registry connectivity
-        registry_health = {}
-        overall_healthy = True
+        # Serve registry health from the background monitor's snapshot instead of probing inline
+        health_monitor.ensure_started()
+        snapshot, age = health_monitor.get_snapshot()
+        snapshot_info = health_monitor.describe(snapshot, age)
 
-        try:
-            if REGISTRY_MODE == "single":
-                # Test single registry
-                default_registry = registry_manager.get_default_registry()
-                if default_registry:
-                    client = registry_manager.get_registry(default_registry)
-                    if client:
-                        test_result = client.test_connection()
-                        registry_health[default_registry] = test_result
-                        if test_result.get("status") != "connected":
-                            overall_healthy = False
-                    else:
-                        overall_healthy = False
-                        registry_health["error"] = "No registry client available"
-            else:
-                # Test all registries in multi mode
-                for registry_name in registry_manager.list_registries():
-                    try:
-                        client = registry_manager.get_registry(registry_name)
-                        if client:
-                            test_result = client.test_connection()
-                            registry_health[registry_name] = test_result
-                            if test_result.get("status") != "connected":
-                                overall_healthy = False
-                        else:
-                            registry_health[registry_name] = {
-                                "status": "error",
-                                "error": "Client not available",
-                            }
-                            overall_healthy = False
-                    except Exception as e:
-                        registry_health[registry_name] = {
-                            "status": "error",
-                            "error": str(e),
-                        }
-                        overall_healthy = False
-
-        except Exception as e:
-            overall_healthy = False
-            registry_health["error"] = str(e)
-
-        # Update server status based on registry health
-        if not overall_healthy:
-            server_status["status"] = "degraded"
+        if snapshot is None:
+            # First probe round still running: the server itself is up
+            overall_healthy = True
+            registry_health = {}
+            server_status["status"] = "starting"
+        else:
+            overall_healthy = snapshot["healthy"] and not snapshot_info["stale"]
+            registry_health = snapshot["registries"]
+            if not overall_healthy:
+                server_status["status"] = "degraded"
 
+        server_status["health_snapshot"] = snapshot_info
+        server_status["snapshot_age_seconds"] = snapshot_info["age_seconds"]
         server_status["registries"] = registry_health
         server_status["response_time_ms"] = (time.time() - start_time) * 1000
 
-        # Record metrics
-        metrics.record_health_check()
         metrics.record_request("health", time.time() - start_time, overall_healthy)
 
         # Return appropriate HTTP status with security headers
@@ -684,20 +954,36 @@ async def prometheus_metrics(request):
 
 @mcp.custom_route("/ready", methods=["GET"])
 async def readiness_check(request):
-    """Readiness check for Kubernetes (simpler than health check)."""
+    """Readiness check for Kubernetes: ready once the first health probe round has completed.
+
+    Registry outages and a stale snapshot are reported in the body but keep the server ready, since
+    cached and offline-snapshot reads can still be served.
+    """
     try:
         from starlette.responses import JSONResponse
 
         security_headers = get_security_headers()
 
+        health_monitor.ensure_started()
+        snapshot, age = health_monitor.get_snapshot()
+        snapshot_info = health_monitor.describe(snapshot, age)
+        if snapshot is None:
+            status = "starting"
+        else:
+            status = "stale" if snapshot_info["stale"] else "ready"
+
         return JSONResponse(
             {
-                "status": "ready",
+                "status": status,
+                "registry_reachable": snapshot is not None and snapshot["ready"],
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "uptime_seconds": metrics.get_uptime(),
+                "snapshot_age_seconds": snapshot_info["age_seconds"],
+                "health_snapshot": snapshot_info,
                 "mcp_protocol_version": MCP_PROTOCOL_VERSION,
                 "oauth_2_1_compliant": True,
             },
+            status_code=503 if snapshot is None else 200,
             headers=security_headers,
         )
     except Exception as e:
@@ -1189,6 +1475,12 @@ def main():
         os.environ["UVICORN_HOST"] = host
         os.environ["UVICORN_PORT"] = str(port)
 
+        # Probe registries in the background so /health and /ready never block on them
+        health_monitor.ensure_started()
+        logger.info(
+            f"🩺 Registry health monitor: every {HEALTH_MONITOR_INTERVAL}s (±{HEALTH_MONITOR_JITTER:.0%} jitter)"
+        )
+
         # Only streamable-http transport is supported (SSE deprecated per MCP 2025-06-18)
         logger.info("🚀 Starting MCP server with streamable-http transport")
         mcp.run(transport="streamable-http")
@@ -552,6 +552,25 @@ EXPORT_SUBJECT_SCHEMA = {
     "additionalProperties": True,
 }
 
+# Offline registry snapshot build response
+REGISTRY_SNAPSHOT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "Snapshot file"},
+        "registry": {"type": "string", "description": "Registry name"},
+        "source": {"type": "string", "description": "Export or registry URL the snapshot was built from"},
+        "created_at": {"type": "string", "format": "date-time"},
+        "context_count": {"type": "integer", "minimum": 0},
+        "subject_count": {"type": "integer", "minimum": 0},
+        "version_count": {"type": "integer", "minimum": 0},
+        "bytes": {"type": "integer", "minimum": 0, "description": "Size of the snapshot file"},
+        "duration_seconds": {"type": "number", "minimum": 0},
+        **METADATA_FIELDS,
+    },
+    "required": ["path", "source", "subject_count", "version_count"],
+    "additionalProperties": True,
+}
+
 # ===== MIGRATION SCHEMAS =====
 
 # Migration response
@@ -601,6 +620,11 @@ COUNT_SCHEMA = {
             "description": "Context name if scoped to context",
         },
         "registry": {"type": "string", "description": "Registry name"},
+        "refreshed_at": {
+            "type": "string",
+            "format": "date-time",
+            "description": "When the counted figures were last read from the registry",
+        },
         **METADATA_FIELDS,
     },
     "required": ["count", "scope"],
@@ -635,6 +659,7 @@ REGISTRY_STATISTICS_SCHEMA = {
                     "name": {"type": "string"},
                     "subject_count": {"type": "integer", "minimum": 0},
                     "schema_count": {"type": "integer", "minimum": 0},
+                    "refreshed_at": {"type": "string", "format": "date-time"},
                 },
                 "required": ["name", "subject_count", "schema_count"],
             },
@@ -645,12 +670,113 @@ REGISTRY_STATISTICS_SCHEMA = {
             "format": "date-time",
             "description": "When statistics were generated",
         },
+        "snapshot_refreshed_at": {
+            "type": ["string", "null"],
+            "format": "date-time",
+            "description": "Oldest refresh time of the statistics snapshot the figures come from",
+        },
+        "snapshot_age_seconds": {
+            "type": "number",
+            "minimum": 0,
+            "description": "Age of the oldest context in the statistics snapshot",
+        },
         **METADATA_FIELDS,
     },
     "required": ["total_contexts", "total_subjects", "total_schemas"],
     "additionalProperties": True,
 }
 
+# Summary and power-of-two histogram of one analytics column
+DISTRIBUTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "count": {"type": "integer", "minimum": 0},
+        "min": {"type": "integer", "minimum": 0},
+        "max": {"type": "integer", "minimum": 0},
+        "mean": {"type": "number", "minimum": 0},
+        "p50": {"type": "integer", "minimum": 0},
+        "p90": {"type": "integer", "minimum": 0},
+        "p99": {"type": "integer", "minimum": 0},
+        "histogram": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "le": {"type": "integer", "description": "Largest value in the bucket"},
+                    "count": {"type": "integer", "minimum": 0},
+                },
+                "required": ["le", "count"],
+            },
+        },
+    },
+    "required": ["count", "min", "max", "mean"],
+}
+
+TOP_SUBJECTS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "subject": {"type": "string"},
+            "context": {"type": "string"},
+            "versions": {"type": "integer", "minimum": 0},
+            "latest_version": {"type": "integer", "minimum": 0},
+            "size_bytes": {"type": "integer", "minimum": 0, "description": "Size of the latest version"},
+        },
+        "required": ["subject", "context", "versions", "size_bytes"],
+    },
+}
+
+ANALYTICS_CUBE_PROPERTIES = {
+    "subjects": {"type": "integer", "minimum": 0, "description": "Number of subjects"},
+    "versions": {"type": "integer", "minimum": 0, "description": "Number of schema versions"},
+    "total_bytes": {"type": "integer", "minimum": 0, "description": "Size of all schema versions"},
+    "versions_per_subject": DISTRIBUTION_SCHEMA,
+    "schema_size_bytes": DISTRIBUTION_SCHEMA,
+    "field_count": DISTRIBUTION_SCHEMA,
+    "schema_types": {
+        "type": "object",
+        "additionalProperties": {"type": "integer", "minimum": 0},
+        "description": "Schema versions per schema type (AVRO, JSON, PROTOBUF)",
+    },
+    "top_subjects_by_versions": TOP_SUBJECTS_SCHEMA,
+    "top_subjects_by_size": TOP_SUBJECTS_SCHEMA,
+}
+
+REGISTRY_ANALYTICS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "registry": {"type": "string", "description": "Registry name"},
+        "context": {"type": ["string", "null"], "description": "Analyzed context, null for the whole registry"},
+        "top_n": {"type": "integer", "minimum": 0},
+        "total_contexts": {"type": "integer", "minimum": 0, "description": "Total number of contexts"},
+        **ANALYTICS_CUBE_PROPERTIES,
+        "contexts": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"context": {"type": "string"}, **ANALYTICS_CUBE_PROPERTIES},
+                "required": ["context", "subjects", "versions"],
+            },
+            "description": "Per-context analytics",
+        },
+        "errors": {
+            "type": "object",
+            "additionalProperties": {"type": "string"},
+            "description": "Contexts that could not be read",
+        },
+        "computed_in_seconds": {"type": "number", "minimum": 0},
+        "generated_at": {
+            "type": "string",
+            "format": "date-time",
+            "description": "When analytics were generated",
+        },
+        **METADATA_FIELDS,
+    },
+    "required": ["total_contexts", "subjects", "versions", "versions_per_subject", "schema_types"],
+    "additionalProperties": True,
+}
+
 # ===== TASK MANAGEMENT SCHEMAS =====
 
 # Task status response
@@ -1000,6 +1126,7 @@ TOOL_OUTPUT_SCHEMAS = {
         "type": "object",
         "additionalProperties": True,
     },  # Complex export structure
+    "build_registry_snapshot": REGISTRY_SNAPSHOT_SCHEMA,
     # Migration Operations
     "migrate_schema": MIGRATE_SCHEMA_SCHEMA,
     "migrate_context": MIGRATE_SCHEMA_SCHEMA,  # Similar structure
@@ -1015,6 +1142,7 @@ TOOL_OUTPUT_SCHEMAS = {
     "count_schemas": COUNT_SCHEMA,
     "count_schema_versions": COUNT_SCHEMA,
     "get_registry_statistics": REGISTRY_STATISTICS_SCHEMA,
+    "get_registry_analytics": REGISTRY_ANALYTICS_SCHEMA,
     # Batch Operations
     "clear_context_batch": BATCH_OPERATION_SCHEMA,
     "clear_multiple_contexts_batch": BATCH_OPERATION_SCHEMA,
@@ -6,30 +6,72 @@ Shared functionality for both single and multi-registry MCP servers.
 Includes registry management, HTTP utilities, authentication, and export functionality.
 """
 
+import asyncio
 import base64
 import ipaddress
 import json
 import logging
 import os
 import re
+import signal
 import ssl
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import quote, urlparse
+import weakref
+from collections import ChainMap
+from concurrent.futures import wait as wait_futures
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, urlencode, urlparse
 
 import aiohttp
+import httpx
 import requests
 import urllib3
-from requests.adapters import HTTPAdapter
+from dotenv import dotenv_values
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from registry_cache import (
+    AsyncSingleFlight,
+    CachedResponse,
+    RegistryResponseCache,
+    ServerMetadataCache,
+    SingleFlight,
+    StatisticsSnapshot,
+)
+from registry_resilience import (
+    BREAKER_FAILURE_STATUSES,
+    REGISTRY_BREAKER_PROBE_TIMEOUT,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    get_registry_executor,
+)
+from registry_snapshot import RegistrySnapshot
+
+
+def read_credential(var: str, environ: Optional[Mapping[str, str]] = None) -> str:
+    """Read a credential from the secret file named by ``<var>_FILE`` if set, else from ``<var>``.
+
+    Variables are looked up in `environ` (default: the process environment).
+    """
+    environ = os.environ if environ is None else environ
+    secret_file = environ.get(f"{var}_FILE", "")
+    if secret_file:
+        try:
+            with open(secret_file, encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError as e:
+            logging.getLogger(__name__).error(f"Failed to read {var}_FILE: {e}")
+    return environ.get(var, "")
+
+
 # Environment variables for single registry mode (backward compatibility)
 SINGLE_REGISTRY_URL = os.getenv("SCHEMA_REGISTRY_URL", "")
-SINGLE_REGISTRY_USER = os.getenv("SCHEMA_REGISTRY_USER", "")
-SINGLE_REGISTRY_PASSWORD = os.getenv("SCHEMA_REGISTRY_PASSWORD", "")
+SINGLE_REGISTRY_USER = read_credential("SCHEMA_REGISTRY_USER")
+SINGLE_REGISTRY_PASSWORD = read_credential("SCHEMA_REGISTRY_PASSWORD")
 # Support both VIEWONLY (new) and READONLY (deprecated) for backward compatibility
 SINGLE_VIEWONLY = os.getenv("VIEWONLY", os.getenv("READONLY", "false")).lower() in ("true", "1", "yes", "on")
 
@@ -52,6 +94,45 @@ ENFORCE_SSL_TLS_VERIFICATION = os.getenv("ENFORCE_SSL_TLS_VERIFICATION", "true")
 CUSTOM_CA_BUNDLE_PATH = os.getenv("CUSTOM_CA_BUNDLE_PATH", "")
 SSL_CERT_PINNING_ENABLED = os.getenv("SSL_CERT_PINNING_ENABLED", "false").lower() in ("true", "1", "yes", "on")
 
+# Connection Pooling Configuration
+# Pool size defaults to the initial adaptive concurrency window (REGISTRY_CONCURRENCY_INITIAL)
+# so requests admitted by the limiter never wait for a socket.
+DEFAULT_REGISTRY_POOL_SIZE = 10
+REGISTRY_KEEPALIVE_ENABLED = os.getenv("REGISTRY_KEEPALIVE_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+REGISTRY_POOL_SIZE = int(os.getenv("REGISTRY_POOL_SIZE", str(DEFAULT_REGISTRY_POOL_SIZE)))
+REGISTRY_POOL_IDLE_TIMEOUT = float(os.getenv("REGISTRY_POOL_IDLE_TIMEOUT", "60"))  # seconds
+
+# Opt-in HTTP/2 transport (requires the h2 package: pip install "httpx[http2]")
+REGISTRY_HTTP2_ENABLED = os.getenv("REGISTRY_HTTP2_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+# Speak HTTP/2 to plain http:// registries without negotiation (h2c prior knowledge)
+REGISTRY_HTTP2_CLEARTEXT = os.getenv("REGISTRY_HTTP2_CLEARTEXT", "false").lower() in ("true", "1", "yes", "on")
+
+# Offline registry snapshot (SQLite file built by build_registry_snapshot) that reads are answered from;
+# per registry SCHEMA_REGISTRY_SNAPSHOT_X in multi-registry mode
+REGISTRY_SNAPSHOT_PATH = os.getenv("REGISTRY_SNAPSHOT_PATH", "")
+
+# Registry configuration reload: optional KEY=VALUE file with the SCHEMA_REGISTRY_* variables,
+# re-applied on SIGHUP or when it changes (polled every REGISTRY_CONFIG_WATCH_INTERVAL seconds, 0 disables)
+REGISTRY_CONFIG_FILE = os.getenv("REGISTRY_CONFIG_FILE", "")
+REGISTRY_CONFIG_WATCH_INTERVAL = float(os.getenv("REGISTRY_CONFIG_WATCH_INTERVAL", "5"))
+_NUMBERED_REGISTRY_URL = re.compile(r"^SCHEMA_REGISTRY_URL_(\d+)$")
+
+# Credential rotation: mounted *_FILE credential secrets are polled every REGISTRY_CREDENTIALS_WATCH_INTERVAL
+# seconds (0 disables) and the registries' credentials re-read when one of them changes
+REGISTRY_CREDENTIALS_WATCH_INTERVAL = float(os.getenv("REGISTRY_CREDENTIALS_WATCH_INTERVAL", "5"))
+# Clients replaced or removed by a reload are closed once their requests in flight finish, or after this many seconds
+REGISTRY_CLIENT_DRAIN_TIMEOUT = float(os.getenv("REGISTRY_CLIENT_DRAIN_TIMEOUT", "30"))
+
+# Registry health snapshot: connection tests younger than the TTL are served without re-probing
+REGISTRY_HEALTH_SNAPSHOT_TTL = float(os.getenv("REGISTRY_HEALTH_SNAPSHOT_TTL", "5"))  # seconds
+# Per-registry deadline for a connection test before it is reported as timed out
+REGISTRY_HEALTH_PROBE_TIMEOUT = float(os.getenv("REGISTRY_HEALTH_PROBE_TIMEOUT", "5"))  # seconds
+
+# Bulk schema listing (GET /schemas) page size
+REGISTRY_BULK_PAGE_SIZE = int(os.getenv("REGISTRY_BULK_PAGE_SIZE", "1000"))
+# Statuses meaning the registry has no usable bulk listing endpoint
+BULK_UNSUPPORTED_STATUSES = (404, 405, 501)
+
 
 # SSL/TLS Configuration Logging
 def log_ssl_configuration():
@@ -188,27 +269,335 @@ def validate_url(url: str) -> bool:
         return False
 
 
-class SecureHTTPAdapter(HTTPAdapter):
+def create_secure_ssl_context() -> ssl.SSLContext:
+    """Create the hardened SSL context shared by sync and async registry clients."""
+    context = ssl.create_default_context()
+
+    # Configure SSL context for maximum security
+    context.check_hostname = True
+    context.verify_mode = ssl.CERT_REQUIRED
+
+    # Disable weak protocols and ciphers
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.set_ciphers("ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS")
+
+    return context
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with keep-alive connection pooling, idle eviction and reuse accounting."""
+
+    def __init__(self, *args, idle_timeout: float = REGISTRY_POOL_IDLE_TIMEOUT, **kwargs):
+        self.idle_timeout = idle_timeout
+        self.idle_evictions = 0
+        self._pool_lock = threading.Lock()
+        self._in_flight = 0
+        self._last_used = time.monotonic()
+        # Counters of pools that were already evicted (live pools are read on demand)
+        self._retired_requests = 0
+        self._retired_connections = 0
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        """Send a request over a pooled connection, evicting the pool first if it sat idle too long."""
+        with self._pool_lock:
+            if (
+                self.idle_timeout > 0
+                and self._in_flight == 0
+                and time.monotonic() - self._last_used > self.idle_timeout
+            ):
+                self._evict_idle_connections()
+            self._in_flight += 1
+            self._last_used = time.monotonic()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._pool_lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def _iter_pools(self):
+        """Yield the live urllib3 connection pools owned by this adapter."""
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                yield pool
+
+    def _evict_idle_connections(self):
+        """Close stale keep-alive connections (caller must hold the pool lock)."""
+        for pool in self._iter_pools():
+            self._retired_requests += pool.num_requests
+            self._retired_connections += pool.num_connections
+        self.poolmanager.clear()
+        self.idle_evictions += 1
+        logging.getLogger(__name__).debug("Evicted idle registry connections after %.0fs", self.idle_timeout)
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Return request/connection counters used to compute the connection reuse rate."""
+        with self._pool_lock:
+            requests_total = self._retired_requests
+            connections_total = self._retired_connections
+            for pool in self._iter_pools():
+                requests_total += pool.num_requests
+                connections_total += pool.num_connections
+            return {
+                "requests": requests_total,
+                "connections_opened": connections_total,
+                "idle_evictions": self.idle_evictions,
+            }
+
+
+class SecureHTTPAdapter(PooledHTTPAdapter):
     """Custom HTTP adapter with enhanced SSL/TLS security."""
 
     def __init__(self, *args, **kwargs):
+        self._ssl_context: Optional[ssl.SSLContext] = None
         super().__init__(*args, **kwargs)
 
     def init_poolmanager(self, *args, **kwargs):
         """Initialize the pool manager with secure SSL context."""
-        context = ssl.create_default_context()
-
-        # Configure SSL context for maximum security
-        context.check_hostname = True
-        context.verify_mode = ssl.CERT_REQUIRED
-
-        # Disable weak protocols and ciphers
-        context.minimum_version = ssl.TLSVersion.TLSv1_2
-        context.set_ciphers("ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS")
+        context = create_secure_ssl_context()
 
+        # The pool manager outlives idle evictions, so every pooled connection reuses this context
+        self._ssl_context = context
         kwargs["ssl_context"] = context
         return super().init_poolmanager(*args, **kwargs)
 
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Apply the hardened SSL context to proxied connections as well."""
+        if self._ssl_context is not None:
+            proxy_kwargs.setdefault("ssl_context", self._ssl_context)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+class HTTP2Adapter(BaseAdapter):
+    """requests adapter that multiplexes concurrent requests over one HTTP/2 connection via httpx.
+
+    Mounted on a RegistrySession in place of the urllib3 adapters, so caching, coalescing,
+    the concurrency limiter and the circuit breaker work unchanged. TLS uses the same
+    hardened SSL context as SecureHTTPAdapter; HTTP/2 is negotiated through ALPN on https
+    and used with prior knowledge on http when ``cleartext`` is set.
+    """
+
+    # Connection-specific headers are forbidden in HTTP/2 (RFC 9113, section 8.2.2)
+    HOP_BY_HOP_HEADERS = ("connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade")
+
+    def __init__(
+        self,
+        pool_size: int = REGISTRY_POOL_SIZE,
+        idle_timeout: float = REGISTRY_POOL_IDLE_TIMEOUT,
+        cleartext: bool = False,
+    ):
+        super().__init__()
+        if ENFORCE_SSL_TLS_VERIFICATION:
+            verify: Union[ssl.SSLContext, bool] = create_secure_ssl_context()
+            if CUSTOM_CA_BUNDLE_PATH and os.path.exists(CUSTOM_CA_BUNDLE_PATH):
+                verify.load_verify_locations(CUSTOM_CA_BUNDLE_PATH)
+        else:
+            verify = False
+        # Raises ImportError when the h2 package is missing
+        self._client = httpx.Client(
+            http1=not cleartext,
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=max(1, pool_size),
+                max_keepalive_connections=max(1, pool_size),
+                keepalive_expiry=idle_timeout if idle_timeout > 0 else None,
+            ),
+            trust_env=False,
+        )
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.http2_requests = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        """Send a prepared request through httpx and return a requests Response."""
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in self.HOP_BY_HOP_HEADERS]
+
+        try:
+            upstream = self._client.request(
+                request.method, request.url, headers=headers, content=request.body, timeout=httpx_timeout
+            )
+        except httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except httpx.ConnectError as e:
+            if isinstance(e.__context__, ssl.SSLError) or "CERTIFICATE_VERIFY_FAILED" in str(e):
+                raise requests.exceptions.SSLError(e, request=request)
+            raise requests.exceptions.ConnectionError(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        with self._stats_lock:
+            self.requests += 1
+            if upstream.http_version == "HTTP/2":
+                self.http2_requests += 1
+
+        response = requests.Response()
+        response.status_code = upstream.status_code
+        response.reason = upstream.reason_phrase
+        response.headers = requests.structures.CaseInsensitiveDict(upstream.headers)
+        # httpx already decoded any Content-Encoding
+        response.headers.pop("Content-Encoding", None)
+        response._content = upstream.content
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.elapsed = upstream.elapsed
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        self._client.close()
+
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Return request counters for this transport."""
+        with self._stats_lock:
+            return {"requests": self.requests, "http2_requests": self.http2_requests}
+
+
+class RegistrySession(requests.Session):
+    """requests Session that serves idempotent registry reads through a response cache.
+
+    Tools call ``client.session.get/post/put/delete`` directly, so the cache lives here
+    to cover both RegistryClient methods and those direct calls. Concurrent identical
+    GETs that miss the cache are coalesced into one upstream request, and every request
+    that reaches the registry holds a slot of the registry's adaptive concurrency limiter.
+    While the registry's circuit breaker is open, requests fail fast with CircuitOpenError.
+    With an offline snapshot, the reads it covers are answered from it before the cache;
+    reads it has no entry for go to the registry and get its not-found answer only when
+    the registry cannot be reached.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[RegistryResponseCache] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        snapshot: Optional[RegistrySnapshot] = None,
+    ):
+        super().__init__()
+        self.cache = cache
+        self.limiter = limiter
+        self.breaker = breaker
+        self.snapshot = snapshot
+        self.inflight = SingleFlight()
+
+    def request(self, method, url, *args, use_cache: bool = True, **kwargs):
+        """Send a request, reading GETs through the cache and invalidating it on writes."""
+        method = method.upper()
+        if method == "GET" and not args and not kwargs.get("params") and not kwargs.get("stream"):
+            return self._get(url, use_cache, **kwargs)
+
+        response = self._send(method, url, *args, **kwargs)
+        if self.cache is not None and method not in ("HEAD", "OPTIONS"):
+            self.cache.invalidate_for_write(method, url)
+        return response
+
+    def _send(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        """Send a request upstream within the registry's concurrency window, unless its breaker is open."""
+        if self.breaker is not None:
+            self.breaker.check()
+        if self.limiter is not None:
+            self.limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except (requests.Timeout, requests.ConnectionError):
+            self._record(time.monotonic() - start, timed_out=True)
+            raise
+        except Exception:
+            self._record(time.monotonic() - start)
+            raise
+        self._record(time.monotonic() - start, response.status_code, response.headers.get("Retry-After"))
+        return response
+
+    def _record(
+        self,
+        latency: float,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        timed_out: bool = False,
+    ):
+        """Feed the outcome of an upstream request to the limiter and the circuit breaker."""
+        if self.limiter is not None:
+            self.limiter.release(latency, status, timed_out=timed_out, retry_after=retry_after)
+        if self.breaker is not None:
+            self.breaker.record(status, failed=timed_out)
+
+    def _get(self, url: str, use_cache: bool, **kwargs) -> requests.Response:
+        """Serve a plain GET from the snapshot or cache, or share one upstream request among concurrent callers."""
+        if self.snapshot is not None and use_cache:
+            answered = self.snapshot.get(url)
+            if answered is not None:
+                return self._build_response(url, answered, reason="OK" if answered.status_code == 200 else "Not Found")
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return self._build_response(url, cached)
+
+        # Keyed by cache generation so a read never joins a request that started before a write
+        generation = self.cache.generation if self.cache is not None else None
+        try:
+            response, shared = self.inflight.do((url, generation), lambda: self._send("GET", url, **kwargs))
+        except requests.RequestException:
+            # Includes CircuitOpenError
+            answered = self._offline_answer(url, use_cache)
+            if answered is None:
+                raise
+            return self._build_response(url, answered, reason="OK" if answered.status_code == 200 else "Not Found")
+        if response.status_code in BREAKER_FAILURE_STATUSES:
+            answered = self._offline_answer(url, use_cache)
+            if answered is not None:
+                return self._build_response(url, answered, reason="OK" if answered.status_code == 200 else "Not Found")
+        if shared:
+            return self._build_response(
+                url,
+                CachedResponse(response.status_code, response.content, dict(response.headers), response.encoding),
+                reason=response.reason,
+            )
+
+        if self.cache is not None and use_cache and response.status_code == 200:
+            self.cache.put(
+                url,
+                CachedResponse(
+                    response.status_code,
+                    response.content,
+                    {"Content-Type": response.headers.get("Content-Type", "application/json")},
+                    response.encoding,
+                ),
+                generation=generation,
+            )
+        return response
+
+    def _offline_answer(self, url: str, use_cache: bool) -> Optional[CachedResponse]:
+        """The snapshot's not-found answer for a read it has no entry for, once the registry failed it."""
+        if self.snapshot is None or not use_cache:
+            return None
+        return self.snapshot.get(url, offline=True)
+
+    @staticmethod
+    def _build_response(url: str, cached: CachedResponse, reason: str = "OK") -> requests.Response:
+        """Build a fresh Response for a cache hit so callers never share parsed state."""
+        response = requests.Response()
+        response.status_code = cached.status_code
+        response.reason = reason
+        response._content = cached.content
+        response.headers = requests.structures.CaseInsensitiveDict(cached.headers)
+        response.encoding = cached.encoding
+        response.url = url
+        response.elapsed = timedelta(0)
+        return response
+
 
 @dataclass
 class RegistryConfig:
@@ -220,10 +609,20 @@ class RegistryConfig:
     password: str = ""
     description: str = ""
     viewonly: bool = False
+    pool_size: int = REGISTRY_POOL_SIZE
+    http2: bool = REGISTRY_HTTP2_ENABLED
+    # Offline snapshot file reads are answered from; empty for none
+    snapshot_path: str = ""
+    # Environment variables the credentials were read from, re-read by reload_credentials()
+    user_env: str = ""
+    password_env: str = ""
+    # Where those variables are looked up (default: the process environment)
+    environ: Optional[Mapping[str, str]] = field(default=None, compare=False, repr=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with sensitive data masked."""
-        result = asdict(self)
+        result = asdict(replace(self, environ=None))
+        del result["environ"]
         if result.get("password"):
             result["password"] = "***MASKED***"
         return result
@@ -265,15 +664,35 @@ class RegistryClient:
 
         self.config = config
         self.auth = None
-        # Don't store authorization headers as instance variables
-        self._base_headers = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
-        self._base_standard_headers = {"Content-Type": "application/json"}
-
-        if config.user and config.password:
-            self.auth = HTTPBasicAuth(config.user, config.password)
+        self._headers: Dict[str, str] = {}
+        self._standard_headers: Dict[str, str] = {}
+        self._credentials_lock = threading.Lock()
+        self._load_auth()
+
+        # Per-registry read-through response cache shared by the sync and async clients
+        self.cache = RegistryResponseCache(config.url)
+        # Per-registry adaptive concurrency window shared by the sync and async clients
+        self.limiter = AdaptiveConcurrencyLimiter(config.name)
+        # Per-registry circuit breaker shared by the sync and async clients
+        self.breaker = CircuitBreaker(config.name, probe=self._probe_registry)
+        # Long-lived server metadata shared by the sync and async clients
+        self.metadata_cache = ServerMetadataCache()
+        self._metadata_flight = SingleFlight()
+        # Materialized statistics, told about every write made through the shared cache
+        self.statistics = StatisticsSnapshot()
+        self.cache.write_listeners.append(self.statistics.record_write)
+        # Offline snapshot shared by the sync and async clients, told which subjects writes change
+        self.snapshot: Optional[RegistrySnapshot] = None
+        if config.snapshot_path:
+            self.snapshot = RegistrySnapshot(config.snapshot_path, config.url)
+            self.cache.write_listeners.append(self.snapshot.record_write)
 
         # Create secure session with SSL/TLS configuration
         self.session = self._create_secure_session()
+        self._async_client: Optional["AsyncRegistryClient"] = None
+        self._async_client_lock = threading.Lock()
+        # Learned on first use of GET /schemas; None until then
+        self.supports_bulk_schemas: Optional[bool] = None
 
         # Log SSL configuration for this client
         logger = logging.getLogger(__name__)
@@ -281,7 +700,12 @@ class RegistryClient:
 
     def _create_secure_session(self) -> requests.Session:
         """Create a secure requests session with proper SSL/TLS configuration."""
-        session = requests.Session()
+        session = RegistrySession(self.cache, self.limiter, self.breaker, self.snapshot)
+
+        # Size the keep-alive pool per registry; pool_block=False lets bursts open extra
+        # short-lived connections instead of stalling callers.
+        pool_size = max(1, self.config.pool_size)
+        pool_kwargs = {"pool_connections": 1, "pool_maxsize": pool_size}
 
         # Configure SSL verification
         if ENFORCE_SSL_TLS_VERIFICATION:
@@ -293,7 +717,7 @@ class RegistryClient:
                 logging.getLogger(__name__).info(f"Using custom CA bundle: {CUSTOM_CA_BUNDLE_PATH}")
 
             # Mount secure adapter for HTTPS connections
-            session.mount("https://", SecureHTTPAdapter())
+            session.mount("https://", SecureHTTPAdapter(**pool_kwargs))
 
         else:
             # SSL verification disabled (not recommended for production)
@@ -302,6 +726,12 @@ class RegistryClient:
             logging.getLogger(__name__).warning(
                 "SSL verification is DISABLED - this is not recommended for production use"
             )
+            session.mount("https://", PooledHTTPAdapter(**pool_kwargs))
+
+        session.mount("http://", PooledHTTPAdapter(**pool_kwargs))
+
+        if self.config.http2:
+            self._mount_http2_transport(session)
 
         # Configure session timeouts for security
         session.timeout = 30  # 30 second default timeout
@@ -310,34 +740,194 @@ class RegistryClient:
         session.headers.update(
             {
                 "User-Agent": "KafkaSchemaRegistryMCP/2.0.0 (Security Enhanced)",
-                "Connection": "close",  # Don't keep connections alive unnecessarily
+                # Reuse pooled connections unless keep-alive was explicitly disabled
+                "Connection": "keep-alive" if REGISTRY_KEEPALIVE_ENABLED else "close",
             }
         )
 
         return session
 
+    def _mount_http2_transport(self, session: requests.Session):
+        """Replace the HTTP/1.1 adapters with the multiplexed HTTP/2 transport where it applies."""
+        logger = logging.getLogger(__name__)
+        try:
+            session.mount("https://", HTTP2Adapter(pool_size=self.config.pool_size))
+            if REGISTRY_HTTP2_CLEARTEXT:
+                session.mount("http://", HTTP2Adapter(pool_size=self.config.pool_size, cleartext=True))
+            elif self.config.url.startswith("http://"):
+                logger.warning(
+                    f"HTTP/2 for registry '{self.config.name}' needs https or REGISTRY_HTTP2_CLEARTEXT=true; "
+                    "using HTTP/1.1"
+                )
+        except ImportError as e:
+            logger.warning(f"HTTP/2 transport unavailable for registry '{self.config.name}' ({e}); using HTTP/1.1")
+            return
+        logger.info(f"HTTP/2 transport enabled for registry '{self.config.name}'")
+
+    @property
+    def async_client(self) -> "AsyncRegistryClient":
+        """Get the asyncio counterpart of this client, created on first use."""
+        if self._async_client is None:
+            with self._async_client_lock:
+                if self._async_client is None:
+                    self._async_client = AsyncRegistryClient(
+                        self.config,
+                        cache=self.cache,
+                        limiter=self.limiter,
+                        breaker=self.breaker,
+                        metadata_cache=self.metadata_cache,
+                        statistics=self.statistics,
+                        snapshot=self.snapshot,
+                    )
+        return self._async_client
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics for this registry."""
+        return {"registry": self.config.name, **self.cache.get_stats()}
+
+    def get_snapshot_stats(self) -> Dict[str, Any]:
+        """Get offline snapshot statistics for this registry."""
+        if self.snapshot is None:
+            return {"registry": self.config.name, "enabled": False}
+        return {"registry": self.config.name, **self.snapshot.get_stats()}
+
+    def get_schema_store_stats(self) -> Dict[str, Any]:
+        """Get statistics of the process-wide schema-by-ID store this registry reads through."""
+        return self.cache.schema_store.get_stats()
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get keep-alive connection pool statistics for this registry."""
+        requests_total = 0
+        connections_total = 0
+        idle_evictions = 0
+        http2_requests = 0
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, PooledHTTPAdapter):
+                adapter_stats = adapter.get_connection_stats()
+                requests_total += adapter_stats["requests"]
+                connections_total += adapter_stats["connections_opened"]
+                idle_evictions += adapter_stats["idle_evictions"]
+            elif isinstance(adapter, HTTP2Adapter):
+                http2_requests += adapter.get_connection_stats()["http2_requests"]
+
+        connections_reused = max(requests_total - connections_total, 0)
+        return {
+            "registry": self.config.name,
+            "keepalive_enabled": REGISTRY_KEEPALIVE_ENABLED,
+            "pool_size": self.config.pool_size,
+            "requests": requests_total,
+            "connections_opened": connections_total,
+            "connections_reused": connections_reused,
+            "reuse_ratio": round(connections_reused / requests_total, 4) if requests_total else 0.0,
+            "idle_evictions": idle_evictions,
+            "http2_requests": http2_requests,
+            "coalesced_requests": self.get_coalesced_requests(),
+        }
+
+    def get_concurrency_stats(self) -> Dict[str, Any]:
+        """Get the adaptive concurrency window and its adaptation counters for this registry."""
+        return {"registry": self.config.name, **self.limiter.get_stats()}
+
+    def get_breaker_stats(self) -> Dict[str, Any]:
+        """Get the circuit breaker state and counters for this registry."""
+        return {"registry": self.config.name, **self.breaker.get_stats()}
+
+    def close(self):
+        """Close pooled connections and stop the breaker probe (used when a registry is removed or reconfigured)."""
+        self.breaker.stop()
+        self.session.close()
+        if self._async_client is not None:
+            self._async_client.close_sessions()
+        if self.snapshot is not None:
+            self.snapshot.close()
+
+    def close_when_idle(self, timeout: float = REGISTRY_CLIENT_DRAIN_TIMEOUT) -> threading.Thread:
+        """Close on a background thread once no request holds a limiter slot, or after `timeout` seconds.
+
+        Used for clients a reload replaced while tools may still be using them. Without an enabled
+        limiter in-flight requests cannot be counted, so the close waits for the whole timeout.
+        """
+
+        def drain():
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline and (not self.limiter.enabled or self.limiter.in_flight):
+                time.sleep(0.05)
+            self.close()
+
+        thread = threading.Thread(target=drain, name=f"registry-drain-{self.config.name}", daemon=True)
+        thread.start()
+        return thread
+
+    def _probe_registry(self) -> bool:
+        """Recovery probe for the circuit breaker: one cheap GET that bypasses cache, limiter and breaker."""
+        response = requests.Session.request(
+            self.session,
+            "GET",
+            f"{self.config.url}/config",
+            auth=self.auth,
+            headers=self.headers,
+            timeout=REGISTRY_BREAKER_PROBE_TIMEOUT,
+        )
+        return response.status_code not in BREAKER_FAILURE_STATUSES
+
+    def get_coalesced_requests(self) -> int:
+        """Number of GETs that shared another caller's in-flight request (sync and async paths)."""
+        coalesced = self.session.inflight.coalesced
+        if self._async_client is not None:
+            coalesced += self._async_client.inflight.coalesced
+        return coalesced
+
+    def _load_auth(self):
+        """Build the auth object and request headers once from the configured credentials."""
+        if self.config.user and self.config.password:
+            self.auth = HTTPBasicAuth(self.config.user, self.config.password)
+        else:
+            self.auth = None
+        self._headers = self._get_headers()
+        self._standard_headers = self._get_headers("application/json")
+
+    def reload_credentials(self, user: Optional[str] = None, password: Optional[str] = None) -> bool:
+        """Rotate this registry's credentials without recreating the client or its connection pool.
+
+        Explicit values win; otherwise credentials are re-read from the environment variables
+        (or their ``*_FILE`` secret files) they were originally loaded from.
+        Returns True if the credentials changed.
+        """
+        environ = self.config.environ
+        if user is None:
+            user = read_credential(self.config.user_env, environ) if self.config.user_env else self.config.user
+        if password is None:
+            password = (
+                read_credential(self.config.password_env, environ) if self.config.password_env else self.config.password
+            )
+        with self._credentials_lock:
+            if (user, password) == (self.config.user, self.config.password):
+                return False
+            self.config.user = user
+            self.config.password = password
+            self._load_auth()
+            if self._async_client is not None:
+                self._async_client._load_auth()
+        logging.getLogger(__name__).info(f"Reloaded credentials for registry '{self.config.name}'")
+        return True
+
     def _get_headers(self, content_type: str = "application/vnd.schemaregistry.v1+json") -> Dict[str, str]:
-        """Get headers with authentication, created fresh each time."""
+        """Build headers with authentication for the given content type."""
         headers = {"Content-Type": content_type}
         if self.auth:
-            # Create auth header dynamically without storing credentials
             credentials = base64.b64encode(f"{self.config.user}:{self.config.password}".encode()).decode()
             headers["Authorization"] = f"Basic {credentials}"
         return headers
 
-    def _get_standard_headers(self) -> Dict[str, str]:
-        """Get standard headers with authentication, created fresh each time."""
-        return self._get_headers("application/json")
-
     @property
     def headers(self) -> Dict[str, str]:
-        """Get default headers for registry operations."""
-        return self._get_headers()
+        """Get default headers for registry operations (built once; do not mutate)."""
+        return self._headers
 
     @property
     def standard_headers(self) -> Dict[str, str]:
-        """Get standard headers for configuration operations."""
-        return self._get_standard_headers()
+        """Get standard headers for configuration operations (built once; do not mutate)."""
+        return self._standard_headers
 
     def __repr__(self) -> str:
         """Safe representation without credentials."""
@@ -350,11 +940,7 @@ class RegistryClient:
         return f"Registry '{self.config.name}' at {self.config.url} ({auth_status}, {ssl_status})"
 
     def build_context_url(self, base_url: str, context: Optional[str] = None) -> str:
-        """Build URL with optional context support."""
-        # Validate base registry URL
-        if not validate_url(self.config.url):
-            raise ValueError("Invalid registry URL")
-
+        """Build URL with optional context support (registry URL is validated on initialization)."""
         # Handle default context "." as no context
         if context and context != ".":
             # URL encode the context to prevent injection
@@ -370,6 +956,7 @@ class RegistryClient:
                 auth=self.auth,
                 headers=self.headers,
                 timeout=10,
+                use_cache=False,
             )
             if response.status_code == 200:
                 return {
@@ -378,12 +965,14 @@ class RegistryClient:
                     "url": self.config.url,
                     "response_time_ms": response.elapsed.total_seconds() * 1000,
                     "ssl_verified": ENFORCE_SSL_TLS_VERIFICATION,
+                    "circuit_breaker": self.breaker.state,
                 }
             else:
                 return {
                     "status": "error",
                     "registry": self.config.name,
                     "error": f"HTTP {response.status_code}: {response.text}",
+                    "circuit_breaker": self.breaker.state,
                 }
         except requests.exceptions.SSLError as e:
             return {
@@ -391,9 +980,15 @@ class RegistryClient:
                 "registry": self.config.name,
                 "error": f"SSL verification failed: {str(e)}",
                 "ssl_error": True,
+                "circuit_breaker": self.breaker.state,
             }
         except Exception as e:
-            return {"status": "error", "registry": self.config.name, "error": str(e)}
+            return {
+                "status": "error",
+                "registry": self.config.name,
+                "error": str(e),
+                "circuit_breaker": self.breaker.state,
+            }
 
     def get_subjects(self, context: Optional[str] = None) -> List[str]:
         """Get subjects from this registry."""
@@ -435,6 +1030,19 @@ class RegistryClient:
         except Exception as e:
             return {"error": str(e)}
 
+    def get_schema_by_id(self, schema_id: int, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get a schema by its ID (served from the schema-by-ID store after the first fetch)."""
+        try:
+            url = self.build_context_url(f"/schemas/ids/{schema_id}", context)
+            response = self.session.get(url, auth=self.auth, headers=self.headers)
+            response.raise_for_status()
+            result = response.json()
+            result["id"] = schema_id
+            result["registry"] = self.config.name
+            return result
+        except Exception as e:
+            return {"error": str(e)}
+
     def register_schema(
         self,
         subject: str,
@@ -642,46 +1250,595 @@ class RegistryClient:
             return {"error": str(e)}
 
     def get_server_metadata(self) -> Dict[str, Any]:
-        """Get comprehensive server metadata including ID and version information."""
-        metadata = {}
-
-        # Get metadata ID information
-        metadata_id = self.get_metadata_id()
-        if "error" not in metadata_id:
-            metadata.update(
-                {
-                    "scope": metadata_id.get("scope", {}),
-                    "kafka_cluster_id": metadata_id.get("scope", {}).get("clusters", {}).get("kafka-cluster"),
-                    "schema_registry_cluster_id": metadata_id.get("scope", {})
-                    .get("clusters", {})
-                    .get("schema-registry-cluster"),
-                }
-            )
+        """Get comprehensive server metadata including ID and version information.
+
+        Served from the metadata cache; once it expires the cached value is returned while a
+        background refresh runs.
+        """
+        metadata, refresh = self.metadata_cache.lookup()
+        if metadata is None:
+            metadata, _ = self._metadata_flight.do("metadata", self._fetch_server_metadata)
+            return dict(metadata)
+        if refresh:
+            executor = get_registry_executor()
+            executor.submit(executor.health_lane(self.config.name), self._refresh_server_metadata)
+        return metadata
+
+    def _fetch_server_metadata(self, concurrent: bool = True) -> Dict[str, Any]:
+        """Fetch both metadata endpoints (in parallel unless called for a background refresh) and cache them."""
+        if concurrent:
+            executor = get_registry_executor()
+            version_future = executor.submit(executor.health_lane(self.config.name), self.get_metadata_version)
+            metadata_id = self.get_metadata_id()
+            metadata_version = version_future.result()
         else:
-            metadata["metadata_id_error"] = metadata_id["error"]
-
-        # Get version information
-        metadata_version = self.get_metadata_version()
-        if "error" not in metadata_version:
-            metadata.update(
-                {
-                    "version": metadata_version.get("version"),
-                    "commit_id": metadata_version.get("commitId"),
-                }
+            metadata_id = self.get_metadata_id()
+            metadata_version = self.get_metadata_version()
+        metadata = build_server_metadata(metadata_id, metadata_version)
+        self.metadata_cache.store(metadata)
+        return metadata
+
+    def _refresh_server_metadata(self):
+        try:
+            self._fetch_server_metadata(concurrent=False)
+        except Exception as e:
+            self.metadata_cache.refresh_failed()
+            logging.getLogger(__name__).warning(f"Metadata refresh failed for registry '{self.config.name}': {e}")
+
+
+def build_server_metadata(metadata_id: Dict[str, Any], metadata_version: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine /v1/metadata/id and /v1/metadata/version results into one metadata dict."""
+    metadata = {}
+
+    if "error" not in metadata_id:
+        metadata.update(
+            {
+                "scope": metadata_id.get("scope", {}),
+                "kafka_cluster_id": metadata_id.get("scope", {}).get("clusters", {}).get("kafka-cluster"),
+                "schema_registry_cluster_id": metadata_id.get("scope", {})
+                .get("clusters", {})
+                .get("schema-registry-cluster"),
+            }
+        )
+    else:
+        metadata["metadata_id_error"] = metadata_id["error"]
+
+    if "error" not in metadata_version:
+        metadata.update(
+            {
+                "version": metadata_version.get("version"),
+                "commit_id": metadata_version.get("commitId"),
+            }
+        )
+    else:
+        metadata["metadata_version_error"] = metadata_version["error"]
+
+    return metadata
+
+
+class RegistryResponseError(Exception):
+    """HTTP error response returned by a Schema Registry."""
+
+    def __init__(self, status: int, body: str = ""):
+        self.status = status
+        self.body = body
+        super().__init__(f"HTTP {status}: {body}")
+
+
+# Shared, read-only header templates for the async client (credentials travel in BasicAuth)
+ASYNC_DEFAULT_HEADERS = {"Content-Type": "application/vnd.schemaregistry.v1+json"}
+ASYNC_STANDARD_HEADERS = {"Content-Type": "application/json"}
+
+
+async def _close_at_loop_shutdown(session: aiohttp.ClientSession):
+    """Async generator that closes `session` when finalized, at the latest by the loop's shutdown_asyncgens()."""
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+async def _finalize(guard) -> None:
+    await guard.aclose()
+
+
+class AsyncRegistryClient:
+    """Asyncio client for a single Schema Registry instance.
+
+    Mirrors the RegistryClient API with coroutine methods so async tools never block the event loop.
+    One aiohttp session (and keep-alive pool) is kept per running event loop.
+    """
+
+    def __init__(
+        self,
+        config: RegistryConfig,
+        cache: Optional[RegistryResponseCache] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        metadata_cache: Optional[ServerMetadataCache] = None,
+        statistics: Optional[StatisticsSnapshot] = None,
+        snapshot: Optional[RegistrySnapshot] = None,
+    ):
+        # Validate the registry URL on initialization
+        if not validate_url(config.url):
+            raise ValueError(f"Invalid or unsafe registry URL: {config.url}")
+
+        self.config = config
+        self.cache = cache
+        self.snapshot = snapshot
+        self.metadata_cache = metadata_cache if metadata_cache is not None else ServerMetadataCache()
+        self.statistics = statistics if statistics is not None else StatisticsSnapshot()
+        self._metadata_refresh: Optional[asyncio.Task] = None
+        self.limiter = limiter if limiter is not None else AdaptiveConcurrencyLimiter(config.name)
+        # Without a background probe the breaker lets one trial request through after the reset timeout
+        self.breaker = breaker if breaker is not None else CircuitBreaker(config.name)
+        self.auth = None
+        self._load_auth()
+
+        # Each loop's session with the guard that closes it when the loop shuts down
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.inflight = AsyncSingleFlight()
+        self.supports_bulk_schemas: Optional[bool] = None
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create a pooled connector with the same SSL/TLS hardening as the sync client."""
+        if ENFORCE_SSL_TLS_VERIFICATION:
+            ssl_context = create_secure_ssl_context()
+            if CUSTOM_CA_BUNDLE_PATH and os.path.exists(CUSTOM_CA_BUNDLE_PATH):
+                ssl_context.load_verify_locations(CUSTOM_CA_BUNDLE_PATH)
+        else:
+            ssl_context = False
+
+        return aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit_per_host=max(1, self.config.pool_size),
+            keepalive_timeout=REGISTRY_POOL_IDLE_TIMEOUT,
+            force_close=not REGISTRY_KEEPALIVE_ENABLED,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session bound to the running event loop, creating it on first use.
+
+        The session is closed by a guard the loop finalizes on shutdown (asyncio.run() does so
+        before closing the loop), so sessions of short-lived loops do not leak their connectors.
+        """
+        loop = asyncio.get_running_loop()
+        session, guard = self._sessions.get(loop, (None, None))
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._create_connector(),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={"User-Agent": "KafkaSchemaRegistryMCP/2.0.0 (Security Enhanced)"},
             )
+            guard = _close_at_loop_shutdown(session)
+            await guard.asend(None)
+            self._sessions[loop] = (session, guard)
+        return session
+
+    async def close(self):
+        """Close the session bound to the running event loop."""
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    def close_sessions(self):
+        """Close the sessions of every event loop, from any thread.
+
+        A session on a running loop is closed on that loop without waiting; one on an idle loop is
+        closed by running the loop. Loops that are already closed closed their session on shutdown.
+        """
+        entries = list(self._sessions.items())
+        self._sessions.clear()
+        for loop, (_, guard) in entries:
+            if loop.is_closed():
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(_finalize(guard), loop)
+            else:
+                loop.run_until_complete(_finalize(guard))
+
+    def _load_auth(self):
+        """Build the BasicAuth object once from the configured credentials."""
+        if self.config.user and self.config.password:
+            self.auth = aiohttp.BasicAuth(self.config.user, self.config.password)
         else:
-            metadata["metadata_version_error"] = metadata_version["error"]
+            self.auth = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Get default headers for registry operations (credentials are sent via BasicAuth)."""
+        return ASYNC_DEFAULT_HEADERS
+
+    @property
+    def standard_headers(self) -> Dict[str, str]:
+        """Get standard headers for configuration operations."""
+        return ASYNC_STANDARD_HEADERS
+
+    def __repr__(self) -> str:
+        """Safe representation without credentials."""
+        return (
+            f"AsyncRegistryClient(name={self.config.name!r}, url={self.config.url!r}, viewonly={self.config.viewonly})"
+        )
+
+    def build_context_url(self, base_url: str, context: Optional[str] = None) -> str:
+        """Build URL with optional context support (registry URL is validated on initialization)."""
+        if context and context != ".":
+            # URL encode the context to prevent injection
+            safe_context = quote(context, safe="")
+            return f"{self.config.url}/contexts/{safe_context}{base_url}"
+        return f"{self.config.url}{base_url}"
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> Tuple[int, str]:
+        """Send a request to the registry and return the status code and response body.
+
+        GETs are answered from the offline snapshot when it covers them, otherwise read
+        through the registry's response cache, and concurrent identical
+        GETs share one upstream request; writes invalidate the cache.
+        """
+        kwargs: Dict[str, Any] = {"auth": self.auth, "headers": headers or self.headers}
+        if payload is not None:
+            kwargs["data"] = json.dumps(payload)
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async def send() -> Tuple[int, str]:
+            self.breaker.check()
+            await self.limiter.acquire_async()
+            start = time.monotonic()
+            try:
+                async with (await self._get_session()).request(method, url, **kwargs) as response:
+                    status, body = response.status, await response.text()
+                    retry_after = response.headers.get("Retry-After")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+                self.limiter.release(time.monotonic() - start, timed_out=True)
+                self.breaker.record(failed=True)
+                raise
+            except BaseException:
+                self.limiter.release(time.monotonic() - start)
+                self.breaker.record()
+                raise
+            self.limiter.release(time.monotonic() - start, status, retry_after=retry_after)
+            self.breaker.record(status)
+            return status, body
+
+        if method != "GET":
+            status, body = await send()
+            if self.cache is not None and method not in ("HEAD", "OPTIONS"):
+                self.cache.invalidate_for_write(method, url)
+            return status, body
+
+        if self.snapshot is not None and use_cache:
+            answered = self.snapshot.get(url)
+            if answered is not None:
+                return answered.status_code, answered.text
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached.status_code, cached.text
+
+        # Keyed by cache generation so a read never joins a request that started before a write
+        generation = self.cache.generation if self.cache is not None else None
+        try:
+            (status, body), shared = await self.inflight.do((url, generation), send)
+        except (requests.RequestException, aiohttp.ClientError, asyncio.TimeoutError):
+            # Includes CircuitOpenError: the snapshot's not-found answer once the registry failed the read
+            answered = self.snapshot.get(url, offline=True) if self.snapshot is not None and use_cache else None
+            if answered is None:
+                raise
+            return answered.status_code, answered.text
+        if status in BREAKER_FAILURE_STATUSES and self.snapshot is not None and use_cache:
+            answered = self.snapshot.get(url, offline=True)
+            if answered is not None:
+                return answered.status_code, answered.text
+        if self.cache is not None and use_cache and not shared and status == 200:
+            self.cache.put(url, CachedResponse(status, body.encode("utf-8"), encoding="utf-8"), generation)
+        return status, body
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a request and decode the JSON body, raising on HTTP errors like raise_for_status()."""
+        status, body = await self.request(method, url, headers=headers, payload=payload, timeout=timeout)
+        if status >= 400:
+            raise RegistryResponseError(status, body)
+        return json.loads(body) if body else None
+
+    async def _request_result(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a request and return its JSON object tagged with the registry name, or an error dict."""
+        try:
+            result = await self._request_json(method, url, headers=headers, payload=payload)
+            result["registry"] = self.config.name
+            return result
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def test_connection(self) -> Dict[str, Any]:
+        """Test connection to this registry."""
+        try:
+            start_time = time.time()
+            status, body = await self.request("GET", f"{self.config.url}/subjects", timeout=10, use_cache=False)
+            if status == 200:
+                return {
+                    "status": "connected",
+                    "registry": self.config.name,
+                    "url": self.config.url,
+                    "response_time_ms": (time.time() - start_time) * 1000,
+                    "ssl_verified": ENFORCE_SSL_TLS_VERIFICATION,
+                    "circuit_breaker": self.breaker.state,
+                }
+            return {
+                "status": "error",
+                "registry": self.config.name,
+                "error": f"HTTP {status}: {body}",
+                "circuit_breaker": self.breaker.state,
+            }
+        except aiohttp.ClientSSLError as e:
+            return {
+                "status": "error",
+                "registry": self.config.name,
+                "error": f"SSL verification failed: {str(e)}",
+                "ssl_error": True,
+                "circuit_breaker": self.breaker.state,
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "registry": self.config.name,
+                "error": str(e),
+                "circuit_breaker": self.breaker.state,
+            }
+
+    async def get_subjects(self, context: Optional[str] = None) -> List[str]:
+        """Get subjects from this registry."""
+        try:
+            return await self._request_json("GET", self.build_context_url("/subjects", context))
+        except Exception:
+            return []
+
+    async def get_contexts(self) -> List[str]:
+        """Get contexts from this registry."""
+        try:
+            return await self._request_json("GET", f"{self.config.url}/contexts")
+        except Exception:
+            return []
+
+    async def delete_subject(self, subject: str, context: Optional[str] = None) -> bool:
+        """Delete a subject from this registry."""
+        try:
+            url = self.build_context_url(f"/subjects/{subject}", context)
+            status, _ = await self.request("DELETE", url, timeout=30)
+            return status in [200, 404]  # 404 means already deleted
+        except Exception:
+            return False
+
+    async def get_schema(self, subject: str, version: str = "latest", context: Optional[str] = None) -> Dict[str, Any]:
+        """Get a specific version of a schema."""
+        url = self.build_context_url(f"/subjects/{subject}/versions/{version}", context)
+        return await self._request_result("GET", url)
+
+    async def get_schema_by_id(self, schema_id: int, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get a schema by its ID (served from the schema-by-ID store after the first fetch)."""
+        url = self.build_context_url(f"/schemas/ids/{schema_id}", context)
+        result = await self._request_result("GET", url)
+        if "error" not in result:
+            result["id"] = schema_id
+        return result
+
+    async def register_schema(
+        self,
+        subject: str,
+        schema_definition: Dict[str, Any],
+        schema_type: str = "AVRO",
+        context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Register a new schema version."""
+        payload = {"schema": json.dumps(schema_definition), "schemaType": schema_type}
+        url = self.build_context_url(f"/subjects/{subject}/versions", context)
+        return await self._request_result("POST", url, payload=payload)
+
+    async def get_global_config(self, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get global configuration settings."""
+        url = self.build_context_url("/config", context)
+        return await self._request_result("GET", url, headers=self.standard_headers)
+
+    async def update_global_config(self, compatibility: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Update global configuration settings."""
+        url = self.build_context_url("/config", context)
+        payload = {"compatibility": compatibility}
+        return await self._request_result("PUT", url, headers=self.standard_headers, payload=payload)
+
+    async def get_subject_config(self, subject: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get configuration settings for a specific subject."""
+        url = self.build_context_url(f"/config/{subject}", context)
+        return await self._request_result("GET", url, headers=self.standard_headers)
+
+    async def update_subject_config(
+        self, subject: str, compatibility: str, context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Update configuration settings for a specific subject."""
+        url = self.build_context_url(f"/config/{subject}", context)
+        payload = {"compatibility": compatibility}
+        return await self._request_result("PUT", url, headers=self.standard_headers, payload=payload)
+
+    async def get_mode(self, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get the current mode of the Schema Registry."""
+        url = self.build_context_url("/mode", context)
+        return await self._request_result("GET", url, headers=self.standard_headers)
+
+    async def update_mode(self, mode: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Update the mode of the Schema Registry."""
+        url = self.build_context_url("/mode", context)
+        return await self._request_result("PUT", url, headers=self.standard_headers, payload={"mode": mode})
+
+    async def get_subject_mode(self, subject: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Get the mode for a specific subject."""
+        url = self.build_context_url(f"/mode/{subject}", context)
+        return await self._request_result("GET", url, headers=self.standard_headers)
+
+    async def update_subject_mode(self, subject: str, mode: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Update the mode for a specific subject."""
+        url = self.build_context_url(f"/mode/{subject}", context)
+        return await self._request_result("PUT", url, headers=self.standard_headers, payload={"mode": mode})
+
+    async def get_schema_versions(
+        self, subject: str, context: Optional[str] = None
+    ) -> Union[List[int], Dict[str, str]]:
+        """Get all versions of a schema."""
+        try:
+            return await self._request_json("GET", self.build_context_url(f"/subjects/{subject}/versions", context))
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def check_compatibility(
+        self,
+        subject: str,
+        schema_definition: Dict[str, Any],
+        schema_type: str = "AVRO",
+        context: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Check if a schema is compatible with the latest version of a subject."""
+        payload = {"schema": json.dumps(schema_definition), "schemaType": schema_type}
+        url = self.build_context_url(f"/compatibility/subjects/{subject}/versions/latest", context)
+        return await self._request_result("POST", url, payload=payload)
+
+    async def get_metadata_id(self) -> Dict[str, Any]:
+        """Get metadata ID information from the registry."""
+        return await self._request_result("GET", f"{self.config.url}/v1/metadata/id")
+
+    async def get_metadata_version(self) -> Dict[str, Any]:
+        """Get version and commit information from the registry."""
+        return await self._request_result("GET", f"{self.config.url}/v1/metadata/version")
+
+    async def get_server_metadata(self) -> Dict[str, Any]:
+        """Get comprehensive server metadata including ID and version information (cached, see RegistryClient)."""
+        metadata, refresh = self.metadata_cache.lookup()
+        if metadata is None:
+            metadata, _ = await self.inflight.do(("metadata",), self._fetch_server_metadata)
+            return dict(metadata)
+        if refresh:
+            self._metadata_refresh = asyncio.get_running_loop().create_task(self._refresh_server_metadata())
+        return metadata
 
+    async def _fetch_server_metadata(self) -> Dict[str, Any]:
+        metadata_id, metadata_version = await asyncio.gather(self.get_metadata_id(), self.get_metadata_version())
+        metadata = build_server_metadata(metadata_id, metadata_version)
+        self.metadata_cache.store(metadata)
         return metadata
 
+    async def _refresh_server_metadata(self):
+        try:
+            await self._fetch_server_metadata()
+        except Exception as e:
+            self.metadata_cache.refresh_failed()
+            logging.getLogger(__name__).warning(f"Metadata refresh failed for registry '{self.config.name}': {e}")
+
+
+class _PendingRegistry:
+    """Placeholder for a configured registry whose client has not been created yet."""
+
+    __slots__ = ("config",)
+
+    def __init__(self, config: RegistryConfig):
+        self.config = config
+
+
+class RegistryClientMap(dict):
+    """Registry name -> RegistryClient mapping that creates each client on first access.
+
+    Configured registries are known (``in``, ``keys()``, ``len()``) without building their
+    session, connection pool and async client; looking one up creates it exactly once.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def add_config(self, config: RegistryConfig):
+        """Register a registry to be created on first use."""
+        super().__setitem__(config.name, _PendingRegistry(config))
+
+    def config(self, name: str) -> Optional[RegistryConfig]:
+        """Configuration of a registry without creating its client."""
+        value = dict.get(self, name)
+        return value.config if value is not None else None
+
+    def is_loaded(self, name: str) -> bool:
+        return isinstance(dict.get(self, name), RegistryClient)
+
+    def loaded(self) -> Dict[str, "RegistryClient"]:
+        """Clients created so far."""
+        return {name: value for name, value in dict.items(self) if not isinstance(value, _PendingRegistry)}
+
+    def __getitem__(self, name: str) -> "RegistryClient":
+        value = super().__getitem__(name)
+        if isinstance(value, _PendingRegistry):
+            with self._lock:
+                value = super().__getitem__(name)
+                if isinstance(value, _PendingRegistry):
+                    value = RegistryClient(value.config)
+                    if value.config.user_env or value.config.password_env:
+                        # Pick up credentials rotated since the configuration was read
+                        value.reload_credentials()
+                    super().__setitem__(name, value)
+        return value
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def values(self):
+        return [self[name] for name in list(self.keys())]
+
+    def items(self):
+        return [(name, self[name]) for name in list(self.keys())]
+
+    def __iter__(self):
+        return iter(list(self.keys()))
+
+    def pop(self, name, *default):
+        """Remove a registry, returning its client (or None if it was never created)."""
+        value = super().pop(name, *default)
+        return None if isinstance(value, _PendingRegistry) else value
+
 
 class BaseRegistryManager:
     """Base class for managing Schema Registry instances."""
 
     def __init__(self):
-        self.registries: Dict[str, RegistryClient] = {}
+        self.registries: Dict[str, RegistryClient] = RegistryClientMap()
         self.default_registry: Optional[str] = None
         self.migration_tasks: Dict[str, MigrationTask] = {}
+        # Connection test results shared by status tools and resources: name -> (monotonic time, result)
+        self._health_snapshot: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._health_lock = threading.Lock()
+        self._health_probes = SingleFlight()
+        self._async_health_probes = AsyncSingleFlight()
+        self._credentials_watcher: Optional[threading.Thread] = None
+        self._credentials_watch_stop = threading.Event()
 
     def get_registry(self, name: Optional[str] = None) -> Optional[RegistryClient]:
         """Get a registry client by name, or default if name is None."""
@@ -689,6 +1846,11 @@ class BaseRegistryManager:
             name = self.default_registry
         return self.registries.get(name)
 
+    def get_async_registry(self, name: Optional[str] = None) -> Optional[AsyncRegistryClient]:
+        """Get the asyncio registry client by name, or default if name is None."""
+        client = self.get_registry(name)
+        return client.async_client if client else None
+
     def list_registries(self) -> List[str]:
         """List all configured registry names."""
         return list(self.registries.keys())
@@ -697,37 +1859,185 @@ class BaseRegistryManager:
         """Get detailed information about a registry."""
         if name not in self.registries:
             return None
+        return self.get_registries_info([name])[name]
+
+    def get_registries_info(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get detailed information about several registries at once.
+
+        Server metadata (cached per client) and connection status (shared health snapshot) are
+        gathered for all registries concurrently, so the cost is about one registry round trip.
+        """
+        names = [name for name in (names if names is not None else self.list_registries()) if name in self.registries]
+        # Metadata lookups run in each registry's health lane of the shared executor
+        executor = get_registry_executor()
+        metadata_futures = {
+            name: executor.submit(executor.health_lane(name), self.registries[name].get_server_metadata)
+            for name in names
+        }
+        # Connection status from the shared health snapshot (fails fast while the breaker is open)
+        connection_tests = self.probe_registries(names)
+
+        infos = {}
+        for name in names:
+            client = self.registries[name]
+            connection_test = connection_tests[name]
+            info = client.config.to_dict()
+            info["is_default"] = name == self.default_registry
+
+            info["connection_status"] = connection_test["status"]
+            info["circuit_breaker"] = client.breaker.state
+            if "response_time_ms" in connection_test:
+                info["response_time_ms"] = connection_test["response_time_ms"]
+            if "error" in connection_test:
+                info["connection_error"] = connection_test["error"]
+
+            # Add SSL status information
+            info["ssl_verification_enabled"] = ENFORCE_SSL_TLS_VERIFICATION
+            if "ssl_verified" in connection_test:
+                info["ssl_verified"] = connection_test["ssl_verified"]
+
+            # Get server metadata
+            try:
+                info.update(metadata_futures[name].result())
+            except Exception as e:
+                info["metadata_error"] = str(e)
+            infos[name] = info
 
-        client = self.registries[name]
-        info = client.config.to_dict()
-        info["is_default"] = name == self.default_registry
+        return infos
 
-        # Test connection
-        connection_test = client.test_connection()
-        info["connection_status"] = connection_test["status"]
-        if "response_time_ms" in connection_test:
-            info["response_time_ms"] = connection_test["response_time_ms"]
-        if "error" in connection_test:
-            info["connection_error"] = connection_test["error"]
+    # ===== HEALTH SNAPSHOT =====
 
-        # Add SSL status information
-        info["ssl_verification_enabled"] = ENFORCE_SSL_TLS_VERIFICATION
-        if "ssl_verified" in connection_test:
-            info["ssl_verified"] = connection_test["ssl_verified"]
+    def _cached_health(self, name: str, max_age: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Return the snapshot entry for a registry if it is younger than max_age seconds."""
+        with self._health_lock:
+            entry = self._health_snapshot.get(name)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return None
+        return entry
+
+    def _store_health(self, name: str, result: Dict[str, Any], checked: float):
+        """Record a connection test result unless a newer one is already stored."""
+        with self._health_lock:
+            current = self._health_snapshot.get(name)
+            if current is None or current[0] <= checked:
+                self._health_snapshot[name] = (checked, result)
+
+    @staticmethod
+    def _with_snapshot_age(entry: Tuple[float, Dict[str, Any]]) -> Dict[str, Any]:
+        checked, result = entry
+        return {**result, "snapshot_age": round(time.monotonic() - checked, 3)}
+
+    @staticmethod
+    def _timed_out_health(name: str, timeout: float) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "registry": name,
+            "error": f"Connection test timed out after {timeout:g}s",
+            "timed_out": True,
+            "checked_at": datetime.now().isoformat(),
+        }
+
+    def _probe_health(self, name: str, max_age: float) -> Tuple[float, Dict[str, Any]]:
+        """Run one connection test and store it in the snapshot, unless another caller just did."""
+        cached = self._cached_health(name, max_age)
+        if cached is not None:
+            return cached
+        checked = time.monotonic()
+        result = self.registries[name].test_connection()
+        result["checked_at"] = datetime.now().isoformat()
+        self._store_health(name, result, checked)
+        return checked, result
+
+    def probe_registries(
+        self,
+        names: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Connection status of registries from the shared snapshot, probing stale ones concurrently.
+
+        Each probe gets ``timeout`` seconds; a registry that misses the deadline is reported as
+        timed out and its probe keeps running in the background to refresh the snapshot.
+        Concurrent callers share in-flight probes.
+        """
+        max_age = REGISTRY_HEALTH_SNAPSHOT_TTL if max_age is None else max_age
+        timeout = REGISTRY_HEALTH_PROBE_TIMEOUT if timeout is None else timeout
+        names = [name for name in (names if names is not None else self.list_registries()) if name in self.registries]
+
+        entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        stale = []
+        for name in names:
+            cached = self._cached_health(name, max_age)
+            if cached is not None:
+                entries[name] = cached
+            else:
+                stale.append(name)
+
+        if stale:
+            executor = get_registry_executor()
+            started = time.monotonic()
+            futures = {
+                name: executor.submit(
+                    executor.health_lane(name),
+                    self._health_probes.do,
+                    name,
+                    lambda name=name: self._probe_health(name, max_age),
+                )
+                for name in stale
+            }
+            wait_futures(futures.values(), timeout=timeout)
+            for name, future in futures.items():
+                if future.done() and future.exception() is None:
+                    entries[name] = future.result()[0]
+                else:
+                    result = self._timed_out_health(name, timeout)
+                    self._store_health(name, result, started)
+                    entries[name] = (started, result)
 
-        # Get server metadata
-        server_metadata = client.get_server_metadata()
-        info.update(server_metadata)
+        return {name: self._with_snapshot_age(entries[name]) for name in names}
 
-        return info
+    async def probe_registries_async(
+        self,
+        names: Optional[List[str]] = None,
+        max_age: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Asyncio variant of probe_registries using the async clients; shares the same snapshot."""
+        max_age = REGISTRY_HEALTH_SNAPSHOT_TTL if max_age is None else max_age
+        timeout = REGISTRY_HEALTH_PROBE_TIMEOUT if timeout is None else timeout
+        names = [name for name in (names if names is not None else self.list_registries()) if name in self.registries]
+
+        async def probe(name: str) -> Tuple[float, Dict[str, Any]]:
+            cached = self._cached_health(name, max_age)
+            if cached is not None:
+                return cached
+            checked = time.monotonic()
+            try:
+                result = await asyncio.wait_for(self.get_async_registry(name).test_connection(), timeout)
+                result["checked_at"] = datetime.now().isoformat()
+            except asyncio.TimeoutError:
+                result = self._timed_out_health(name, timeout)
+            self._store_health(name, result, checked)
+            return checked, result
+
+        async def status(name: str) -> Dict[str, Any]:
+            entry = self._cached_health(name, max_age)
+            if entry is None:
+                entry, _ = await self._async_health_probes.do(name, lambda: probe(name))
+            return self._with_snapshot_age(entry)
+
+        statuses = await asyncio.gather(*(status(name) for name in names))
+        return dict(zip(names, statuses))
+
+    def get_registry_health(self, name: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Connection status of one registry from the shared snapshot (probed if stale)."""
+        if name not in self.registries:
+            return None
+        return self.probe_registries([name], max_age=max_age)[name]
 
     def test_all_registries(self) -> Dict[str, Any]:
-        """Test connections to all configured registries (synchronous)."""
-        results = {}
-        for name in self.list_registries():
-            client = self.get_registry(name)
-            if client:
-                results[name] = client.test_connection()
+        """Test connections to all configured registries concurrently (synchronous)."""
+        results = self.probe_registries()
 
         return {
             "registry_tests": results,
@@ -738,36 +2048,12 @@ class BaseRegistryManager:
         }
 
     async def test_all_registries_async(self) -> Dict[str, Any]:
-        """Test connections to all registries asynchronously."""
+        """Test connections to all registries concurrently."""
         results = {}
-        async with aiohttp.ClientSession() as session:
-            for name, client in self.registries.items():
-                try:
-                    start_time = time.time()
-                    async with session.get(
-                        f"{client.config.url}/subjects",
-                        headers=client.headers,
-                        timeout=10,
-                    ) as response:
-                        response_time = (time.time() - start_time) * 1000
-                        if response.status == 200:
-                            results[name] = {
-                                "status": "connected",
-                                "url": client.config.url,
-                                "response_time_ms": response_time,
-                            }
-                        else:
-                            results[name] = {
-                                "status": "error",
-                                "url": client.config.url,
-                                "error": f"HTTP {response.status}: {await response.text()}",
-                            }
-                except Exception as e:
-                    results[name] = {
-                        "status": "error",
-                        "url": client.config.url,
-                        "error": str(e),
-                    }
+        for name, test in (await self.probe_registries_async()).items():
+            test.pop("registry", None)
+            test.setdefault("url", self.get_registry(name).config.url)
+            results[name] = test
 
         return {
             "registry_tests": results,
@@ -778,39 +2064,29 @@ class BaseRegistryManager:
 
     async def compare_registries_async(self, source: str, target: str) -> Dict[str, Any]:
         """Compare two registries asynchronously."""
-        source_client = self.get_registry(source)
-        target_client = self.get_registry(target)
+        source_client = self.get_async_registry(source)
+        target_client = self.get_async_registry(target)
 
         if not source_client or not target_client:
             return {"error": "Invalid registry configuration"}
 
-        async with aiohttp.ClientSession() as session:
-            # Get subjects from both registries
-            source_subjects = await self._get_subjects_async(session, source_client)
-            target_subjects = await self._get_subjects_async(session, target_client)
-
-            return {
-                "source": source,
-                "target": target,
-                "compared_at": datetime.now().isoformat(),
-                "subjects": {
-                    "source_only": list(set(source_subjects) - set(target_subjects)),
-                    "target_only": list(set(target_subjects) - set(source_subjects)),
-                    "common": list(set(source_subjects) & set(target_subjects)),
-                    "source_total": len(source_subjects),
-                    "target_total": len(target_subjects),
-                },
-            }
+        # Get subjects from both registries
+        source_subjects, target_subjects = await asyncio.gather(
+            source_client.get_subjects(), target_client.get_subjects()
+        )
 
-    async def _get_subjects_async(self, session: aiohttp.ClientSession, client: RegistryClient) -> List[str]:
-        """Get subjects from a registry asynchronously."""
-        try:
-            async with session.get(f"{client.config.url}/subjects", headers=client.headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                return []
-        except Exception:
-            return []
+        return {
+            "source": source,
+            "target": target,
+            "compared_at": datetime.now().isoformat(),
+            "subjects": {
+                "source_only": list(set(source_subjects) - set(target_subjects)),
+                "target_only": list(set(target_subjects) - set(source_subjects)),
+                "common": list(set(source_subjects) & set(target_subjects)),
+                "source_total": len(source_subjects),
+                "target_total": len(target_subjects),
+            },
+        }
 
     def is_viewonly(self, registry_name: Optional[str] = None) -> bool:
         """Check if a registry is in viewonly mode."""
@@ -832,6 +2108,84 @@ class BaseRegistryManager:
         )
         return self.is_viewonly(registry_name)
 
+    def reload_credentials(self) -> Dict[str, bool]:
+        """Re-read every registry's credentials from its env vars or secret files (credential rotation hook)."""
+        # Clients not created yet read the current credentials when they are
+        registries = self.registries.loaded() if isinstance(self.registries, RegistryClientMap) else self.registries
+        return {name: client.reload_credentials() for name, client in registries.items()}
+
+    def _credential_files(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Secret files the registries' credentials are read from, with their (mtime, inode) or None if missing."""
+        if isinstance(self.registries, RegistryClientMap):
+            configs = [self.registries.config(name) for name in self.registries.keys()]
+        else:
+            configs = [client.config for client in self.registries.values()]
+        files: Dict[str, Optional[Tuple[int, int]]] = {}
+        for config in configs:
+            environ = os.environ if config is None or config.environ is None else config.environ
+            for var in (config.user_env, config.password_env) if config else ():
+                path = environ.get(f"{var}_FILE", "") if var else ""
+                if path and path not in files:
+                    try:
+                        stat = os.stat(path)
+                        files[path] = (stat.st_mtime_ns, stat.st_ino)
+                    except OSError:
+                        files[path] = None
+        return files
+
+    def watch_credential_files(
+        self,
+        reload: Optional[Callable[[], Any]] = None,
+        interval: float = REGISTRY_CREDENTIALS_WATCH_INTERVAL,
+    ) -> bool:
+        """Poll the registries' ``*_FILE`` credential secrets every `interval` seconds and call `reload`
+        (default: reload_credentials) when one changes. Returns False if there is nothing to watch.
+        """
+        if interval <= 0 or self._credentials_watcher is not None:
+            return False
+        seen = self._credential_files()
+        if not seen:
+            return False
+        reload = reload or self.reload_credentials
+
+        def watch():
+            nonlocal seen
+            while not self._credentials_watch_stop.wait(interval):
+                current = self._credential_files()
+                if current == seen:
+                    continue
+                seen = current
+                try:
+                    reload()
+                except Exception as e:
+                    logging.error(f"Registry credential reload failed: {e}")
+
+        self._credentials_watch_stop.clear()
+        self._credentials_watcher = threading.Thread(target=watch, name="registry-credentials-watcher", daemon=True)
+        self._credentials_watcher.start()
+        return True
+
+    def install_reload_signal(self, signum: int = signal.SIGHUP, reload: Optional[Callable[[], Any]] = None) -> bool:
+        """Call `reload` (default: reload_credentials) on a thread when the process receives `signum` (default SIGHUP)."""
+        reload = reload or self.reload_credentials
+
+        def handle(received, frame):
+            threading.Thread(target=reload, name="registry-reload", daemon=True).start()
+
+        try:
+            signal.signal(signum, handle)
+        except (ValueError, OSError) as e:  # not in the main thread, or unsupported platform
+            logging.warning(f"Could not install registry reload signal handler: {e}")
+            return False
+        return True
+
+    def stop_watching(self):
+        """Stop the credential secret watcher."""
+        self._credentials_watch_stop.set()
+        if self._credentials_watcher is not None:
+            self._credentials_watcher.join()
+            self._credentials_watcher = None
+
     def get_default_registry(self) -> Optional[str]:
         """Get the default registry name."""
         return self.default_registry
@@ -862,6 +2216,9 @@ class SingleRegistryManager(BaseRegistryManager):
                     password=SINGLE_REGISTRY_PASSWORD,
                     description="Default Schema Registry",
                     viewonly=SINGLE_VIEWONLY,
+                    snapshot_path=REGISTRY_SNAPSHOT_PATH,
+                    user_env="SCHEMA_REGISTRY_USER",
+                    password_env="SCHEMA_REGISTRY_PASSWORD",
                 )
                 self.registries["default"] = RegistryClient(config)
                 self.default_registry = "default"
@@ -871,36 +2228,63 @@ class SingleRegistryManager(BaseRegistryManager):
 
 
 class MultiRegistryManager(BaseRegistryManager):
-    """Manager for multi-registry mode."""
+    """Manager for multi-registry mode.
+
+    Registries are read from numbered environment variables (no upper limit on the number)
+    and their clients are created on first use. ``reload()`` re-reads the configuration,
+    optionally from ``REGISTRY_CONFIG_FILE``, and applies only what changed. Values from the
+    config file take precedence over the process environment, which is never modified.
+    """
 
-    def __init__(self, max_registries: int = 8):
+    def __init__(self, max_registries: Optional[int] = None, config_file: Optional[str] = None):
         super().__init__()
         self.max_registries = max_registries
+        self.config_file = REGISTRY_CONFIG_FILE if config_file is None else config_file
+        # Config file values layered over the process environment; the file layer is swapped on reload
+        self.settings: ChainMap = ChainMap({}, os.environ)
+        self._config_file_mtime: Optional[float] = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._load_config_file()
         self._load_multi_registries()
 
-    def _load_multi_registries(self):
-        """Load multi-registry configurations from environment variables."""
-        # Check for multi-registry mode first (numbered environment variables)
+    def _registry_indices(self) -> List[int]:
+        """Numbers i of every SCHEMA_REGISTRY_URL_i in the settings, in order."""
+        indices = sorted(
+            int(match.group(1)) for match in map(_NUMBERED_REGISTRY_URL.match, self.settings) if match is not None
+        )
+        if self.max_registries is not None:
+            indices = [i for i in indices if i <= self.max_registries]
+        return indices
+
+    def _read_registry_configs(self) -> Dict[str, RegistryConfig]:
+        """Build registry configurations from the settings (validated, clients not created)."""
+        settings = self.settings
+        configs: Dict[str, RegistryConfig] = {}
         multi_registry_found = False
 
-        for i in range(1, self.max_registries + 1):
+        for i in self._registry_indices():
             name_var = f"SCHEMA_REGISTRY_NAME_{i}"
             url_var = f"SCHEMA_REGISTRY_URL_{i}"
             user_var = f"SCHEMA_REGISTRY_USER_{i}"
             password_var = f"SCHEMA_REGISTRY_PASSWORD_{i}"
             viewonly_var = f"VIEWONLY_{i}"
             readonly_var = f"READONLY_{i}"  # For backward compatibility
+            pool_size_var = f"SCHEMA_REGISTRY_POOL_SIZE_{i}"
+            http2_var = f"SCHEMA_REGISTRY_HTTP2_{i}"
+            snapshot_var = f"SCHEMA_REGISTRY_SNAPSHOT_{i}"
 
-            name = os.getenv(name_var, "")
-            url = os.getenv(url_var, "")
+            name = settings.get(name_var, "")
+            url = settings.get(url_var, "")
 
             if name and url:
                 multi_registry_found = True
 
-                user = os.getenv(user_var, "")
-                password = os.getenv(password_var, "")
+                user = read_credential(user_var, settings)
+                password = read_credential(password_var, settings)
                 # Support both VIEWONLY (new) and READONLY (deprecated) for backward compatibility
-                viewonly = os.getenv(viewonly_var, os.getenv(readonly_var, "false")).lower() in (
+                viewonly = settings.get(viewonly_var, settings.get(readonly_var, "false")).lower() in (
                     "true",
                     "1",
                     "yes",
@@ -908,7 +2292,7 @@ class MultiRegistryManager(BaseRegistryManager):
                 )
 
                 # Warn if deprecated READONLY_{i} parameter is used
-                if os.getenv(readonly_var) is not None and os.getenv(viewonly_var) is None:
+                if settings.get(readonly_var) is not None and settings.get(viewonly_var) is None:
                     import warnings
 
                     warnings.warn(
@@ -921,48 +2305,178 @@ class MultiRegistryManager(BaseRegistryManager):
                     print(f"   Example: export {viewonly_var}=true")
                     print(f"   Support for {readonly_var} will be removed in a future version.")
 
-                try:
-                    config = RegistryConfig(
-                        name=name,
-                        url=url,
-                        user=user,
-                        password=password,
-                        description=f"{name} Schema Registry (instance {i})",
-                        viewonly=viewonly,
-                    )
-
-                    self.registries[name] = RegistryClient(config)
-
-                    # Set first registry as default
-                    if self.default_registry is None:
-                        self.default_registry = name
-
-                    logging.info(f"Loaded registry {i}: {name} at {url} (viewonly: {viewonly})")
-                except ValueError as e:
-                    logging.error(f"Failed to load registry {i} ({name}): {e}")
+                if not validate_url(url):
+                    logging.error(f"Failed to load registry {i} ({name}): Invalid or unsafe registry URL: {url}")
+                    continue
+
+                configs[name] = RegistryConfig(
+                    name=name,
+                    url=url,
+                    user=user,
+                    password=password,
+                    description=f"{name} Schema Registry (instance {i})",
+                    viewonly=viewonly,
+                    pool_size=int(settings.get(pool_size_var, str(REGISTRY_POOL_SIZE))),
+                    http2=settings.get(http2_var, str(REGISTRY_HTTP2_ENABLED)).lower() in ("true", "1", "yes", "on"),
+                    snapshot_path=settings.get(snapshot_var, ""),
+                    user_env=user_var,
+                    password_env=password_var,
+                    environ=settings,
+                )
 
         # Fallback to single registry mode if no multi-registry found
-        if not multi_registry_found and SINGLE_REGISTRY_URL:
-            try:
-                config = RegistryConfig(
+        single_url = settings.get("SCHEMA_REGISTRY_URL", "")
+        if not multi_registry_found and single_url:
+            if validate_url(single_url):
+                configs["default"] = RegistryConfig(
                     name="default",
-                    url=SINGLE_REGISTRY_URL,
-                    user=SINGLE_REGISTRY_USER,
-                    password=SINGLE_REGISTRY_PASSWORD,
+                    url=single_url,
+                    user=read_credential("SCHEMA_REGISTRY_USER", settings),
+                    password=read_credential("SCHEMA_REGISTRY_PASSWORD", settings),
                     description="Default Schema Registry",
-                    viewonly=SINGLE_VIEWONLY,
+                    viewonly=settings.get("VIEWONLY", settings.get("READONLY", "false")).lower()
+                    in ("true", "1", "yes", "on"),
+                    snapshot_path=settings.get("REGISTRY_SNAPSHOT_PATH", ""),
+                    user_env="SCHEMA_REGISTRY_USER",
+                    password_env="SCHEMA_REGISTRY_PASSWORD",
+                    environ=settings,
                 )
-                self.registries["default"] = RegistryClient(config)
-                self.default_registry = "default"
-                logging.info(f"Loaded single registry: default at {SINGLE_REGISTRY_URL} (viewonly: {SINGLE_VIEWONLY})")
-            except ValueError as e:
-                logging.error(f"Failed to load single registry: {e}")
+            else:
+                logging.error(f"Failed to load single registry: Invalid or unsafe registry URL: {single_url}")
+
+        return configs
+
+    def _load_multi_registries(self):
+        """Load multi-registry configurations from environment variables."""
+        for name, config in self._read_registry_configs().items():
+            self.registries.add_config(config)
+
+            # Set first registry as default
+            if self.default_registry is None:
+                self.default_registry = name
+
+            logging.info(f"Configured registry {name} at {config.url} (viewonly: {config.viewonly})")
 
         if not self.registries:
             logging.warning(
                 "No Schema Registry instances configured. Set SCHEMA_REGISTRY_URL for single mode or SCHEMA_REGISTRY_NAME_1/SCHEMA_REGISTRY_URL_1 for multi mode."
             )
 
+    # ===== CONFIG RELOAD =====
+
+    def _load_config_file(self) -> bool:
+        """Layer REGISTRY_CONFIG_FILE (KEY=VALUE lines) over the environment; keys dropped from it fall back to it."""
+        if not self.config_file:
+            return False
+        try:
+            mtime = os.path.getmtime(self.config_file)
+            values = dotenv_values(self.config_file)
+        except OSError as e:
+            logging.error(f"Failed to read registry config file {self.config_file}: {e}")
+            return False
+
+        # One assignment, so concurrent lookups see either the old or the new file
+        self.settings.maps[0] = {key: value for key, value in values.items() if value is not None}
+        self._config_file_mtime = mtime
+        return True
+
+    def reload(self) -> Dict[str, List[str]]:
+        """Re-read the registry configuration and apply the differences in place.
+
+        Added registries are created lazily, removed ones are closed once their requests in flight
+        finish, and registries whose connection settings (URL, pool size, HTTP/2, snapshot) changed
+        get a new client (the old one is drained the same way). Credential,
+        description and viewonly changes are applied to the existing client, so unchanged
+        registries keep their connection pools, caches and breaker state.
+        """
+        with self._reload_lock:
+            self._load_config_file()
+            configs = self._read_registry_configs()
+            changes: Dict[str, List[str]] = {"added": [], "removed": [], "replaced": [], "updated": [], "unchanged": []}
+
+            for name in [name for name in self.registries.keys() if name not in configs]:
+                client = self.registries.pop(name, None)
+                if client is not None:
+                    client.close_when_idle()
+                changes["removed"].append(name)
+
+            for name, config in configs.items():
+                current = self.registries.config(name)
+                if current is None:
+                    self.registries.add_config(config)
+                    changes["added"].append(name)
+                elif (current.url, current.pool_size, current.http2, current.snapshot_path) != (
+                    config.url,
+                    config.pool_size,
+                    config.http2,
+                    config.snapshot_path,
+                ):
+                    client = self.registries.pop(name, None)
+                    if client is not None:
+                        client.close_when_idle()
+                    self.registries.add_config(config)
+                    changes["replaced"].append(name)
+                elif current != config:
+                    if self.registries.is_loaded(name):
+                        client = self.registries[name]
+                        client.reload_credentials(config.user, config.password)
+                        current.description = config.description
+                        current.viewonly = config.viewonly
+                        current.user_env = config.user_env
+                        current.password_env = config.password_env
+                    else:
+                        self.registries.add_config(config)
+                    changes["updated"].append(name)
+                else:
+                    changes["unchanged"].append(name)
+
+            if self.default_registry not in self.registries:
+                self.default_registry = next(iter(configs), None)
+
+            with self._health_lock:
+                for name in changes["removed"] + changes["replaced"]:
+                    self._health_snapshot.pop(name, None)
+
+        logging.info(
+            "Reloaded registry configuration: "
+            + ", ".join(f"{kind}={names}" for kind, names in changes.items() if names and kind != "unchanged")
+        )
+        return changes
+
+    def install_reload_signal(self, signum: int = signal.SIGHUP, reload: Optional[Callable[[], Any]] = None) -> bool:
+        """Reload the registry configuration, credentials included, when the process receives `signum`."""
+        return super().install_reload_signal(signum, reload or self.reload)
+
+    def watch_config_file(self, interval: float = REGISTRY_CONFIG_WATCH_INTERVAL) -> bool:
+        """Poll REGISTRY_CONFIG_FILE every `interval` seconds and reload when it changes."""
+        if not self.config_file or interval <= 0 or self._watcher is not None:
+            return False
+
+        def watch():
+            while not self._watch_stop.wait(interval):
+                try:
+                    mtime = os.path.getmtime(self.config_file)
+                except OSError:
+                    continue
+                if mtime != self._config_file_mtime:
+                    try:
+                        self.reload()
+                    except Exception as e:
+                        logging.error(f"Registry configuration reload failed: {e}")
+
+        self._watch_stop.clear()
+        self._watcher = threading.Thread(target=watch, name="registry-config-watcher", daemon=True)
+        self._watcher.start()
+        return True
+
+    def stop_watching(self):
+        """Stop the config file and credential secret watchers."""
+        self._watch_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+        super().stop_watching()
+
 
 class LegacyRegistryManager(BaseRegistryManager):
     """Manager that supports legacy JSON configuration mode."""
@@ -984,6 +2498,9 @@ class LegacyRegistryManager(BaseRegistryManager):
                     password=SINGLE_REGISTRY_PASSWORD,
                     description="Default Schema Registry",
                     viewonly=SINGLE_VIEWONLY,
+                    snapshot_path=REGISTRY_SNAPSHOT_PATH,
+                    user_env="SCHEMA_REGISTRY_USER",
+                    password_env="SCHEMA_REGISTRY_PASSWORD",
                 )
                 self.registries["default"] = RegistryClient(config)
                 self.default_registry = "default"
@@ -1022,6 +2539,7 @@ class LegacyRegistryManager(BaseRegistryManager):
                             password=config_data.get("password", ""),
                             description=config_data.get("description", f"{name} registry"),
                             viewonly=viewonly,
+                            pool_size=int(config_data.get("pool_size", REGISTRY_POOL_SIZE)),
                         )
                         self.registries[name] = RegistryClient(config)
 
@@ -1088,6 +2606,295 @@ def get_default_client(
     return registry_manager.get_registry()
 
 
+# ===== BULK SCHEMA LOADING =====
+
+
+def _bulk_schemas_url(
+    client: Union[RegistryClient, AsyncRegistryClient],
+    context: Optional[str],
+    subject_prefix: Optional[str],
+    deleted: bool,
+    latest_only: bool,
+    offset: int,
+    limit: int,
+) -> str:
+    """Build one page URL of the GET /schemas bulk listing."""
+    params: Dict[str, Any] = {"offset": offset, "limit": limit}
+    if subject_prefix:
+        params["subjectPrefix"] = subject_prefix
+    if deleted:
+        params["deleted"] = "true"
+    if latest_only:
+        params["latestOnly"] = "true"
+    return f"{client.build_context_url('/schemas', context)}?{urlencode(params)}"
+
+
+def _read_bulk_page(
+    client: Union[RegistryClient, AsyncRegistryClient], status: int, body: str
+) -> Optional[List[Dict[str, Any]]]:
+    """Decode one bulk page; None (and remember it) when the registry lacks the endpoint."""
+    if status in BULK_UNSUPPORTED_STATUSES:
+        client.supports_bulk_schemas = False
+        return None
+    if status >= 400:
+        raise RegistryResponseError(status, body)
+    page = json.loads(body) if body else None
+    if not isinstance(page, list):
+        client.supports_bulk_schemas = False
+        return None
+    client.supports_bulk_schemas = True
+    return page
+
+
+def _record_bulk_schemas(
+    client: Union[RegistryClient, AsyncRegistryClient],
+    context: Optional[str],
+    schemas: List[Dict[str, Any]],
+    generation: Optional[int],
+):
+    """Feed bulk-listed bodies into the schema-by-ID store so later reads are local."""
+    if client.cache is None:
+        return
+    store_context = context if context and context != "." else "."
+    for entry in schemas:
+        if isinstance(entry, dict):
+            client.cache.record_subject_version(store_context, entry, generation)
+
+
+def iter_schemas_bulk(
+    client: RegistryClient,
+    context: Optional[str] = None,
+    subject_prefix: Optional[str] = None,
+    deleted: bool = False,
+    latest_only: bool = False,
+    page_size: int = REGISTRY_BULK_PAGE_SIZE,
+    start: int = 0,
+) -> Optional[Iterator[List[Dict[str, Any]]]]:
+    """Page through GET /schemas one page at a time, so callers can stream without holding the listing.
+
+    The first page (from entry `start` of the listing) is requested up front; returns None when the
+    registry does not support the bulk listing endpoint. Every page is fed into the schema-by-ID store
+    as it is read.
+    """
+    if getattr(client, "supports_bulk_schemas", None) is False:
+        return None
+
+    generation = client.cache.generation if client.cache is not None else None
+
+    def read_page(offset: int) -> Optional[List[Dict[str, Any]]]:
+        url = _bulk_schemas_url(client, context, subject_prefix, deleted, latest_only, offset, page_size)
+        response = client.session.get(url, auth=client.auth, headers=client.headers)
+        return _read_bulk_page(client, response.status_code, response.text)
+
+    first = read_page(start)
+    if first is None:
+        return None
+
+    def pages() -> Iterator[List[Dict[str, Any]]]:
+        page, offset = first, start
+        while page is not None:
+            _record_bulk_schemas(client, context, page, generation)
+            yield page
+            # A short page is the last one; an oversized one means the registry ignored paging
+            if len(page) != page_size:
+                return
+            offset += page_size
+            page = read_page(offset)
+
+    return pages()
+
+
+def fetch_schemas_bulk(
+    client: RegistryClient,
+    context: Optional[str] = None,
+    subject_prefix: Optional[str] = None,
+    deleted: bool = False,
+    latest_only: bool = False,
+    page_size: int = REGISTRY_BULK_PAGE_SIZE,
+) -> Optional[List[Dict[str, Any]]]:
+    """Page through GET /schemas and return every (subject, version, id, schemaType, schema) entry.
+
+    Returns None when the registry does not support the bulk listing endpoint.
+    """
+    pages = iter_schemas_bulk(client, context, subject_prefix, deleted, latest_only, page_size)
+    if pages is None:
+        return None
+    return [entry for page in pages for entry in page]
+
+
+async def fetch_schemas_bulk_async(
+    client: AsyncRegistryClient,
+    context: Optional[str] = None,
+    subject_prefix: Optional[str] = None,
+    deleted: bool = False,
+    latest_only: bool = False,
+    page_size: int = REGISTRY_BULK_PAGE_SIZE,
+) -> Optional[List[Dict[str, Any]]]:
+    """Page through GET /schemas (async); None when the registry lacks the endpoint."""
+    if getattr(client, "supports_bulk_schemas", None) is False:
+        return None
+
+    generation = client.cache.generation if client.cache is not None else None
+    schemas: List[Dict[str, Any]] = []
+    offset = 0
+    while True:
+        url = _bulk_schemas_url(client, context, subject_prefix, deleted, latest_only, offset, page_size)
+        status, body = await client.request("GET", url)
+        page = _read_bulk_page(client, status, body)
+        if page is None:
+            return None
+        schemas.extend(page)
+        if len(page) != page_size:
+            break
+        offset += page_size
+
+    _record_bulk_schemas(client, context, schemas, generation)
+    return schemas
+
+
+def _group_by_subject(schemas: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group bulk entries by subject (in listing order) with versions ascending."""
+    subjects: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in schemas:
+        subjects.setdefault(entry["subject"], []).append(entry)
+    for versions in subjects.values():
+        versions.sort(key=lambda entry: entry.get("version", 0))
+    return subjects
+
+
+def _crawl_query(deleted: bool) -> str:
+    return "?deleted=true" if deleted else ""
+
+
+async def gather_limited(fn: Callable[[Any], Awaitable[Any]], items: Iterable[Any], limit: int) -> List[Any]:
+    """Await fn(item) for every item with at most `limit` in flight; results keep the input order."""
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    positions = iter(range(len(items)))
+
+    async def worker():
+        for position in positions:
+            results[position] = await fn(items[position])
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(limit, len(items))))))
+    return results
+
+
+def _crawl_context_schemas(
+    client: RegistryClient,
+    context: Optional[str],
+    subject_prefix: Optional[str],
+    deleted: bool,
+    latest_only: bool,
+    include_schemas: bool,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Per-subject fallback for registries without GET /schemas."""
+    query = _crawl_query(deleted)
+
+    def get_json(path: str) -> Any:
+        response = client.session.get(
+            client.build_context_url(path, context) + query, auth=client.auth, headers=client.headers
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def load_subject(subject: str) -> List[Dict[str, Any]]:
+        versions = get_json(f"/subjects/{subject}/versions")
+        if latest_only:
+            versions = versions[-1:]
+        if include_schemas:
+            return executor.map(
+                client.config.name, lambda version: get_json(f"/subjects/{subject}/versions/{version}"), versions
+            )
+        return [{"subject": subject, "version": version} for version in versions]
+
+    # Subjects load concurrently within the registry's bulkhead; their versions fan out too while workers are free
+    executor = get_registry_executor()
+    names = [subject for subject in get_json("/subjects") if not subject_prefix or subject.startswith(subject_prefix)]
+    return dict(zip(names, executor.map(client.config.name, load_subject, names)))
+
+
+async def _crawl_context_schemas_async(
+    client: AsyncRegistryClient,
+    context: Optional[str],
+    subject_prefix: Optional[str],
+    deleted: bool,
+    latest_only: bool,
+    include_schemas: bool,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Per-subject fallback for registries without GET /schemas (async)."""
+    query = _crawl_query(deleted)
+
+    async def get_json(path: str) -> Any:
+        return await client._request_json("GET", client.build_context_url(path, context) + query)
+
+    async def load_subject(subject: str) -> List[Dict[str, Any]]:
+        versions = await get_json(f"/subjects/{subject}/versions")
+        if latest_only:
+            versions = versions[-1:]
+        if include_schemas:
+            return await gather_limited(
+                lambda version: get_json(f"/subjects/{subject}/versions/{version}"), versions, client.limiter.window
+            )
+        return [{"subject": subject, "version": version} for version in versions]
+
+    names = [
+        subject for subject in await get_json("/subjects") if not subject_prefix or subject.startswith(subject_prefix)
+    ]
+    return dict(zip(names, await gather_limited(load_subject, names, client.limiter.window)))
+
+
+def load_context_schemas(
+    client: RegistryClient,
+    context: Optional[str] = None,
+    subject_prefix: Optional[str] = None,
+    deleted: bool = False,
+    latest_only: bool = False,
+    include_schemas: bool = True,
+    page_size: int = REGISTRY_BULK_PAGE_SIZE,
+) -> Dict[str, Any]:
+    """Load every subject version of a context in a few paged bulk requests.
+
+    Falls back to crawling subject by subject when the registry lacks GET /schemas.
+    With ``include_schemas=False`` the fallback only lists versions (the bulk listing
+    always carries schema bodies).
+
+    Returns:
+        {"subjects": {subject: [version entries ascending]}, "source": "bulk" | "crawl"},
+        or a dictionary with an "error" key
+    """
+    try:
+        schemas = fetch_schemas_bulk(client, context, subject_prefix, deleted, latest_only, page_size)
+        if schemas is not None:
+            return {"subjects": _group_by_subject(schemas), "source": "bulk"}
+        subjects = _crawl_context_schemas(client, context, subject_prefix, deleted, latest_only, include_schemas)
+        return {"subjects": subjects, "source": "crawl"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def load_context_schemas_async(
+    client: AsyncRegistryClient,
+    context: Optional[str] = None,
+    subject_prefix: Optional[str] = None,
+    deleted: bool = False,
+    latest_only: bool = False,
+    include_schemas: bool = True,
+    page_size: int = REGISTRY_BULK_PAGE_SIZE,
+) -> Dict[str, Any]:
+    """Load every subject version of a context in a few paged bulk requests (async)."""
+    try:
+        schemas = await fetch_schemas_bulk_async(client, context, subject_prefix, deleted, latest_only, page_size)
+        if schemas is not None:
+            return {"subjects": _group_by_subject(schemas), "source": "bulk"}
+        subjects = await _crawl_context_schemas_async(
+            client, context, subject_prefix, deleted, latest_only, include_schemas
+        )
+        return {"subjects": subjects, "source": "crawl"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
 # ===== EXPORT FUNCTIONALITY =====
 
 
@@ -1167,26 +2974,68 @@ def get_schema_with_metadata(
         schema_data = client.get_schema(subject, version, context)
         if "error" in schema_data:
             return schema_data
+        return _add_schema_export_metadata(schema_data, client, context)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+async def get_schema_with_metadata_async(
+    client: AsyncRegistryClient, subject: str, version: str, context: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get schema with additional metadata (async)."""
+    try:
+        schema_data = await client.get_schema(subject, version, context)
+        if "error" in schema_data:
+            return schema_data
+        return _add_schema_export_metadata(schema_data, client, context)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _add_schema_export_metadata(
+    schema_data: Dict[str, Any], client: Union[RegistryClient, AsyncRegistryClient], context: Optional[str]
+) -> Dict[str, Any]:
+    """Parse the schema string and attach export metadata."""
+    # Ensure schema is parsed as JSON object if it's a string
+    if isinstance(schema_data.get("schema"), str):
+        try:
+            schema_data["schema"] = json.loads(schema_data["schema"])
+        except (json.JSONDecodeError, TypeError):
+            # Keep as string if not valid JSON
+            pass
+
+    # Add export metadata
+    schema_data["metadata"] = {
+        "exported_at": datetime.now().isoformat(),
+        "registry_url": client.config.url,
+        "context": context,
+        "export_version": "1.7.0",
+    }
+
+    return schema_data
 
-        # Ensure schema is parsed as JSON object if it's a string
-        if isinstance(schema_data.get("schema"), str):
-            try:
-                schema_data["schema"] = json.loads(schema_data["schema"])
-            except (json.JSONDecodeError, TypeError):
-                # Keep as string if not valid JSON
-                pass
 
-        # Add export metadata
-        schema_data["metadata"] = {
+def build_subject_export(
+    client: Union[RegistryClient, AsyncRegistryClient],
+    subject: str,
+    versions: List[Dict[str, Any]],
+    context: Optional[str],
+    include_metadata: bool,
+) -> Dict[str, Any]:
+    """Shape bulk-loaded versions of a subject like export_subject output (config is added by the caller)."""
+    schemas = [
+        _add_schema_export_metadata({**version, "registry": client.config.name}, client, context)
+        for version in versions
+    ]
+    result: Dict[str, Any] = {"subject": subject, "versions": schemas}
+    if include_metadata:
+        result["metadata"] = {
             "exported_at": datetime.now().isoformat(),
             "registry_url": client.config.url,
             "context": context,
             "export_version": "1.7.0",
         }
-
-        return schema_data
-    except Exception as e:
-        return {"error": str(e)}
+    return result
 
 
 def export_schema(
@@ -1230,12 +3079,11 @@ def export_subject(
                 return versions_list
             versions = [str(v) for v in versions_list]
 
-        # Get schemas for each version
-        schemas = []
-        for version in versions:
-            schema_data = get_schema_with_metadata(client, subject, version, context)
-            if "error" not in schema_data:
-                schemas.append(schema_data)
+        # Get schemas for every version concurrently within the registry's bulkhead
+        fetched = get_registry_executor().map(
+            client.config.name, lambda version: get_schema_with_metadata(client, subject, version, context), versions
+        )
+        schemas = [schema_data for schema_data in fetched if "error" not in schema_data]
 
         result = {"subject": subject, "versions": schemas}
 
@@ -1257,6 +3105,53 @@ def export_subject(
         return {"error": str(e)}
 
 
+async def export_subject_async(
+    client: AsyncRegistryClient,
+    subject: str,
+    context: Optional[str] = None,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Export all versions of a subject (async)."""
+    try:
+        # Get versions
+        if include_versions == "latest":
+            versions = ["latest"]
+        else:
+            versions_list = await client.get_schema_versions(subject, context)
+            if isinstance(versions_list, dict) and "error" in versions_list:
+                return versions_list
+            versions = [str(v) for v in versions_list]
+
+        # Get schemas for every version concurrently, up to the registry's concurrency window
+        fetched = await gather_limited(
+            lambda version: get_schema_with_metadata_async(client, subject, version, context),
+            versions,
+            client.limiter.window,
+        )
+        schemas = [schema_data for schema_data in fetched if "error" not in schema_data]
+
+        result = {"subject": subject, "versions": schemas}
+
+        if include_config:
+            config = await client.get_subject_config(subject, context)
+            if "error" not in config:
+                result["config"] = config
+
+        if include_metadata:
+            result["metadata"] = {
+                "exported_at": datetime.now().isoformat(),
+                "registry_url": client.config.url,
+                "context": context,
+                "export_version": "1.7.0",
+            }
+
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+
 def export_context(
     client: RegistryClient,
     context: str,
@@ -1264,24 +3159,25 @@ def export_context(
     include_config: bool = True,
     include_versions: str = "all",
 ) -> Dict[str, Any]:
-    """Export all subjects within a context."""
+    """Export all subjects within a context (schemas are bulk-loaded, not fetched per subject)."""
     try:
-        # Get all subjects in context
-        subjects_list = client.get_subjects(context)
-
-        # Export each subject
-        subjects_data = []
-        for subject in subjects_list:
-            subject_export = export_subject(
-                client,
-                subject,
-                context,
-                include_metadata,
-                include_config,
-                include_versions,
+        loaded = load_context_schemas(client, context, latest_only=include_versions == "latest")
+        if "error" in loaded:
+            return loaded
+
+        subjects_data = [
+            build_subject_export(client, subject, versions, context, include_metadata)
+            for subject, versions in loaded["subjects"].items()
+        ]
+        if include_config:
+            configs = get_registry_executor().map(
+                client.config.name,
+                lambda subject_export: client.get_subject_config(subject_export["subject"], context),
+                subjects_data,
             )
-            if "error" not in subject_export:
-                subjects_data.append(subject_export)
+            for subject_export, config in zip(subjects_data, configs):
+                if "error" not in config:
+                    subject_export["config"] = config
 
         result = {"context": context, "subjects": subjects_data}
 
@@ -1306,6 +3202,56 @@ def export_context(
         return {"error": str(e)}
 
 
+async def export_context_async(
+    client: AsyncRegistryClient,
+    context: str,
+    include_metadata: bool = True,
+    include_config: bool = True,
+    include_versions: str = "all",
+) -> Dict[str, Any]:
+    """Export all subjects within a context (async; schemas are bulk-loaded, not fetched per subject)."""
+    try:
+        loaded = await load_context_schemas_async(client, context, latest_only=include_versions == "latest")
+        if "error" in loaded:
+            return loaded
+
+        subjects_data = [
+            build_subject_export(client, subject, versions, context, include_metadata)
+            for subject, versions in loaded["subjects"].items()
+        ]
+        if include_config:
+            configs = await gather_limited(
+                lambda subject_export: client.get_subject_config(subject_export["subject"], context),
+                subjects_data,
+                client.limiter.window,
+            )
+            for subject_export, config in zip(subjects_data, configs):
+                if "error" not in config:
+                    subject_export["config"] = config
+
+        result = {"context": context, "subjects": subjects_data}
+
+        if include_config:
+            global_config, global_mode = await asyncio.gather(
+                client.get_global_config(context), client.get_mode(context)
+            )
+            if "error" not in global_config:
+                result["global_config"] = global_config
+            if "error" not in global_mode:
+                result["global_mode"] = global_mode
+
+        if include_metadata:
+            result["metadata"] = {
+                "exported_at": datetime.now().isoformat(),
+                "registry_url": client.config.url,
+                "export_version": "1.7.0",
+            }
+
+        return result
+    except Exception as e:
+        return {"error": str(e)}
+
+
 def export_global(
     client: RegistryClient,
     include_metadata: bool = True,
@@ -1386,11 +3332,10 @@ def clear_context_batch(
         deleted_subjects = []
         failed_deletions = []
 
+        max_concurrent = client.limiter.window
         if dry_run:
             deleted_subjects = subjects_list.copy()
         else:
-            # Use concurrent deletions for better performance
-            import concurrent.futures
 
             def delete_single_subject(subject):
                 try:
@@ -1406,9 +3351,8 @@ def clear_context_batch(
                 except Exception as e:
                     return {"subject": subject, "status": "failed", "error": str(e)}
 
-            # Execute deletions in parallel (max 10 concurrent)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                deletion_results = list(executor.map(delete_single_subject, subjects_list))
+            # Execute deletions in parallel within the registry's bulkhead; its limiter bounds the requests
+            deletion_results = get_registry_executor().map(client.config.name, delete_single_subject, subjects_list)
 
             # Process results
             for result in deletion_results:
@@ -1454,7 +3398,7 @@ def clear_context_batch(
             "performance": {
                 "subjects_per_second": round(len(deleted_subjects) / max(duration, 0.1), 1),
                 "parallel_execution": not dry_run,
-                "max_concurrent_deletions": 10,
+                "max_concurrent_deletions": max_concurrent,
             },
         }
 
@@ -12,18 +12,266 @@ Uses FastMCP background tasks API (SEP-1686) for long-running operations.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import json
+import math
+import re
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import as_completed
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from fastmcp.dependencies import Progress
 
-from schema_registry_common import get_default_client
+from registry_cache import STATISTICS_MAX_STALENESS, ContextStatistics
+from registry_resilience import get_registry_executor
+from schema_registry_common import fetch_schemas_bulk, get_default_client
 from schema_validation import (
     create_error_response,
     structured_output,
 )
 
+DEFAULT_CONTEXT = "."
+
+
+# ===== STATISTICS ENGINE =====
+
+
+def _statistics_contexts(contexts: List[str]) -> List[Optional[str]]:
+    """Named contexts plus the default context (None) exactly once."""
+    return [context for context in contexts if context != DEFAULT_CONTEXT] + [None]
+
+
+def _list_context_for_statistics(client, context: Optional[str], incremental: bool = False) -> Tuple[str, Any]:
+    """Phase one for a context: version lists straight from the bulk listing, else its subject list.
+
+    An incremental refresh only needs the subject list: the few subjects to re-read are fetched one
+    by one instead of listing every version of the context again.
+    """
+    schemas = None
+    if not incremental:
+        try:
+            schemas = fetch_schemas_bulk(client, context)
+        except Exception:
+            schemas = None
+    if schemas is not None:
+        versions: Dict[str, List[int]] = {}
+        for entry in schemas:
+            versions.setdefault(entry.get("subject"), []).append(entry.get("version"))
+        for subject_versions in versions.values():
+            subject_versions.sort()
+        return "versions", versions
+
+    subjects = client.get_subjects(context)
+    if isinstance(subjects, dict) and "error" in subjects:
+        return "error", subjects["error"]
+    return "subjects", subjects
+
+
+def collect_subject_versions(
+    client,
+    contexts: List[Optional[str]],
+    previous: Optional[Dict[Optional[str], Dict[str, List[int]]]] = None,
+    changed: Optional[Dict[Optional[str], Optional[Set[str]]]] = None,
+    on_context: Optional[Callable[[Optional[str], Optional[Dict[str, List[int]]], Optional[str]], None]] = None,
+) -> Tuple[Dict[Optional[str], Dict[str, List[int]]], Dict[Optional[str], str]]:
+    """Subject -> version list for each context (None is the default context), gathered in one pass.
+
+    Contexts are read in full from the paged bulk listing where the registry supports it. For the rest,
+    subjects are listed and their version lists fetched with raw client calls on the shared registry
+    executor, within the registry's bulkhead; the work is flattened across contexts, so one slow
+    context does not serialize the others. No MCP tools are called.
+
+    With `previous` version lists for a context, only subjects missing from them or named in
+    `changed[context]` (None meaning all) are fetched again; subjects no longer listed drop out.
+    Such a context is diffed against its subject list rather than read from the bulk listing,
+    unless all of its subjects are to be fetched.
+
+    `on_context(context, versions, error)` is called on the calling thread as soon as each context
+    is complete, so callers can publish partial results before the slowest context finishes.
+
+    Returns (versions, errors); contexts whose subjects could not be listed appear only in errors.
+    """
+    previous = previous or {}
+    changed = changed or {}
+    executor = get_registry_executor()
+    bulkhead = client.config.name
+    versions: Dict[Optional[str], Dict[str, List[int]]] = {}
+    errors: Dict[Optional[str], str] = {}
+    remaining: Dict[Optional[str], int] = {}
+
+    def finish(context: Optional[str]):
+        if on_context is not None:
+            on_context(context, versions.get(context), errors.get(context))
+
+    listings = {
+        context: executor.submit(
+            bulkhead,
+            _list_context_for_statistics,
+            client,
+            context,
+            context in previous and changed.get(context, set()) is not None,
+        )
+        for context in contexts
+    }
+    pending = []
+    for context, future in listings.items():
+        try:
+            kind, value = future.result()
+        except Exception as e:
+            kind, value = "error", str(e)
+        if kind == "error":
+            errors[context] = value
+        elif kind == "versions":
+            versions[context] = value
+        else:
+            known = previous.get(context, {})
+            stale = changed.get(context, set())
+            versions[context] = {}
+            for subject in value:
+                if subject in known and stale is not None and subject not in stale:
+                    versions[context][subject] = known[subject]
+                else:
+                    versions[context][subject] = known.get(subject, [])
+                    pending.append((context, subject))
+                    remaining[context] = remaining.get(context, 0) + 1
+        if context not in remaining:
+            finish(context)
+
+    futures = {
+        executor.submit(bulkhead, client.get_schema_versions, subject, context): (context, subject)
+        for context, subject in pending
+    }
+    for future in as_completed(futures):
+        context, subject = futures[future]
+        try:
+            subject_versions = future.result()
+        except Exception:
+            subject_versions = None  # Skip failed version lists
+        if subject_versions is not None and not isinstance(subject_versions, dict):
+            versions[context][subject] = subject_versions
+        remaining[context] -= 1
+        if not remaining[context]:
+            finish(context)
+
+    return versions, errors
+
+
+def _resolve_max_staleness(max_staleness: Optional[float]) -> float:
+    return STATISTICS_MAX_STALENESS if max_staleness is None else max(0.0, max_staleness)
+
+
+def _refreshed_at(entry: ContextStatistics) -> str:
+    return datetime.fromtimestamp(entry.refreshed_at, timezone.utc).isoformat()
+
+
+def _age(entry: ContextStatistics) -> float:
+    return round(time.monotonic() - entry.refreshed, 3)
+
+
+def _context_totals(subjects: Dict[str, List[int]], refreshed_at: str, age: float) -> Dict[str, Any]:
+    return {
+        "subjects": len(subjects),
+        "versions": sum(len(versions) for versions in subjects.values()),
+        "refreshed_at": refreshed_at,
+        "age": age,
+    }
+
+
+def _refresh_contexts(
+    client,
+    contexts: List[Optional[str]],
+    on_context: Optional[Callable[[Optional[str], Dict[str, Any]], None]] = None,
+) -> Dict[Optional[str], str]:
+    """Bring the snapshot of the given contexts up to date, re-reading only what changed."""
+    snapshot = client.statistics
+    started = (time.time(), time.monotonic())
+    refreshed_at = datetime.fromtimestamp(started[0], timezone.utc).isoformat()
+    previous, changed, sequences = {}, {}, {}
+    for context in contexts:
+        known, stale, sequences[context] = snapshot.start_refresh(context)
+        if known is not None:
+            previous[context] = known
+            changed[context] = stale
+
+    def context_done(context: Optional[str], subjects: Optional[Dict[str, List[int]]], error: Optional[str]):
+        if on_context is not None:
+            on_context(context, {"error": error} if error else _context_totals(subjects, refreshed_at, 0.0))
+
+    versions, errors = collect_subject_versions(client, contexts, previous, changed, context_done)
+    for context, subjects in versions.items():
+        snapshot.store(context, subjects, started, context not in previous, sequences[context])
+    return errors
+
+
+def collect_registry_statistics(
+    client,
+    max_staleness: Optional[float] = None,
+    on_context: Optional[Callable[[Optional[str], Dict[str, Any], int], None]] = None,
+) -> Dict[str, Any]:
+    """Contexts, per-context version counts and totals for a registry, served from its statistics snapshot.
+
+    Contexts refreshed more than `max_staleness` seconds ago (STATISTICS_MAX_STALENESS by default),
+    or written to since, are refreshed first; concurrent callers share one refresh.
+
+    `on_context(context, totals, total_contexts)` receives each context's totals (or {"error": ...})
+    once, as soon as they are known: fresh contexts straight away, refreshed ones as their refresh completes.
+    """
+    snapshot = client.statistics
+    max_staleness = _resolve_max_staleness(max_staleness)
+
+    contexts = snapshot.get_contexts(max_staleness)
+    if contexts is None:
+        contexts = client.get_contexts()
+        if isinstance(contexts, dict) and "error" in contexts:
+            return {"error": contexts["error"]}
+        snapshot.store_contexts(contexts)
+
+    statistics_contexts = _statistics_contexts(contexts)
+    reported: Set[Optional[str]] = set()
+
+    def report(context: Optional[str], totals: Dict[str, Any]):
+        if on_context is not None and context not in reported:
+            reported.add(context)
+            on_context(context, totals, len(statistics_contexts))
+
+    stale = []
+    for context in statistics_contexts:
+        entry = snapshot.get(context, max_staleness)
+        if entry is None:
+            stale.append(context)
+        else:
+            report(context, _context_totals(entry.subjects, _refreshed_at(entry), _age(entry)))
+
+    errors: Dict[Optional[str], str] = {}
+    if stale:
+        errors, _ = snapshot.flight.do(tuple(stale), lambda: _refresh_contexts(client, stale, report))
+
+    counts: Dict[Optional[str], Dict[str, int]] = {}
+    context_totals: Dict[Optional[str], Dict[str, Any]] = {}
+    for context in statistics_contexts:
+        entry = snapshot.get(context)
+        if entry is None:
+            report(context, {"error": errors.get(context, "not counted")})
+            continue
+        counts[context] = {subject: len(versions) for subject, versions in entry.subjects.items()}
+        context_totals[context] = _context_totals(entry.subjects, _refreshed_at(entry), _age(entry))
+        # Contexts refreshed by a concurrent caller's shared flight are reported here
+        report(context, context_totals[context])
+
+    return {
+        "contexts": contexts,
+        "counts": counts,
+        "context_totals": context_totals,
+        "errors": errors,
+        "total_subjects": sum(totals["subjects"] for totals in context_totals.values()),
+        "total_versions": sum(totals["versions"] for totals in context_totals.values()),
+        "refreshed_at": min((totals["refreshed_at"] for totals in context_totals.values()), default=None),
+        "age": max((totals["age"] for totals in context_totals.values()), default=0.0),
+    }
+
 
 @structured_output("count_contexts", fallback_on_error=True)
 def count_contexts_tool(registry_manager, registry_mode: str, registry: Optional[str] = None) -> Dict[str, Any]:
@@ -87,6 +335,7 @@ def count_schemas_tool(
     registry_mode: str,
     context: Optional[str] = None,
     registry: Optional[str] = None,
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Count the number of schemas in a context or registry.
@@ -94,6 +343,7 @@ def count_schemas_tool(
     Args:
         context: Optional schema context
         registry: Optional registry name (ignored in single-registry mode)
+        max_staleness: Oldest statistics snapshot age in seconds to answer from (STATISTICS_MAX_STALENESS by default)
 
     Returns:
         Dictionary containing schema count and details with registry metadata and structured validation
@@ -110,7 +360,14 @@ def count_schemas_tool(
                     registry_mode=registry_mode,
                 )
 
-        subjects = client.get_subjects(context)
+        # Answer from a fresh statistics snapshot; otherwise list the subjects directly
+        snapshot = client.statistics.get(context or None, _resolve_max_staleness(max_staleness))
+        if snapshot is not None:
+            subjects = sorted(snapshot.subjects)
+            refreshed_at = _refreshed_at(snapshot)
+        else:
+            subjects = client.get_subjects(context)
+            refreshed_at = datetime.now(timezone.utc).isoformat()
         if isinstance(subjects, dict) and "error" in subjects:
             return create_error_response(
                 f"Failed to get subjects: {subjects.get('error')}",
@@ -128,6 +385,7 @@ def count_schemas_tool(
             "scope": "schemas",
             "schemas": subjects,
             "counted_at": datetime.now().isoformat(),
+            "refreshed_at": refreshed_at,
             "registry_mode": registry_mode,
             "mcp_protocol_version": "2025-11-25",
         }
@@ -151,6 +409,7 @@ def count_schema_versions_tool(
     registry_mode: str,
     context: Optional[str] = None,
     registry: Optional[str] = None,
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Count the number of versions for a specific schema.
@@ -159,6 +418,7 @@ def count_schema_versions_tool(
         subject: The subject name
         context: Optional schema context
         registry: Optional registry name (ignored in single-registry mode)
+        max_staleness: Oldest statistics snapshot age in seconds to answer from (STATISTICS_MAX_STALENESS by default)
 
     Returns:
         Dictionary containing version count and details with registry metadata and structured validation
@@ -175,16 +435,24 @@ def count_schema_versions_tool(
                     registry_mode=registry_mode,
                 )
 
-        # Import the function here to avoid circular imports
-        from kafka_schema_registry_unified_mcp import get_schema_versions
+        # Answer from a fresh statistics snapshot; otherwise read the versions and fold them back in
+        snapshot = client.statistics.get(context or None, _resolve_max_staleness(max_staleness))
+        if snapshot is not None and subject in snapshot.subjects:
+            versions = list(snapshot.subjects[subject])
+            refreshed_at = _refreshed_at(snapshot)
+        else:
+            # Import the function here to avoid circular imports
+            from kafka_schema_registry_unified_mcp import get_schema_versions
 
-        versions = get_schema_versions(subject, context, registry)
-        if isinstance(versions, dict) and "error" in versions:
-            return create_error_response(
-                f"Failed to get schema versions: {versions.get('error')}",
-                error_code="SCHEMA_VERSIONS_RETRIEVAL_FAILED",
-                registry_mode=registry_mode,
-            )
+            versions = get_schema_versions(subject, context, registry)
+            if isinstance(versions, dict) and "error" in versions:
+                return create_error_response(
+                    f"Failed to get schema versions: {versions.get('error')}",
+                    error_code="SCHEMA_VERSIONS_RETRIEVAL_FAILED",
+                    registry_mode=registry_mode,
+                )
+            client.statistics.update_subject(context or None, subject, versions)
+            refreshed_at = datetime.now(timezone.utc).isoformat()
 
         # Get registry metadata
         metadata = client.get_server_metadata()
@@ -197,6 +465,7 @@ def count_schema_versions_tool(
             "scope": "versions",
             "versions": versions,
             "counted_at": datetime.now().isoformat(),
+            "refreshed_at": refreshed_at,
             "registry_mode": registry_mode,
             "mcp_protocol_version": "2025-11-25",
         }
@@ -219,6 +488,7 @@ def get_registry_statistics_tool(
     registry_mode: str,
     registry: Optional[str] = None,
     include_context_details: bool = True,
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Get comprehensive statistics about a registry.
@@ -226,6 +496,7 @@ def get_registry_statistics_tool(
     Args:
         registry: Optional registry name (ignored in single-registry mode)
         include_context_details: Whether to include detailed context statistics
+        max_staleness: Oldest snapshot age in seconds to answer from (STATISTICS_MAX_STALENESS by default)
 
     Returns:
         Dictionary containing registry statistics with metadata and structured validation
@@ -242,71 +513,27 @@ def get_registry_statistics_tool(
                     registry_mode=registry_mode,
                 )
 
-        # Get all contexts
-        contexts = client.get_contexts()
-        if isinstance(contexts, dict) and "error" in contexts:
+        # Subject and version counts for every context from the statistics snapshot
+        statistics = collect_registry_statistics(client, max_staleness)
+        if "error" in statistics:
             return create_error_response(
-                f"Failed to get contexts: {contexts.get('error')}",
+                f"Failed to get contexts: {statistics.get('error')}",
                 error_code="CONTEXTS_RETRIEVAL_FAILED",
                 registry_mode=registry_mode,
             )
 
-        total_schemas = 0
-        total_versions = 0
-        context_stats = []
-
-        # Import the function here to avoid circular imports
-        from kafka_schema_registry_unified_mcp import get_schema_versions
-
-        # Get statistics for each context
-        for context in contexts:
-            subjects = client.get_subjects(context)
-            if isinstance(subjects, dict) and "error" in subjects:
-                continue
-
-            context_schemas = len(subjects)
-            context_versions = 0
-
-            # Count versions for each subject
-            for subject in subjects:
-                versions = get_schema_versions(subject, context, registry)
-                if not isinstance(versions, dict):
-                    context_versions += len(versions)
-
-            total_schemas += context_schemas
-            total_versions += context_versions
-
-            if include_context_details:
-                context_stats.append(
-                    {
-                        "name": context,
-                        "subject_count": context_schemas,
-                        "schema_count": context_versions,
-                    }
-                )
-
-        # Get default context stats
-        default_subjects = client.get_subjects()
-        if not isinstance(default_subjects, dict):
-            default_schemas = len(default_subjects)
-            default_versions = 0
-
-            for subject in default_subjects:
-                versions = get_schema_versions(subject, None, registry)
-                if not isinstance(versions, dict):
-                    default_versions += len(versions)
-
-            total_schemas += default_schemas
-            total_versions += default_versions
-
-            if include_context_details:
-                context_stats.append(
-                    {
-                        "name": "default",
-                        "subject_count": default_schemas,
-                        "schema_count": default_versions,
-                    }
-                )
+        contexts = statistics["contexts"]
+        total_schemas = statistics["total_subjects"]
+        total_versions = statistics["total_versions"]
+        context_stats = [
+            {
+                "name": context or "default",
+                "subject_count": totals["subjects"],
+                "schema_count": totals["versions"],
+                "refreshed_at": totals["refreshed_at"],
+            }
+            for context, totals in statistics["context_totals"].items()
+        ]
 
         # Get registry metadata
         metadata = client.get_server_metadata()
@@ -318,6 +545,8 @@ def get_registry_statistics_tool(
             "total_schemas": total_versions,
             "contexts": context_stats if include_context_details else None,
             "generated_at": datetime.now().isoformat(),
+            "snapshot_refreshed_at": statistics["refreshed_at"],
+            "snapshot_age_seconds": statistics["age"],
             "registry_mode": registry_mode,
             "mcp_protocol_version": "2025-11-25",
         }
@@ -333,12 +562,43 @@ def get_registry_statistics_tool(
 # ===== OPTIMIZED ASYNC STATISTICS FUNCTIONS =====
 
 
+def _fresh_snapshot_subjects(snapshot, max_staleness: float) -> Optional[Tuple[Dict[str, List[str]], str]]:
+    """Subjects of every context and the oldest refresh time, if the whole snapshot is that fresh."""
+    contexts = snapshot.get_contexts(max_staleness)
+    if contexts is None:
+        return None
+    entries = {context: snapshot.get(context, max_staleness) for context in _statistics_contexts(contexts)}
+    if any(entry is None for entry in entries.values()):
+        return None
+    schemas_by_context = {context or "default": sorted(entry.subjects) for context, entry in entries.items()}
+    return schemas_by_context, min(_refreshed_at(entry) for entry in entries.values())
+
+
+PARTIAL_RESULT_MARKER = "partial_result="
+
+
+def format_partial_result(message: str, partial: Dict[str, Any]) -> str:
+    """Progress message with a partial result appended as compact JSON after the readable text."""
+    return f"{message} {PARTIAL_RESULT_MARKER}{json.dumps(partial, separators=(',', ':'), default=str)}"
+
+
+def parse_partial_result(message: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The partial result carried by a progress or task status message, if any."""
+    if not message or PARTIAL_RESULT_MARKER not in message:
+        return None
+    try:
+        return json.loads(message.partition(PARTIAL_RESULT_MARKER)[2])
+    except ValueError:
+        return None
+
+
 async def _count_schemas_async(
     registry_manager,
     registry_mode: str,
     context: Optional[str] = None,
     registry: Optional[str] = None,
     progress: Progress = Progress(),
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Async version of count_schemas_tool with better performance.
@@ -349,19 +609,18 @@ async def _count_schemas_async(
     """
     try:
         if registry_mode == "single":
-            client = get_default_client(registry_manager)
-        else:
-            client = registry_manager.get_registry(registry)
-            if client is None:
-                return {"error": f"Registry '{registry}' not found"}
+            registry = None
+        client = registry_manager.get_async_registry(registry)
+        if client is None:
+            return {"error": f"Registry '{registry}' not found"}
 
         # Get registry metadata
-        metadata = client.get_server_metadata()
+        metadata = await client.get_server_metadata()
 
         if context:
             # Single context - direct call
             await progress.set_message(f"Counting schemas in context '{context}'")
-            subjects = client.get_subjects(context)
+            subjects = await client.get_subjects(context)
             if isinstance(subjects, dict) and "error" in subjects:
                 return subjects
 
@@ -386,40 +645,64 @@ async def _count_schemas_async(
             result.update(metadata_copy)
             return result
         else:
-            # All contexts - parallel execution
+            # All contexts - answer from the statistics snapshot when every context in it is fresh
+            snapshot = _fresh_snapshot_subjects(client.statistics, _resolve_max_staleness(max_staleness))
+            if snapshot is not None:
+                schemas_by_context, refreshed_at = snapshot
+                result = {
+                    "registry": (client.config.name if hasattr(client.config, "name") else "default"),
+                    "count": sum(len(subjects) for subjects in schemas_by_context.values()),
+                    "scope": "schemas",
+                    "total_schemas": sum(len(subjects) for subjects in schemas_by_context.values()),
+                    "schemas_by_context": schemas_by_context,
+                    "contexts_analyzed": len(schemas_by_context),
+                    "counted_at": datetime.now(timezone.utc).isoformat(),
+                    "refreshed_at": refreshed_at,
+                }
+                metadata_copy = metadata.copy()
+                if "scope" in metadata_copy:
+                    metadata_copy["server_scope"] = metadata_copy.pop("scope")
+                result.update(metadata_copy)
+                return result
+
+            # Otherwise list every context's subjects in parallel
             await progress.set_message("Getting contexts list")
-            contexts = client.get_contexts()
+            contexts = await client.get_contexts()
             if isinstance(contexts, dict) and "error" in contexts:
                 return contexts
 
-            total_contexts = len(contexts) + 1  # +1 for default context
+            total_contexts = len(_statistics_contexts(contexts))
             await progress.set_total(total_contexts)
             await progress.set_message(f"Counting schemas across {total_contexts} contexts")
 
             total_schemas = 0
             all_schemas = {}
 
-            # Parallel execution for better performance
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                future_to_context = {executor.submit(client.get_subjects, ctx): ctx for ctx in contexts}
-
-                # Add default context
-                future_to_context[executor.submit(client.get_subjects, None)] = "default"
-
-                for future in as_completed(future_to_context):
-                    ctx = future_to_context[future]
-                    try:
-                        subjects = future.result()
-                        if not isinstance(subjects, dict):
-                            all_schemas[ctx] = subjects
-                            total_schemas += len(subjects)
-                        await progress.increment()
-                        await progress.set_message(
-                            f"Processed context '{ctx}' ({len(subjects) if not isinstance(subjects, dict) else 0} schemas)"
-                        )
-                    except Exception as e:
-                        all_schemas[ctx] = {"error": str(e)}
-                        await progress.increment()
+            # Concurrent requests on the event loop, bounded by the registry's adaptive concurrency limiter
+            async def count_context(ctx: Optional[str]):
+                try:
+                    return ctx or "default", await client.get_subjects(ctx), None
+                except Exception as e:
+                    return ctx or "default", None, e
+
+            # Each context is published as a partial result as soon as it is counted
+            tasks = asyncio.as_completed([count_context(ctx) for ctx in _statistics_contexts(contexts)])
+            for completed, task in enumerate(tasks, start=1):
+                ctx, subjects, error = await task
+                if error is not None:
+                    all_schemas[ctx] = {"error": str(error)}
+                    partial = {"context": ctx, "error": str(error)}
+                elif isinstance(subjects, dict):
+                    partial = {"context": ctx, "error": subjects.get("error", "not counted")}
+                else:
+                    all_schemas[ctx] = subjects
+                    total_schemas += len(subjects)
+                    partial = {"context": ctx, "count": len(subjects)}
+                partial.update(completed=completed, total=total_contexts, total_schemas=total_schemas)
+                await progress.increment()
+                await progress.set_message(
+                    format_partial_result(f"Processed context '{ctx}' ({partial.get('count', 0)} schemas)", partial)
+                )
 
             result = {
                 "registry": (client.config.name if hasattr(client.config, "name") else "default"),
@@ -429,6 +712,7 @@ async def _count_schemas_async(
                 "schemas_by_context": all_schemas,
                 "contexts_analyzed": len(all_schemas),
                 "counted_at": datetime.now(timezone.utc).isoformat(),
+                "refreshed_at": datetime.now(timezone.utc).isoformat(),
             }
 
             # Add metadata information, but preserve the scope field
@@ -449,6 +733,7 @@ async def count_schemas_task_queue_tool(
     context: Optional[str] = None,
     registry: Optional[str] = None,
     progress: Progress = Progress(),
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Background task version of count_schemas for better performance on large registries.
@@ -464,17 +749,37 @@ async def count_schemas_task_queue_tool(
             context=context,
             registry=registry,
             progress=progress,
+            max_staleness=max_staleness,
         )
     except Exception as e:
         return create_error_response(str(e), error_code="SCHEMA_COUNT_FAILED", registry_mode=registry_mode)
 
 
+async def count_schemas_executor_tool(
+    registry_manager,
+    registry_mode: str,
+    context: Optional[str] = None,
+    registry: Optional[str] = None,
+    max_staleness: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Run count_schemas_tool on the shared registry executor so its registry reads never block the event loop."""
+    client = (
+        get_default_client(registry_manager) if registry_mode == "single" else registry_manager.get_registry(registry)
+    )
+    args = (registry_manager, registry_mode, context, registry, max_staleness)
+    if client is None:
+        # Nothing to read: the tool only reports the missing registry
+        return count_schemas_tool(*args)
+    return await asyncio.wrap_future(get_registry_executor().submit(client.config.name, count_schemas_tool, *args))
+
+
 async def _get_registry_statistics_async(
     registry_manager,
     registry_mode: str,
     registry: Optional[str] = None,
     include_context_details: bool = True,
     progress: Progress = Progress(),
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Async version of get_registry_statistics_tool with parallel execution.
@@ -488,69 +793,92 @@ async def _get_registry_statistics_async(
             if client is None:
                 return {"error": f"Registry '{registry}' not found"}
 
-        # Get all contexts
-        await progress.set_message("Getting contexts list")
-        contexts = client.get_contexts()
-        if isinstance(contexts, dict) and "error" in contexts:
-            return contexts
-
-        total_contexts = len(contexts) + 1  # +1 for default context
-        await progress.set_total(total_contexts)
-        await progress.set_message(f"Analyzing {total_contexts} contexts")
+        # Serve from the statistics snapshot, refreshing stale contexts on the shared registry executor.
+        # Contexts are published as partial results while the refresh runs; a cancelled task leaves the
+        # refresh to finish in the background, so its results still land in the snapshot.
+        await progress.set_message("Refreshing statistics snapshot")
+        loop = asyncio.get_running_loop()
+        finished: asyncio.Queue = asyncio.Queue()
+
+        def on_context(context: Optional[str], totals: Dict[str, Any], total_contexts: int):
+            try:
+                loop.call_soon_threadsafe(finished.put_nowait, (context, totals, total_contexts))
+            except RuntimeError:
+                pass  # The task's event loop is gone; let the refresh finish for the snapshot
+
+        executor = get_registry_executor()
+        refresh = asyncio.wrap_future(
+            executor.submit(client.config.name, collect_registry_statistics, client, max_staleness, on_context)
+        )
+        # Metadata is looked up meanwhile in the registry's health lane, also off the event loop
+        metadata_lookup = asyncio.wrap_future(
+            executor.submit(executor.health_lane(client.config.name), client.get_server_metadata)
+        )
 
-        total_schemas = 0
-        total_versions = 0
+        published = {"completed": 0, "schemas": 0, "versions": 0}
+
+        async def publish(context: Optional[str], totals: Dict[str, Any], total_contexts: int):
+            name = context or "default"
+            if not published["completed"]:
+                await progress.set_total(total_contexts)
+            published["completed"] += 1
+            partial = {"context": name, **totals}
+            partial.pop("age", None)
+            if "error" in totals:
+                message = f"Context '{name}' failed"
+            else:
+                published["schemas"] += totals["subjects"]
+                published["versions"] += totals["versions"]
+                message = f"Analyzed context '{name}' ({totals['subjects']} schemas, {totals['versions']} versions)"
+            partial.update(
+                completed=published["completed"],
+                total=total_contexts,
+                total_schemas=published["schemas"],
+                total_versions=published["versions"],
+            )
+            await progress.increment()
+            await progress.set_message(format_partial_result(message, partial))
+
+        while not refresh.done():
+            next_context = asyncio.ensure_future(finished.get())
+            await asyncio.wait({next_context, refresh}, return_when=asyncio.FIRST_COMPLETED)
+            if next_context.done():
+                await publish(*next_context.result())
+            else:
+                next_context.cancel()
+        statistics = refresh.result()
+        while not finished.empty():
+            await publish(*finished.get_nowait())
+        if "error" in statistics:
+            metadata_lookup.cancel()
+            return statistics
+
+        contexts = statistics["contexts"]
+        statistics_contexts = _statistics_contexts(contexts)
+
+        total_schemas = statistics["total_subjects"]
+        total_versions = statistics["total_versions"]
         context_stats = []
-
-        # Parallel execution for better performance
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            # Submit all context analysis tasks
-            future_to_context = {}
-
-            # Add all contexts
-            for context in contexts:
-                future = executor.submit(_analyze_context_parallel, client, context, registry)
-                future_to_context[future] = context
-
-            # Add default context
-            future = executor.submit(_analyze_context_parallel, client, None, registry)
-            future_to_context[future] = "default"
-
-            # Collect results
-            completed = 0
-            total_contexts = len(future_to_context)
-
-            for future in as_completed(future_to_context):
-                context = future_to_context[future]
-                try:
-                    context_result = future.result()
-
-                    if not isinstance(context_result, dict) or "error" not in context_result:
-                        total_schemas += context_result.get("schemas", 0)
-                        total_versions += context_result.get("versions", 0)
-
-                        if include_context_details:
-                            context_stats.append(
-                                {
-                                    "context": context,
-                                    "schemas": context_result.get("schemas", 0),
-                                    "versions": context_result.get("versions", 0),
-                                }
-                            )
-
-                    # Update progress
-                    completed += 1
-                    await progress.increment()
-                    await progress.set_message(f"Analyzed {completed}/{total_contexts} contexts")
-
-                except Exception as e:
-                    if include_context_details:
-                        context_stats.append({"context": context, "error": str(e)})
+        if include_context_details:
+            for context in statistics_contexts:
+                name = context or "default"
+                if context in statistics["context_totals"]:
+                    totals = statistics["context_totals"][context]
+                    context_stats.append(
+                        {
+                            "context": name,
+                            "schemas": totals["subjects"],
+                            "versions": totals["versions"],
+                            "refreshed_at": totals["refreshed_at"],
+                        }
+                    )
+                else:
+                    context_stats.append({"context": name, "error": statistics["errors"].get(context, "not counted")})
 
         await progress.set_message("Finalizing statistics")
 
         # Get registry metadata
-        metadata = client.get_server_metadata()
+        metadata = await metadata_lookup
 
         result = {
             "registry": (client.config.name if hasattr(client.config, "name") else "default"),
@@ -560,6 +888,8 @@ async def _get_registry_statistics_async(
             "average_versions_per_schema": round(total_versions / max(total_schemas, 1), 2),
             "contexts": context_stats if include_context_details else None,
             "counted_at": datetime.now().isoformat(),
+            "snapshot_refreshed_at": statistics["refreshed_at"],
+            "snapshot_age_seconds": statistics["age"],
         }
 
         # Add metadata information
@@ -573,41 +903,6 @@ async def _get_registry_statistics_async(
         return {"error": str(e)}
 
 
-def _analyze_context_parallel(client, context: Optional[str], registry: Optional[str]) -> Dict[str, Any]:
-    """
-    Analyze a single context in parallel execution.
-    Returns schema and version counts for the context.
-    """
-    try:
-        subjects = client.get_subjects(context)
-        if isinstance(subjects, dict) and "error" in subjects:
-            return {"error": subjects["error"]}
-
-        schema_count = len(subjects)
-        version_count = 0
-
-        # Use ThreadPoolExecutor for version counting too
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Import here to avoid circular imports
-            from kafka_schema_registry_unified_mcp import get_schema_versions
-
-            futures = [executor.submit(get_schema_versions, subject, context, registry) for subject in subjects]
-
-            for future in as_completed(futures):
-                try:
-                    versions = future.result()
-                    if not isinstance(versions, dict):
-                        version_count += len(versions)
-                except Exception:
-                    # Skip failed version counts
-                    pass
-
-        return {"schemas": schema_count, "versions": version_count}
-
-    except Exception as e:
-        return {"error": str(e)}
-
-
 @structured_output("get_registry_statistics_task_queue", fallback_on_error=True)
 async def get_registry_statistics_task_queue_tool(
     registry_manager,
@@ -615,6 +910,7 @@ async def get_registry_statistics_task_queue_tool(
     registry: Optional[str] = None,
     include_context_details: bool = True,
     progress: Progress = Progress(),
+    max_staleness: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Background task version of get_registry_statistics for better performance.
@@ -630,6 +926,374 @@ async def get_registry_statistics_task_queue_tool(
             registry=registry,
             include_context_details=include_context_details,
             progress=progress,
+            max_staleness=max_staleness,
         )
     except Exception as e:
         return create_error_response(str(e), error_code="REGISTRY_STATISTICS_FAILED", registry_mode=registry_mode)
+
+
+# ===== ANALYTICS CUBE =====
+
+SCHEMA_TYPES = ("AVRO", "JSON", "PROTOBUF")
+ANALYTICS_DEFAULT_TOP_N = 10
+_PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+_PROTOBUF_FIELD = re.compile(
+    r"^\s*(?:optional\s+|required\s+|repeated\s+)?(?:map\s*<[^>]*>|[A-Za-z_][\w.]*)\s+[A-Za-z_]\w*\s*=\s*\d+",
+    re.MULTILINE,
+)
+
+
+def _avro_field_count(node: Any, seen: Set[str]) -> int:
+    """Fields of every record reachable from an Avro schema node, each named record counted once."""
+    if isinstance(node, list):
+        return sum(_avro_field_count(branch, seen) for branch in node)
+    if not isinstance(node, dict):
+        return 0
+    node_type = node.get("type")
+    if node_type in ("record", "error"):
+        name = node.get("name")
+        if name in seen:
+            return 0
+        seen.add(name)
+        return sum(1 + _avro_field_count(field.get("type"), seen) for field in node.get("fields", []))
+    if node_type == "array":
+        return _avro_field_count(node.get("items"), seen)
+    if node_type == "map":
+        return _avro_field_count(node.get("values"), seen)
+    return _avro_field_count(node_type, seen)
+
+
+def _json_field_count(node: Any) -> int:
+    """Properties declared anywhere in a JSON Schema document."""
+    if isinstance(node, list):
+        return sum(_json_field_count(item) for item in node)
+    if not isinstance(node, dict):
+        return 0
+    properties = node.get("properties")
+    count = len(properties) if isinstance(properties, dict) else 0
+    return count + sum(_json_field_count(value) for value in node.values() if isinstance(value, (dict, list)))
+
+
+def schema_field_count(schema_type: str, schema: str) -> int:
+    """Number of fields a schema declares (Avro record fields, JSON properties, Protobuf fields); 0 if unparseable."""
+    try:
+        if schema_type == "PROTOBUF":
+            return len(_PROTOBUF_FIELD.findall(schema))
+        if schema_type == "JSON":
+            return _json_field_count(json.loads(schema))
+        return _avro_field_count(json.loads(schema), set())
+    except (ValueError, TypeError, AttributeError, RecursionError):
+        return 0
+
+
+class SchemaColumns:
+    """One row per schema version, stored column-wise in compact typed arrays.
+
+    Rows and subjects are appended one context at a time, so every context owns a contiguous
+    range of both and its aggregates are computed over array slices rather than filtered rows.
+    """
+
+    def __init__(self):
+        self.contexts: List[Optional[str]] = []
+        self.context_rows: List[Tuple[int, int]] = []
+        self.context_subjects: List[Tuple[int, int]] = []
+        self.subject_names: List[str] = []
+        self.subject_context = array("I")
+        # Row columns
+        self.subject = array("I")
+        self.version = array("I")
+        self.size = array("Q")
+        self.fields = array("I")
+        self.schema_type = array("B")
+
+    def __len__(self) -> int:
+        return len(self.subject)
+
+    def add_context(self, context: Optional[str], subjects: Dict[str, List[Tuple[int, int, int, int]]]):
+        """Append a context given subject -> [(version, size, fields, schema type code)] rows."""
+        context_index = len(self.contexts)
+        self.contexts.append(context)
+        row_start, subject_start = len(self.subject), len(self.subject_names)
+        for name, rows in subjects.items():
+            subject_index = len(self.subject_names)
+            self.subject_names.append(name)
+            self.subject_context.append(context_index)
+            for version, size, fields, type_code in rows:
+                self.subject.append(subject_index)
+                self.version.append(version)
+                self.size.append(size)
+                self.fields.append(fields)
+                self.schema_type.append(type_code)
+        self.context_rows.append((row_start, len(self.subject)))
+        self.context_subjects.append((subject_start, len(self.subject_names)))
+
+
+def _schema_type_code(schema_type: Optional[str]) -> int:
+    """Index into SCHEMA_TYPES; registries omit schemaType for Avro."""
+    try:
+        return SCHEMA_TYPES.index(schema_type or "AVRO")
+    except ValueError:
+        return 0
+
+
+def _analytics_rows(entries: List[Dict[str, Any]]) -> Dict[str, List[Tuple[int, int, int, int]]]:
+    """Turn version entries (bulk listing or single version responses) into per-subject rows.
+
+    Field counts are parsed once per schema ID of the context, since the same schema is often
+    registered under many subjects.
+    """
+    subjects: Dict[str, List[Tuple[int, int, int, int]]] = {}
+    field_counts: Dict[int, int] = {}
+    for entry in entries:
+        schema = entry.get("schema") or ""
+        type_code = _schema_type_code(entry.get("schemaType"))
+        schema_id = entry.get("id")
+        fields = field_counts.get(schema_id) if schema_id is not None else None
+        if fields is None:
+            fields = schema_field_count(SCHEMA_TYPES[type_code], schema)
+            if schema_id is not None:
+                field_counts[schema_id] = fields
+        subjects.setdefault(entry.get("subject"), []).append(
+            (entry.get("version") or 0, len(schema.encode("utf-8")), fields, type_code)
+        )
+    for rows in subjects.values():
+        rows.sort()
+    return subjects
+
+
+def _fetch_context_versions(client, context: Optional[str], versions: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+    """Version entries of a context without the bulk listing: one GET per version on the registry's bulkhead."""
+    executor = get_registry_executor()
+    futures = {
+        executor.submit(client.config.name, client.get_schema, subject, version, context): (subject, version)
+        for subject, subject_versions in versions.items()
+        for version in subject_versions
+    }
+    entries = []
+    for future, (subject, version) in futures.items():
+        try:
+            entry = future.result()
+        except Exception:
+            continue  # Skip versions that could not be read
+        if "error" not in entry:
+            entries.append({**entry, "subject": subject, "version": version})
+    return entries
+
+
+def collect_schema_columns(client, contexts: List[Optional[str]]) -> Tuple[SchemaColumns, Dict[Optional[str], str]]:
+    """Load every schema version of the given contexts into columns. Returns (columns, errors).
+
+    Contexts are read from the paged bulk listing where the registry supports it; the rest fall back
+    to their version lists and one request per version on the shared registry executor. Each context's
+    entries are reduced to rows as soon as they arrive, so at most a few listings are held at once.
+    """
+    executor = get_registry_executor()
+    bulkhead = client.config.name
+    listings = {context: executor.submit(bulkhead, fetch_schemas_bulk, client, context) for context in contexts}
+
+    loaded: Dict[Optional[str], Dict[str, List[Tuple[int, int, int, int]]]] = {}
+    errors: Dict[Optional[str], str] = {}
+    crawl = []
+    for context, future in listings.items():
+        try:
+            entries = future.result()
+        except Exception:
+            entries = None
+        if entries is None:
+            crawl.append(context)
+        else:
+            loaded[context] = _analytics_rows(entries)
+
+    if crawl:
+        versions, errors = collect_subject_versions(client, crawl)
+        for context, subject_versions in versions.items():
+            loaded[context] = _analytics_rows(_fetch_context_versions(client, context, subject_versions))
+
+    columns = SchemaColumns()
+    for context in contexts:
+        if context in loaded:
+            columns.add_context(context, loaded.pop(context))
+    return columns, errors
+
+
+def _distribution(values: array) -> Dict[str, Any]:
+    """Summary and power-of-two histogram of a column (buckets hold values up to `le`)."""
+    if not values:
+        return {"count": 0, "min": 0, "max": 0, "mean": 0.0, "p50": 0, "p90": 0, "p99": 0, "histogram": []}
+    ordered = sorted(values)
+    count = len(ordered)
+    summary: Dict[str, Any] = {
+        "count": count,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": round(sum(ordered) / count, 2),
+    }
+    for name, fraction in _PERCENTILES:
+        summary[name] = ordered[min(count - 1, max(0, math.ceil(fraction * count) - 1))]
+
+    histogram, below = [], 0
+    for bits in range(ordered[-1].bit_length() + 1):
+        upper = (1 << bits) - 1
+        through = bisect_right(ordered, upper)
+        if through > below:
+            histogram.append({"le": upper, "count": through - below})
+        below = through
+    summary["histogram"] = histogram
+    return summary
+
+
+def _cube(columns: SchemaColumns, rows: Tuple[int, int], subjects: Tuple[int, int], top_n: int) -> Dict[str, Any]:
+    """Aggregates over a contiguous range of rows and the subjects they belong to."""
+    row_start, row_end = rows
+    subject_start, subject_end = subjects
+    subject_count = subject_end - subject_start
+
+    # Per-subject columns from one pass over the rows; versions are ascending, so the last row is the latest
+    version_counts = array("I", [0]) * subject_count
+    latest_size = array("Q", [0]) * subject_count
+    latest_version = array("I", [0]) * subject_count
+    for row in range(row_start, row_end):
+        subject = columns.subject[row] - subject_start
+        version_counts[subject] += 1
+        latest_size[subject] = columns.size[row]
+        latest_version[subject] = columns.version[row]
+
+    type_counts = [0] * len(SCHEMA_TYPES)
+    for type_code in columns.schema_type[row_start:row_end]:
+        type_counts[type_code] += 1
+
+    def subject_entry(index: int) -> Dict[str, Any]:
+        context = columns.contexts[columns.subject_context[subject_start + index]]
+        return {
+            "subject": columns.subject_names[subject_start + index],
+            "context": context or "default",
+            "versions": version_counts[index],
+            "latest_version": latest_version[index],
+            "size_bytes": latest_size[index],
+        }
+
+    by_versions = heapq.nlargest(top_n, range(subject_count), key=version_counts.__getitem__)
+    by_size = heapq.nlargest(top_n, range(subject_count), key=latest_size.__getitem__)
+    return {
+        "subjects": subject_count,
+        "versions": row_end - row_start,
+        "total_bytes": sum(columns.size[row_start:row_end]),
+        "versions_per_subject": _distribution(version_counts),
+        "schema_size_bytes": _distribution(columns.size[row_start:row_end]),
+        "field_count": _distribution(columns.fields[row_start:row_end]),
+        "schema_types": dict(zip(SCHEMA_TYPES, type_counts)),
+        "top_subjects_by_versions": [subject_entry(index) for index in by_versions],
+        "top_subjects_by_size": [subject_entry(index) for index in by_size],
+    }
+
+
+def compute_registry_analytics(
+    columns: SchemaColumns, top_n: int = ANALYTICS_DEFAULT_TOP_N, include_context_details: bool = True
+) -> Dict[str, Any]:
+    """Registry-wide and per-context distributions, schema type breakdown and top-N subjects."""
+    top_n = max(0, top_n)
+    result = _cube(columns, (0, len(columns)), (0, len(columns.subject_names)), top_n)
+    if include_context_details:
+        result["contexts"] = [
+            {"context": context or "default", **_cube(columns, rows, subjects, top_n)}
+            for context, rows, subjects in zip(columns.contexts, columns.context_rows, columns.context_subjects)
+        ]
+    return result
+
+
+def collect_registry_analytics(
+    client,
+    context: Optional[str] = None,
+    top_n: int = ANALYTICS_DEFAULT_TOP_N,
+    include_context_details: bool = True,
+) -> Dict[str, Any]:
+    """Analytics cube for one context, or for every context of the registry when `context` is None."""
+    if context:
+        contexts = [context]
+        statistics_contexts = [None if context == DEFAULT_CONTEXT else context]
+    else:
+        contexts = client.get_contexts()
+        if isinstance(contexts, dict) and "error" in contexts:
+            return {"error": contexts["error"]}
+        statistics_contexts = _statistics_contexts(contexts)
+
+    columns, errors = collect_schema_columns(client, statistics_contexts)
+    result = compute_registry_analytics(columns, top_n, include_context_details)
+    result["total_contexts"] = len(contexts)
+    result["errors"] = {(context or "default"): error for context, error in errors.items()}
+    return result
+
+
+@structured_output("get_registry_analytics", fallback_on_error=True)
+async def get_registry_analytics_tool(
+    registry_manager,
+    registry_mode: str,
+    registry: Optional[str] = None,
+    context: Optional[str] = None,
+    top_n: int = ANALYTICS_DEFAULT_TOP_N,
+    include_context_details: bool = True,
+    progress: Progress = Progress(),
+) -> Dict[str, Any]:
+    """
+    Distributions, schema type breakdown and top-N subjects for capacity planning.
+
+    Args:
+        registry: Optional registry name (ignored in single-registry mode)
+        context: Optional context to analyze instead of the whole registry
+        top_n: Number of subjects to list by version count and by size
+        include_context_details: Whether to include the aggregates of each context
+
+    Returns:
+        Registry analytics with structured validation
+    """
+    try:
+        if registry_mode == "single":
+            client = get_default_client(registry_manager)
+        else:
+            client = registry_manager.get_registry(registry)
+            if client is None:
+                return create_error_response(
+                    f"Registry '{registry}' not found",
+                    error_code="REGISTRY_NOT_FOUND",
+                    registry_mode=registry_mode,
+                )
+
+        # Load and aggregate on the shared registry executor so the event loop stays free;
+        # metadata is looked up meanwhile in the registry's health lane
+        await progress.set_message("Loading schemas for analytics")
+        started = time.perf_counter()
+        executor = get_registry_executor()
+        metadata = asyncio.wrap_future(
+            executor.submit(executor.health_lane(client.config.name), client.get_server_metadata)
+        )
+        analytics = await asyncio.wrap_future(
+            executor.submit(
+                client.config.name, collect_registry_analytics, client, context, top_n, include_context_details
+            )
+        )
+        if "error" in analytics:
+            metadata.cancel()
+            return create_error_response(
+                f"Failed to get contexts: {analytics.get('error')}",
+                error_code="CONTEXTS_RETRIEVAL_FAILED",
+                registry_mode=registry_mode,
+            )
+        await progress.set_message("Analytics complete")
+
+        result = {
+            "registry": (client.config.name if hasattr(client.config, "name") else "default"),
+            "context": context or None,
+            "top_n": top_n,
+            **analytics,
+            "computed_in_seconds": round(time.perf_counter() - started, 3),
+            "generated_at": datetime.now().isoformat(),
+            "registry_mode": registry_mode,
+            "mcp_protocol_version": "2025-11-25",
+        }
+
+        # Add metadata information
+        result.update(await metadata)
+
+        return result
+    except Exception as e:
+        return create_error_response(str(e), error_code="REGISTRY_ANALYTICS_FAILED", registry_mode=registry_mode)
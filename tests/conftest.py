@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for tests that run against the in-process registry stand-in.
+
+Modules vary the stand-in by overriding ``stand_in_options`` (e.g. to
+parametrize bulk vs crawl listing or add per-request delay) or
+``stand_in_class``, and populate it by overriding ``stand_in`` with a fixture
+that requests the base one.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from registry_stand_in import StandInRegistry  # noqa: E402
+from schema_registry_common import RegistryClient, RegistryConfig  # noqa: E402
+
+
+def make_client(url: str, cache: bool = False, limiter=None, name: str = "test", **config) -> RegistryClient:
+    """Client for ``url`` with the response cache off by default so every call reaches the registry.
+
+    ``limiter`` replaces the client's adaptive concurrency limiter; ``False`` disables it.
+    """
+    client = RegistryClient(RegistryConfig(name=name, url=url, **config))
+    client.cache.enabled = cache
+    if limiter is False:
+        client.limiter.enabled = False
+    elif limiter is not None:
+        client.limiter = limiter
+        client.session.limiter = limiter
+    return client
+
+
+@pytest.fixture
+def stand_in_options():
+    """Keyword arguments for StandInRegistry."""
+    return {}
+
+
+@pytest.fixture
+def stand_in_class():
+    """StandInRegistry or a subclass with custom request handling."""
+    return StandInRegistry
+
+
+@pytest.fixture
+def stand_in(stand_in_class, stand_in_options):
+    with stand_in_class(**stand_in_options) as registry:
+        yield registry
+
+
+@pytest.fixture
+def client(stand_in):
+    return make_client(stand_in.url)
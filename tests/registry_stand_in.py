@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+In-process Schema Registry stand-in for unit tests and benchmarks.
+
+Serves the subset of the Schema Registry REST API used by the MCP server
+(subjects, versions, schemas by ID, bulk schema listing, contexts, config, mode,
+metadata) from
+memory over HTTP/1.1 keep-alive (or cleartext HTTP/2 with prior knowledge when
+``http2=True``; needs the h2 package), and records every request it receives.
+
+Usage:
+    with StandInRegistry() as registry:
+        registry.add_schema("orders-value", '{"type": "string"}')
+        client = RegistryClient(RegistryConfig(name="test", url=registry.url))
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from registry_cache import schema_id_store
+
+DEFAULT_CONTEXT = "."
+
+
+class StandInRegistry:
+    """Minimal in-memory Schema Registry served on a local port."""
+
+    def __init__(self, delay: float = 0.0, bulk_enabled: bool = True, http2: bool = False, nodelay: bool = False):
+        self.delay = delay
+        self.http2 = http2
+        # Headers and body go out in separate writes; unless TCP_NODELAY is set, each keep-alive
+        # response waits out the client's delayed ACK (~40ms) on top of `delay`
+        self.nodelay = nodelay
+        # Older registries have no GET /schemas bulk listing
+        self.bulk_enabled = bulk_enabled
+        self.lock = threading.Lock()
+        # (context, subject) -> list of {"version": int, "id": int}
+        self.subjects: Dict[Tuple[str, str], List[Dict[str, int]]] = {}
+        # schema id -> {"schema": str, "schemaType": str}
+        self.schemas: Dict[int, Dict[str, str]] = {}
+        # (schema, schemaType) -> schema id, so populating thousands of subjects stays linear
+        self._schema_ids: Dict[Tuple[str, str], int] = {}
+        self.configs: Dict[Tuple[str, Optional[str]], str] = {(DEFAULT_CONTEXT, None): "BACKWARD"}
+        self.modes: Dict[Tuple[str, Optional[str]], str] = {(DEFAULT_CONTEXT, None): "READWRITE"}
+        self.requests: List[Tuple[str, str]] = []
+        # Authorization header each request arrived with
+        self.authorizations: List[Optional[str]] = []
+        # Optional per-path status overrides: path regex -> status code
+        self.fail_paths: Dict[str, int] = {}
+        # Retry-After header sent with injected failures
+        self.retry_after: Optional[str] = None
+        # Concurrent requests being served now, and the highest number seen
+        self.active = 0
+        self.peak_active = 0
+        # TCP connections accepted
+        self.connections = 0
+        self.port = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
+    # ----- data setup -----
+
+    def add_schema(self, subject: str, schema: str, context: str = DEFAULT_CONTEXT, schema_type: str = "AVRO") -> int:
+        """Register a schema version and return its global ID (identical schemas share an ID)."""
+        with self.lock:
+            return self._register(context, subject, schema, schema_type)["id"]
+
+    def _register(self, context: str, subject: str, schema: str, schema_type: str) -> Dict[str, int]:
+        schema_id = self._schema_ids.get((schema, schema_type))
+        if schema_id is None:
+            schema_id = len(self.schemas) + 1
+            self.schemas[schema_id] = {"schema": schema, "schemaType": schema_type}
+            self._schema_ids[(schema, schema_type)] = schema_id
+        versions = self.subjects.setdefault((context, subject), [])
+        for entry in versions:
+            if entry["id"] == schema_id:
+                return entry
+        entry = {"version": len(versions) + 1, "id": schema_id}
+        versions.append(entry)
+        return entry
+
+    def request_count(self, path_prefix: str = "", method: Optional[str] = None) -> int:
+        """Number of recorded requests whose path starts with the prefix."""
+        with self.lock:
+            return sum(
+                1 for m, path in self.requests if path.startswith(path_prefix) and (method is None or m == method)
+            )
+
+    # ----- server lifecycle -----
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "StandInRegistry":
+        # Every stand-in numbers schemas from 1, so bodies stored for earlier instances must go
+        schema_id_store.clear()
+        if self.http2:
+            return self._start_http2()
+        registry = self
+
+        class Handler(_StandInHandler):
+            stand_in = registry
+            disable_nagle_algorithm = registry.nodelay
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def _start_http2(self) -> "StandInRegistry":
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(loop.create_server(lambda: _H2StandInProtocol(self), "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+
+        def run():
+            loop.run_forever()
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+            loop.close()
+
+        self._loop = loop
+        self._loop_thread = threading.Thread(target=run, daemon=True)
+        self._loop_thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop = None
+
+    def __enter__(self) -> "StandInRegistry":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ----- request routing -----
+
+    def handle(self, method: str, raw_path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        parsed = urlparse(raw_path)
+        path = parsed.path
+        with self.lock:
+            self.requests.append((method, path))
+            for pattern, status in self.fail_paths.items():
+                if re.search(pattern, path):
+                    return status, {"error_code": status, "message": "injected failure"}
+
+            context = DEFAULT_CONTEXT
+            match = re.match(r"^/contexts/([^/]+)(/.*)$", path)
+            if match:
+                context, path = unquote(match.group(1)), match.group(2)
+
+            if path == "/contexts" and method == "GET":
+                return 200, sorted({DEFAULT_CONTEXT, *(ctx for ctx, _ in self.subjects)})
+            if path == "/subjects" and method == "GET":
+                return 200, sorted(s for ctx, s in self.subjects if ctx == context)
+            if path.startswith("/v1/metadata/"):
+                if path.endswith("/id"):
+                    return 200, {"scope": {"clusters": {"kafka-cluster": "stand-in", "schema-registry-cluster": "sr"}}}
+                return 200, {"version": "7.6.0", "commitId": "stand-in"}
+
+            if path == "/schemas" and method == "GET" and self.bulk_enabled:
+                return 200, self._list_schemas(context, parse_qs(parsed.query))
+
+            match = re.match(r"^/schemas/ids/(\d+)(/subjects|/versions)?$", path)
+            if match and method == "GET":
+                schema_id = int(match.group(1))
+                if schema_id not in self.schemas:
+                    return 404, {"error_code": 40403, "message": "Schema not found"}
+                if match.group(2) == "/subjects":
+                    return 200, sorted(
+                        s for (ctx, s), vs in self.subjects.items() if any(v["id"] == schema_id for v in vs)
+                    )
+                if match.group(2) == "/versions":
+                    return 200, [
+                        {"subject": s, "version": v["version"]}
+                        for (ctx, s), vs in self.subjects.items()
+                        for v in vs
+                        if v["id"] == schema_id
+                    ]
+                return 200, dict(self.schemas[schema_id])
+
+            match = re.match(r"^/subjects/([^/]+)(?:/versions(?:/([^/]+))?)?$", path)
+            if match:
+                subject = unquote(match.group(1))
+                key = (context, subject)
+                if method == "DELETE" and "/versions" not in path:
+                    versions = self.subjects.pop(key, None)
+                    if versions is None:
+                        return 404, {"error_code": 40401, "message": "Subject not found"}
+                    return 200, [v["version"] for v in versions]
+                if method == "POST" and path.endswith("/versions"):
+                    entry = self._register(context, subject, body["schema"], body.get("schemaType", "AVRO"))
+                    return 200, {"id": entry["id"]}
+                if key not in self.subjects:
+                    return 404, {"error_code": 40401, "message": "Subject not found"}
+                versions = self.subjects[key]
+                if match.group(2) is None and path.endswith("/versions"):
+                    return 200, [v["version"] for v in versions]
+                if match.group(2) is not None:
+                    version = match.group(2)
+                    entry = (
+                        versions[-1]
+                        if version == "latest"
+                        else next((v for v in versions if str(v["version"]) == version), None)
+                    )
+                    if entry is None:
+                        return 404, {"error_code": 40402, "message": "Version not found"}
+                    schema = self.schemas[entry["id"]]
+                    return 200, {
+                        "subject": subject,
+                        "version": entry["version"],
+                        "id": entry["id"],
+                        "schema": schema["schema"],
+                        "schemaType": schema["schemaType"],
+                    }
+
+            match = re.match(r"^/(config|mode)(?:/([^/]+))?$", path)
+            if match:
+                store = self.configs if match.group(1) == "config" else self.modes
+                field = "compatibility" if match.group(1) == "config" else "mode"
+                subject = unquote(match.group(2)) if match.group(2) else None
+                if method == "PUT":
+                    store[(context, subject)] = body[field]
+                    return 200, {field: body[field]}
+                value = store.get((context, subject)) or store.get((DEFAULT_CONTEXT, None))
+                key = "compatibilityLevel" if field == "compatibility" else "mode"
+                return 200, {key: value}
+
+        return 404, {"error_code": 404, "message": f"Unknown endpoint {method} {path}"}
+
+    def _list_schemas(self, context: str, query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """GET /schemas: every subject version ordered by subject and version, with paging."""
+        prefix = query.get("subjectPrefix", [""])[0]
+        latest_only = query.get("latestOnly", ["false"])[0] == "true"
+        entries = []
+        for (ctx, subject), versions in sorted(self.subjects.items()):
+            if ctx != context or not subject.startswith(prefix):
+                continue
+            for entry in versions[-1:] if latest_only else versions:
+                schema = self.schemas[entry["id"]]
+                entries.append(
+                    {
+                        "subject": subject,
+                        "version": entry["version"],
+                        "id": entry["id"],
+                        "schemaType": schema["schemaType"],
+                        "schema": schema["schema"],
+                    }
+                )
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", ["-1"])[0])
+        return entries[offset:] if limit < 0 else entries[offset : offset + limit]
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    stand_in: StandInRegistry
+
+    def setup(self):
+        super().setup()
+        with self.stand_in.lock:
+            self.stand_in.connections += 1
+
+    def _respond(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        stand_in = self.stand_in
+        with stand_in.lock:
+            stand_in.active += 1
+            stand_in.peak_active = max(stand_in.peak_active, stand_in.active)
+            stand_in.authorizations.append(self.headers.get("Authorization"))
+        try:
+            if stand_in.delay:
+                time.sleep(stand_in.delay)
+            status, payload = stand_in.handle(method, self.path, body)
+        finally:
+            with stand_in.lock:
+                stand_in.active -= 1
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.schemaregistry.v1+json")
+        if status >= 400 and stand_in.retry_after:
+            self.send_header("Retry-After", stand_in.retry_after)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._respond("GET")
+
+    def do_POST(self):
+        self._respond("POST")
+
+    def do_PUT(self):
+        self._respond("PUT")
+
+    def do_DELETE(self):
+        self._respond("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _H2StandInProtocol(asyncio.Protocol):
+    """Cleartext HTTP/2 (prior knowledge) front end for StandInRegistry; streams are served concurrently."""
+
+    def __init__(self, stand_in: StandInRegistry):
+        import h2.config
+        import h2.connection
+
+        self.stand_in = stand_in
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.streams: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+        self.transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        with self.stand_in.lock:
+            self.stand_in.connections += 1
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes):
+        import h2.events
+        import h2.exceptions
+
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.write(self.conn.data_to_send())
+            self.transport.close()
+            return
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self.streams[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, h2.events.DataReceived):
+                self.streams[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                headers, body = self.streams.pop(event.stream_id)
+                asyncio.ensure_future(self._respond(event.stream_id, headers, bytes(body)))
+            elif isinstance(event, h2.events.StreamReset):
+                self.streams.pop(event.stream_id, None)
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id: int, headers: Dict[str, str], body: bytes):
+        stand_in = self.stand_in
+        with stand_in.lock:
+            stand_in.active += 1
+            stand_in.peak_active = max(stand_in.peak_active, stand_in.active)
+            stand_in.authorizations.append(headers.get("authorization"))
+        try:
+            if stand_in.delay:
+                await asyncio.sleep(stand_in.delay)
+            status, payload = stand_in.handle(headers[":method"], headers[":path"], json.loads(body) if body else None)
+        finally:
+            with stand_in.lock:
+                stand_in.active -= 1
+        if self.transport.is_closing():
+            return
+        data = json.dumps(payload).encode()
+        response_headers = [
+            (":status", str(status)),
+            ("content-type", "application/vnd.schemaregistry.v1+json"),
+            ("content-length", str(len(data))),
+        ]
+        if status >= 400 and stand_in.retry_after:
+            response_headers.append(("retry-after", stand_in.retry_after))
+        self.conn.send_headers(stream_id, response_headers)
+        # Stand-in payloads fit in the default flow-control window
+        frame_size = self.conn.max_outbound_frame_size
+        for offset in range(0, len(data), frame_size):
+            self.conn.send_data(stream_id, data[offset : offset + frame_size])
+        self.conn.end_stream(stream_id)
+        self.transport.write(self.conn.data_to_send())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Adaptive Concurrency Limiter Tests
+
+Validates the per-registry AIMD concurrency window:
+- Sync threads and async coroutines never exceed the window
+- The window shrinks on 429/503/timeouts and honours Retry-After
+- The window grows again while responses are fast
+- Window size exposed through RegistryClient stats
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from conftest import make_client
+
+from registry_resilience import AdaptiveConcurrencyLimiter
+from schema_registry_common import RegistryClient, RegistryConfig
+
+SUBJECTS = [f"subject-{i}" for i in range(8)]
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"delay": 0.05}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for subject in SUBJECTS:
+        stand_in.add_schema(subject, '{"type": "string"}')
+    return stand_in
+
+
+def _client(url: str, window: int) -> RegistryClient:
+    return make_client(url, limiter=AdaptiveConcurrencyLimiter("test", initial=window, max_limit=window))
+
+
+def test_threads_stay_within_window(stand_in):
+    """Eight threads reading different subjects never have more than the window in flight."""
+    client = _client(stand_in.url, window=2)
+    with ThreadPoolExecutor(max_workers=len(SUBJECTS)) as executor:
+        results = list(executor.map(client.get_schema_versions, SUBJECTS))
+
+    assert results == [[1]] * len(SUBJECTS)
+    assert stand_in.peak_active <= 2
+    stats = client.get_concurrency_stats()
+    assert stats["window"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["waits"] > 0
+
+
+@pytest.mark.asyncio
+async def test_coroutines_stay_within_window(stand_in):
+    """Coroutines wait for slots on the event loop instead of piling onto the registry."""
+    client = _client(stand_in.url, window=3)
+    results = await asyncio.gather(*(client.async_client.get_schema_versions(s) for s in SUBJECTS))
+
+    assert results == [[1]] * len(SUBJECTS)
+    assert stand_in.peak_active <= 3
+    assert client.limiter.in_flight == 0
+    await client.async_client.close()
+
+
+def test_window_shrinks_on_overload_and_grows_back(stand_in):
+    """A 503 halves the window; fast successes grow it back additively."""
+    stand_in.delay = 0
+    client = make_client(stand_in.url)
+    assert client.limiter.window == 10
+
+    stand_in.fail_paths["^/subjects$"] = 503
+    client.session.get(f"{stand_in.url}/subjects")
+    client.session.get(f"{stand_in.url}/subjects")
+    stats = client.get_concurrency_stats()
+    assert stats["window"] == 5
+    assert stats["overloads"] == 2
+    assert stats["decreases"] == 1  # failures within the cooldown count once
+
+    stand_in.fail_paths.clear()
+    for _ in range(12):
+        client.session.get(f"{stand_in.url}/contexts")
+    assert client.limiter.window >= 7
+
+
+def test_timeouts_shrink_window():
+    """Connection failures and timeouts count as overload."""
+    limiter = AdaptiveConcurrencyLimiter("test", initial=8)
+    client = RegistryClient(RegistryConfig(name="test", url="http://127.0.0.1:1"))
+    client.session.limiter = limiter
+    with pytest.raises(requests.ConnectionError):
+        client.session.get("http://127.0.0.1:1/subjects", timeout=0.5)
+    assert limiter.window == 4
+    assert limiter.get_stats()["timeouts"] == 1
+
+
+def test_retry_after_delays_new_requests():
+    """Retry-After from a 429 holds back new requests for that long."""
+    limiter = AdaptiveConcurrencyLimiter("test", initial=4)
+    limiter.acquire()
+    limiter.release(0.01, status=429, retry_after="0.2")
+    assert limiter.get_stats()["backoff_remaining"] > 0
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+    limiter.release(0.01, status=200)
+
+
+def test_slow_responses_do_not_grow_window():
+    """Successful but slow responses keep the window where it is."""
+    limiter = AdaptiveConcurrencyLimiter("test", initial=4, latency_target=0.5)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(1.0, status=200)
+    assert limiter.window == 4
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Async Registry Client Tests
+
+Validates AsyncRegistryClient against a local stand-in registry:
+- API parity with RegistryClient (subjects, versions, config, mode, metadata, register, delete)
+- Error dictionaries instead of exceptions, matching the sync client
+- Async tool paths (count, export, compare, batch cleanup) not blocking the event loop
+- Per-loop sessions closed on loop shutdown and by RegistryClient.close()
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from conftest import make_client
+
+from schema_registry_common import AsyncRegistryClient, BaseRegistryManager, RegistryConfig
+
+SCHEMA = {"type": "record", "name": "Order", "fields": [{"name": "id", "type": "string"}]}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("orders-value", json.dumps(SCHEMA))
+    stand_in.add_schema("payments-value", json.dumps({"type": "string"}), context="finance")
+    return stand_in
+
+
+@pytest.fixture
+def manager(stand_in):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = make_client(stand_in.url, cache=True)
+    manager.default_registry = "test"
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_async_client_api_parity(stand_in):
+    """Async methods return the same shapes as the sync client."""
+    sync_client = make_client(stand_in.url, cache=True)
+    client = sync_client.async_client
+    assert isinstance(client, AsyncRegistryClient)
+    assert sync_client.async_client is client
+
+    assert await client.get_subjects() == sync_client.get_subjects()
+    assert await client.get_subjects("finance") == ["payments-value"]
+    assert await client.get_contexts() == sync_client.get_contexts()
+    assert await client.get_schema_versions("orders-value") == [1]
+    assert await client.get_schema("orders-value") == sync_client.get_schema("orders-value")
+    assert (await client.get_global_config())["compatibilityLevel"] == "BACKWARD"
+    assert (await client.get_mode())["mode"] == "READWRITE"
+
+    metadata = await client.get_server_metadata()
+    assert metadata == sync_client.get_server_metadata()
+    assert metadata["kafka_cluster_id"] == "stand-in"
+
+    registered = await client.register_schema("orders-value", {**SCHEMA, "doc": "v2"})
+    assert registered["registry"] == "test"
+    assert await client.get_schema_versions("orders-value") == [1, 2]
+
+    assert (await client.update_subject_config("orders-value", "FULL"))["compatibility"] == "FULL"
+    assert (await client.get_subject_config("orders-value"))["compatibilityLevel"] == "FULL"
+    assert (await client.update_mode("READONLY"))["mode"] == "READONLY"
+
+    assert await client.delete_subject("orders-value") is True
+    assert await client.get_subjects() == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_errors_are_dicts(stand_in):
+    """HTTP errors surface as error dictionaries like the sync client."""
+    client = AsyncRegistryClient(RegistryConfig(name="test", url=stand_in.url))
+
+    result = await client.get_schema("missing-subject")
+    assert "error" in result
+    assert "404" in result["error"]
+    assert "error" in await client.get_schema_versions("missing-subject")
+
+    connection = await client.test_connection()
+    assert connection["status"] == "connected"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_tools_do_not_block_event_loop(stand_in, manager):
+    """A slow registry call lets other coroutines run meanwhile."""
+    from statistics_tools import _count_schemas_async
+
+    stand_in.delay = 0.2
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    progress = MagicMock(set_message=AsyncMock(), set_total=AsyncMock(), increment=AsyncMock())
+    result = await _count_schemas_async(manager, "single", context="finance", progress=progress)
+    ticker_task.cancel()
+
+    assert result["total_schemas"] == 1
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_single_context_count_runs_off_event_loop(stand_in, manager):
+    """count_schemas with a context (and in SLIM_MODE) runs the sync tool on the registry executor."""
+    from statistics_tools import count_schemas_executor_tool
+
+    stand_in.delay = 0.2
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    result = await count_schemas_executor_tool(manager, "single", context="finance")
+    ticker_task.cancel()
+
+    assert result["count"] == 1 and result["schemas"] == ["payments-value"]
+    assert ticks >= 10
+    assert "error" in await count_schemas_executor_tool(manager, "multi", context="finance", registry="missing")
+
+
+@pytest.mark.asyncio
+async def test_async_tool_paths(stand_in, manager):
+    """Export, compare and batch cleanup run on the async client."""
+    from batch_operations import _execute_clear_context_batch
+    from comparison_tools import compare_registries_tool
+    from export_tools import export_context_tool
+
+    export = await export_context_tool(".", manager, "multi", registry="test")
+    assert export["subject_count"] == 1
+    assert export["subjects"][0]["versions"][0]["schema"] == SCHEMA
+
+    manager.registries["other"] = make_client(stand_in.url, cache=True, name="other")
+    comparison = await compare_registries_tool("test", "other", manager, "multi")
+    assert comparison["summary"]["registries_match"] is True
+
+    progress = MagicMock(set_message=AsyncMock(), set_total=AsyncMock(), increment=AsyncMock())
+    cleanup = await _execute_clear_context_batch("finance", "test", manager, dry_run=False, progress=progress)
+    assert cleanup["subjects_deleted"] == 1
+    assert stand_in.request_count("/contexts/finance/subjects/payments-value", method="DELETE") == 1
+
+
+def test_sessions_are_closed_on_loop_shutdown_and_client_close(stand_in):
+    """No session outlives its event loop or the client that created it."""
+    client = make_client(stand_in.url, cache=True)
+
+    async def session():
+        await client.async_client.get_subjects()
+        return await client.async_client._get_session()
+
+    # asyncio.run() closes the session before closing its loop
+    assert asyncio.run(session()).closed
+
+    # An idle loop and a loop running in another thread are closed by RegistryClient.close()
+    idle_loop = asyncio.new_event_loop()
+    idle = idle_loop.run_until_complete(session())
+    running_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=running_loop.run_forever, daemon=True)
+    thread.start()
+    running = asyncio.run_coroutine_threadsafe(session(), running_loop).result(5)
+
+    client.close()
+    assert idle.closed
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), running_loop).result(5)
+    assert running.closed
+
+    running_loop.call_soon_threadsafe(running_loop.stop)
+    thread.join(5)
+    for loop in (idle_loop, running_loop):
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
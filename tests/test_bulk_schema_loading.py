@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Bulk Schema Loading Tests
+
+Validates the GET /schemas bulk loader in schema_registry_common:
+- Paging, subjectPrefix, latestOnly and context scoping
+- Per-subject crawl fallback for registries without the bulk endpoint
+- Bulk-listed bodies feeding the schema-by-ID store
+- Exports and statistics loading a context without per-subject round trips
+"""
+
+import json
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import (
+    export_context,
+    load_context_schemas,
+    load_context_schemas_async,
+)
+
+SUBJECTS = [f"subject-{i}" for i in range(5)]
+
+
+def _populate(registry: StandInRegistry):
+    for subject in SUBJECTS:
+        for version in range(2):
+            registry.add_schema(
+                subject,
+                json.dumps({"type": "record", "name": subject.replace("-", "_"), "doc": str(version), "fields": []}),
+            )
+    registry.add_schema("payments-value", json.dumps({"type": "string"}), context="finance")
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    _populate(stand_in)
+    return stand_in
+
+
+def test_load_context_schemas(stand_in):
+    """Bulk and crawl sources return the same subjects, versions and bodies."""
+    client = make_client(stand_in.url)
+    loaded = load_context_schemas(client, page_size=3)
+
+    assert loaded["source"] == ("bulk" if stand_in.bulk_enabled else "crawl")
+    assert list(loaded["subjects"]) == SUBJECTS
+    versions = loaded["subjects"]["subject-1"]
+    assert [entry["version"] for entry in versions] == [1, 2]
+    assert json.loads(versions[1]["schema"])["doc"] == "1"
+
+    if stand_in.bulk_enabled:
+        # 10 versions in pages of 3, and no per-subject requests
+        assert stand_in.request_count("/schemas", method="GET") == 4
+        assert stand_in.request_count("/subjects") == 0
+    else:
+        assert client.supports_bulk_schemas is False
+
+
+def test_filters_and_context(stand_in):
+    """subjectPrefix, latestOnly and contexts narrow the listing."""
+    client = make_client(stand_in.url)
+
+    loaded = load_context_schemas(client, subject_prefix="subject-3", latest_only=True)
+    assert list(loaded["subjects"]) == ["subject-3"]
+    assert [entry["version"] for entry in loaded["subjects"]["subject-3"]] == [2]
+
+    finance = load_context_schemas(client, context="finance")
+    assert list(finance["subjects"]) == ["payments-value"]
+
+
+@pytest.mark.parametrize("stand_in_options", [{"bulk_enabled": False}])
+def test_unsupported_endpoint_is_probed_once(stand_in):
+    """After a 404 the client crawls directly instead of probing GET /schemas again."""
+    client = make_client(stand_in.url)
+    load_context_schemas(client, include_schemas=False)
+    loaded = load_context_schemas(client, include_schemas=False)
+
+    assert loaded["subjects"]["subject-0"] == [
+        {"subject": "subject-0", "version": 1},
+        {"subject": "subject-0", "version": 2},
+    ]
+    assert stand_in.request_count("/schemas") == 1
+    assert stand_in.request_count("/subjects/subject-0/versions/") == 0
+
+
+@pytest.mark.parametrize("stand_in_options", [{"bulk_enabled": True}])
+def test_bulk_listing_fills_schema_store(stand_in):
+    """Bodies from the bulk listing are served later without registry requests."""
+    client = make_client(stand_in.url, cache=True)
+    load_context_schemas(client)
+
+    assert client.get_schema("subject-2", "2")["version"] == 2
+    assert "error" not in client.get_schema_by_id(1)
+    assert stand_in.request_count("/subjects") == 0
+    assert stand_in.request_count("/schemas/ids") == 0
+
+
+def test_export_context_uses_bulk_loader(stand_in):
+    """Exporting a context does not fetch each version separately when bulk listing works."""
+    client = make_client(stand_in.url)
+    export = export_context(client, ".", include_config=False)
+
+    assert [subject["subject"] for subject in export["subjects"]] == SUBJECTS
+    assert export["subjects"][0]["versions"][0]["registry"] == "test"
+    assert isinstance(export["subjects"][0]["versions"][0]["schema"], dict)
+    if stand_in.bulk_enabled:
+        assert stand_in.request_count("/subjects") == 0
+
+
+@pytest.mark.parametrize("stand_in_options", [{"bulk_enabled": True}])
+def test_statistics_count_from_bulk(stand_in):
+    """Context statistics count subjects and versions from the bulk listing."""
+    from statistics_tools import collect_registry_statistics
+
+    client = make_client(stand_in.url)
+    statistics = collect_registry_statistics(client)
+    assert statistics["errors"] == {}
+    assert statistics["counts"][None] == {subject: 2 for subject in SUBJECTS}
+    assert (statistics["total_subjects"], statistics["total_versions"]) == (6, 11)
+    assert stand_in.request_count("/subjects") == 0
+
+
+@pytest.mark.asyncio
+async def test_async_loader_matches_sync(stand_in):
+    """The async loader returns the same data as the sync one."""
+    client = make_client(stand_in.url)
+    sync_loaded = load_context_schemas(client)
+    async_loaded = await load_context_schemas_async(client.async_client)
+    assert async_loaded == sync_loaded
+    await client.async_client.close()
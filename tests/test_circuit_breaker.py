@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Circuit Breaker Tests
+
+Validates the per-registry circuit breaker:
+- Consecutive connection failures and 502/503/504 responses open the breaker
+- Calls to an open registry fail fast without touching the network
+- The background probe closes the breaker once the registry recovers
+- Without a probe, one trial request is let through after the reset timeout
+- Breaker state reported by connection tests and registry info
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from conftest import make_client
+
+from registry_resilience import CircuitBreaker, CircuitOpenError
+from schema_registry_common import BaseRegistryManager, RegistryClient
+
+DEAD_URL = "http://127.0.0.1:1"
+
+
+def _client(url: str, failure_threshold: int = 2, reset_timeout: float = 0.1) -> RegistryClient:
+    client = make_client(url)
+    client.breaker = CircuitBreaker(
+        "test", failure_threshold=failure_threshold, reset_timeout=reset_timeout, probe=client._probe_registry
+    )
+    client.session.breaker = client.breaker
+    return client
+
+
+def test_open_breaker_fails_fast():
+    """After the threshold, calls to a dead registry fail without opening connections."""
+    client = _client(DEAD_URL, reset_timeout=60)
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client.session.get(f"{DEAD_URL}/subjects", timeout=0.5)
+    assert client.breaker.state == CircuitBreaker.OPEN
+    requests_before = client.limiter.get_stats()["requests"]
+
+    start = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        client.session.get(f"{DEAD_URL}/subjects")
+    assert time.perf_counter() - start < 0.01
+    assert client.limiter.get_stats()["requests"] == requests_before
+
+    # Client methods keep returning their usual error shapes
+    assert client.get_subjects() == []
+    stats = client.get_breaker_stats()
+    assert stats["state_value"] == 2
+    assert stats["opens"] == 1
+    assert stats["rejected"] == 2
+
+
+def test_probe_closes_breaker_on_recovery(stand_in):
+    """5xx responses open the breaker; the background probe closes it once the registry answers."""
+    stand_in.add_schema("orders-value", '{"type": "string"}')
+    client = _client(stand_in.url)
+
+    stand_in.fail_paths[".*"] = 503
+    client.get_subjects()
+    client.get_subjects()
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    # Still down: probes keep the breaker open
+    time.sleep(0.3)
+    assert client.breaker.state == CircuitBreaker.OPEN
+    assert client.breaker.get_stats()["probe_failures"] >= 1
+
+    stand_in.fail_paths.clear()
+    deadline = time.monotonic() + 2
+    while client.breaker.state != CircuitBreaker.CLOSED and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert client.breaker.state == CircuitBreaker.CLOSED
+    assert client.get_subjects() == ["orders-value"]
+
+
+def test_client_errors_do_not_open_breaker(stand_in):
+    """429 and 404 mean the registry is alive."""
+    client = _client(stand_in.url)
+    stand_in.fail_paths["^/subjects$"] = 429
+    for _ in range(3):
+        client.session.get(f"{stand_in.url}/subjects")
+        client.session.get(f"{stand_in.url}/subjects/missing/versions")
+    assert client.breaker.state == CircuitBreaker.CLOSED
+    assert client.breaker.consecutive_failures == 0
+
+
+def test_registry_info_reports_open_breaker_without_waiting():
+    """get_registry_info and connection tests return immediately for a known-dead registry."""
+    client = _client(DEAD_URL, reset_timeout=60)
+    client.breaker.record_failure()
+    client.breaker.record_failure()
+
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    start = time.perf_counter()
+    info = manager.get_registry_info("test")
+    assert time.perf_counter() - start < 0.05
+    assert info["connection_status"] == "error"
+    assert info["circuit_breaker"] == "open"
+    assert "Circuit breaker open" in info["connection_error"]
+    assert manager.test_all_registries()["registry_tests"]["test"]["circuit_breaker"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_async_trial_request_closes_breaker(stand_in):
+    """Without a probe, one request is let through after the reset timeout and closes the breaker."""
+    stand_in.add_schema("orders-value", '{"type": "string"}')
+    client = make_client(stand_in.url)
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.1)
+    client.breaker = client.session.breaker = breaker
+    async_client = client.async_client
+
+    stand_in.fail_paths[".*"] = 503
+    assert await async_client.get_subjects() == []
+    assert breaker.state == CircuitBreaker.OPEN
+    result = await async_client.test_connection()
+    assert result["circuit_breaker"] == "open"
+    requests_before = stand_in.request_count("/subjects")
+
+    stand_in.fail_paths.clear()
+    await asyncio.sleep(0.15)
+    assert await async_client.get_subjects() == ["orders-value"]
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert stand_in.request_count("/subjects") == requests_before + 1
+    await async_client.close()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Concurrent Export Tests
+
+Validates that exports fetch subjects and versions concurrently:
+- export_subject (sync and async) fetches versions in parallel and keeps version order
+- Context exports fetch subject configs in parallel and keep subject order
+- The per-subject crawl fallback loads subjects in parallel
+- export_context_tool reports progress in batches, not once per subject
+- gather_limited never exceeds its limit
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from export_tools import EXPORT_PROGRESS_STEPS, export_context_tool
+from schema_registry_common import (
+    BaseRegistryManager,
+    export_context,
+    export_subject,
+    export_subject_async,
+    gather_limited,
+    load_context_schemas,
+)
+
+DELAY = 0.05
+SUBJECTS = 40
+VERSIONS = 8
+
+
+def _schema(i: int) -> str:
+    return json.dumps({"type": "record", "name": f"R{i}", "fields": [{"name": "f", "type": "string"}]})
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"delay": DELAY, "bulk_enabled": False, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(VERSIONS):
+        stand_in.add_schema("orders-value", _schema(i))
+    for i in range(SUBJECTS):
+        stand_in.add_schema(f"subject-{i:03d}", _schema(100 + i), context="bulk")
+    return stand_in
+
+
+def test_export_subject_fetches_versions_concurrently(client, stand_in):
+    start = time.monotonic()
+    result = export_subject(client, "orders-value")
+    elapsed = time.monotonic() - start
+
+    assert [v["version"] for v in result["versions"]] == list(range(1, VERSIONS + 1))
+    assert result["versions"][3]["schema"]["name"] == "R3"
+    assert stand_in.peak_active > 1
+    assert elapsed < (VERSIONS + 2) * DELAY
+
+
+def test_export_subject_async_fetches_versions_concurrently(client, stand_in):
+    result = asyncio.run(export_subject_async(client.async_client, "orders-value"))
+    assert [v["version"] for v in result["versions"]] == list(range(1, VERSIONS + 1))
+    assert "config" in result
+    assert stand_in.peak_active > 1
+
+
+def test_crawl_and_configs_run_concurrently(client, stand_in):
+    start = time.monotonic()
+    result = export_context(client, "bulk")
+    elapsed = time.monotonic() - start
+
+    assert [s["subject"] for s in result["subjects"]] == [f"subject-{i:03d}" for i in range(SUBJECTS)]
+    assert all(s["config"]["compatibilityLevel"] == "BACKWARD" for s in result["subjects"])
+    # Serially: subjects, then versions + schema + config per subject
+    assert elapsed < SUBJECTS * 3 * DELAY / 3
+    assert stand_in.peak_active > 2
+
+
+def test_export_context_tool_reports_progress_in_batches(client, stand_in):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+    mcp_context = Mock(info=AsyncMock(), error=AsyncMock(), report_progress=AsyncMock())
+
+    result = asyncio.run(export_context_tool("bulk", manager, "multi", "test", mcp_context=mcp_context))
+
+    assert [s["subject"] for s in result["subjects"]] == [f"subject-{i:03d}" for i in range(SUBJECTS)]
+    assert all("config" in s and s["registry_mode"] == "multi" for s in result["subjects"])
+    batch_reports = [c.args[2] for c in mcp_context.report_progress.await_args_list if "/" in c.args[2]]
+    assert 1 < len(batch_reports) <= EXPORT_PROGRESS_STEPS
+    assert batch_reports[-1] == f"Exported {SUBJECTS}/{SUBJECTS} subjects"
+
+
+def test_gather_limited_bounds_concurrency():
+    active = peak = 0
+
+    async def work(item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01 * (item % 3))
+        active -= 1
+        return item * 2
+
+    results = asyncio.run(gather_limited(work, range(30), 4))
+    assert results == [item * 2 for item in range(30)]
+    assert peak == 4
+    assert asyncio.run(gather_limited(work, [], 4)) == []
+
+
+def test_crawl_keeps_listing_order(client):
+    loaded = load_context_schemas(client, "bulk", latest_only=True)
+    assert loaded["source"] == "crawl"
+    assert list(loaded["subjects"]) == [f"subject-{i:03d}" for i in range(SUBJECTS)]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Connection Pooling Tests
+
+Validates keep-alive connection pooling in RegistryClient:
+- Pool adapters mounted for HTTP and HTTPS with the configured pool size
+- Keep-alive header and the REGISTRY_KEEPALIVE_ENABLED opt-out
+- Connection reuse accounting against a local HTTP/1.1 stand-in registry
+- Idle pool eviction
+"""
+
+import unittest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import DEFAULT_REGISTRY_POOL_SIZE, PooledHTTPAdapter, SecureHTTPAdapter
+
+
+class TestConnectionPooling(unittest.TestCase):
+    """Test cases for keep-alive connection pooling."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = StandInRegistry().start()
+        cls.url = cls.registry.url
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.registry.stop()
+
+    def _client(self, **kwargs):
+        # Every request must reach the stand-in to exercise the pool
+        return make_client(self.url, name="pool-test", **kwargs)
+
+    def test_pool_adapters_mounted_with_pool_size(self):
+        """HTTPS gets the hardened adapter and both schemes share the configured pool size."""
+        client = self._client(pool_size=4)
+
+        https_adapter = client.session.get_adapter("https://example.com")
+        http_adapter = client.session.get_adapter("http://example.com")
+        self.assertIsInstance(https_adapter, SecureHTTPAdapter)
+        self.assertIsInstance(http_adapter, PooledHTTPAdapter)
+        self.assertEqual(https_adapter._pool_maxsize, 4)
+        self.assertEqual(http_adapter._pool_maxsize, 4)
+
+    def test_default_pool_size_matches_worker_pools(self):
+        """Default pool size covers the widest registry fan-out thread pool."""
+        client = self._client()
+        self.assertEqual(client.config.pool_size, DEFAULT_REGISTRY_POOL_SIZE)
+
+    def test_keepalive_header(self):
+        """Sessions ask the registry to keep connections alive."""
+        client = self._client()
+        self.assertEqual(client.session.headers["Connection"], "keep-alive")
+
+    def test_connections_are_reused(self):
+        """Sequential requests reuse one pooled connection."""
+        client = self._client()
+        for _ in range(5):
+            response = client.session.get(f"{self.url}/subjects", auth=client.auth, headers=client.headers)
+            self.assertEqual(response.status_code, 200)
+
+        stats = client.get_connection_stats()
+        self.assertEqual(stats["registry"], "pool-test")
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 4)
+        self.assertEqual(stats["reuse_ratio"], 0.8)
+
+    def test_idle_connections_are_evicted(self):
+        """A pool idle longer than the timeout is dropped before the next request."""
+        client = self._client()
+        adapter = client.session.get_adapter(self.url)
+        client.session.get(f"{self.url}/subjects")
+
+        adapter.idle_timeout = 0.001
+        adapter._last_used -= 1
+        client.session.get(f"{self.url}/subjects")
+
+        stats = client.get_connection_stats()
+        self.assertEqual(stats["idle_evictions"], 1)
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["connections_opened"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
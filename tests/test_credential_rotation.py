@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Credential Rotation Tests
+
+Validates precomputed registry auth headers and the credential rotation hook:
+- Headers and auth are built once per client, not per request
+- build_context_url no longer re-validates the registry URL
+- reload_credentials re-reads env vars or mounted *_FILE secrets in place
+- A live client picks up a rotated *_FILE secret from the secret watcher or on SIGHUP
+"""
+
+import base64
+import os
+import signal
+import time
+
+import pytest
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+import schema_registry_common
+from schema_registry_common import BaseRegistryManager, RegistryClient, RegistryConfig, read_credential
+
+URL = "http://localhost:38081"
+
+
+def _basic(user: str, password: str) -> str:
+    return "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode()
+
+
+def _client(**kwargs) -> RegistryClient:
+    return RegistryClient(RegistryConfig(name="test", url=URL, **kwargs))
+
+
+def test_headers_built_once():
+    """Header properties return the same prebuilt dicts."""
+    client = _client(user="alice", password="secret")
+    assert client.headers is client.headers
+    assert client.headers["Authorization"] == _basic("alice", "secret")
+    assert client.standard_headers["Content-Type"] == "application/json"
+    assert "Authorization" not in _client().headers
+
+
+def test_build_context_url_skips_validation(monkeypatch):
+    """The registry URL is validated once at construction, not on every URL build."""
+    client = _client()
+
+    def fail(url):
+        raise AssertionError("validate_url called on the hot path")
+
+    monkeypatch.setattr(schema_registry_common, "validate_url", fail)
+    assert client.build_context_url("/subjects", "team a") == f"{URL}/contexts/team%20a/subjects"
+    assert client.build_context_url("/subjects", ".") == f"{URL}/subjects"
+
+
+def test_reload_from_env(monkeypatch):
+    """Rotating env credentials updates auth and headers without a new session."""
+    monkeypatch.setenv("TEST_REGISTRY_USER", "alice")
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD", "old")
+    client = _client(user="alice", password="old", user_env="TEST_REGISTRY_USER", password_env="TEST_REGISTRY_PASSWORD")
+    session = client.session
+    async_client = client.async_client
+    assert client.reload_credentials() is False
+
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD", "new")
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    assert manager.reload_credentials() == {"test": True}
+
+    assert client.session is session
+    assert client.auth.password == "new"
+    assert client.headers["Authorization"] == _basic("alice", "new")
+    assert async_client.auth.password == "new"
+
+
+def test_reload_from_secret_file(monkeypatch, tmp_path):
+    """*_FILE secrets take precedence over plain env vars and are re-read on rotation."""
+    secret = tmp_path / "password"
+    secret.write_text("from-file\n")
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD", "from-env")
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD_FILE", str(secret))
+    assert read_credential("TEST_REGISTRY_PASSWORD") == "from-file"
+
+    client = _client(user="alice", password="from-file", password_env="TEST_REGISTRY_PASSWORD")
+    secret.write_text("rotated\n")
+    assert client.reload_credentials() is True
+    assert client.headers["Authorization"] == _basic("alice", "rotated")
+
+    # Explicit values win over the configured source
+    assert client.reload_credentials(user="bob", password="pw") is True
+    assert client.config.user == "bob"
+    assert client.headers["Authorization"] == _basic("bob", "pw")
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"nodelay": True}
+
+
+def _live_client(stand_in: StandInRegistry) -> BaseRegistryManager:
+    manager = BaseRegistryManager()
+    manager.registries["test"] = make_client(
+        stand_in.url,
+        user="alice",
+        password=read_credential("TEST_REGISTRY_PASSWORD"),
+        user_env="TEST_REGISTRY_USER",
+        password_env="TEST_REGISTRY_PASSWORD",
+    )
+    return manager
+
+
+def test_secret_file_watcher_rotates_live_client(monkeypatch, tmp_path, stand_in):
+    """Rewriting a mounted secret switches the next request to the new credentials on the same connection."""
+    secret = tmp_path / "password"
+    secret.write_text("old\n")
+    monkeypatch.setenv("TEST_REGISTRY_USER", "alice")
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD_FILE", str(secret))
+    manager = _live_client(stand_in)
+    client = manager.registries["test"]
+    rotated = []
+    assert manager.watch_credential_files(lambda: rotated.append(manager.reload_credentials()), interval=0.02)
+    try:
+        client.get_subjects()
+        assert stand_in.authorizations[-1] == _basic("alice", "old")
+
+        secret.write_text("new\n")
+        os.utime(secret, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        assert _wait_for(lambda: rotated == [{"test": True}])
+        client.get_subjects()
+        assert stand_in.authorizations[-1] == _basic("alice", "new")
+        assert stand_in.connections == 1
+    finally:
+        manager.stop_watching()
+
+    assert not BaseRegistryManager().watch_credential_files()
+
+
+def test_sighup_rotates_credentials(monkeypatch, tmp_path, stand_in):
+    """Outside multi-registry mode SIGHUP re-reads credentials instead of the configuration."""
+    secret = tmp_path / "password"
+    secret.write_text("old\n")
+    monkeypatch.setenv("TEST_REGISTRY_USER", "alice")
+    monkeypatch.setenv("TEST_REGISTRY_PASSWORD_FILE", str(secret))
+    manager = _live_client(stand_in)
+    client = manager.registries["test"]
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        assert manager.install_reload_signal()
+        secret.write_text("new\n")
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert _wait_for(lambda: client.config.password == "new")
+    finally:
+        signal.signal(signal.SIGHUP, previous)
+    client.get_subjects()
+    assert stand_in.authorizations[-1] == _basic("alice", "new")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Deduplicated Export Tests
+
+Validates the content-addressed export format in export_dedup:
+- Each distinct schema body is stored once, however many subjects and contexts use it
+- Expanding a dedup export reproduces the export_context / export_global shape
+- The dedup export is several times smaller than the inline export
+- export_context and export_global tools accept format="dedup"
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from export_dedup import (
+    DEDUP_FORMAT,
+    expand_dedup_export,
+    export_context_dedup,
+    export_global_dedup,
+    schema_fingerprint,
+)
+from export_tools import export_context_tool, export_global_tool
+from schema_registry_common import BaseRegistryManager, export_context
+
+SHARED = json.dumps(
+    {
+        "type": "record",
+        "name": "Envelope",
+        "fields": [{"name": f"field_{i}", "type": "string", "doc": "x" * 40} for i in range(20)],
+    }
+)
+PROTOBUF = 'syntax = "proto3";\nmessage Payment { string id = 1; }\n'
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(30):
+        stand_in.add_schema(f"topic-{i:02d}-value", SHARED)
+    stand_in.add_schema("topic-00-value", json.dumps({"type": "string"}))
+    stand_in.add_schema("payments-value", PROTOBUF, schema_type="PROTOBUF")
+    for i in range(10):
+        stand_in.add_schema(f"copy-{i}-value", SHARED, context="mirror")
+    return stand_in
+
+
+def test_fingerprint_depends_on_type_body_and_references():
+    assert schema_fingerprint("AVRO", SHARED) == schema_fingerprint("AVRO", SHARED)
+    assert schema_fingerprint("AVRO", SHARED) != schema_fingerprint("JSON", SHARED)
+    refs = [{"name": "a", "subject": "a-value", "version": 1}]
+    assert schema_fingerprint("AVRO", SHARED) != schema_fingerprint("AVRO", SHARED, refs)
+
+
+def test_blobs_are_stored_once(client):
+    export = export_global_dedup(client)
+    assert export["format"] == DEDUP_FORMAT
+    assert export["blob_count"] == 3
+    assert export["version_count"] == 42
+    assert export["subject_count"] == 41
+    assert [context["context"] for context in export["contexts"]] == ["mirror", "."]
+
+    shared = schema_fingerprint("AVRO", SHARED)
+    mirror = export["contexts"][0]["subjects"]
+    assert all(subject["versions"][0]["blob"] == shared for subject in mirror)
+    assert "metadata" not in mirror[0]
+
+
+def test_expand_reproduces_context_export(client):
+    expanded = expand_dedup_export(export_context_dedup(client, ""))
+    original = export_context(client, "")
+
+    def normalize(export):
+        export = json.loads(json.dumps(export))
+        for key in ("metadata",):
+            export.pop(key, None)
+        for subject in export["subjects"]:
+            subject.pop("metadata", None)
+            for version in subject["versions"]:
+                version["metadata"].pop("exported_at")
+        return export
+
+    assert normalize(expanded) == normalize(original)
+    payments = next(s for s in expanded["subjects"] if s["subject"] == "payments-value")
+    assert payments["versions"][0]["schema"] == PROTOBUF
+    assert payments["versions"][0]["schemaType"] == "PROTOBUF"
+
+
+def test_expand_global_shape(client):
+    expanded = expand_dedup_export(export_global_dedup(client, include_config=False))
+    assert [context["context"] for context in expanded["contexts"]] == ["mirror"]
+    assert expanded["default_context"]["context"] == ""
+    assert len(expanded["default_context"]["subjects"]) == 31
+    assert "global_config" not in expanded
+    with pytest.raises(ValueError):
+        expand_dedup_export({"contexts": []})
+
+
+def test_dedup_export_is_several_times_smaller(client):
+    dedup_size = len(json.dumps(export_global_dedup(client)))
+    inline_size = len(json.dumps(export_context(client, "")) + json.dumps(export_context(client, "mirror")))
+    print(f"\ninline {inline_size} bytes, dedup {dedup_size} bytes")
+    assert inline_size > 4 * dedup_size
+
+
+def test_export_tools_accept_dedup_format(client):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+
+    result = asyncio.run(export_context_tool("mirror", manager, "multi", "test", format="dedup"))
+    assert result["_validation"]["validated"] is True
+    assert (result["blob_count"], result["version_count"]) == (1, 10)
+
+    result = asyncio.run(export_global_tool(manager, "multi", "test", format="dedup"))
+    assert result["blob_count"] == 3
+    assert result["global_config"]["compatibilityLevel"] == "BACKWARD"
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Differential Export Tests
+
+Validates incremental NDJSON exports in export_delta:
+- A delta holds only new and deleted versions and changed configs and modes
+- Versions of a subject deleted and registered again are replaced, not skipped
+- Only new versions have their schema bodies fetched on registries without GET /schemas
+- The delta's index matches a fresh full export, and deltas chain
+- apply_delta on the base export gives the same records as a fresh full export
+- export_global tool writes a delta when given base_index
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+import export_stream
+from export_delta import NDJSON_DELTA_FORMAT, apply_delta, stream_export_delta
+from export_stream import SnapshotIndex, stream_export_global
+from export_tools import export_global_tool
+from schema_registry_common import BaseRegistryManager
+
+
+def _schema(i: int) -> str:
+    return json.dumps({"type": "record", "name": f"R{i}", "fields": [{"name": "f", "type": "string"}]})
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_stream, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(10):
+        stand_in.add_schema(f"subject-{i}", _schema(i))
+    stand_in.add_schema("subject-0", _schema(100))
+    stand_in.add_schema("payments-value", _schema(200), context="finance")
+    return stand_in
+
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _schemas(path):
+    return sorted(
+        (r["context"], r["subject"], r["version"], r["id"], r["schema"])
+        for r in _records(path)
+        if r["type"] == "schema"
+    )
+
+
+def _change_registry(stand_in):
+    stand_in.add_schema("subject-1", _schema(101))
+    stand_in.add_schema("subject-new", _schema(300))
+    stand_in.add_schema("audit-value", _schema(400), context="audit")
+    del stand_in.subjects[(".", "subject-2")]
+    stand_in.subjects[(".", "subject-0")] = stand_in.subjects[(".", "subject-0")][1:]
+    stand_in.configs[(".", "subject-3")] = "FULL"
+    stand_in.modes[("finance", None)] = "READONLY"
+
+
+def test_delta_holds_only_changes(client, stand_in):
+    base = stream_export_global(client, output_path="base.ndjson")
+    _change_registry(stand_in)
+    requests_before = len(stand_in.requests)
+
+    delta = stream_export_delta(client, base["index_path"], output_path="delta.ndjson")
+    records = _records(delta["path"])
+
+    assert records[0]["format"] == NDJSON_DELTA_FORMAT
+    assert (delta["added_count"], delta["deleted_count"]) == (3, 2)
+    assert sorted((r["subject"], r["version"]) for r in records if r["type"] == "schema") == [
+        ("audit-value", 1),
+        ("subject-1", 2),
+        ("subject-new", 1),
+    ]
+    assert sorted((r["subject"], r["version"]) for r in records if r["type"] == "delete") == [
+        ("subject-0", 1),
+        ("subject-2", 1),
+    ]
+    changed_configs = {r["subject"] for r in records if r["type"] == "subject_config"}
+    assert changed_configs == {"subject-3", "subject-new", "audit-value"}
+    contexts = {r["context"]: r for r in records if r["type"] == "context"}
+    assert contexts["finance"]["global_mode"]["mode"] == "READONLY"
+    assert "global_mode" not in contexts["."] and "global_config" not in contexts["."]
+
+    if not stand_in.bulk_enabled:
+        bodies = [path for _, path in stand_in.requests[requests_before:] if "/versions/" in path]
+        # The 3 new versions, and one version per subject kept from the base to check its schema ID
+        assert len(bodies) == 3 + 10
+
+
+def test_delta_replaces_versions_of_reregistered_subjects(client, stand_in):
+    base = stream_export_global(client, output_path="base.ndjson")
+    # Hard-delete subject-1 and register it again: its versions restart at 1 with another schema
+    del stand_in.subjects[(".", "subject-1")]
+    stand_in.add_schema("subject-1", _schema(500))
+    stand_in.add_schema("subject-1", _schema(501))
+
+    delta = stream_export_delta(client, base["index_path"], output_path="delta.ndjson")
+    changes = [(r["type"], r.get("subject"), r.get("version")) for r in _records(delta["path"]) if "subject" in r]
+    assert changes == [
+        ("delete", "subject-1", 1),
+        ("subject_config", "subject-1", None),
+        ("schema", "subject-1", 1),
+        ("schema", "subject-1", 2),
+    ]
+
+    fresh = stream_export_global(client, output_path="fresh.ndjson")
+    applied = apply_delta(base["path"], delta["path"], "applied.ndjson")
+    assert _schemas(applied["path"]) == _schemas(fresh["path"])
+    assert SnapshotIndex.load(delta["index_path"]).contexts == SnapshotIndex.load(fresh["index_path"]).contexts
+
+
+def test_delta_index_matches_fresh_export_and_chains(client, stand_in):
+    base = stream_export_global(client, output_path="base.ndjson")
+    _change_registry(stand_in)
+    delta = stream_export_delta(client, base["index_path"], output_path="delta.ndjson")
+    fresh = stream_export_global(client, output_path="fresh.ndjson")
+    assert SnapshotIndex.load(delta["index_path"]).contexts == SnapshotIndex.load(fresh["index_path"]).contexts
+
+    stand_in.add_schema("subject-4", _schema(104))
+    second = stream_export_delta(client, delta["index_path"], output_path="delta2.ndjson")
+    assert (second["added_count"], second["deleted_count"], second["configs_changed_count"]) == (1, 0, 0)
+
+    unchanged = stream_export_delta(client, second["index_path"], output_path="delta3.ndjson")
+    assert {r["type"] for r in _records(unchanged["path"])} == {"header", "context"}
+
+
+def test_apply_delta_rebuilds_full_export(client, stand_in):
+    base = stream_export_global(client, output_path="base.ndjson")
+    _change_registry(stand_in)
+    delta = stream_export_delta(client, base["index_path"], output_path="delta.ndjson")
+    fresh = stream_export_global(client, output_path="fresh.ndjson")
+
+    applied = apply_delta(base["path"], delta["path"], "applied.ndjson")
+    assert _schemas(applied["path"]) == _schemas(fresh["path"])
+    assert SnapshotIndex.load(applied["index_path"]).contexts == SnapshotIndex.load(fresh["index_path"]).contexts
+    # Deleted subjects leave no config behind
+    assert "subject-2" not in {r.get("subject") for r in _records(applied["path"])}
+
+    with pytest.raises(ValueError):
+        apply_delta("base.ndjson", "base.ndjson", "wrong.ndjson")
+
+
+def test_export_global_tool_writes_delta(client, stand_in):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+
+    base = asyncio.run(export_global_tool(manager, "multi", "test", format="ndjson", output_path="base.ndjson"))
+    stand_in.add_schema("subject-5", _schema(105))
+    result = asyncio.run(export_global_tool(manager, "multi", "test", format="ndjson", base_index=base["index_path"]))
+    assert result["format"] == NDJSON_DELTA_FORMAT
+    assert result["added_count"] == 1
+    assert os.path.exists(result["path"])
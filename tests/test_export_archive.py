@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Export Archive Tests
+
+Validates chunked, compressed and resumable exports in export_archive:
+- Segments are cut at subject boundaries and hold the same records as an NDJSON export
+- Segments are compressed and much smaller than the records they hold
+- An interrupted export resumes from its checkpoint without fetching finished subjects again
+- Resuming continues after the last completed subject when subjects were added or removed ahead of it
+- Damaged segments and changed options are refused; zstd falls back to gzip without zstandard
+- export_global tool writes an archive for format="archive"
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+import export_archive
+import export_stream
+from export_archive import ArchiveError, archive_export_global, iter_archive_records, resolve_compression
+from export_stream import SnapshotIndex, stream_export_global
+from export_tools import export_global_tool
+from schema_registry_common import BaseRegistryManager
+
+SEGMENT_BYTES = 4096
+
+
+def _schema(i: int) -> str:
+    fields = [{"name": f"field_{n}", "type": "string", "doc": "customer attribute"} for n in range(10)]
+    return json.dumps({"type": "record", "name": f"R{i}", "fields": fields})
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_stream, "EXPORT_DIR", str(tmp_path))
+    monkeypatch.setattr(export_archive, "EXPORT_SEGMENT_MAX_BYTES", SEGMENT_BYTES)
+    return tmp_path
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(40):
+        stand_in.add_schema(f"subject-{i:02d}", _schema(i))
+        stand_in.add_schema(f"subject-{i:02d}", _schema(1000 + i))
+    for i in range(10):
+        stand_in.add_schema(f"payments-{i}", _schema(2000 + i), context="finance")
+    return stand_in
+
+
+def _schemas(records):
+    return [(r["context"], r["subject"], r["version"], r["schema"]) for r in records if r["type"] == "schema"]
+
+
+def test_archive_matches_ndjson_export(client, export_dir):
+    manifest = archive_export_global(client, output_path="nightly")
+    plain = stream_export_global(client, output_path="plain.ndjson")
+    with open(plain["path"], encoding="utf-8") as f:
+        plain_records = [json.loads(line) for line in f]
+    records = list(iter_archive_records(manifest["path"]))
+
+    assert manifest["segment_count"] > 3
+    assert _schemas(records) == _schemas(plain_records)
+    assert (manifest["subject_count"], manifest["version_count"]) == (50, 90)
+    assert manifest["compressed_bytes"] * 4 < manifest["bytes"]
+    assert SnapshotIndex.load(manifest["index_path"]).contexts == SnapshotIndex.load(plain["index_path"]).contexts
+
+    # Segments only end between subjects
+    for segment in manifest["segments"][:-1]:
+        assert segment["bytes"] >= SEGMENT_BYTES
+    names = sorted(os.listdir(manifest["path"]))
+    assert names[:2] == ["checkpoint.json", "index.json"]
+    assert all(name.endswith(".ndjson.gz") for name in names if name.startswith("segment-"))
+
+
+def _interrupt(client, monkeypatch, segments: int):
+    """Run an archive export into "nightly" that fails once `segments` segments are complete."""
+    calls = {"n": 0}
+    original = export_archive._Segment.close
+
+    def failing_close(self):
+        calls["n"] += 1
+        if calls["n"] == segments + 1:
+            raise ConnectionError("registry went away")
+        return original(self)
+
+    monkeypatch.setattr(export_archive._Segment, "close", failing_close)
+    with pytest.raises(ArchiveError, match="resume with output_path=nightly"):
+        archive_export_global(client, output_path="nightly")
+    monkeypatch.setattr(export_archive._Segment, "close", original)
+
+
+def test_interrupted_export_resumes(client, stand_in, monkeypatch):
+    _interrupt(client, monkeypatch, 3)
+
+    directory = os.path.join(export_stream.EXPORT_DIR, "nightly")
+    with open(os.path.join(directory, "checkpoint.json")) as f:
+        checkpoint = json.load(f)
+    assert len(checkpoint["segments"]) == 3
+    written = {(r["context"], r["subject"]) for r in iter_archive_records(directory) if r["type"] == "schema"}
+    assert written
+
+    requests_before = len(stand_in.requests)
+    manifest = archive_export_global(client, output_path="nightly")
+    assert manifest["resumed"] == 1
+    assert manifest["version_count"] == 90
+
+    records = list(iter_archive_records(manifest["path"]))
+    keys = [(r["context"], r["subject"], r["version"]) for r in records if r["type"] == "schema"]
+    assert len(keys) == len(set(keys)) == 90
+    assert sum(r["type"] == "header" for r in records) == 1
+
+    # Subjects written before the interruption are not fetched again
+    for context, subject in written:
+        prefix = f"/contexts/{context}/subjects/{subject}/" if context != "." else f"/subjects/{subject}/"
+        assert not any(path.startswith(prefix) for _, path in stand_in.requests[requests_before:])
+
+    # A complete archive is returned as is
+    assert archive_export_global(client, output_path="nightly")["sha256"] == manifest["sha256"]
+
+
+@pytest.mark.parametrize("change", ["added", "removed"])
+def test_resume_after_subjects_change(client, stand_in, monkeypatch, change):
+    _interrupt(client, monkeypatch, 5)
+    directory = os.path.join(export_stream.EXPORT_DIR, "nightly")
+    with open(os.path.join(directory, "checkpoint.json")) as f:
+        current = json.load(f)["current"]
+    assert current["context"] == "." and current["last_subject"] == "subject-05"
+    written = {r["subject"] for r in iter_archive_records(directory) if r["type"] == "schema" and r["context"] == "."}
+
+    # Changes ahead of the resume point shift every later offset in the listing
+    if change == "added":
+        stand_in.add_schema("subject-01a", _schema(3000))
+    else:
+        del stand_in.subjects[(".", "subject-01")]
+    stand_in.add_schema("subject-05a", _schema(3001))
+    stand_in.add_schema("subject-99", _schema(3002))
+
+    manifest = archive_export_global(client, output_path="nightly")
+    records = [r for r in iter_archive_records(manifest["path"]) if r["type"] == "schema" and r["context"] == "."]
+    keys = [(r["subject"], r["version"]) for r in records]
+    assert len(keys) == len(set(keys))
+
+    # Subjects after the last completed one are exported from the registry as it is now
+    remaining = {subject for context, subject in stand_in.subjects if context == "." and subject > "subject-05"}
+    assert {subject for subject, _ in keys} == written | remaining
+    for subject in remaining:
+        assert sum(key[0] == subject for key in keys) == len(stand_in.subjects[(".", subject)])
+
+
+def test_resume_refuses_damage_and_changed_options(client, export_dir):
+    manifest = archive_export_global(client, output_path="nightly")
+    checkpoint_path = os.path.join(manifest["path"], "checkpoint.json")
+    with open(checkpoint_path) as f:
+        checkpoint = json.load(f)
+    checkpoint["complete"] = False
+    with open(checkpoint_path, "w") as f:
+        json.dump(checkpoint, f)
+
+    with pytest.raises(ArchiveError, match="include_versions"):
+        archive_export_global(client, output_path="nightly", include_versions="latest")
+
+    with open(os.path.join(manifest["path"], manifest["segments"][0]["name"]), "ab") as f:
+        f.write(b"garbage")
+    with pytest.raises(ArchiveError, match="damaged"):
+        archive_export_global(client, output_path="nightly")
+
+
+def test_zstd_falls_back_to_gzip_without_zstandard(monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    assert resolve_compression("zstd") == "gzip"
+    assert resolve_compression("gzip") == "gzip"
+    with pytest.raises(ValueError):
+        resolve_compression("bzip2")
+
+
+def test_export_global_tool_writes_archive(client):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+
+    result = asyncio.run(export_global_tool(manager, "multi", "test", format="archive", output_path="tool"))
+    assert result["_validation"]["validated"] is True
+    assert result["compression"] == "gzip"
+    assert result["version_count"] == 90
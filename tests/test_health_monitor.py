@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Registry Health Monitor Tests
+
+Validates the background health monitor behind /health and /ready:
+- Endpoints serve the in-memory snapshot without contacting registries
+- Snapshot age is reported, and a stale snapshot marks the server degraded
+- Probe rounds run on a jittered schedule with a per-registry deadline
+- /ready waits for the first snapshot, then reports registry outages and staleness without failing
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import BaseRegistryManager
+
+
+def import_remote_mcp_server():
+    """Import remote-mcp-server.py with route decorators passed through."""
+    remote_script_path = os.path.join(os.path.dirname(__file__), "..", "remote-mcp-server.py")
+    spec = importlib.util.spec_from_file_location("remote_mcp_server_health", remote_script_path)
+    module = importlib.util.module_from_spec(spec)
+    mcp = MagicMock()
+    mcp.custom_route = lambda *args, **kwargs: (lambda func: func)
+    with patch.dict(
+        "sys.modules",
+        {
+            "kafka_schema_registry_unified_mcp": MagicMock(
+                mcp=mcp, registry_manager=MagicMock(), REGISTRY_MODE="multi", MCP_PROTOCOL_VERSION="2025-06-18"
+            )
+        },
+    ):
+        spec.loader.exec_module(module)
+    return module
+
+
+remote_mcp_server = import_remote_mcp_server()
+
+
+@pytest.fixture
+def stand_ins():
+    registries = [StandInRegistry().start() for _ in range(3)]
+    yield registries
+    for registry in registries:
+        registry.stop()
+
+
+@pytest.fixture
+def monitor(stand_ins):
+    manager = BaseRegistryManager()
+    for i, registry in enumerate(stand_ins):
+        manager.registries[f"registry-{i}"] = make_client(registry.url, cache=True, name=f"registry-{i}")
+    manager.default_registry = "registry-0"
+    monitor = remote_mcp_server.RegistryHealthMonitor(manager, "multi", interval=0.2, jitter=0.1, timeout=0.5)
+    remote_mcp_server.health_monitor = monitor
+    yield monitor
+    monitor.stop(timeout=2)
+
+
+def _call(endpoint):
+    response = asyncio.run(endpoint(MagicMock()))
+    return response.status_code, json.loads(response.body)
+
+
+def test_endpoints_serve_snapshot_without_probing(stand_ins, monitor):
+    """Repeated /health and /ready calls between rounds do not touch the registries."""
+    monitor.ensure_started = lambda: False  # drive rounds by hand
+    monitor.probe()
+    requests_before = [registry.request_count("/subjects") for registry in stand_ins]
+
+    for _ in range(20):
+        status, body = _call(remote_mcp_server.health_check)
+        assert status == 200
+        assert body["status"] == "healthy"
+        assert set(body["registries"]) == {"registry-0", "registry-1", "registry-2"}
+        assert body["snapshot_age_seconds"] >= 0
+        status, body = _call(remote_mcp_server.readiness_check)
+        assert status == 200
+        assert body["status"] == "ready"
+
+    assert [registry.request_count("/subjects") for registry in stand_ins] == requests_before
+    assert monitor.rounds == 1
+
+
+def test_monitor_refreshes_on_schedule(stand_ins, monitor):
+    """The background thread keeps the snapshot fresh and picks up registry failures."""
+    monitor.ensure_started()
+    deadline = time.monotonic() + 2
+    while monitor.rounds < 3 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert monitor.rounds >= 3
+    assert monitor.snapshot["healthy"] is True
+
+    stand_ins[1].fail_paths[".*"] = 500
+    time.sleep(0.5)
+    status, body = _call(remote_mcp_server.health_check)
+    assert status == 503
+    assert body["status"] == "degraded"
+    assert body["registries"]["registry-1"]["status"] == "error"
+    assert body["health_snapshot"]["age_seconds"] < 0.5
+
+    # Other registries still answer, so the server stays ready
+    assert _call(remote_mcp_server.readiness_check)[0] == 200
+
+    # With every registry down the server stays ready and reports it: cached and snapshot reads still work
+    for stand_in in stand_ins:
+        stand_in.fail_paths[".*"] = 500
+    time.sleep(0.5)
+    status, body = _call(remote_mcp_server.readiness_check)
+    assert status == 200
+    assert body["status"] == "ready"
+    assert body["registry_reachable"] is False
+
+
+def test_probe_deadline_bounds_round(stand_ins, monitor):
+    """A slow registry is reported as timed out instead of stalling the round."""
+    stand_ins[2].delay = 1.5
+    start = time.perf_counter()
+    snapshot = monitor.probe()
+    assert time.perf_counter() - start < 1.0
+    assert snapshot["registries"]["registry-2"]["timed_out"] is True
+    assert snapshot["healthy"] is False
+    assert snapshot["ready"] is True
+
+
+def test_stale_and_missing_snapshot(monitor):
+    """No snapshot yet: /health reports starting, /ready is 503. A stale snapshot degrades /health, /ready says so."""
+    monitor.ensure_started = lambda: False
+    status, body = _call(remote_mcp_server.health_check)
+    assert status == 200
+    assert body["status"] == "starting"
+    assert body["snapshot_age_seconds"] is None
+    status, body = _call(remote_mcp_server.readiness_check)
+    assert status == 503
+    assert body["status"] == "starting"
+
+    monitor.probe()
+    monitor.snapshot["monotonic"] -= monitor.stale_after + 1
+    status, body = _call(remote_mcp_server.health_check)
+    assert status == 503
+    assert body["health_snapshot"]["stale"] is True
+    status, body = _call(remote_mcp_server.readiness_check)
+    assert status == 200
+    assert body["status"] == "stale"
+
+
+def test_jitter_spreads_rounds(monitor):
+    """Delays vary within the configured jitter around the interval."""
+    delays = [monitor.next_delay() for _ in range(200)]
+    assert min(delays) >= 0.2 * 0.9
+    assert max(delays) <= 0.2 * 1.1
+    assert len(set(delays)) > 1
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+HTTP/2 Transport Tests
+
+Validates the opt-in httpx HTTP/2 transport for RegistryClient:
+- Requests multiplexed over one connection to an HTTP/2 stand-in
+- Same hardened TLS context as SecureHTTPAdapter
+- HTTP/1.1 fallback when the h2 package is missing
+- Benchmark: parallel fan-out multiplexed over one connection instead of a socket per request
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+import schema_registry_common
+from schema_registry_common import HTTP2Adapter, PooledHTTPAdapter, RegistryClient, RegistryConfig
+
+SUBJECTS = [f"subject-{i}" for i in range(200)]
+
+
+@pytest.fixture
+def stand_in_options():
+    pytest.importorskip("h2")
+    return {"delay": 0.02, "http2": True}
+
+
+def _client(url: str, http2: bool) -> RegistryClient:
+    # Measure the transport alone
+    client = make_client(url, limiter=False)
+    if http2:
+        client.session.mount("http://", HTTP2Adapter(pool_size=client.config.pool_size, cleartext=True))
+    return client
+
+
+def test_requests_multiplexed_over_one_connection(stand_in):
+    """Reads and writes go over a single HTTP/2 connection with client features intact."""
+    for subject in SUBJECTS[:20]:
+        stand_in.add_schema(subject, '{"type": "string"}')
+    client = _client(stand_in.url, http2=True)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        results = list(executor.map(client.get_schema_versions, SUBJECTS[:20]))
+    assert results == [[1]] * 20
+    assert client.register_schema("new-subject", '{"type": "long"}')["id"] == 2
+    assert client.get_schema("missing")["error"]
+
+    assert stand_in.connections == 1
+    assert stand_in.peak_active > 1
+    assert client.get_connection_stats()["http2_requests"] == 22
+
+
+def test_https_uses_hardened_ssl_context(monkeypatch):
+    """The HTTP/2 transport is built on the same SSL context factory as SecureHTTPAdapter."""
+    pytest.importorskip("h2")
+    calls = []
+    original = schema_registry_common.create_secure_ssl_context
+
+    def spy():
+        calls.append(True)
+        return original()
+
+    monkeypatch.setattr(schema_registry_common, "create_secure_ssl_context", spy)
+    monkeypatch.setattr(schema_registry_common, "ENFORCE_SSL_TLS_VERIFICATION", True)
+    client = RegistryClient(RegistryConfig(name="test", url="https://registry.example.com", http2=True))
+    assert isinstance(client.session.get_adapter("https://registry.example.com"), HTTP2Adapter)
+    assert calls
+
+
+def test_falls_back_to_http1_without_h2(monkeypatch):
+    """If h2 is not installed the client keeps working over HTTP/1.1."""
+
+    def missing_h2(*args, **kwargs):
+        raise ImportError("Using http2=True, but the 'h2' package is not installed")
+
+    monkeypatch.setattr(HTTP2Adapter, "__init__", missing_h2)
+    client = RegistryClient(RegistryConfig(name="test", url="https://registry.example.com", http2=True))
+    assert isinstance(client.session.get_adapter("https://registry.example.com"), PooledHTTPAdapter)
+
+
+def _fan_out(http2: bool):
+    with StandInRegistry(delay=0.02, http2=http2) as registry:
+        for subject in SUBJECTS:
+            registry.add_schema(subject, '{"type": "string"}')
+        client = _client(registry.url, http2)
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(client.get_schema_versions, SUBJECTS))
+            elapsed = time.perf_counter() - start
+        assert results == [[1]] * len(SUBJECTS)
+        return elapsed, registry.connections, registry.peak_active
+
+
+def test_benchmark_http2_fan_out_beats_http1():
+    """Hundreds of parallel GETs: one multiplexed HTTP/2 connection vs an HTTP/1.1 socket per request."""
+    pytest.importorskip("h2")
+    http1_elapsed, http1_connections, _ = _fan_out(http2=False)
+    http2_elapsed, http2_connections, http2_peak = _fan_out(http2=True)
+    print(
+        f"\nHTTP/1.1: {http1_elapsed:.3f}s over {http1_connections} connections; "
+        f"HTTP/2: {http2_elapsed:.3f}s over {http2_connections} connection, {http2_peak} concurrent streams"
+    )
+
+    # HTTP/1.1 opens a socket per concurrent request; HTTP/2 keeps the same concurrency on one connection
+    assert http1_connections > 10
+    assert http2_connections == 1
+    assert http2_peak >= 16
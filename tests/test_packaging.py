@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Packaging Tests
+
+Validates that the Docker image and the wheel ship the modules the server imports:
+- Every local module imported by a module the Dockerfile copies is copied too
+- The wheel includes the registry client's modules and every export module
+- Those modules import cleanly
+"""
+
+import ast
+import importlib
+import os
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, ROOT)
+LOCAL_MODULES = {name[:-3] for name in os.listdir(ROOT) if name.endswith(".py")}
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _local_imports(module: str) -> set:
+    imported = set()
+    for node in ast.walk(ast.parse(_read(f"{module}.py"))):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            imported.add(node.module.split(".")[0])
+    return imported & LOCAL_MODULES
+
+
+def _docker_modules() -> set:
+    return set(re.findall(r"^COPY --chown=mcp:mcp (\S+)\.py \.$", _read("Dockerfile"), re.M))
+
+
+def _wheel_modules() -> set:
+    include = re.search(r"\[tool\.hatch\.build\]\s*include = \[(.*?)\]", _read("pyproject.toml"), re.S).group(1)
+    return set(re.findall(r'"([^"]+)\.py"', include))
+
+
+# The registry client with its cache, resilience and snapshot layers, and every export module
+WHEEL_REQUIRED = sorted(
+    {"schema_registry_common", "registry_cache", "registry_resilience", "registry_snapshot"}
+    | {module for module in LOCAL_MODULES if module.startswith("export_")}
+)
+
+
+def test_docker_image_ships_every_imported_module():
+    shipped = _docker_modules()
+    missing = {module: sorted(_local_imports(module) - shipped) for module in shipped if module in LOCAL_MODULES}
+    assert {module: deps for module, deps in missing.items() if deps} == {}
+
+
+@pytest.mark.parametrize("module", WHEEL_REQUIRED)
+def test_wheel_ships_registry_and_export_modules(module):
+    assert module in _wheel_modules()
+    assert module in _docker_modules()
+    importlib.import_module(module)
@@ -146,11 +146,12 @@ class TestProgressReporting:
         mock_registry_manager = MagicMock()
         mock_client = MagicMock()
         mock_registry_manager.get_registry = MagicMock(return_value=mock_client)
+        mock_registry_manager.get_async_registry = MagicMock(return_value=mock_client)
         mock_registry_manager.list_registries = MagicMock(return_value=["test-registry"])
 
-        # Mock client methods
-        mock_client.get_subjects = MagicMock(return_value=["subject1", "subject2"])
-        mock_client.delete_subject = MagicMock(return_value=[1, 2])
+        # Mock client methods (batch cleanup uses the async registry client)
+        mock_client.get_subjects = AsyncMock(return_value=["subject1", "subject2"])
+        mock_client.delete_subject = AsyncMock(return_value=True)
         mock_client.config = MagicMock()
         mock_client.config.name = "test-registry"
 
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Registry Analytics Tests
+
+Validates the analytics cube in statistics_tools:
+- Field counts for Avro, JSON Schema and Protobuf schemas
+- Distributions, schema type breakdown and top-N subjects per registry and per context
+- The bulk listing and the per-version fallback produce the same cube
+- get_registry_analytics tool output validates against its schema, without blocking the event loop
+- Aggregating 100k schema versions stays well under a second or two
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from conftest import make_client
+
+from statistics_tools import (
+    SchemaColumns,
+    collect_registry_analytics,
+    compute_registry_analytics,
+    get_registry_analytics_tool,
+    schema_field_count,
+)
+
+AVRO_V1 = {"type": "record", "name": "User", "fields": [{"name": "id", "type": "long"}]}
+AVRO_V2 = {
+    "type": "record",
+    "name": "User",
+    "fields": [
+        {"name": "id", "type": "long"},
+        {
+            "name": "address",
+            "type": ["null", {"type": "record", "name": "Address", "fields": [{"name": "city", "type": "string"}]}],
+        },
+    ],
+}
+JSON_SCHEMA = {
+    "type": "object",
+    "properties": {"sku": {"type": "string"}, "price": {"type": "object", "properties": {"amount": {}}}},
+}
+PROTOBUF_SCHEMA = """syntax = "proto3";
+message Payment {
+  option deprecated = true;
+  string id = 1;
+  repeated int64 items = 2;
+  map<string, string> labels = 3;
+  enum Status {
+    OK = 0;
+  }
+}
+"""
+
+
+def test_schema_field_count():
+    assert schema_field_count("AVRO", json.dumps(AVRO_V2)) == 3
+    assert schema_field_count("AVRO", json.dumps({"type": "string"})) == 0
+    assert schema_field_count("JSON", json.dumps(JSON_SCHEMA)) == 3
+    assert schema_field_count("PROTOBUF", PROTOBUF_SCHEMA) == 3
+    assert schema_field_count("AVRO", "not json") == 0
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("users-value", json.dumps(AVRO_V1))
+    stand_in.add_schema("users-value", json.dumps(AVRO_V2))
+    stand_in.add_schema("events-value", json.dumps({"type": "string"}))
+    stand_in.add_schema("orders-value", json.dumps(JSON_SCHEMA), "shop", schema_type="JSON")
+    stand_in.add_schema("payments-value", PROTOBUF_SCHEMA, "shop", schema_type="PROTOBUF")
+    return stand_in
+
+
+def test_registry_cube(stand_in):
+    analytics = collect_registry_analytics(make_client(stand_in.url), top_n=2)
+
+    assert analytics["total_contexts"] == 2
+    assert (analytics["subjects"], analytics["versions"]) == (4, 5)
+    assert analytics["schema_types"] == {"AVRO": 3, "JSON": 1, "PROTOBUF": 1}
+    assert analytics["versions_per_subject"]["max"] == 2
+    assert analytics["versions_per_subject"]["histogram"] == [{"le": 1, "count": 3}, {"le": 3, "count": 1}]
+    assert analytics["field_count"]["max"] == 3
+    schemas = [json.dumps(AVRO_V1), json.dumps(AVRO_V2), json.dumps({"type": "string"}), json.dumps(JSON_SCHEMA)]
+    assert analytics["total_bytes"] == sum(len(schema) for schema in schemas) + len(PROTOBUF_SCHEMA)
+
+    top = analytics["top_subjects_by_versions"]
+    assert top[0] == {
+        "subject": "users-value",
+        "context": "default",
+        "versions": 2,
+        "latest_version": 2,
+        "size_bytes": len(json.dumps(AVRO_V2)),
+    }
+    latest_sizes = {"users-value": len(json.dumps(AVRO_V2)), "payments-value": len(PROTOBUF_SCHEMA)}
+    assert analytics["top_subjects_by_size"][0]["subject"] == max(latest_sizes, key=latest_sizes.get)
+
+    contexts = {entry["context"]: entry for entry in analytics["contexts"]}
+    assert set(contexts) == {"shop", "default"}
+    assert contexts["shop"]["schema_types"] == {"AVRO": 0, "JSON": 1, "PROTOBUF": 1}
+    assert (contexts["default"]["subjects"], contexts["default"]["versions"]) == (2, 3)
+    assert {entry["context"] for entry in contexts["shop"]["top_subjects_by_versions"]} == {"shop"}
+
+
+def test_single_context(stand_in):
+    analytics = collect_registry_analytics(make_client(stand_in.url), context="shop", include_context_details=False)
+    assert (analytics["subjects"], analytics["versions"]) == (2, 2)
+    assert "contexts" not in analytics
+
+
+def test_registry_analytics_tool(stand_in):
+    client = make_client(stand_in.url)
+    manager = type("Manager", (), {"get_registry": lambda self, name: client})()
+    progress = Mock(set_message=AsyncMock())
+    metadata_threads = []
+    fetch_metadata = client.get_server_metadata
+    client.get_server_metadata = lambda: metadata_threads.append(threading.current_thread()) or fetch_metadata()
+    result = asyncio.run(get_registry_analytics_tool(manager, "multi", "test", top_n=1, progress=progress))
+
+    assert result["_validation"]["validated"] is True
+    # Metadata was looked up on the registry executor, not on the event loop's thread
+    assert metadata_threads and threading.main_thread() not in metadata_threads
+    assert result["registry"] == "test"
+    assert len(result["top_subjects_by_versions"]) == 1
+    assert result["versions"] == 5
+
+
+def test_cube_over_100k_versions():
+    """100k schema versions across 20k subjects in 10 contexts aggregate in about a second."""
+    rng = random.Random(7)
+    columns = SchemaColumns()
+    for context in range(10):
+        subjects = {
+            f"subject-{context}-{i}": [
+                (version, rng.randint(100, 50_000), rng.randint(1, 200), rng.randrange(3)) for version in range(1, 6)
+            ]
+            for i in range(2_000)
+        }
+        columns.add_context(f"ctx-{context}", subjects)
+    assert len(columns) == 100_000
+
+    start = time.perf_counter()
+    analytics = compute_registry_analytics(columns, top_n=10)
+    elapsed = time.perf_counter() - start
+    print(f"\n100k versions aggregated in {elapsed:.2f}s")
+
+    assert analytics["versions"] == 100_000
+    assert analytics["subjects"] == 20_000
+    assert sum(analytics["schema_types"].values()) == 100_000
+    assert len(analytics["contexts"]) == 10
+    assert len(analytics["top_subjects_by_size"]) == 10
+    assert elapsed < 5
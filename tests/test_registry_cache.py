@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Registry Response Cache Tests
+
+Validates the read-through response cache in RegistryClient:
+- Repeated reads served from cache (sync session, client methods, async client)
+- Context-aware keys and per-endpoint TTL expiry
+- LRU eviction by entry count and bytes
+- Invalidation on register/delete/config/mode writes through the same client
+"""
+
+import json
+import time
+
+import pytest
+
+from conftest import make_client
+
+from registry_cache import CachedResponse, RegistryResponseCache, classify_registry_path
+
+SCHEMA = {"type": "record", "name": "Order", "fields": [{"name": "id", "type": "string"}]}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("orders-value", json.dumps(SCHEMA))
+    stand_in.add_schema("payments-value", json.dumps({"type": "string"}), context="finance")
+    return stand_in
+
+
+@pytest.fixture
+def client(stand_in):
+    return make_client(stand_in.url, cache=True)
+
+
+def test_classify_registry_path():
+    """Paths map to (context, endpoint, subject) and unknown paths are not cached."""
+    assert classify_registry_path("/subjects") == (".", "subjects", None)
+    assert classify_registry_path("/contexts/finance/subjects/a/versions") == ("finance", "versions", "a")
+    assert classify_registry_path("/subjects/a/versions/latest") == (".", "schema", "a")
+    assert classify_registry_path("/config/a") == (".", "config", "a")
+    assert classify_registry_path("/contexts/finance/mode") == ("finance", "mode", None)
+    assert classify_registry_path("/schemas/ids/1")[1] is None
+
+
+def test_repeated_reads_hit_cache(stand_in, client):
+    """Client methods and direct session calls share the cache."""
+    for _ in range(5):
+        assert client.get_subjects() == ["orders-value"]
+        assert client.get_schema("orders-value")["version"] == 1
+    response = client.session.get(f"{stand_in.url}/subjects", auth=client.auth, headers=client.headers)
+    assert response.json() == ["orders-value"]
+
+    assert stand_in.request_count("/subjects", method="GET") == 2
+    stats = client.get_cache_stats()
+    assert stats["hits"] == 9
+    assert stats["misses"] == 2
+
+
+def test_cache_is_context_aware(stand_in, client):
+    """Different contexts are cached under different keys."""
+    assert client.get_subjects() == ["orders-value"]
+    assert client.get_subjects("finance") == ["payments-value"]
+    assert client.get_subjects("finance") == ["payments-value"]
+    assert client.get_cache_stats()["entries"] == 2
+
+
+def test_health_checks_bypass_cache(stand_in, client):
+    """test_connection always reaches the registry."""
+    client.test_connection()
+    client.test_connection()
+    assert stand_in.request_count("/subjects") == 2
+
+
+def test_writes_invalidate_affected_entries(stand_in, client):
+    """Register, delete, config and mode writes drop stale entries only in their scope."""
+    client.get_subjects()
+    client.get_subjects("finance")
+    client.get_schema_versions("orders-value")
+    client.get_subject_config("orders-value")
+    client.get_mode()
+
+    client.register_schema("orders-value", {**SCHEMA, "doc": "v2"})
+    assert client.get_schema_versions("orders-value") == [1, 2]
+    assert client.get_cache_stats()["entries"] == 3  # finance subjects, mode + refreshed versions
+
+    client.update_subject_config("orders-value", "FULL")
+    assert client.get_subject_config("orders-value")["compatibilityLevel"] == "FULL"
+
+    client.update_mode("READONLY")
+    assert client.get_mode()["mode"] == "READONLY"
+
+    client.delete_subject("orders-value")
+    assert client.get_subjects() == []
+    assert client.get_subjects("finance") == ["payments-value"]
+    assert stand_in.request_count("/contexts/finance/subjects") == 1
+
+
+def test_ttl_expiry():
+    """Entries expire after their endpoint TTL."""
+    cache = RegistryResponseCache("http://registry", ttls={"subjects": 0.05})
+    cache.put("http://registry/subjects", CachedResponse(200, b"[]"))
+    assert cache.get("http://registry/subjects") is not None
+    time.sleep(0.06)
+    assert cache.get("http://registry/subjects") is None
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_lru_eviction_by_count_and_bytes():
+    """Least recently used entries are evicted first when either bound is exceeded."""
+    cache = RegistryResponseCache("http://registry", ttls={"versions": 60}, max_entries=2, max_bytes=10_000)
+    for name in ("a", "b"):
+        cache.put(f"http://registry/subjects/{name}/versions", CachedResponse(200, b"[1]"))
+    cache.get("http://registry/subjects/a/versions")
+    cache.put("http://registry/subjects/c/versions", CachedResponse(200, b"[1]"))
+    assert cache.get("http://registry/subjects/b/versions") is None
+    assert cache.get("http://registry/subjects/a/versions") is not None
+
+    url = "http://registry/subjects/big/versions"
+    cache = RegistryResponseCache("http://registry", ttls={"versions": 60}, max_bytes=len(url) + 150)
+    cache.put("http://registry/subjects/a/versions", CachedResponse(200, b"x" * 100))
+    cache.put(url, CachedResponse(200, b"x" * 100))
+    assert cache.get_stats()["entries"] == 1
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_disabled_cache_passes_through(stand_in):
+    """REGISTRY_CACHE_ENABLED=false behaviour: every read reaches the registry."""
+    client = make_client(stand_in.url)
+    client.get_subjects()
+    client.get_subjects()
+    assert stand_in.request_count("/subjects") == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_cache(stand_in, client):
+    """Reads and writes through the async client use the same per-registry cache."""
+    assert client.get_subjects() == ["orders-value"]
+    assert await client.async_client.get_subjects() == ["orders-value"]
+    assert stand_in.request_count("/subjects") == 1
+
+    await client.async_client.delete_subject("orders-value")
+    assert client.get_subjects() == []
+    await client.async_client.close()
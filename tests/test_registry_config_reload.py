@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Registry Configuration Reload Tests
+
+Validates lazy client creation and hot configuration reload in MultiRegistryManager:
+- More than eight numbered registries are loaded
+- Clients (and their sessions) are created on first use only
+- reload() adds, removes and reconfigures registries in place
+- Unchanged registries keep their client and connection pool
+- Replaced clients are closed only once their requests in flight finish
+- Config files are layered over the environment without modifying it
+- Reloads triggered by config file changes and SIGHUP
+"""
+
+import json
+import os
+import re
+import signal
+import threading
+import time
+
+import pytest
+
+from schema_registry_common import MultiRegistryManager, RegistryClient
+
+REGISTRY_VAR = re.compile(r"^(SCHEMA_REGISTRY_(NAME|URL|USER|PASSWORD)_\d+|SCHEMA_REGISTRY_URL|VIEWONLY_\d+)$")
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for key in [key for key in os.environ if REGISTRY_VAR.match(key)]:
+        monkeypatch.delenv(key)
+    yield monkeypatch
+    for key in [key for key in os.environ if REGISTRY_VAR.match(key)]:
+        del os.environ[key]
+
+
+def _write_config(path, registries):
+    lines = []
+    for i, (name, url, extra) in enumerate(registries, start=1):
+        lines += [f"SCHEMA_REGISTRY_NAME_{i}={name}", f"SCHEMA_REGISTRY_URL_{i}={url}"]
+        lines += [f"{key}_{i}={value}" for key, value in extra.items()]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_dozens_of_registries_created_lazily(clean_env):
+    """Registries beyond the former cap of eight are configured; clients appear on first use."""
+    for i in range(1, 31):
+        clean_env.setenv(f"SCHEMA_REGISTRY_NAME_{i}", f"env-{i}")
+        clean_env.setenv(f"SCHEMA_REGISTRY_URL_{i}", f"http://registry-{i}.example.com:8081")
+
+    manager = MultiRegistryManager()
+    assert len(manager.list_registries()) == 30
+    assert manager.default_registry == "env-1"
+    assert manager.registries.loaded() == {}
+    assert "env-25" in manager.registries
+
+    client = manager.get_registry("env-25")
+    assert isinstance(client, RegistryClient)
+    assert manager.get_registry("env-25") is client
+    assert list(manager.registries.loaded()) == ["env-25"]
+    assert manager.get_registry("missing") is None
+
+
+def test_reload_applies_only_changes(clean_env, tmp_path):
+    """Added, removed, reconfigured and unchanged registries are handled without touching the others."""
+    config = tmp_path / "registries.env"
+    _write_config(
+        config,
+        [
+            ("dev", "http://dev.example.com:8081", {}),
+            ("staging", "http://staging.example.com:8081", {"SCHEMA_REGISTRY_PASSWORD": "old"}),
+            ("prod", "http://prod.example.com:8081", {}),
+            ("qa", "http://qa.example.com:8081", {}),
+        ],
+    )
+    manager = MultiRegistryManager(config_file=str(config))
+    assert manager.list_registries() == ["dev", "staging", "prod", "qa"]
+    dev, staging, prod = (manager.get_registry(name) for name in ("dev", "staging", "prod"))
+    dev_session = dev.session
+
+    _write_config(
+        config,
+        [
+            ("dev", "http://dev.example.com:8081", {}),
+            ("staging", "http://staging.example.com:8081", {"SCHEMA_REGISTRY_PASSWORD": "new", "VIEWONLY": "true"}),
+            ("prod", "http://prod-v2.example.com:8081", {}),
+            ("eu", "http://eu.example.com:8081", {}),
+        ],
+    )
+    changes = manager.reload()
+
+    assert changes["added"] == ["eu"]
+    assert changes["removed"] == ["qa"]
+    assert changes["replaced"] == ["prod"]
+    assert changes["updated"] == ["staging"]
+    assert changes["unchanged"] == ["dev"]
+
+    # Unchanged registry keeps its client and pool; credential changes are applied in place
+    assert manager.get_registry("dev") is dev and dev.session is dev_session
+    assert manager.get_registry("staging") is staging
+    assert staging.config.password == "new" and staging.config.viewonly is True
+    assert manager.get_registry("prod") is not prod
+    assert manager.get_registry("prod").config.url == "http://prod-v2.example.com:8081"
+    assert "qa" not in manager.registries and manager.settings["SCHEMA_REGISTRY_NAME_4"] == "eu"
+    assert "SCHEMA_REGISTRY_NAME_1" not in os.environ
+    assert not manager.registries.is_loaded("eu")
+
+
+def test_removing_default_registry_picks_new_default(clean_env, tmp_path):
+    config = tmp_path / "registries.env"
+    _write_config(config, [("dev", "http://dev.example.com:8081", {}), ("prod", "http://prod.example.com:8081", {})])
+    manager = MultiRegistryManager(config_file=str(config))
+    assert manager.default_registry == "dev"
+
+    _write_config(config, [("prod", "http://prod.example.com:8081", {})])
+    manager.reload()
+    assert manager.list_registries() == ["prod"]
+    assert manager.default_registry == "prod"
+    assert "SCHEMA_REGISTRY_NAME_2" not in manager.settings
+
+
+def test_config_file_layers_over_environment(clean_env, tmp_path):
+    """File values win over the environment, dropped keys fall back to it, and managers do not share files."""
+    clean_env.setenv("SCHEMA_REGISTRY_NAME_1", "env")
+    clean_env.setenv("SCHEMA_REGISTRY_URL_1", "http://env.example.com:8081")
+    clean_env.setenv("SCHEMA_REGISTRY_PASSWORD_1", "from-env")
+    first, second = tmp_path / "first.env", tmp_path / "second.env"
+    _write_config(first, [("first", "http://first.example.com:8081", {"SCHEMA_REGISTRY_PASSWORD": "from-file"})])
+    _write_config(second, [("second", "http://second.example.com:8081", {})])
+
+    manager = MultiRegistryManager(config_file=str(first))
+    other = MultiRegistryManager(config_file=str(second))
+    assert manager.list_registries() == ["first"] and other.list_registries() == ["second"]
+    assert manager.get_registry("first").config.password == "from-file"
+    assert other.get_registry("second").config.password == "from-env"
+    assert os.environ["SCHEMA_REGISTRY_NAME_1"] == "env"
+
+    # A credential reload reads the file layer too, not just the environment
+    assert manager.reload_credentials() == {"first": False}
+
+    first.write_text("")
+    manager.reload()
+    assert manager.list_registries() == ["env"]
+
+
+@pytest.mark.parametrize("stand_in_options", [{"delay": 0.3, "nodelay": True}])
+def test_replaced_client_drains_before_close(clean_env, tmp_path, stand_in):
+    """A request in flight on a replaced client completes; the client is closed after it."""
+    stand_in.add_schema("orders-value", json.dumps({"type": "string"}))
+    config = tmp_path / "registries.env"
+    _write_config(config, [("dev", stand_in.url, {})])
+    manager = MultiRegistryManager(config_file=str(config))
+    old = manager.get_registry("dev")
+    old.cache.enabled = False
+    closed = threading.Event()
+    close = old.close
+    old.close = lambda: (close(), closed.set())
+
+    result = {}
+    request = threading.Thread(target=lambda: result.update(subjects=old.get_subjects()))
+    request.start()
+    assert _wait_for(lambda: old.limiter.in_flight == 1)
+
+    _write_config(config, [("dev", stand_in.url, {"SCHEMA_REGISTRY_POOL_SIZE": "3"})])
+    assert manager.reload()["replaced"] == ["dev"]
+    assert not closed.is_set()
+    request.join()
+    assert result["subjects"] == ["orders-value"]
+    assert closed.wait(2)
+    assert manager.get_registry("dev") is not old
+
+
+def test_config_file_change_triggers_reload(clean_env, tmp_path):
+    config = tmp_path / "registries.env"
+    _write_config(config, [("dev", "http://dev.example.com:8081", {})])
+    manager = MultiRegistryManager(config_file=str(config))
+    assert manager.watch_config_file(interval=0.05)
+
+    time.sleep(0.05)  # make sure the modification time moves on
+    _write_config(config, [("dev", "http://dev.example.com:8081", {}), ("eu", "http://eu.example.com:8081", {})])
+    assert _wait_for(lambda: "eu" in manager.registries)
+    manager.stop_watching()
+
+
+def test_sighup_triggers_reload(clean_env, tmp_path):
+    config = tmp_path / "registries.env"
+    _write_config(config, [("dev", "http://dev.example.com:8081", {})])
+    manager = MultiRegistryManager(config_file=str(config))
+    previous = signal.getsignal(signal.SIGHUP)
+    try:
+        assert manager.install_reload_signal()
+        _write_config(config, [("eu", "http://eu.example.com:8081", {})])
+        os.kill(os.getpid(), signal.SIGHUP)
+        assert _wait_for(lambda: manager.list_registries() == ["eu"])
+    finally:
+        signal.signal(signal.SIGHUP, previous)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Registry Executor Tests
+
+Validates the process-wide executor for blocking registry work in registry_resilience:
+- The global worker cap and the per-registry bulkhead are never exceeded
+- Queued work is reported as queue depth and drained across bulkheads
+- Health lanes are not starved by bulk work on the same registry
+- Nested fan-outs from a worker run inline instead of deadlocking
+- Statistics and batch deletes reuse the shared pool instead of creating threads per call
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from conftest import make_client
+
+from registry_resilience import RegistryExecutor, get_registry_executor
+from schema_registry_common import clear_context_batch
+from statistics_tools import collect_registry_statistics
+
+
+@pytest.fixture
+def executor():
+    executor = RegistryExecutor(max_workers=4, bulkhead=2)
+    yield executor
+    executor.shutdown()
+
+
+class _Tracker:
+    """Records peak concurrency overall and per key while tasks are blocked on an event."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+
+    def task(self, key):
+        with self.lock:
+            self.active[key] = self.active.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        self.release.wait(5)
+        with self.lock:
+            self.active[key] -= 1
+        return key
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_bulkhead_and_global_caps(executor):
+    """Three registries with ten tasks each: at most two per registry and four overall run at once."""
+    tracker = _Tracker()
+    futures = [executor.submit(key, tracker.task, key) for key in ("a", "b", "c") for _ in range(10)]
+
+    assert _wait_for(lambda: executor.get_stats()["active_workers"] == 4)
+    stats = executor.get_stats()
+    assert stats["queue_depth"] == 26
+    assert all(bulkhead["active"] <= 2 for bulkhead in stats["bulkheads"].values())
+    assert sum(bulkhead["queued"] for bulkhead in stats["bulkheads"].values()) == 26
+
+    tracker.release.set()
+    assert [future.result(5) for future in futures] == [key for key in ("a", "b", "c") for _ in range(10)]
+    assert tracker.peak_total == 4
+    assert max(tracker.peak.values()) == 2
+    assert set(tracker.peak) == {"a", "b", "c"}
+
+    stats = executor.get_stats()
+    assert stats["queue_depth"] == 0 and stats["active_workers"] == 0
+    assert stats["completed"] == 30
+    assert stats["threads"] <= 4
+
+
+def test_health_lane_not_starved(executor):
+    """A registry's bulkhead is full of slow work; its health lane still runs right away."""
+    tracker = _Tracker()
+    bulk = [executor.submit("prod", tracker.task, "prod") for _ in range(6)]
+    assert _wait_for(lambda: executor.get_stats()["bulkheads"]["prod"]["queued"] == 4)
+
+    probe = executor.submit(RegistryExecutor.health_lane("prod"), lambda: "ok")
+    assert probe.result(1) == "ok"
+
+    tracker.release.set()
+    for future in bulk:
+        future.result(5)
+
+
+def test_nested_fan_out_runs_inline(executor):
+    """Workers fanning out on a full pool run their sub-tasks inline rather than waiting forever."""
+
+    def outer(i):
+        return sum(executor.map("nested", lambda j: i * j, range(5)))
+
+    results = executor.map("nested", outer, range(8))
+    assert results == [i * 10 for i in range(8)]
+    assert executor.get_stats()["caller_runs"] > 0
+
+
+def test_exceptions_surface_on_future(executor):
+    def boom():
+        raise ValueError("registry said no")
+
+    with pytest.raises(ValueError, match="registry said no"):
+        executor.submit("a", boom).result(1)
+    assert executor.get_stats()["active_workers"] == 0
+
+
+@pytest.mark.parametrize("stand_in_options", [{"bulk_enabled": False, "nodelay": True}])
+def test_shared_pool_has_no_thread_churn(stand_in):
+    """Repeated statistics runs and batch deletes reuse the process-wide pool."""
+    for i in range(40):
+        stand_in.add_schema(f"subject-{i}", json.dumps({"type": "string"}), context="staging")
+    client = make_client(stand_in.url, name="churn")
+    executor = get_registry_executor()
+
+    existing = {thread.ident for thread in threading.enumerate()}
+    for _ in range(5):
+        collect_registry_statistics(client, max_staleness=0)
+    result = clear_context_batch(client, "staging", delete_context_after=False, dry_run=False)
+    assert result["subjects_deleted"] == 40
+
+    # Per-call pools would show up as default-named ThreadPoolExecutor threads
+    names = [thread.name for thread in threading.enumerate() if thread.ident not in existing]
+    assert not [name for name in names if name.startswith("ThreadPoolExecutor-")]
+    assert sum(name.startswith("registry-worker") for name in names) <= executor.max_workers
+    stats = executor.get_stats()
+    assert stats["threads"] <= executor.max_workers
+    assert stats["bulkheads"].get("churn", {"active": 0})["active"] == 0
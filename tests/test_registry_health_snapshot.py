@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Registry Health Snapshot Tests
+
+Validates concurrent, cached connection testing in BaseRegistryManager:
+- All registries are probed concurrently, not one after another
+- A per-registry deadline reports slow registries as timed out
+- Sync and async callers, tools and resources share one short-lived snapshot
+- Concurrent callers share in-flight probes
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import BaseRegistryManager
+
+DELAY = 0.3
+
+
+@pytest.fixture
+def stand_ins():
+    registries = [StandInRegistry(delay=DELAY).start() for _ in range(4)]
+    yield registries
+    for registry in registries:
+        registry.stop()
+
+
+@pytest.fixture
+def manager(stand_ins):
+    manager = BaseRegistryManager()
+    for i, registry in enumerate(stand_ins):
+        manager.registries[f"registry-{i}"] = make_client(registry.url, cache=True, name=f"registry-{i}")
+    manager.default_registry = "registry-0"
+    return manager
+
+
+def test_registries_probed_concurrently(manager):
+    """Four registries with 0.3s latency are tested in about one latency."""
+    start = time.perf_counter()
+    result = manager.test_all_registries()
+    elapsed = time.perf_counter() - start
+
+    assert result["connected"] == 4
+    assert elapsed < DELAY * 2
+
+
+def test_snapshot_shared_between_callers(stand_ins, manager):
+    """Sync, async and per-registry lookups within the TTL reuse one probe per registry."""
+    import asyncio
+
+    async def test_async():
+        result = await manager.test_all_registries_async()
+        for client in manager.registries.values():
+            await client.async_client.close()
+        return result
+
+    manager.test_all_registries()
+    assert manager.get_registry_health("registry-1")["status"] == "connected"
+    assert asyncio.run(test_async())["connected"] == 4
+    assert manager.get_registry_info("registry-2")["connection_status"] == "connected"
+
+    for registry in stand_ins:
+        assert registry.request_count("/subjects") == 1
+    assert manager.get_registry_health("registry-1")["snapshot_age"] > 0
+
+    # An explicit max_age of zero forces a fresh probe
+    manager.probe_registries(["registry-1"], max_age=0)
+    assert stand_ins[1].request_count("/subjects") == 2
+
+
+def test_deadline_reports_slow_registry(stand_ins, manager):
+    """A registry slower than the deadline is reported as timed out; its probe still refreshes the snapshot."""
+    stand_ins[3].delay = 1.0
+    start = time.perf_counter()
+    results = manager.probe_registries(timeout=0.5)
+    assert time.perf_counter() - start < 0.9
+
+    assert results["registry-3"]["timed_out"] is True
+    assert all(results[f"registry-{i}"]["status"] == "connected" for i in range(3))
+
+    time.sleep(0.7)
+    assert manager.get_registry_health("registry-3")["status"] == "connected"
+
+
+def test_concurrent_callers_share_probe(stand_ins, manager):
+    """Many simultaneous status reads of a stale registry issue one connection test."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: manager.get_registry_health("registry-0"), range(8)))
+    assert all(result["status"] == "connected" for result in results)
+    assert stand_ins[0].request_count("/subjects") == 1
+
+
+@pytest.mark.asyncio
+async def test_status_tool_uses_snapshot(stand_ins, manager):
+    """The tools behind registry://status and registry://status/{name} share the snapshot."""
+    from registry_management_tools import test_all_registries_tool, test_registry_connection_tool
+
+    result = await test_all_registries_tool(manager, "multi")
+    assert result["connected"] == 4
+
+    single = test_registry_connection_tool(manager, "multi", "registry-2")
+    assert single["status"] == "connected"
+    assert stand_ins[2].request_count("/subjects") == 1
+    for client in manager.registries.values():
+        await client.async_client.close()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Offline Registry Snapshot Tests
+
+Validates the SQLite snapshot in registry_snapshot and its builders in export_snapshot:
+- A live sync or an ndjson/archive export builds a snapshot that answers the same as the registry
+- Covered reads (subjects, versions, schemas by version and ID, subjects of an ID) never reach the registry
+- Reads the snapshot has no entry for go to the registry, and are answered "not found" while it is down
+- Read tools and the async client keep working when the registry is down
+- Subjects written through the client are read from the registry until the next sync
+- Registries pick up their snapshot file from SCHEMA_REGISTRY_SNAPSHOT_X
+"""
+
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from conftest import make_client
+
+import export_stream
+from core_registry_tools import (
+    get_schema_by_id_tool,
+    get_schema_tool,
+    get_schema_versions_tool,
+    get_subjects_by_schema_id_tool,
+    list_subjects_tool,
+)
+from export_archive import archive_export_global
+from export_delta import stream_export_delta
+from export_snapshot import build_registry_snapshot
+from export_stream import ExportPathError, stream_export_global
+from export_tools import build_registry_snapshot_tool
+from schema_registry_common import BaseRegistryManager, MultiRegistryManager, RegistryClient, RegistryConfig
+
+COVERED_PATHS = [
+    "/contexts",
+    "/subjects",
+    "/subjects/orders-value/versions",
+    "/subjects/orders-value/versions/1",
+    "/subjects/orders-value/versions/latest",
+    "/subjects/orders-proto/versions/latest",
+    "/contexts/finance/subjects",
+    "/contexts/finance/subjects/payments-value/versions/latest",
+]
+# Not in the snapshot: read from the registry, answered "not found" by the snapshot only while it is down
+MISSING_PATHS = [
+    "/subjects/missing/versions",
+    "/subjects/missing/versions/latest",
+    "/subjects/orders-value/versions/9",
+    "/schemas/ids/999",
+    "/schemas/ids/999/subjects",
+]
+
+
+def _schema(name: str, fields: int = 1) -> str:
+    return json.dumps(
+        {"type": "record", "name": name, "fields": [{"name": f"f{n}", "type": "string"} for n in range(fields)]}
+    )
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_stream, "EXPORT_DIR", str(tmp_path / "exports"))
+    return tmp_path / "exports"
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("orders-value", _schema("Order"))
+    stand_in.add_schema("orders-value", _schema("Order", 2))
+    # Same body as orders-value v2, so it shares the schema ID
+    stand_in.add_schema("orders-copy", _schema("Order", 2))
+    stand_in.add_schema("orders-proto", 'syntax = "proto3"; message Order {}', schema_type="PROTOBUF")
+    stand_in.add_schema("payments-value", _schema("Payment"), context="finance")
+    return stand_in
+
+
+@pytest.fixture
+def client(stand_in, tmp_path):
+    client = make_client(stand_in.url, snapshot_path=str(tmp_path / "test.db"))
+    yield client
+    client.close()
+
+
+def _manager(client):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+    return manager
+
+
+def _get(client, path):
+    response = client.session.get(f"{client.config.url}{path}")
+    body = response.json()
+    if isinstance(body, list) and body and isinstance(body[0], dict):
+        body.sort(key=lambda entry: (entry["subject"], entry["version"]))
+    if isinstance(body, dict):
+        body.pop("message", None)
+        if "schema" in body:
+            body.setdefault("schemaType", "AVRO")
+    return response.status_code, body
+
+
+def test_snapshot_answers_like_the_registry(client, stand_in):
+    expected = {path: _get(client, path) for path in COVERED_PATHS}
+    schema_id = expected["/subjects/orders-value/versions/latest"][1]["id"]
+    for suffix in ("", "/subjects", "/versions"):
+        expected[f"/schemas/ids/{schema_id}{suffix}"] = _get(client, f"/schemas/ids/{schema_id}{suffix}")
+    assert not client.snapshot.loaded
+
+    result = build_registry_snapshot(client)
+    assert (result["context_count"], result["subject_count"], result["version_count"]) == (2, 4, 5)
+    assert result["source"] == f"registry:{stand_in.url}"
+
+    requests_before = len(stand_in.requests)
+    for path, answer in expected.items():
+        assert _get(client, path) == answer, path
+    assert len(stand_in.requests) == requests_before
+    assert client.get_snapshot_stats()["served"] == len(expected)
+
+    # Config is not in the snapshot and still comes from the registry
+    assert "error" not in client.get_global_config()
+    assert len(stand_in.requests) == requests_before + 1
+
+
+def test_snapshot_misses_go_to_the_registry(client, stand_in):
+    expected = {path: _get(client, path) for path in MISSING_PATHS}
+    build_registry_snapshot(client)
+
+    requests_before = len(stand_in.requests)
+    for path, answer in expected.items():
+        assert _get(client, path) == answer, path
+    assert len(stand_in.requests) == requests_before + len(MISSING_PATHS)
+
+    # Registered after the snapshot was built, by a producer outside this server
+    schema_id = stand_in.add_schema("late-value", _schema("Late"))
+    assert client.get_schema_by_id(schema_id)["schema"]
+    assert client.get_schema("late-value")["id"] == schema_id
+
+    stand_in.stop()
+    for path, answer in expected.items():
+        assert _get(client, path) == answer, path
+    assert asyncio.run(client.async_client.get_schema_versions("missing"))["error"]
+
+
+def test_read_tools_work_while_registry_is_down(client, stand_in):
+    build_registry_snapshot(client)
+    manager = _manager(client)
+    stand_in.stop()
+
+    schema = get_schema_tool("orders-value", manager, "multi", registry="test")
+    assert schema["version"] == 2 and schema["schema"]["name"] == "Order"
+    assert get_schema_versions_tool("orders-value", manager, "multi", registry="test")["versions"] == [1, 2]
+    assert list_subjects_tool(manager, "multi", context="finance", registry="test")["subjects"] == ["payments-value"]
+    assert get_schema_by_id_tool(schema["id"], manager, "multi", registry="test")["schema"]["name"] == "Order"
+    assert get_subjects_by_schema_id_tool(schema["id"], manager, "multi", registry="test")["subject_versions"] == [
+        {"subject": "orders-copy", "version": 1},
+        {"subject": "orders-value", "version": 2},
+    ]
+    assert "error" in get_schema_tool("missing", manager, "multi", registry="test")
+    assert asyncio.run(client.async_client.get_subjects()) == ["orders-copy", "orders-proto", "orders-value"]
+
+    started = time.perf_counter()
+    for _ in range(2000):
+        client.snapshot.get(f"{client.config.url}/subjects/orders-value/versions/latest")
+    assert (time.perf_counter() - started) / 2000 < 0.001
+
+
+def test_written_subjects_go_to_the_registry_until_resynced(client, stand_in):
+    build_registry_snapshot(client)
+    assert "error" not in client.register_schema("orders-value", json.loads(_schema("Order", 3)))
+
+    requests_before = len(stand_in.requests)
+    assert client.get_schema_versions("orders-value") == [1, 2, 3]
+    assert client.get_subjects() == ["orders-copy", "orders-proto", "orders-value"]
+    assert client.get_schema_versions("orders-proto") == [1]
+    assert client.get_subjects("finance") == ["payments-value"]
+    # The written subject and its context's listing were read from the registry
+    assert len(stand_in.requests) == requests_before + 2
+    assert client.get_snapshot_stats()["changed_subjects"] == 1
+
+    build_registry_snapshot(client)
+    requests_before = len(stand_in.requests)
+    assert client.get_schema_versions("orders-value") == [1, 2, 3]
+    assert len(stand_in.requests) == requests_before
+    assert client.get_snapshot_stats()["changed_subjects"] == 0
+
+
+def test_snapshot_from_exports(client, stand_in):
+    plain = stream_export_global(client, output_path="nightly.ndjson")
+    archive = archive_export_global(client, output_path="nightly")
+
+    for source in (os.path.basename(plain["path"]), os.path.basename(archive["path"])):
+        result = build_registry_snapshot(client, source)
+        assert result["version_count"] == 5
+        assert result["source"] == f"export:{source}"
+        stand_in.stop()
+        assert client.get_schema("orders-proto")["schemaType"] == "PROTOBUF"
+        stand_in.start()
+
+    stand_in.add_schema("orders-value", _schema("Order", 3))
+    delta = stream_export_delta(client, plain["index_path"], "delta.ndjson", True)
+    assert "apply_delta" in build_registry_snapshot(client, os.path.basename(delta["path"]))["error"]
+    assert "not found" in build_registry_snapshot(client, "missing.ndjson")["error"]
+    with pytest.raises(ExportPathError):
+        build_registry_snapshot(client, "../test.db")
+
+
+def test_build_tool_and_configuration(client, stand_in, tmp_path, monkeypatch):
+    result = asyncio.run(build_registry_snapshot_tool(_manager(client), "multi", "test"))
+    assert result["_validation"]["validated"] is True
+    assert result["subject_count"] == 4
+
+    plain = RegistryClient(RegistryConfig(name="plain", url=stand_in.url))
+    assert "error" in build_registry_snapshot(plain)
+    assert plain.get_snapshot_stats() == {"registry": "plain", "enabled": False}
+
+    monkeypatch.setenv("SCHEMA_REGISTRY_NAME_1", "offline")
+    monkeypatch.setenv("SCHEMA_REGISTRY_URL_1", stand_in.url)
+    monkeypatch.setenv("SCHEMA_REGISTRY_SNAPSHOT_1", str(tmp_path / "test.db"))
+    manager = MultiRegistryManager(config_file="")
+    offline = manager.get_registry("offline")
+    assert offline.snapshot.loaded
+    stand_in.stop()
+    assert offline.get_subjects("finance") == ["payments-value"]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Request Coalescing Tests
+
+Validates single-flight de-duplication of concurrent identical registry GETs:
+- Threaded callers of the sync client share one upstream request
+- Coroutines on the async client share one upstream request
+- Errors reach every waiting caller and nothing is shared once a call finishes
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from registry_cache import AsyncSingleFlight, SingleFlight
+
+CALLERS = 8
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"delay": 0.2}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("orders-value", '{"type": "string"}')
+    return stand_in
+
+
+def test_threaded_reads_share_one_request(stand_in, client):
+    """Concurrent sync reads of the same URL issue one upstream GET."""
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        results = list(executor.map(lambda _: client.get_subjects(), range(CALLERS)))
+
+    assert results == [["orders-value"]] * CALLERS
+    assert stand_in.request_count("/subjects", method="GET") == 1
+    assert client.get_connection_stats()["coalesced_requests"] == CALLERS - 1
+
+
+def test_health_probes_are_coalesced(stand_in, client):
+    """Uncached reads such as connection tests still share in-flight requests."""
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        results = list(executor.map(lambda _: client.test_connection(), range(CALLERS)))
+
+    assert all(result["status"] == "connected" for result in results)
+    assert stand_in.request_count("/subjects") == 1
+
+
+def test_different_urls_are_not_coalesced(stand_in, client):
+    """Only identical requests are shared."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda path: client.session.get(f"{stand_in.url}{path}"), ["/subjects", "/contexts"]))
+    assert stand_in.request_count("/subjects") == 1
+    assert stand_in.request_count("/contexts") == 1
+
+
+def test_sequential_reads_are_not_shared(stand_in, client):
+    """A finished call is forgotten, so later reads see fresh data."""
+    stand_in.delay = 0
+    client.get_subjects()
+    client.get_subjects()
+    assert stand_in.request_count("/subjects") == 2
+
+
+def test_single_flight_propagates_errors():
+    """Followers receive the leader's exception."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_call():
+        started.set()
+        release.wait()
+        raise ConnectionError("registry down")
+
+    errors = []
+
+    def caller():
+        try:
+            flight.do("key", failing_call)
+        except ConnectionError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.coalesced < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(errors) == 4
+    assert flight.do("key", lambda: "fresh") == ("fresh", False)
+
+
+@pytest.mark.asyncio
+async def test_async_reads_share_one_request(stand_in, client):
+    """Concurrent coroutine reads of the same URL issue one upstream GET."""
+    async_client = client.async_client
+    results = await asyncio.gather(*(async_client.get_subjects() for _ in range(CALLERS)))
+
+    assert results == [["orders-value"]] * CALLERS
+    assert stand_in.request_count("/subjects", method="GET") == 1
+    assert client.get_connection_stats()["coalesced_requests"] == CALLERS - 1
+    await async_client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_errors_and_cancellation():
+    """Errors reach every waiter; a cancelled leader does not cancel its followers."""
+    flight = AsyncSingleFlight()
+
+    async def failing_call():
+        await asyncio.sleep(0.05)
+        raise ConnectionError("registry down")
+
+    results = await asyncio.gather(*(flight.do("key", failing_call) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+    async def slow_call():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    leader = asyncio.create_task(flight.do("key", slow_call))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", slow_call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("value", False)
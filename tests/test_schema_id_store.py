@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Schema-by-ID Store Tests
+
+Validates the process-wide permanent schema store behind RegistryClient:
+- Schema bodies fetched at most once by ID, and learned from numbered version reads
+- Numbered versions only cached with the response TTL, so deleted versions are not served
+- Keys scoped by registry and context
+- Memory bound with optional disk spill
+- Export and async paths reading bodies through the store
+"""
+
+import json
+
+import pytest
+
+from registry_cache import SchemaIdStore, schema_id_store
+from schema_registry_common import BaseRegistryManager
+
+SCHEMA = {"type": "record", "name": "Order", "fields": [{"name": "id", "type": "string"}]}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    stand_in.add_schema("orders-value", json.dumps(SCHEMA))
+    stand_in.add_schema("orders-value", json.dumps({**SCHEMA, "doc": "v2"}))
+    stand_in.add_schema("payments-value", json.dumps({"type": "string"}), context="finance")
+    return stand_in
+
+
+def test_schema_by_id_fetched_once(stand_in, client):
+    """Repeated ID lookups reach the registry once, through client methods and tools alike."""
+    from core_registry_tools import get_schema_by_id_tool
+
+    hits_before = client.get_schema_store_stats()["hits"]
+    first = client.get_schema_by_id(1)
+    assert json.loads(first["schema"]) == SCHEMA
+    assert client.get_schema_by_id(1) == first
+
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    tool_result = get_schema_by_id_tool(1, manager, "multi", registry="test")
+    assert tool_result["schema"] == SCHEMA
+
+    assert stand_in.request_count("/schemas/ids/1") == 1
+    assert client.get_schema_store_stats()["hits"] - hits_before == 2
+
+
+def test_numbered_versions_feed_store(stand_in, client):
+    """Numbered version reads teach the store their body but are not answered from it."""
+    first = client.get_schema("orders-value", "1")
+    assert client.get_schema("orders-value", "1") == first
+    assert stand_in.request_count("/subjects/orders-value/versions/1") == 2
+
+    # The body was learned from the version read, so the ID lookup is free too
+    assert json.loads(client.get_schema_by_id(first["id"])["schema"]) == SCHEMA
+    assert stand_in.request_count("/schemas/ids") == 0
+
+    client.get_schema("orders-value", "latest")
+    client.get_schema("orders-value", "latest")
+    assert stand_in.request_count("/subjects/orders-value/versions/latest") == 2
+
+
+def test_store_is_context_scoped(stand_in, client):
+    """The same ID in another context is a different key."""
+    default_schema = client.get_schema_by_id(3)
+    finance_schema = client.get_schema_by_id(3, context="finance")
+    assert default_schema["schema"] == finance_schema["schema"]
+    assert stand_in.request_count("/schemas/ids/3") == 1
+    assert stand_in.request_count("/contexts/finance/schemas/ids/3") == 1
+
+
+def test_deleted_versions_are_not_served(stand_in, client):
+    """Versions deleted through the client or behind its back stop being served once the cache lets go."""
+    client.cache.enabled = True
+    assert "error" not in client.get_schema("orders-value", "1")
+    client.delete_subject("orders-value")
+    assert "error" in client.get_schema("orders-value", "1")
+    assert stand_in.request_count("/subjects/orders-value/versions/1") == 2
+
+    stand_in.add_schema("orders-value", json.dumps(SCHEMA))
+    assert "error" not in client.get_schema("orders-value", "1")
+    with stand_in.lock:
+        del stand_in.subjects[(".", "orders-value")]
+    client.cache.clear()
+    assert "error" in client.get_schema("orders-value", "1")
+    # The body itself is immutable and stays in the store
+    assert "error" not in client.get_schema_by_id(1)
+    assert stand_in.request_count("/schemas/ids") == 0
+
+
+def test_memory_bound_and_disk_spill(tmp_path):
+    """Bodies beyond the memory budget are spilled to disk and read back instead of refetched."""
+    store = SchemaIdStore(max_bytes=100, spill_dir=str(tmp_path))
+    for schema_id in range(1, 4):
+        store.put_body("http://registry", ".", schema_id, b"x" * 40)
+
+    stats = store.get_stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 80
+    assert stats["spilled_entries"] == 1
+    assert store.get_body("http://registry", ".", 1) == b"x" * 40
+    assert store.get_stats()["spill_reads"] == 1
+
+    store.clear()
+    assert list(tmp_path.iterdir()) == []
+
+    store = SchemaIdStore(max_bytes=100)
+    for schema_id in range(1, 4):
+        store.put_body("http://registry", ".", schema_id, b"x" * 40)
+    assert store.get_body("http://registry", ".", 1) is None
+    assert store.get_body("http://registry", ".", 3) == b"x" * 40
+
+
+def test_export_reads_bodies_once(stand_in, client):
+    """Exporting twice within the cache TTL fetches each numbered version body only once."""
+    from schema_registry_common import export_subject
+
+    client.cache.enabled = True
+    first = export_subject(client, "orders-value")
+    second = export_subject(client, "orders-value")
+    assert [v["schema"] for v in first["versions"]] == [v["schema"] for v in second["versions"]]
+    assert stand_in.request_count("/subjects/orders-value/versions/1") == 1
+    assert stand_in.request_count("/subjects/orders-value/versions/2") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_store(stand_in, client):
+    """Bodies stored by the sync client are served to the async client and vice versa."""
+    client.cache.enabled = True
+    client.get_schema("orders-value", "1")
+    result = await client.async_client.get_schema("orders-value", "1")
+    assert result["id"] == 1
+
+    by_id = await client.async_client.get_schema_by_id(2)
+    assert json.loads(by_id["schema"])["doc"] == "v2"
+    assert client.get_schema_by_id(2)["id"] == 2
+    assert stand_in.request_count("/subjects/orders-value/versions/1") == 1
+    assert stand_in.request_count("/schemas/ids/2") == 1
+    assert schema_id_store.get_stats()["entries"] >= 2
+    await client.async_client.close()
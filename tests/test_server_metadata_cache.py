@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Server Metadata Cache Tests
+
+Validates cached server metadata and concurrent registry listing:
+- /v1/metadata/id and /v1/metadata/version are fetched once per TTL
+- Expired metadata is served while a single background refresh runs
+- A failed refresh keeps the last good metadata
+- list_registries and get_registry_info cost about one registry latency
+"""
+
+import asyncio
+import time
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from registry_cache import ServerMetadataCache
+from schema_registry_common import BaseRegistryManager
+
+DELAY = 0.3
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_metadata_fetched_once_per_ttl(stand_in):
+    """Sync and async callers share one cached copy of the server metadata."""
+    client = make_client(stand_in.url, cache=True)
+    first = client.get_server_metadata()
+    assert first["kafka_cluster_id"] == "stand-in"
+
+    for _ in range(5):
+        assert client.get_server_metadata() == first
+
+    async def read_async():
+        metadata = await client.async_client.get_server_metadata()
+        await client.async_client.close()
+        return metadata
+
+    assert asyncio.run(read_async()) == first
+    assert stand_in.request_count("/v1/metadata/id") == 1
+    assert stand_in.request_count("/v1/metadata/version") == 1
+
+    # Callers get copies they are free to modify
+    first["version"] = "changed"
+    assert client.get_server_metadata()["version"] != "changed"
+
+
+def test_expired_metadata_refreshed_in_background(stand_in):
+    """After the TTL the cached value is returned immediately and refreshed once behind the scenes."""
+    client = make_client(stand_in.url, cache=True)
+    client.metadata_cache = client.async_client.metadata_cache = ServerMetadataCache(ttl=0.1)
+    client.get_server_metadata()
+    time.sleep(0.15)
+
+    stand_in.delay = DELAY
+    start = time.perf_counter()
+    for _ in range(5):
+        assert client.get_server_metadata()["kafka_cluster_id"] == "stand-in"
+    assert time.perf_counter() - start < DELAY
+
+    assert _wait_for(lambda: stand_in.request_count("/v1/metadata/id") == 2)
+    time.sleep(DELAY)
+    assert stand_in.request_count("/v1/metadata/id") == 2
+    assert client.metadata_cache.get_stats()["refreshes"] == 1
+
+
+def test_failed_refresh_keeps_last_good_metadata(stand_in):
+    """A registry outage during refresh does not replace good metadata with errors."""
+    client = make_client(stand_in.url, cache=True)
+    client.metadata_cache = ServerMetadataCache(ttl=0.05, error_ttl=0.05)
+    good = client.get_server_metadata()
+    time.sleep(0.1)
+
+    stand_in.fail_paths["^/v1/metadata"] = 500
+    client.get_server_metadata()
+    assert _wait_for(lambda: stand_in.request_count("/v1/metadata/id") == 2)
+    time.sleep(0.05)
+    assert client.get_server_metadata() == good
+
+    # Errors are retried after error_ttl
+    stand_in.fail_paths.clear()
+    time.sleep(0.1)
+    client.get_server_metadata()
+    assert _wait_for(lambda: stand_in.request_count("/v1/metadata/id") == 3)
+
+
+def test_list_registries_costs_one_latency():
+    """Four registries with 0.3s latency are listed in about one round trip, then served from cache."""
+    from registry_management_tools import list_registries_tool
+
+    registries = [StandInRegistry(delay=DELAY).start() for _ in range(4)]
+    try:
+        manager = BaseRegistryManager()
+        for i, registry in enumerate(registries):
+            manager.registries[f"registry-{i}"] = make_client(registry.url, cache=True, name=f"registry-{i}")
+        manager.default_registry = "registry-0"
+
+        start = time.perf_counter()
+        result = list_registries_tool(manager, "multi")
+        elapsed = time.perf_counter() - start
+        assert result["total_count"] == 4
+        assert all(info["connection_status"] == "connected" for info in result["registries"])
+        assert all(info["kafka_cluster_id"] == "stand-in" for info in result["registries"])
+        assert elapsed < DELAY * 2
+
+        start = time.perf_counter()
+        info = manager.get_registry_info("registry-2")
+        assert time.perf_counter() - start < 0.05
+        assert info["version"]
+        assert registries[2].request_count("/v1/metadata/version") == 1
+    finally:
+        for registry in registries:
+            registry.stop()
@@ -77,6 +77,7 @@ EXCLUDED_TOOLS_SLIM_MODE = {
     "export_context",
     "export_global",
     "export_global_interactive",
+    "build_registry_snapshot",
     # Interactive/elicitation tools
     "register_schema_interactive",
     "check_compatibility_interactive",
@@ -97,6 +98,7 @@ EXCLUDED_TOOLS_SLIM_MODE = {
     "set_default_registry",  # Only included in SLIM_MODE for single-registry configurations
     # Heavy statistics with async
     "get_registry_statistics",
+    "get_registry_analytics",
     # Task management
     "get_task_status",
     "get_task_progress",
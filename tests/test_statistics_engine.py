@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Statistics Engine Tests
+
+Validates the single-pass statistics engine in statistics_tools:
+- Per-context subject and version counts from the bulk listing or raw client calls
+- The default context is counted once, even when listed as "."
+- No MCP tool calls and no nested per-context pools
+- 10k subjects counted from a handful of bulk pages instead of a request per subject
+- Without the bulk endpoint, version requests are fanned out concurrently
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import REGISTRY_BULK_PAGE_SIZE
+from statistics_tools import collect_registry_statistics, get_registry_statistics_tool
+
+
+def _populate(registry: StandInRegistry, subjects: int):
+    for i in range(subjects):
+        registry.add_schema(f"subject-{i}", json.dumps({"type": "string"}))
+    for version in range(3):
+        registry.add_schema(
+            "payments-value", json.dumps({"type": "enum", "name": "E", "symbols": [str(version)]}), "finance"
+        )
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    _populate(stand_in, 20)
+    stand_in.add_schema("subject-0", json.dumps({"type": "long"}))
+    return stand_in
+
+
+def test_counts_every_context_once(stand_in):
+    """Subjects and versions per context, with the default context reported once."""
+    client = make_client(stand_in.url)
+    with patch("kafka_schema_registry_unified_mcp.get_schema_versions") as mcp_tool:
+        statistics = collect_registry_statistics(client)
+    mcp_tool.assert_not_called()
+
+    assert statistics["counts"][None]["subject-0"] == 2
+    assert {
+        context: (totals["subjects"], totals["versions"]) for context, totals in statistics["context_totals"].items()
+    } == {
+        "finance": (1, 3),
+        None: (20, 21),
+    }
+    assert statistics["total_subjects"] == 21
+    assert statistics["total_versions"] == 24
+    assert statistics["errors"] == {}
+
+
+def test_registry_statistics_tool(stand_in):
+    client = make_client(stand_in.url)
+    manager = type("Manager", (), {"get_registry": lambda self, name: client})()
+    result = get_registry_statistics_tool(manager, "multi", "test")
+
+    assert result["total_subjects"] == 21
+    assert result["total_schemas"] == 24
+    assert {entry["name"]: entry["schema_count"] for entry in result["contexts"]} == {"finance": 3, "default": 21}
+
+
+def test_10k_subjects_from_bulk_pages():
+    """10k subjects are counted from the paged bulk listing, without any per-subject request."""
+    with StandInRegistry(nodelay=True) as registry:
+        _populate(registry, 10_000)
+        client = make_client(registry.url)
+
+        statistics = collect_registry_statistics(client)
+        assert statistics["total_subjects"] == 10_001
+        assert statistics["total_versions"] == 10_003
+
+        # The context listing plus each context's pages (a short page ends the listing);
+        # a per-subject crawl would need 10k version requests
+        default_pages = 10_000 // REGISTRY_BULK_PAGE_SIZE + 1
+        assert registry.request_count("/schemas", "GET") == default_pages
+        assert registry.request_count("/contexts/finance/schemas", "GET") == 1
+        assert len(registry.requests) == 1 + default_pages + 1
+        assert registry.request_count("/subjects") == 0
+
+
+def test_crawl_fans_out_without_bulk_endpoint():
+    """Registries without GET /schemas are counted with version requests fanned out on the shared pool."""
+    with StandInRegistry(delay=0.01, bulk_enabled=False, nodelay=True) as registry:
+        _populate(registry, 500)
+        client = make_client(registry.url)
+
+        statistics = collect_registry_statistics(client)
+        assert statistics["total_versions"] == 503
+
+        # One subject listing per context, then exactly one version list per subject, several at a time
+        version_requests = [path for _, path in registry.requests if path.endswith("/versions")]
+        assert len(version_requests) == len(set(version_requests)) == 501
+        listings = sorted(path for _, path in registry.requests if path.endswith("/subjects"))
+        assert listings == ["/contexts/finance/subjects", "/subjects"]
+        assert registry.peak_active > 1
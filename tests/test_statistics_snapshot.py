@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Statistics Snapshot Tests
+
+Validates the materialized per-registry statistics snapshot:
+- Statistics tools answer from the snapshot within max_staleness and report refresh times
+- A refresh re-queries only new subjects and subjects written through the client, with or without bulk listing
+- Subjects removed from the registry drop out of the snapshot
+- Contexts are fully re-read once the full refresh interval has passed
+"""
+
+import json
+
+import pytest
+
+from conftest import make_client
+from registry_stand_in import StandInRegistry
+
+from statistics_tools import (
+    collect_registry_statistics,
+    count_schema_versions_tool,
+    count_schemas_tool,
+    get_registry_statistics_tool,
+)
+
+SUBJECTS = [f"subject-{i}" for i in range(30)]
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"bulk_enabled": False, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for subject in SUBJECTS:
+        stand_in.add_schema(subject, json.dumps({"type": "string"}))
+    stand_in.add_schema("payments-value", json.dumps({"type": "long"}), context="finance")
+    return stand_in
+
+
+class _Manager:
+    def __init__(self, client):
+        self.client = client
+
+    def get_registry(self, name=None):
+        return self.client
+
+
+def _version_requests(registry: StandInRegistry):
+    return sorted(path for method, path in registry.requests if method == "GET" and path.endswith("/versions"))
+
+
+def test_tools_answer_from_snapshot(stand_in, client):
+    """Within max_staleness the statistics tools make no registry requests."""
+    manager = _Manager(client)
+    first = get_registry_statistics_tool(manager, "multi", max_staleness=60)
+    assert first["total_subjects"] == 31
+    assert first["snapshot_refreshed_at"]
+    assert all(entry["refreshed_at"] for entry in first["contexts"])
+    requests_before = len(stand_in.requests)
+
+    again = get_registry_statistics_tool(manager, "multi", max_staleness=60)
+    schemas = count_schemas_tool(manager, "multi", context="finance", max_staleness=60)
+    versions = count_schema_versions_tool("subject-3", manager, "multi", max_staleness=60)
+
+    assert again["total_schemas"] == 31
+    assert schemas["count"] == 1 and schemas["schemas"] == ["payments-value"]
+    assert versions["count"] == 1 and versions["refreshed_at"] == again["snapshot_refreshed_at"]
+    assert len(stand_in.requests) == requests_before
+    assert client.statistics.get_stats()["refreshes"] == 2
+
+
+def test_delta_refresh_requeries_only_changes(stand_in, client):
+    """New subjects and subjects written through the client are re-read; the rest come from the snapshot."""
+    collect_registry_statistics(client)
+    stand_in.requests.clear()
+
+    client.register_schema("subject-3", {"type": "long"})
+    stand_in.add_schema("brand-new", json.dumps({"type": "int"}))  # registered by someone else
+    with stand_in.lock:
+        del stand_in.subjects[(".", "subject-7")]
+
+    statistics = collect_registry_statistics(client, max_staleness=0)
+    assert _version_requests(stand_in) == ["/subjects/brand-new/versions", "/subjects/subject-3/versions"]
+    assert statistics["counts"][None]["subject-3"] == 2
+    assert statistics["counts"][None]["brand-new"] == 1
+    assert "subject-7" not in statistics["counts"][None]
+    assert statistics["total_subjects"] == 31
+    assert statistics["total_versions"] == 32
+
+
+def test_bulk_delta_refresh_requeries_only_changes():
+    """On a registry with GET /schemas, only the first refresh lists every version; deltas diff the subject list."""
+    with StandInRegistry(nodelay=True) as registry:
+        for subject in SUBJECTS:
+            registry.add_schema(subject, json.dumps({"type": "string"}))
+        client = make_client(registry.url)
+        collect_registry_statistics(client)
+        assert registry.request_count("/schemas", "GET") == 1
+        registry.requests.clear()
+
+        client.register_schema("subject-3", {"type": "long"})
+        registry.add_schema("brand-new", json.dumps({"type": "int"}))
+        statistics = collect_registry_statistics(client, max_staleness=0)
+
+        assert registry.request_count("/schemas", "GET") == 0
+        assert _version_requests(registry) == ["/subjects/brand-new/versions", "/subjects/subject-3/versions"]
+        # Context list, subject list, the two version lists and the registration
+        assert len(registry.requests) == 5
+        assert statistics["counts"][None]["subject-3"] == 2
+        assert statistics["total_versions"] == 32
+
+
+def test_write_invalidates_fresh_snapshot(stand_in, client):
+    """A write through the client forces a refresh of its context even within max_staleness."""
+    collect_registry_statistics(client, max_staleness=60)
+    stand_in.requests.clear()
+
+    client.register_schema("payments-value", {"type": "int"}, context="finance")
+    statistics = collect_registry_statistics(client, max_staleness=60)
+    assert statistics["counts"]["finance"]["payments-value"] == 2
+    assert _version_requests(stand_in) == ["/contexts/finance/subjects/payments-value/versions"]
+
+
+def test_full_refresh_interval(stand_in, client):
+    """Past the full refresh interval every subject is read again, catching changes made elsewhere."""
+    collect_registry_statistics(client)
+    stand_in.add_schema("subject-1", json.dumps({"type": "bytes"}))  # new version registered elsewhere
+    assert collect_registry_statistics(client, max_staleness=0)["counts"][None]["subject-1"] == 1
+
+    client.statistics.full_refresh_interval = 0
+    stand_in.requests.clear()
+    statistics = collect_registry_statistics(client, max_staleness=0)
+    assert statistics["counts"][None]["subject-1"] == 2
+    assert len(_version_requests(stand_in)) == 31
+    assert client.statistics.get_stats()["full_refreshes"] == 4
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Statistics Streaming Tests
+
+Validates per-context partial results of the statistics and count background tasks:
+- Every context is published once through the progress message, as soon as it finishes
+- Fast contexts are published before a slow context completes
+- Partial results parse back into the same figures as the final result
+- Contexts answered from the snapshot are published straight away
+- Registry metadata is looked up off the event loop
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from registry_stand_in import StandInRegistry
+
+from schema_registry_common import BaseRegistryManager
+from statistics_tools import (
+    _count_schemas_async,
+    _get_registry_statistics_async,
+    format_partial_result,
+    parse_partial_result,
+)
+
+SLOW_CONTEXT_DELAY = 0.5
+
+
+class SlowContextRegistry(StandInRegistry):
+    """Stand-in whose "slow" context answers every request after a delay."""
+
+    def handle(self, method, raw_path, body):
+        if raw_path.startswith("/contexts/slow/"):
+            time.sleep(SLOW_CONTEXT_DELAY)
+        return super().handle(method, raw_path, body)
+
+
+@pytest.fixture
+def stand_in_class():
+    return SlowContextRegistry
+
+
+@pytest.fixture
+def stand_in_options():
+    return {"bulk_enabled": False, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(5):
+        stand_in.add_schema(f"subject-{i}", json.dumps({"type": "string"}))
+    stand_in.add_schema("payments-value", json.dumps({"type": "long"}), context="finance")
+    stand_in.add_schema("payments-value", json.dumps({"type": "int"}), context="finance")
+    stand_in.add_schema("audit-value", json.dumps({"type": "string"}), context="slow")
+    return stand_in
+
+
+@pytest.fixture
+def manager(client):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+    return manager
+
+
+class _Recorder:
+    """Progress stand-in recording when each partial result was published."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.partials = []
+        self.set_total = AsyncMock()
+        self.increment = AsyncMock()
+
+    async def set_message(self, message):
+        partial = parse_partial_result(message)
+        if partial is not None:
+            self.partials.append((time.monotonic() - self.started, partial))
+
+
+def test_partial_result_round_trip():
+    message = format_partial_result("Processed context 'a'", {"context": "a", "count": 3})
+    assert message.startswith("Processed context 'a' ")
+    assert parse_partial_result(message) == {"context": "a", "count": 3}
+    assert parse_partial_result("Refreshing statistics snapshot") is None
+    assert parse_partial_result(None) is None
+
+
+@pytest.mark.asyncio
+async def test_statistics_publish_contexts_as_they_finish(manager):
+    progress = _Recorder()
+    result = await _get_registry_statistics_async(manager, "multi", "test", progress=progress)
+    elapsed = time.monotonic() - progress.started
+
+    by_context = {partial["context"]: (at, partial) for at, partial in progress.partials}
+    assert len(progress.partials) == len(by_context) == 3
+    progress.set_total.assert_awaited_once_with(3)
+    assert progress.increment.await_count == 3
+
+    # The fast contexts are out well before the slow one is done
+    assert by_context["default"][0] < elapsed - SLOW_CONTEXT_DELAY / 2
+    assert by_context["finance"][0] < elapsed - SLOW_CONTEXT_DELAY / 2
+    assert progress.partials[-1][1]["context"] == "slow"
+
+    final = {entry["context"]: entry for entry in result["contexts"]}
+    for name, (_, partial) in by_context.items():
+        assert (partial["subjects"], partial["versions"]) == (final[name]["schemas"], final[name]["versions"])
+    last = progress.partials[-1][1]
+    assert last["completed"] == last["total"] == 3
+    assert (last["total_schemas"], last["total_versions"]) == (result["total_schemas"], result["total_versions"])
+
+
+@pytest.mark.asyncio
+async def test_statistics_metadata_off_event_loop(manager):
+    client = manager.registries["test"]
+    metadata_threads = []
+    fetch_metadata = client.get_server_metadata
+    client.get_server_metadata = lambda: metadata_threads.append(threading.current_thread()) or fetch_metadata()
+
+    result = await _get_registry_statistics_async(manager, "multi", "test", progress=_Recorder())
+    assert result["version"] == "7.6.0"
+    assert metadata_threads and threading.current_thread() not in metadata_threads
+
+
+@pytest.mark.asyncio
+async def test_statistics_from_snapshot_publish_immediately(manager, stand_in):
+    await _get_registry_statistics_async(manager, "multi", "test", progress=_Recorder())
+    requests_before = len(stand_in.requests)
+
+    progress = _Recorder()
+    await _get_registry_statistics_async(manager, "multi", "test", progress=progress, max_staleness=60)
+    assert {partial["context"] for _, partial in progress.partials} == {"default", "finance", "slow"}
+    assert all(at < SLOW_CONTEXT_DELAY for at, _ in progress.partials)
+    assert not [path for _, path in stand_in.requests[requests_before:] if "/versions" in path]
+
+
+@pytest.mark.asyncio
+async def test_count_schemas_publish_contexts_as_they_finish(manager):
+    progress = _Recorder()
+    result = await _count_schemas_async(manager, "multi", registry="test", progress=progress, max_staleness=0)
+    elapsed = time.monotonic() - progress.started
+
+    counts = {partial["context"]: partial["count"] for _, partial in progress.partials}
+    assert counts == {"default": 5, "finance": 1, "slow": 1}
+    assert {name: len(subjects) for name, subjects in result["schemas_by_context"].items()} == counts
+    assert progress.partials[0][0] < elapsed - SLOW_CONTEXT_DELAY / 2
+    assert progress.partials[-1][1] == {
+        "context": "slow",
+        "count": 1,
+        "completed": 3,
+        "total": 3,
+        "total_schemas": 7,
+    }
+
+
+def test_cancelled_statistics_task_still_fills_snapshot(manager):
+    """Cancelling the task once the first contexts are in leaves the refresh to complete in the background."""
+    client = manager.get_registry("test")
+
+    async def cancel_after_first_partial():
+        progress = _Recorder()
+        task = asyncio.create_task(_get_registry_statistics_async(manager, "multi", "test", progress=progress))
+        while not progress.partials:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return progress.partials
+
+    partials = asyncio.run(cancel_after_first_partial())
+    assert partials and partials[0][1]["context"] != "slow"
+
+    deadline = time.monotonic() + 5
+    while client.statistics.get("slow", 60) is None and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert set(client.statistics.get("slow", 60).subjects) == {"audit-value"}
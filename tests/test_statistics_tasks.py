@@ -15,7 +15,7 @@ to use FastMCP Progress dependency instead of task_manager.
 import os
 import sys
 import warnings
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -122,14 +122,17 @@ class TestAsyncStatisticsFunctions:
             from statistics_tools import _count_schemas_async
 
             subjects = ["subject1", "subject2", "subject3"]
-            mock_registry_client.get_subjects.return_value = subjects
-            mock_registry_manager.get_registry.return_value = mock_registry_client
+            mock_registry_client.get_subjects = AsyncMock(return_value=subjects)
+            mock_registry_client.get_server_metadata = AsyncMock(return_value={})
+            mock_registry_manager.get_async_registry.return_value = mock_registry_client
+            progress = Mock(set_message=AsyncMock(), set_total=AsyncMock(), increment=AsyncMock())
 
             result = await _count_schemas_async(
                 mock_registry_manager,
                 "multi",
                 context="test-context",
                 registry="test-registry",
+                progress=progress,
             )
 
             assert result["registry"] == "test-registry"
@@ -141,24 +144,27 @@ class TestAsyncStatisticsFunctions:
         except ImportError:
             pytest.skip("statistics_tools module not available")
 
-    def test_analyze_context_parallel_success(self, mock_registry_client):
+    def test_collect_subject_versions_success(self, mock_registry_client):
         """Test successful parallel context analysis"""
         try:
-            from statistics_tools import _analyze_context_parallel
+            from statistics_tools import collect_subject_versions
 
             subjects = ["subject1", "subject2"]
             mock_registry_client.get_subjects.return_value = subjects
 
-            with patch("kafka_schema_registry_unified_mcp.get_schema_versions") as mock_versions:
-                mock_versions.side_effect = [
-                    [1, 2],
-                    [1, 2, 3],
-                ]  # 2 and 3 versions respectively
+            # Versions are fetched with raw client calls, not through the MCP tool
+            mock_registry_client.get_schema_versions.side_effect = lambda subject, context: {
+                "subject1": [1, 2],
+                "subject2": [1, 2, 3],
+            }[
+                subject
+            ]  # 2 and 3 versions respectively
 
-                result = _analyze_context_parallel(mock_registry_client, "test-context", "test-registry")
+            versions, errors = collect_subject_versions(mock_registry_client, ["test-context"])
 
-            assert result["schemas"] == 2
-            assert result["versions"] == 5  # 2 + 3
+            assert errors == {}
+            assert len(versions["test-context"]) == 2
+            assert sum(len(v) for v in versions["test-context"].values()) == 5  # 2 + 3
 
         except ImportError:
             pytest.skip("statistics_tools module not available")
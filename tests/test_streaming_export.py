@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Tests
+
+Validates NDJSON exports written by export_stream:
+- Every subject version is written as one record, through the bulk listing and the per-subject crawl
+- The manifest's counts, byte size and SHA-256 match the file on disk
+- include_versions="latest" and include_config=False are honoured
+- Output paths outside EXPORT_DIR are rejected and failed exports leave no file behind
+- export_context and export_global tools return the manifest for format="ndjson"
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+
+import pytest
+
+import export_stream
+from export_stream import ExportPathError, resolve_export_path, stream_export_context, stream_export_global
+from export_tools import export_context_tool, export_global_tool
+from schema_registry_common import BaseRegistryManager
+
+
+def _schema(i: int) -> str:
+    return json.dumps({"type": "record", "name": f"R{i}", "fields": [{"name": "f", "type": "string"}]})
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_stream, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture(params=[True, False], ids=["bulk", "crawl"])
+def stand_in_options(request):
+    return {"bulk_enabled": request.param, "nodelay": True}
+
+
+@pytest.fixture
+def stand_in(stand_in):
+    for i in range(3):
+        stand_in.add_schema(f"subject-{i}", _schema(i))
+    stand_in.add_schema("subject-0", _schema(10))
+    stand_in.add_schema("payments-value", _schema(20), context="finance")
+    return stand_in
+
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_context_export_records_and_manifest(client):
+    manifest = stream_export_context(client, "")
+    records = _records(manifest["path"])
+
+    assert records[0]["type"] == "header"
+    assert records[0]["registry"] == "test"
+    assert (records[1]["type"], records[1]["context"]) == ("context", ".")
+    assert records[1]["global_config"]["compatibilityLevel"] == "BACKWARD"
+    assert records[1]["global_mode"]["mode"] == "READWRITE"
+    schemas = [r for r in records if r["type"] == "schema"]
+    assert [(r["subject"], r["version"]) for r in schemas] == [
+        ("subject-0", 1),
+        ("subject-0", 2),
+        ("subject-1", 1),
+        ("subject-2", 1),
+    ]
+    assert json.loads(schemas[1]["schema"])["name"] == "R10"
+    assert sum(r["type"] == "subject_config" for r in records) == 3
+
+    assert (manifest["subject_count"], manifest["version_count"]) == (3, 4)
+    with open(manifest["path"], "rb") as f:
+        data = f.read()
+    assert manifest["bytes"] == len(data)
+    assert manifest["sha256"] == hashlib.sha256(data).hexdigest()
+    with open(manifest["manifest_path"], encoding="utf-8") as f:
+        assert json.load(f)["sha256"] == manifest["sha256"]
+
+
+def test_latest_only_without_config(client):
+    manifest = stream_export_context(client, "", include_config=False, include_versions="latest")
+    records = _records(manifest["path"])
+    assert [(r["subject"], r["version"]) for r in records if r["type"] == "schema"] == [
+        ("subject-0", 2),
+        ("subject-1", 1),
+        ("subject-2", 1),
+    ]
+    assert not [r for r in records if r["type"] == "subject_config"]
+    assert "global_config" not in records[1]
+
+
+def test_global_export_covers_every_context(client):
+    manifest = stream_export_global(client, output_path="all.ndjson")
+    assert manifest["path"].endswith("all.ndjson")
+    assert manifest["contexts"] == {"finance": {"subjects": 1, "versions": 1}, ".": {"subjects": 3, "versions": 4}}
+    records = _records(manifest["path"])
+    assert [r["context"] for r in records if r["type"] == "context"] == ["finance", "."]
+
+
+def test_export_path_must_stay_in_export_dir(export_dir):
+    with pytest.raises(ExportPathError):
+        resolve_export_path("../outside.ndjson", "test", "global")
+    with pytest.raises(ExportPathError):
+        resolve_export_path(str(export_dir.parent / "outside.ndjson"), "test", "global")
+    assert resolve_export_path("nested/out.ndjson", "test", "global") == str(export_dir / "nested" / "out.ndjson")
+    assert os.path.basename(resolve_export_path(None, "test", "orders.v1")).startswith("test-orders_v1-")
+
+
+def test_failed_export_leaves_no_file(client, export_dir, monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError("registry went away")
+
+    monkeypatch.setattr(export_stream, "iter_context_versions", broken)
+    with pytest.raises(RuntimeError):
+        stream_export_context(client, "", output_path="broken.ndjson")
+    assert os.listdir(export_dir) == []
+
+
+def test_export_tools_return_manifest(client):
+    manager = BaseRegistryManager()
+    manager.registries["test"] = client
+    manager.default_registry = "test"
+
+    result = asyncio.run(export_context_tool("finance", manager, "multi", "test", format="ndjson"))
+    assert result["_validation"]["validated"] is True
+    assert (result["subject_count"], result["version_count"]) == (1, 1)
+    assert os.path.exists(result["path"])
+    assert "subjects" not in result
+
+    result = asyncio.run(export_global_tool(manager, "multi", "test", format="ndjson", output_path="g.ndjson"))
+    assert result["version_count"] == 5
+
+    result = asyncio.run(export_global_tool(manager, "multi", "test", format="ndjson", output_path="../g.ndjson"))
+    assert result["error_code"] == "INVALID_EXPORT_PATH"